@@ -41,6 +41,11 @@ def resource_class_to_class_def(
   final_class_docstring = '\n'.join(class_docstring_parts)
   class_body_stmts.append(ast.Expr(value=ast.Constant(value=final_class_docstring)))
 
+  # Resources don't carry any state beyond their client, so they can do without an instance dict
+  class_body_stmts.append(
+    ast.Assign(targets=[ast.Name(id='__slots__', ctx=ast.Store())], value=ast.Tuple(elts=[], ctx=ast.Load()))
+  )
+
   # Generate methods for each operation
   for operation_spec_path, target_method_name, original_api_path in sorted(
     operations_list,
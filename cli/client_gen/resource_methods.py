@@ -8,6 +8,13 @@ from .annotation import spec_piece_to_annotation
 
 """Utilities for converting OpenAPI schema pieces to Python Resource method definitions."""
 
+_RATE_LIMIT_PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+_RATE_LIMIT_RE = re.compile(
+  r'^(?:Tier (?P<tier>\d+) )?Rate limit: (?P<requests>\d+) per (?:(?P<multiplier>\d+) )?'
+  r'(?P<unit>second|minute|hour|day)s?(?P<qualifier> per \w+)?\.?$',
+  re.MULTILINE,
+)
+
 
 def http_method_to_func_name(method_spec: SchemaPath) -> str:
   """
@@ -26,6 +33,30 @@ def _is_collection_response(method_spec: SchemaPath) -> bool:
   return response_type.id.startswith('Iterator[')
 
 
+def parse_rate_limit(description: Optional[str]) -> Optional[tuple[int, int]]:
+  """
+  Extracts the rate limit from an operation description as a (requests, period_seconds) tuple.
+
+  Limits that are scoped to something other than the operation itself (e.g. "per IVR") are ignored,
+  and when several tiers are documented, the lowest tier is used since that is what every API key
+  is guaranteed to have. Returns None if the description does not document a rate limit.
+  """
+  candidates = []
+  for match in _RATE_LIMIT_RE.finditer(description or ''):
+    if match['qualifier']:
+      continue
+
+    period = int(match['multiplier'] or 1) * _RATE_LIMIT_PERIODS[match['unit']]
+    candidates.append((int(match['tier'] or 0), int(match['requests']), period))
+
+  if not candidates:
+    return None
+
+  # Prefer the lowest tier, and then the most restrictive limit within that tier.
+  _tier, requests, period = min(candidates, key=lambda c: (c[0], c[1] / c[2]))
+  return requests, period
+
+
 def _build_method_call_args(
   method_spec: SchemaPath, api_path: Optional[str] = None
 ) -> list[ast.expr]:
@@ -135,6 +166,20 @@ def _build_method_call_args(
     body_arg = ast.keyword(arg='body', value=ast.Name(id='request_body', ctx=ast.Load()))
     args.append(body_arg)
 
+  # Add the operation metadata that the client uses for rate limiting
+  operation_id = method_spec.contents().get('operationId')
+  if operation_id:
+    args.append(ast.keyword(arg='operation_id', value=ast.Constant(value=operation_id)))
+
+  rate_limit = parse_rate_limit(method_spec.contents().get('description'))
+  if rate_limit:
+    args.append(
+      ast.keyword(
+        arg='rate_limit',
+        value=ast.Tuple(elts=[ast.Constant(value=v) for v in rate_limit], ctx=ast.Load()),
+      )
+    )
+
   return args
 
 
@@ -251,21 +296,13 @@ def http_method_to_func_body(
     keywords=call_args,
   )
 
-  if use_async and is_collection:
-    # For async collection responses, use async for loop with yield
-    if_async_for = ast.AsyncFor(
-      target=ast.Name(id='item', ctx=ast.Store()),
-      iter=request_call_expr,
-      body=[ast.Expr(value=ast.Yield(value=ast.Name(id='item', ctx=ast.Load())))],
-      orelse=[],
-    )
-    return [docstring_node, if_async_for]
-  elif use_async:
+  if use_async and not is_collection:
     # For async non-collection responses, use await
     request_call_expr = ast.Await(value=request_call_expr)
     request_call = ast.Return(value=request_call_expr)
   else:
-    # For sync responses, return directly
+    # For sync responses and async collections (whose async iterator is returned as-is), return
+    # directly
     request_call = ast.Return(value=request_call_expr)
 
   # Put it all together
@@ -384,7 +421,7 @@ def http_method_to_func_def(
   func_args = http_method_to_func_args(method_spec)
   returns_annotation = spec_piece_to_annotation(method_spec / 'responses', use_async=use_async)
 
-  if use_async:
+  if use_async and not _is_collection_response(method_spec):
     return ast.AsyncFunctionDef(
       name=func_name,
       args=func_args,
@@ -1,5 +1,6 @@
 """Orchestrates the generation of Python resource modules based on module_mapping.json."""
 
+import ast
 import os
 import re  # Ensure re is imported if to_snake_case is defined here or called
 from typing import Dict, List, Tuple
@@ -9,6 +10,7 @@ from jsonschema_path import SchemaPath
 from rich.markdown import Markdown
 
 from .module_mapping import ModuleMappingEntry, load_module_mapping
+from .resource_methods import parse_rate_limit
 from .resource_modules import resource_class_to_module_def
 from .utils import reformat_python_file, write_python_file
 
@@ -41,7 +43,9 @@ def _convert_to_snake_case(name: str) -> str:
 
 
 def _group_operations_by_class(
-  api_spec: SchemaPath, module_mapping: Dict[str, Dict[str, ModuleMappingEntry]], use_async: bool = False,
+  api_spec: SchemaPath,
+  module_mapping: Dict[str, Dict[str, ModuleMappingEntry]],
+  use_async: bool = False,
 ) -> Dict[str, List[Tuple[SchemaPath, str, str]]]:
   """
   Groups API operations by their target resource class.
@@ -121,9 +125,9 @@ def resources_to_package_directory(
     print(f'Error loading module mapping: {e}')
     return
 
-  grouped_operations_by_class_name = _group_operations_by_class(api_spec, mapping_data, use_async=use_async)
-
-  generated_module_snake_names = []
+  grouped_operations_by_class_name = _group_operations_by_class(
+    api_spec, mapping_data, use_async=use_async
+  )
 
   for resource_class_name, operations_for_class in grouped_operations_by_class_name.items():
     operations_with_target_methods = []
@@ -139,50 +143,115 @@ def resources_to_package_directory(
     module_file_path = os.path.join(output_dir, f'{module_file_snake_name}.py')
     write_python_file(module_file_path, module_ast)
 
-    generated_module_snake_names.append(module_file_snake_name)
     all_resource_class_names_in_package.append(resource_class_name)
 
-  with open(init_file_path, 'w') as f:
-    f.write('# This is an auto-generated resource package. Please do not edit it directly.\n\n')
+  mixin_name = 'AsyncDialpadResourcesMixin' if use_async else 'DialpadResourcesMixin'
 
-    # Create a mapping from snake_case module name to its original ClassName
-    # to ensure correct import statements in __init__.py
-    class_name_map = {to_snake_case(name): name for name in all_resource_class_names_in_package}
+  # Map each resource class to the (snake_case) module that defines it
+  module_names = {name: to_snake_case(name) for name in all_resource_class_names_in_package}
+  sorted_class_names = sorted(all_resource_class_names_in_package, key=lambda n: module_names[n])
 
-    for module_snake_name in sorted(generated_module_snake_names):
-      actual_class_name = class_name_map.get(module_snake_name)
-      if actual_class_name:
-        f.write(f'from .{module_snake_name} import {actual_class_name}\n')
+  with open(init_file_path, 'w') as f:
+    f.write('# This is an auto-generated resource package. Please do not edit it directly.\n\n')
+    f.write('from functools import cached_property\n')
+    f.write('from importlib import import_module\n')
+    f.write('from typing import TYPE_CHECKING\n\n')
+
+    # The resource classes are only imported eagerly for type-checkers. At runtime they are
+    # imported on first use (PEP 562), since most programs only touch a handful of resources.
+    f.write('if TYPE_CHECKING:\n')
+    for class_name in sorted_class_names:
+      f.write(f'  from .{module_names[class_name]} import {class_name}\n')
+
+    f.write('\n_RESOURCE_MODULES = {\n')
+    for class_name in sorted_class_names:
+      f.write(f"  '{class_name}': '.{module_names[class_name]}',\n")
+    f.write('}\n\n\n')
+
+    f.write('def __getattr__(name: str):\n')
+    f.write('  if name not in _RESOURCE_MODULES:\n')
+    f.write("    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')\n\n")
+    f.write('  resource_class = getattr(import_module(_RESOURCE_MODULES[name], __name__), name)\n')
+    f.write('  globals()[name] = resource_class\n')
+    f.write('  return resource_class\n\n\n')
+
+    f.write('def __dir__():\n')
+    f.write('  return sorted(set(globals()) | set(_RESOURCE_MODULES))\n')
 
     # Add the DialpadResourcesMixin class
-    if use_async:
-      f.write('\n\nclass AsyncDialpadResourcesMixin:\n')
-    else:
-      f.write('\n\nclass DialpadResourcesMixin:\n')
+    f.write(f'\n\nclass {mixin_name}:\n')
     f.write('  """Mixin class that provides resource properties for each API resource.\n\n')
     f.write('  This mixin is used by the DialpadClient class to provide easy access\n')
-    f.write('  to all API resources as properties.\n  """\n\n')
+    f.write('  to all API resources as properties.\n\n')
+    f.write(
+      '  Each resource is instantiated on first access, and then memoized for the lifetime of the\n'
+    )
+    f.write('  client.\n  """\n\n')
 
     # Add a property for each resource class
     for class_name in sorted(all_resource_class_names_in_package):
       # Convert the class name to property name (removing 'Resource' suffix and converting to snake_case)
       property_name = to_snake_case(class_name.removesuffix('Resource').removeprefix('Async'))
 
-      f.write('  @property\n')
-      f.write(f'  def {property_name}(self) -> {class_name}:\n')
+      f.write('  @cached_property\n')
+      f.write(f"  def {property_name}(self) -> '{class_name}':\n")
       f.write(f'    """Returns an instance of {class_name}.\n\n')
       f.write('    Returns:\n')
       f.write(f'        A {class_name} instance initialized with this client.\n')
       f.write('    """\n')
+      f.write(f'    from .{module_names[class_name]} import {class_name}\n\n')
       f.write(f'    return {class_name}(self)\n\n')
 
     # Add __all__ for export of the classes and the mixin
     f.write('\n__all__ = [\n')
     for class_name in sorted(all_resource_class_names_in_package):
       f.write(f"    '{class_name}',\n")
-    f.write("    'DialpadResourcesMixin',\n")
+    f.write(f"    '{mixin_name}',\n")
     f.write(']\n')
 
   reformat_python_file(init_file_path)
 
   rich.print(Markdown(f'Resource package generated at `{output_dir}`.'))
+
+
+def operation_rate_limits(spec: SchemaPath) -> Dict[str, Tuple[int, int]]:
+  """Returns the documented (requests, period_seconds) rate limit of each API operation id."""
+  rate_limits = {}
+  for _path_key, path_schema in (spec / 'paths').items():
+    for _method_key, method_schema in path_schema.items():
+      operation_id = method_schema.contents().get('operationId')
+      rate_limit = parse_rate_limit(method_schema.contents().get('description'))
+      if operation_id and rate_limit:
+        rate_limits[operation_id] = rate_limit
+
+  return rate_limits
+
+
+def write_rate_limits_module(spec: SchemaPath, file_path: str) -> None:
+  """Writes a module which maps each API operation id to its documented rate limit.
+
+  These are the same limits that the generated resource methods pass to the client, for code that
+  calls (or throttles) an operation outside of its resource method.
+  """
+  rate_limits = operation_rate_limits(spec)
+  module_def = ast.Module(
+    body=[
+      ast.Expr(
+        value=ast.Constant(
+          value='Maps each API operation id to its documented (requests, period) rate limit.'
+        )
+      ),
+      ast.Assign(
+        targets=[ast.Name(id='OPERATION_RATE_LIMITS', ctx=ast.Store())],
+        value=ast.Dict(
+          keys=[ast.Constant(value=k) for k in sorted(rate_limits)],
+          values=[
+            ast.Tuple(elts=[ast.Constant(value=v) for v in rate_limits[k]], ctx=ast.Load())
+            for k in sorted(rate_limits)
+          ],
+        ),
+      ),
+    ],
+    type_ignores=[],
+  )
+  write_python_file(file_path, module_def)
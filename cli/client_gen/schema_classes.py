@@ -5,7 +5,7 @@ from jsonschema_path.paths import SchemaPath
 
 from . import annotation
 
-"""Utilities for converting OpenAPI object schemas into TypedDict definitions."""
+"""Utilities for converting OpenAPI object schemas into TypedDict and Model definitions."""
 
 
 def _extract_schema_title(object_schema: SchemaPath) -> str:
@@ -14,7 +14,7 @@ def _extract_schema_title(object_schema: SchemaPath) -> str:
 
 
 def _get_property_fields(
-  object_schema: SchemaPath, required_props: Set[str]
+  object_schema: SchemaPath, required_props: Set[str], for_model: bool = False
 ) -> List[Tuple[str, ast.expr, str]]:
   """
   Extract property fields from schema and create appropriate annotations.
@@ -33,11 +33,17 @@ def _get_property_fields(
     is_required = prop_name in required_props
 
     # Use schema_dict_to_annotation with appropriate flags
-    annotation_expr = annotation.schema_dict_to_annotation(
-      prop_dict,
-      override_nullable=False,  # The vast majority of properties are improperly marked as nullable
-      override_omissible=not is_required,
-    )
+    if for_model:
+      # Model fields that are omitted from a response are set to None.
+      annotation_expr = annotation.schema_dict_to_annotation(
+        prop_dict, override_nullable=not is_required, override_omissible=False
+      )
+    else:
+      annotation_expr = annotation.schema_dict_to_annotation(
+        prop_dict,
+        override_nullable=False,  # The vast majority of properties are improperly marked as nullable
+        override_omissible=not is_required,
+      )
 
     # Get the field description from the spec
     description = prop_dict.get('description', '')
@@ -47,6 +53,40 @@ def _get_property_fields(
   return fields
 
 
+def _get_nested_models(object_schema: SchemaPath) -> List[Tuple[str, ast.expr]]:
+  """
+  Find the properties whose values are other schema objects (or lists of them).
+
+  Returns a list of (field_name, model) tuples, where model is either the name of the nested Model
+  class, or a single-item list containing it for list properties. Properties which could hold one
+  of several schemas (oneOf) are left as plain dicts.
+  """
+  nested = []
+  for prop_name, prop_dict in object_schema.contents().get('properties', {}).items():
+    if '$ref' in prop_dict:
+      nested.append((prop_name, ast.Name(id=prop_dict['$ref'].split('.')[-1], ctx=ast.Load())))
+    elif prop_dict.get('type') == 'array' and '$ref' in prop_dict.get('items', {}):
+      model_name = prop_dict['items']['$ref'].split('.')[-1]
+      nested.append(
+        (prop_name, ast.List(elts=[ast.Name(id=model_name, ctx=ast.Load())], ctx=ast.Load()))
+      )
+
+  return nested
+
+
+def _get_docstring(schema_dict: dict, class_name: str, kind: str) -> str:
+  """Returns the class docstring for a schema, falling back to a generic one."""
+  docstring = schema_dict.get('description', '')
+  if not docstring and 'title' in schema_dict:
+    docstring = schema_dict['title']
+
+  # If no description available, provide a generic docstring
+  if not docstring:
+    docstring = f'{kind} representation of the {class_name} schema.'
+
+  return docstring
+
+
 def schema_to_typed_dict_def(object_schema: SchemaPath) -> ast.ClassDef:
   """Converts an OpenAPI object schema to a TypedDict definition (ast.ClassDef)."""
   schema_dict = object_schema.contents()
@@ -63,16 +103,8 @@ def schema_to_typed_dict_def(object_schema: SchemaPath) -> ast.ClassDef:
   # Create class body
   class_body = []
 
-  # Add docstring from schema description or title
-  docstring = schema_dict.get('description', '')
-  if not docstring and 'title' in schema_dict:
-    docstring = schema_dict['title']
-
-  # If no description available, provide a generic docstring
-  if not docstring:
-    docstring = f'TypedDict representation of the {class_name} schema.'
-
-  # Add docstring as first element in class body
+  # Add docstring from schema description or title as first element in class body
+  docstring = _get_docstring(schema_dict, class_name, 'TypedDict')
   class_body.append(ast.Expr(value=ast.Constant(value=docstring)))
 
   # Add class annotations for each field along with field descriptions as string literals
@@ -101,3 +133,52 @@ def schema_to_typed_dict_def(object_schema: SchemaPath) -> ast.ClassDef:
   return ast.ClassDef(
     name=class_name, bases=[typed_dict_base], keywords=[], body=class_body, decorator_list=[]
   )
+
+
+def schema_to_model_def(object_schema: SchemaPath) -> ast.ClassDef:
+  """Converts an OpenAPI object schema to a slotted Model class definition (ast.ClassDef)."""
+  schema_dict = object_schema.contents()
+  class_name = _extract_schema_title(object_schema)
+  required_props = set(schema_dict.get('required', []))
+  field_items = _get_property_fields(object_schema, required_props, for_model=True)
+
+  class_body = [
+    ast.Expr(value=ast.Constant(value=_get_docstring(schema_dict, class_name, 'Model'))),
+    ast.Assign(
+      targets=[ast.Name(id='__slots__', ctx=ast.Store())],
+      value=ast.Tuple(
+        elts=[ast.Constant(value=field_name) for field_name, _, _ in field_items], ctx=ast.Load()
+      ),
+    ),
+  ]
+
+  # Tell Model.from_dict which fields need to be converted into nested models.
+  nested_models = _get_nested_models(object_schema)
+  if nested_models:
+    class_body.append(
+      ast.Assign(
+        targets=[ast.Name(id='_nested', ctx=ast.Store())],
+        value=ast.Dict(
+          keys=[ast.Constant(value=field_name) for field_name, _ in nested_models],
+          values=[model for _, model in nested_models],
+        ),
+      )
+    )
+
+  # The field annotations and descriptions mirror those of the TypedDict.
+  for field_name, field_type, field_description in field_items:
+    class_body.append(
+      ast.AnnAssign(
+        target=ast.Name(id=field_name, ctx=ast.Store()), annotation=field_type, value=None, simple=1
+      )
+    )
+    if field_description:
+      class_body.append(ast.Expr(value=ast.Constant(value=field_description)))
+
+  return ast.ClassDef(
+    name=class_name,
+    bases=[ast.Name(id='Model', ctx=ast.Load())],
+    keywords=[],
+    body=class_body,
+    decorator_list=[],
+  )
@@ -3,7 +3,7 @@ from typing import Dict, List, Set
 
 from jsonschema_path.paths import SchemaPath
 
-from .schema_classes import schema_to_typed_dict_def
+from .schema_classes import schema_to_model_def, schema_to_typed_dict_def
 
 
 def _extract_schema_title(schema: SchemaPath) -> str:
@@ -154,8 +154,12 @@ def _sort_schemas(schemas: List[SchemaPath]) -> List[SchemaPath]:
   return [schema_titles[title] for title in sorted_titles]
 
 
-def schemas_to_module_def(schemas: List[SchemaPath]) -> ast.Module:
-  """Converts a list of OpenAPI colocated schemas to a Python module definition (ast.Module)."""
+def schemas_to_module_def(schemas: List[SchemaPath], models: bool = False) -> ast.Module:
+  """Converts a list of OpenAPI colocated schemas to a Python module definition (ast.Module).
+
+  If `models` is set, then slotted Model classes are generated (for the dialpad.models package)
+  rather than TypedDicts.
+  """
   # First, sort schemas to handle dependencies correctly
   sorted_schemas = _sort_schemas(schemas)
 
@@ -177,15 +181,33 @@ def schemas_to_module_def(schemas: List[SchemaPath]) -> ast.Module:
       ],
       level=0,  # Absolute import
     ),
-    ast.ImportFrom(
-      module='typing_extensions',
-      names=[ast.alias(name='TypedDict', asname=None), ast.alias(name='NotRequired', asname=None)],
-      level=0,  # Absolute import
-    ),
   ]
+  if models:
+    import_statements.append(
+      ast.ImportFrom(
+        module='dialpad.models.base',
+        names=[ast.alias(name='Model', asname=None)],
+        level=0,  # Absolute import
+      )
+    )
+  else:
+    import_statements.append(
+      ast.ImportFrom(
+        module='typing_extensions',
+        names=[
+          ast.alias(name='TypedDict', asname=None),
+          ast.alias(name='NotRequired', asname=None),
+        ],
+        level=0,  # Absolute import
+      )
+    )
 
   # Add imports for external dependencies
   for import_path, schema_names in sorted(external_dependencies.items()):
+    if models:
+      # The models package mirrors the layout of the schemas package.
+      import_path = import_path.replace('dialpad.schemas', 'dialpad.models', 1)
+
     import_statements.append(
       ast.ImportFrom(
         module=import_path,
@@ -197,7 +219,7 @@ def schemas_to_module_def(schemas: List[SchemaPath]) -> ast.Module:
   # Create class definitions for each schema
   class_defs = []
   for schema in sorted_schemas:
-    class_def = schema_to_typed_dict_def(schema)
+    class_def = schema_to_model_def(schema) if models else schema_to_typed_dict_def(schema)
     class_defs.append(class_def)
 
   # Create module body with imports and classes
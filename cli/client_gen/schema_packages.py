@@ -1,28 +1,84 @@
+import ast
 import os
 
 from jsonschema_path.paths import SchemaPath
 
 from .schema_modules import schemas_to_module_def
-from .utils import write_python_file
+from .utils import reformat_python_file, write_python_file
 
 """Utilities for converting an OpenAPI schema collection into a Python schema package."""
 
 
+def write_schema_package_init(init_file_path: str, submodule_names: list[str]) -> None:
+  """Writes a schema package __init__.py which imports its submodules lazily on attribute access."""
+  with open(init_file_path, 'w') as f:
+    f.write('# This is an auto-generated schema package. Please do not edit it directly.\n\n')
+    f.write('from importlib import import_module\n\n')
+
+    # Submodules are only imported when they are first accessed as attributes (PEP 562).
+    f.write('_SUBMODULES = [\n')
+    for name in submodule_names:
+      f.write(f"  '{name}',\n")
+    f.write(']\n\n\n')
+
+    f.write('def __getattr__(name: str):\n')
+    f.write('  if name not in _SUBMODULES:\n')
+    f.write("    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')\n\n")
+    f.write("  return import_module(f'.{name}', __name__)\n\n\n")
+
+    f.write('def __dir__():\n')
+    f.write('  return sorted(set(globals()) | set(_SUBMODULES))\n')
+
+  reformat_python_file(init_file_path)
+
+
+def write_response_models_module(spec: SchemaPath, file_path: str) -> None:
+  """Writes a module which maps each API operation id to the Model of its response body."""
+  response_models = {}
+  for _path_key, path_schema in (spec / 'paths').items():
+    for _method_key, method_schema in path_schema.items():
+      if 'operationId' not in method_schema:
+        continue
+
+      responses = method_schema.contents().get('responses', {})
+      schema = responses.get('200', {}).get('content', {}).get('application/json', {}).get('schema')
+      if not schema or '$ref' not in schema:
+        continue
+
+      # e.g. "#/components/schemas/schemas.user.UserProto" -> "user.UserProto"
+      schema_name = schema['$ref'].split('/')[-1]
+      response_models[method_schema['operationId']] = schema_name.split('.', 1)[1]
+
+  module_def = ast.Module(
+    body=[
+      ast.Expr(
+        value=ast.Constant(value='Maps each API operation id to the Model of its response.')
+      ),
+      ast.Assign(
+        targets=[ast.Name(id='RESPONSE_MODELS', ctx=ast.Store())],
+        value=ast.Dict(
+          keys=[ast.Constant(value=k) for k in sorted(response_models)],
+          values=[ast.Constant(value=response_models[k]) for k in sorted(response_models)],
+        ),
+      ),
+    ],
+    type_ignores=[],
+  )
+  write_python_file(file_path, module_def)
+
+
 def schemas_to_package_directory(
-  schemas: list[SchemaPath], output_dir: str, depth: int = 0
+  schemas: list[SchemaPath], output_dir: str, depth: int = 0, models: bool = False
 ) -> None:
-  """Converts a list of OpenAPI schemas to a Python package directory structure."""
+  """Converts a list of OpenAPI schemas to a Python package directory structure.
+
+  If `models` is set, then the package is populated with slotted Model classes rather than
+  TypedDicts.
+  """
   # We'll start by creating the output directory if it doesn't already exist.
   if not os.path.exists(output_dir):
     os.makedirs(output_dir)
 
-  # Next, we'll need to seed it with an __init__.py file to make it a package.
-  # Although, we'll skip this at depth 0, since we'll actually be injecting this into the root package.
-  if depth > 0:
-    init_file_path = os.path.join(output_dir, '__init__.py')
-    with open(init_file_path, 'w') as f:
-      f.write('# This is an auto-generated schema package. Please do not edit it directly.\n')
-
   # Now we'll need to sift through the schemas and group them by path prefix.
   schema_groups = {
     'modules': {},
@@ -37,12 +93,18 @@ def schemas_to_package_directory(
 
     schema_groups[group_type][group_name].append(schema)
 
+  # Next, we'll need to seed it with an __init__.py file to make it a package.
+  # Although, we'll skip this at depth 0, since we'll actually be injecting this into the root package.
+  if depth > 0:
+    submodule_names = sorted(set(schema_groups['modules']) | set(schema_groups['packages']))
+    write_schema_package_init(os.path.join(output_dir, '__init__.py'), submodule_names)
+
   # Okay, now we can create any module files that need to be created.
   for group_name, m_schemas in schema_groups['modules'].items():
-    module_def = schemas_to_module_def(m_schemas)
+    module_def = schemas_to_module_def(m_schemas, models=models)
     write_python_file(os.path.join(output_dir, f'{group_name}.py'), module_def)
 
   # And now we can recurse on any sub-packages that need to be created.
   for group_name, p_schemas in schema_groups['packages'].items():
     sub_package_dir = os.path.join(output_dir, group_name)
-    schemas_to_package_directory(p_schemas, sub_package_dir, depth + 1)
+    schemas_to_package_directory(p_schemas, sub_package_dir, depth + 1, models=models)
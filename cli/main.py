@@ -9,8 +9,14 @@ from openapi_core import OpenAPI
 from rich.markdown import Markdown
 
 from cli.client_gen.module_mapping import update_module_mapping
-from cli.client_gen.resource_packages import resources_to_package_directory
-from cli.client_gen.schema_packages import schemas_to_package_directory
+from cli.client_gen.resource_packages import (
+  resources_to_package_directory,
+  write_rate_limits_module,
+)
+from cli.client_gen.schema_packages import (
+  schemas_to_package_directory,
+  write_response_models_module,
+)
 from cli.client_gen.utils import bump_patch_version
 
 REPO_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
@@ -65,12 +71,21 @@ def generate_client():
   # Write the generated schema package to the client directory
   schemas_to_package_directory(all_schemas, CLIENT_DIR)
 
+  # Write the equivalent slotted model classes (which mirror the schema package's layout), along
+  # with the mapping from each operation to the model of its response.
+  models_dir = os.path.join(CLIENT_DIR, 'models')
+  schemas_to_package_directory(all_schemas, models_dir, depth=1, models=True)
+  write_response_models_module(open_api_spec.spec, os.path.join(models_dir, 'responses.py'))
+
   # Write the generated resource modules to the client directory
   resources_to_package_directory(open_api_spec.spec, os.path.join(CLIENT_DIR, 'resources'))
 
   # Write async version of the resource modules to the async_resources directory
   resources_to_package_directory(open_api_spec.spec, os.path.join(CLIENT_DIR, 'async_resources'), use_async=True)
 
+  # Write the documented rate limit of each operation, for code that calls operations directly
+  write_rate_limits_module(open_api_spec.spec, os.path.join(CLIENT_DIR, 'operation_rate_limits.py'))
+
 @app.command('interactive-update')
 def interactive_update():
   """The one-stop-shop for updating the Dialpad client with the latest dialpad api spec."""
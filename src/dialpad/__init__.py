@@ -1,7 +1,31 @@
-from .async_client import AsyncDialpadClient
-from .client import DialpadClient
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from .async_client import AsyncDialpadClient
+  from .client import DialpadClient
 
 __all__ = [
   'DialpadClient',
   'AsyncDialpadClient',
 ]
+
+# The clients are imported on first use (PEP 562), so that synchronous users don't pay for importing
+# httpx, and async users don't pay for importing requests.
+_CLIENT_MODULES = {
+  'DialpadClient': '.client',
+  'AsyncDialpadClient': '.async_client',
+}
+
+
+def __getattr__(name: str):
+  if name not in _CLIENT_MODULES:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  client_class = getattr(import_module(_CLIENT_MODULES[name], __name__), name)
+  globals()[name] = client_class
+  return client_class
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_CLIENT_MODULES))
@@ -0,0 +1,354 @@
+"""Columnar export of paginated responses to Apache Arrow record batches, Parquet and Feather.
+
+Requires the pyarrow package (`pip install python-dialpad[arrow]`).
+
+Each page is converted into a record batch as soon as it arrives, so the items never need to be
+held as Python dicts for longer than a page, and only one row group's worth of record batches is
+buffered before it's written out:
+
+    from dialpad import DialpadClient
+    from dialpad.arrow_export import export_parquet
+    from dialpad.schemas.call import CallProto
+
+    dp = DialpadClient(token='API_TOKEN_HERE')
+    export_parquet(dp.calls.list(started_after=1700000000000), 'calls.parquet', CallProto)
+"""
+
+import json
+import typing
+from typing import (
+  Any,
+  AsyncIterable,
+  AsyncIterator,
+  Callable,
+  Dict,
+  Iterable,
+  Iterator,
+  List,
+  Optional,
+  Tuple,
+  Union,
+)
+
+from typing_extensions import get_args, get_origin, get_type_hints, is_typeddict
+
+from .models.base import Model
+
+try:
+  import pyarrow as pa
+  import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+  pa = None
+  pq = None
+
+# The number of rows that are buffered before a row group (or Feather record batch) is written.
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+_SCALAR_TYPES = {str: 'string', int: 'int64', float: 'float64', bool: 'bool_'}
+
+# Converts a (non-None) value into something that pyarrow can build an array of the column's type
+# from, or None if the values can be used as they are.
+Converter = Optional[Callable[[Any], Any]]
+
+
+def _require_pyarrow() -> None:
+  if pa is None:
+    raise ImportError(
+      'Arrow exports require the pyarrow package (pip install python-dialpad[arrow]).'
+    )
+
+
+def _to_json(value: Any) -> str:
+  return json.dumps(value, sort_keys=True)
+
+
+def _arrow_type(annotation: Any, seen: Tuple[type, ...] = ()) -> Tuple['pa.DataType', Converter]:
+  """Maps a schema annotation to an Arrow type, along with the converter that its values need."""
+  origin = get_origin(annotation)
+  if annotation in _SCALAR_TYPES:
+    return getattr(pa, _SCALAR_TYPES[annotation])(), None
+
+  if origin is typing.Literal:
+    values = get_args(annotation)
+    if all(isinstance(value, str) for value in values):
+      # Enums are stored as dictionary-encoded strings, so each distinct value is only stored once.
+      return pa.dictionary(pa.int32(), pa.string()), None
+    return _arrow_type(type(values[0]), seen)
+
+  if origin is list:
+    item_type, convert_item = _arrow_type(get_args(annotation)[0], seen)
+    if convert_item is None:
+      return pa.list_(item_type), None
+    return pa.list_(item_type), lambda items: [
+      convert_item(item) if item is not None else None for item in items
+    ]
+
+  if is_typeddict(annotation) and annotation not in seen:
+    fields, converters = _struct_fields(annotation, seen + (annotation,))
+    if not converters:
+      return pa.struct(fields), None
+
+    def convert_struct(value: dict) -> dict:
+      value = dict(value)
+      for name, convert in converters.items():
+        if value.get(name) is not None:
+          value[name] = convert(value[name])
+      return value
+
+    return pa.struct(fields), convert_struct
+
+  # Unions, free-form dicts and recursive schemas are stored as JSON strings.
+  return pa.string(), _to_json
+
+
+def _struct_fields(
+  typed_dict: type, seen: Tuple[type, ...]
+) -> Tuple[List['pa.Field'], Dict[str, Callable[[Any], Any]]]:
+  fields = []
+  converters = {}
+  for name, annotation in get_type_hints(typed_dict).items():
+    arrow_type, convert = _arrow_type(annotation, seen)
+    fields.append(pa.field(name, arrow_type))
+    if convert is not None:
+      converters[name] = convert
+
+  return fields, converters
+
+
+def arrow_schema(row_type: type) -> 'pa.Schema':
+  """Derives an Arrow schema from one of the TypedDicts in dialpad.schemas (such as CallProto).
+
+  Nested objects become struct columns, lists become list columns, enums become dictionary-encoded
+  string columns, and anything that has no fixed shape (such as a union of objects) becomes a
+  column of JSON strings.
+  """
+  _require_pyarrow()
+  if not is_typeddict(row_type):
+    raise TypeError(f'Expected a TypedDict from dialpad.schemas, not {row_type!r}')
+
+  fields, _ = _struct_fields(row_type, (row_type,))
+  return pa.schema(fields)
+
+
+class RecordBatchBuilder:
+  """Converts lists of decoded items into Arrow record batches that follow a TypedDict's schema."""
+
+  def __init__(self, row_type: type):
+    _require_pyarrow()
+    self.schema = arrow_schema(row_type)
+    _, self._converters = _struct_fields(row_type, (row_type,))
+
+  def _column(self, field: 'pa.Field', items: List[dict]) -> 'pa.Array':
+    convert = self._converters.get(field.name)
+    values = [item.get(field.name) for item in items]
+    if convert is not None:
+      values = [convert(value) if value is not None else None for value in values]
+
+    try:
+      return pa.array(values, type=field.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+      # 64-bit integers are often sent as JSON strings, which pyarrow won't convert by itself.
+      return pa.array([_coerce(value, field.type) for value in values], type=field.type)
+
+  def build(self, items: List[Union[dict, Model]]) -> 'pa.RecordBatch':
+    items = [item.to_dict() if isinstance(item, Model) else item for item in items]
+    columns = [self._column(field, items) for field in self.schema]
+    return pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+
+def _coerce(value: Any, arrow_type: 'pa.DataType') -> Any:
+  """Parses any numbers that were sent as strings within a value of the given Arrow type."""
+  if value is None:
+    return None
+
+  if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+    if isinstance(value, str):
+      return int(value) if pa.types.is_integer(arrow_type) else float(value)
+    return value
+
+  if pa.types.is_list(arrow_type):
+    return [_coerce(item, arrow_type.value_type) for item in value]
+
+  if pa.types.is_struct(arrow_type):
+    value = dict(value)
+    for field in arrow_type:
+      value[field.name] = _coerce(value.get(field.name), field.type)
+    return value
+
+  return value
+
+
+def _iter_page_items(pages: Iterable[Any]) -> Iterator[list]:
+  # Accept the iterator that a list method returns as well as an iterable of pages.
+  if hasattr(pages, 'iter_pages'):
+    pages = pages.iter_pages()
+
+  for page in pages:
+    if isinstance(page, Model):
+      yield page.items or []
+    else:
+      yield page.get('items') or []
+
+
+def iter_record_batches(
+  pages: Iterable[Any], row_type: type, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator['pa.RecordBatch']:
+  """Converts pages of a paginated response into record batches of about `batch_size` rows.
+
+  Args:
+      pages: The iterator returned by a list method (such as `dp.calls.list()`), or any iterable of
+        pages (such as the client's `iter_pages()`).
+      row_type: The TypedDict of the list's items (such as CallProto).
+      batch_size: The number of rows to gather (from however many pages) into each batch.
+  """
+  builder = RecordBatchBuilder(row_type)
+  buffered: List['pa.RecordBatch'] = []
+  rows = 0
+  for items in _iter_page_items(pages):
+    if not items:
+      continue
+
+    buffered.append(builder.build(items))
+    rows += len(items)
+    if rows >= batch_size:
+      yield from _combine(builder.schema, buffered)
+      buffered = []
+      rows = 0
+
+  if buffered:
+    yield from _combine(builder.schema, buffered)
+
+
+class _RowBatcher:
+  """Gathers flat rows of strings (such as the records of a CSV file) into record batches."""
+
+  def __init__(self, batch_size: int, schema: Optional['pa.Schema']):
+    _require_pyarrow()
+    self.batch_size = batch_size
+    self.schema = schema
+    self.rows: List[dict] = []
+
+  def add(self, row: dict) -> Optional['pa.RecordBatch']:
+    self.rows.append(row)
+    return self.flush() if len(self.rows) >= self.batch_size else None
+
+  def flush(self) -> Optional['pa.RecordBatch']:
+    if not self.rows:
+      return None
+
+    rows, self.rows = self.rows, []
+    names = self.schema.names if self.schema is not None else list(rows[0])
+    # Empty CSV fields are nulls rather than empty strings once they're cast to another type.
+    columns = [
+      pa.array([row.get(name) or None for row in rows], type=pa.string()) for name in names
+    ]
+    batch = pa.RecordBatch.from_arrays(columns, names=names)
+    if self.schema is None:
+      return batch
+    return pa.Table.from_batches([batch]).cast(self.schema).to_batches()[0]
+
+
+def iter_row_batches(
+  rows: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE, schema: Optional['pa.Schema'] = None
+) -> Iterator['pa.RecordBatch']:
+  """Gathers rows of strings (such as those of `dialpad.stats_export.iter_stats_rows`) into batches.
+
+  Args:
+      rows: An iterable of dicts whose values are strings.
+      batch_size: The number of rows in each record batch.
+      schema: The Arrow schema to cast the columns to. By default, every column (of the first row)
+        is kept as a string column.
+  """
+  batcher = _RowBatcher(batch_size, schema)
+  for row in rows:
+    batch = batcher.add(row)
+    if batch is not None:
+      yield batch
+
+  batch = batcher.flush()
+  if batch is not None:
+    yield batch
+
+
+async def aiter_row_batches(
+  rows: AsyncIterable[dict],
+  batch_size: int = DEFAULT_BATCH_SIZE,
+  schema: Optional['pa.Schema'] = None,
+) -> AsyncIterator['pa.RecordBatch']:
+  """The async equivalent of `iter_row_batches`."""
+  batcher = _RowBatcher(batch_size, schema)
+  async for row in rows:
+    batch = batcher.add(row)
+    if batch is not None:
+      yield batch
+
+  batch = batcher.flush()
+  if batch is not None:
+    yield batch
+
+
+def _combine(schema: 'pa.Schema', batches: List['pa.RecordBatch']) -> List['pa.RecordBatch']:
+  if len(batches) == 1:
+    return batches
+  return pa.Table.from_batches(batches, schema=schema).combine_chunks().to_batches()
+
+
+def export_parquet(
+  pages: Iterable[Any],
+  path: str,
+  row_type: type,
+  row_group_size: int = DEFAULT_BATCH_SIZE,
+  **writer_options: Any,
+) -> int:
+  """Streams the items of a paginated response into a Parquet file.
+
+  Args:
+      pages: The iterator returned by a list method, or any iterable of pages.
+      path: The path of the Parquet file to write.
+      row_type: The TypedDict of the list's items (such as CallProto).
+      row_group_size: The number of rows in each row group, which bounds the memory that is used.
+      writer_options: Passed on to pyarrow.parquet.ParquetWriter (such as `compression='zstd'`).
+
+  Returns:
+      The number of rows that were written.
+  """
+  _require_pyarrow()
+  schema = arrow_schema(row_type)
+  rows = 0
+  with pq.ParquetWriter(path, schema, **writer_options) as writer:
+    for batch in iter_record_batches(pages, row_type, batch_size=row_group_size):
+      writer.write_batch(batch)
+      rows += batch.num_rows
+
+  return rows
+
+
+def export_feather(
+  pages: Iterable[Any],
+  path: str,
+  row_type: type,
+  batch_size: int = DEFAULT_BATCH_SIZE,
+  compression: Optional[str] = None,
+) -> int:
+  """Streams the items of a paginated response into a Feather (Arrow IPC) file.
+
+  Args:
+      pages: The iterator returned by a list method, or any iterable of pages.
+      path: The path of the Feather file to write.
+      row_type: The TypedDict of the list's items (such as CallProto).
+      batch_size: The number of rows in each record batch, which bounds the memory that is used.
+      compression: The compression codec to use ('lz4' or 'zstd'), if any.
+
+  Returns:
+      The number of rows that were written.
+  """
+  _require_pyarrow()
+  schema = arrow_schema(row_type)
+  options = pa.ipc.IpcWriteOptions(compression=compression)
+  rows = 0
+  with pa.ipc.new_file(path, schema, options=options) as writer:
+    for batch in iter_record_batches(pages, row_type, batch_size=batch_size):
+      writer.write_batch(batch)
+      rows += batch.num_rows
+
+  return rows
@@ -1,11 +1,34 @@
-from typing import AsyncIterator, Optional
+import asyncio
+from functools import cached_property
+from typing import AsyncIterator, Dict, Optional, Tuple, Union
 
 import httpx
 
 from .async_resources import AsyncDialpadResourcesMixin
+from .cache import MISS, MUTATING_METHODS, ResponseCache
+from .checkpoint import AsyncPageIterator, Checkpoint, CheckpointStore, checkpoint_key
+from .coalesce import AsyncSingleFlight
+from .download import GzipDecoder
+from .json_codec import JSONCodec, get_codec
+from .json_stream import CHUNK_SIZE, ItemsParser
+from .models.base import response_model
+from .prefetch import prefetch_aiter
+from .rate_limit import RateLimit, RateLimiter
+from .retry import RetryPolicy
 
 hosts = dict(live='https://dialpad.com', sandbox='https://sandbox.dialpad.com')
 
+# Either a single timeout (in seconds), a (connect timeout, read timeout) tuple, or an httpx.Timeout.
+Timeout = Union[float, Tuple[float, float], httpx.Timeout]
+
+
+def _as_httpx_timeout(timeout: Optional[Timeout]) -> httpx.Timeout:
+  if isinstance(timeout, tuple):
+    connect, read = timeout
+    return httpx.Timeout(read, connect=connect)
+
+  return httpx.Timeout(timeout)
+
 
 class AsyncDialpadClient(AsyncDialpadResourcesMixin):
   def __init__(
@@ -14,11 +37,48 @@ class AsyncDialpadClient(AsyncDialpadResourcesMixin):
     sandbox: bool = False,
     base_url: Optional[str] = None,
     company_id: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    prefetch_pages: int = 0,
+    cache: Optional[ResponseCache] = None,
+    coalesce_requests: bool = False,
+    json_codec: Optional[Union[str, JSONCodec]] = None,
+    models: bool = False,
+    stream_pages: bool = False,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    session: Optional[httpx.AsyncClient] = None,
+    http2: bool = False,
+    limits: Optional[httpx.Limits] = None,
+    timeout: Optional[Timeout] = 600.0,
+    operation_timeouts: Optional[Dict[str, Timeout]] = None,
   ):
     self._token = token
-    self._session = httpx.AsyncClient(timeout=600.0)
+    self._owns_session = session is None
+    try:
+      self._session = session or httpx.AsyncClient(
+        http2=http2,
+        limits=limits or httpx.Limits(),
+        timeout=_as_httpx_timeout(timeout),
+      )
+    except ImportError as e:
+      raise ImportError(
+        'HTTP/2 requires the h2 package to be installed (pip install python-dialpad[http2]).'
+      ) from e
+    self._operation_timeouts = {
+      operation_id: _as_httpx_timeout(op_timeout)
+      for operation_id, op_timeout in (operation_timeouts or {}).items()
+    }
     self._base_url = base_url or hosts.get('sandbox' if sandbox else 'live')
     self._company_id = company_id
+    self._rate_limiter = rate_limiter
+    self._retry_policy = retry_policy
+    self._prefetch_pages = prefetch_pages
+    self._cache = cache
+    self._json = get_codec(json_codec)
+    self._models = models
+    self._stream_pages = stream_pages
+    self._checkpoint_store = checkpoint_store
+    self._single_flight = AsyncSingleFlight() if coalesce_requests else None
 
   @property
   def company_id(self):
@@ -32,6 +92,50 @@ class AsyncDialpadClient(AsyncDialpadResourcesMixin):
   def company_id(self):
     del self._company_id
 
+  async def __aenter__(self) -> 'AsyncDialpadClient':
+    return self
+
+  async def __aexit__(self, *exc_info) -> None:
+    await self.aclose()
+
+  async def aclose(self) -> None:
+    """Releases the client's pooled connections (unless its session was supplied by the caller)."""
+    if self._owns_session:
+      await self._session.aclose()
+    self._forget_resources()
+
+  def _forget_resources(self) -> None:
+    # See DialpadClient._forget_resources.
+    for name in list(vars(self)):
+      if isinstance(getattr(type(self), name, None), cached_property):
+        del self.__dict__[name]
+
+  def _to_model(self, operation_id: Optional[str], data: Optional[dict]):
+    """Converts a decoded response into its Model, when the client is in model mode."""
+    if not self._models or data is None:
+      return data
+
+    model = response_model(operation_id)
+    return model.from_dict(data) if model else data
+
+  async def stream_download(self, url: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Streams a file (such as a stats export's `download_url`) over the client's pooled connections.
+
+    The file is yielded in chunks as it downloads, and decompressed along the way if it's gzipped
+    (whether in transit or as a file). The API token isn't sent, as download URLs are pre-signed.
+    """
+    async with self._session.stream('GET', url) as response:
+      response.raise_for_status()
+      gzip = GzipDecoder()
+      async for chunk in response.aiter_bytes(chunk_size):
+        data = gzip.feed(chunk)
+        if data:
+          yield data
+
+      data = gzip.close()
+      if data:
+        yield data
+
   def _url(self, path: str) -> str:
     return f'{self._base_url}/{path.lstrip("/")}'
 
@@ -42,6 +146,9 @@ class AsyncDialpadClient(AsyncDialpadResourcesMixin):
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    stream: bool = False,
   ) -> httpx.Response:
     url = self._url(sub_path)
     headers = headers or dict()
@@ -49,52 +156,229 @@ class AsyncDialpadClient(AsyncDialpadResourcesMixin):
       headers.update({'DP-Company-ID': str(self.company_id)})
 
     headers.update({'Authorization': f'Bearer {self._token}'})
+    content = None
+    if body is not None:
+      headers.setdefault('Content-Type', 'application/json')
+      content = self._json.dumps(body)
+
     if str(method).upper() in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']:
-      return await self._session.request(
+      if self._rate_limiter:
+        await self._rate_limiter.acquire_async(operation_id, rate_limit)
+
+      request = self._session.build_request(
         method=str(method).upper(),
         url=url,
         headers=headers,
         params=params,
-        json=body,
+        content=content,
+        timeout=self._operation_timeouts.get(operation_id, httpx.USE_CLIENT_DEFAULT),
       )
+      return await self._session.send(request, stream=stream)
     raise ValueError(f'Unsupported method "{method}"')
 
-  async def iter_request(
+  async def _send(
     self,
     method: str = 'GET',
     sub_path: Optional[str] = None,
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    stream: bool = False,
+  ) -> httpx.Response:
+    """Sends a request, retrying transient failures according to the retry policy (if any)."""
+    policy = self._retry_policy
+    if policy:
+      policy.record_request()
+
+    attempt = 0
+    while True:
+      attempt += 1
+      try:
+        response = await self._raw_request(
+          method=method,
+          sub_path=sub_path,
+          params=params,
+          body=body,
+          headers=headers,
+          operation_id=operation_id,
+          rate_limit=rate_limit,
+          stream=stream,
+        )
+      except httpx.TransportError:
+        if not policy or not policy.should_retry(method, attempt):
+          raise
+
+        await asyncio.sleep(policy.backoff(attempt))
+        continue
+
+      if policy and policy.should_retry(method, attempt, response.status_code):
+        await response.aclose()
+        await asyncio.sleep(policy.backoff(attempt, response.headers.get('Retry-After')))
+        continue
+
+      if stream and response.is_error:
+        # Read the error's body, so that it's available from the exception.
+        await response.aread()
+      response.raise_for_status()
+      return response
+
+  async def _iter_pages(
+    self,
+    method: str = 'GET',
+    sub_path: Optional[str] = None,
+    params: Optional[dict] = None,
+    body: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    stream: bool = False,
   ) -> AsyncIterator[dict]:
+    """Yields the decoded body of each page of a paginated response, following the cursors.
+
+    If `stream` is set, then each page's body is parsed as it arrives, and each batch of items is
+    yielded (as a partial page, with only an `items` field) as soon as it has been parsed, followed
+    by the page's other fields once the whole body has been read.
+
+    The last (or only) part of each page always has a `cursor` field, which is None for the last
+    page.
+    """
     # Ensure that we have a mutable copy of params.
     params = dict(params or {})
-    response = await self._raw_request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
-    )
-    response.raise_for_status()
+    while True:
+      response = await self._send(
+        method=method,
+        sub_path=sub_path,
+        params=params,
+        body=body,
+        headers=headers,
+        operation_id=operation_id,
+        rate_limit=rate_limit,
+        stream=stream,
+      )
+      if response.status_code == 204:  # No Content
+        await response.aclose()
+        return
 
-    if response.status_code == 204:  # No Content
-      return
+      if stream:
+        parser = ItemsParser(self._json.loads)
+        try:
+          async for chunk in response.aiter_bytes(CHUNK_SIZE):
+            items = parser.feed(chunk)
+            if items:
+              yield {'items': items}
+        finally:
+          await response.aclose()
 
-    response_json = response.json()
-    if 'items' in response_json:
-      for item in (response_json['items'] or []):
-        yield item
+        page = parser.close()
+        page.setdefault('cursor', None)
+        yield page
+      else:
+        page = self._json.loads(response.content)
+        page.setdefault('cursor', None)
+        yield page
 
-    while response_json.get('cursor', None):
-      params['cursor'] = response_json['cursor']
-      response = await self._raw_request(
-        method=method, sub_path=sub_path, params=params, body=body, headers=headers
-      )
-      response.raise_for_status()
-      if response.status_code == 204:  # No Content
+      if not page.get('cursor', None):
         return
 
-      response_json = response.json()
-      if 'items' in response_json:
-        for item in (response_json['items'] or []):
-          yield item
+      params['cursor'] = page['cursor']
+
+  def iter_request(
+    self,
+    method: str = 'GET',
+    sub_path: Optional[str] = None,
+    params: Optional[dict] = None,
+    body: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    prefetch: Optional[int] = None,
+    stream: Optional[bool] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    limit: Optional[int] = None,
+  ) -> AsyncPageIterator:
+    """Returns an iterator over the items from each page of a paginated response.
+
+    If `prefetch` (which defaults to the client's `prefetch_pages`) is non-zero, then up to that
+    many pages will be requested ahead of the caller by a separate task.
+
+    If `stream` (which defaults to the client's `stream_pages`) is set, then items are yielded as
+    each page's body is parsed, rather than once the whole page has been downloaded.
+
+    If `checkpoint` is given, then iteration resumes from that position rather than from the start
+    (or from the position that was saved to the client's `checkpoint_store`).
+
+    If `limit` is given, then iteration stops once that many items have been returned. It is also
+    sent as the `limit` query parameter of operations that accept one, so that no more items than
+    that are requested.
+    """
+    stream = self._stream_pages if stream is None else stream
+    if limit is not None and params and 'limit' in params and params['limit'] is None:
+      params = dict(params, limit=limit)
+
+    prefetch = self._prefetch_pages if prefetch is None else prefetch
+
+    def fetch_pages(cursor: Optional[str]) -> AsyncIterator[dict]:
+      page_params = dict(params or {})
+      if cursor:
+        page_params['cursor'] = cursor
+
+      pages = self._iter_pages(
+        method=method,
+        sub_path=sub_path,
+        params=page_params,
+        body=body,
+        headers=headers,
+        operation_id=operation_id,
+        rate_limit=rate_limit,
+        stream=stream,
+      )
+      return prefetch_aiter(pages, prefetch) if prefetch else pages
+
+    store = self._checkpoint_store
+    return AsyncPageIterator(
+      fetch_pages,
+      model=response_model(operation_id) if self._models else None,
+      store=store,
+      key=checkpoint_key(method, sub_path, params, self.company_id) if store else None,
+      checkpoint=checkpoint,
+      limit=limit,
+    )
+
+  def iter_pages(
+    self,
+    method: str = 'GET',
+    sub_path: Optional[str] = None,
+    params: Optional[dict] = None,
+    body: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    prefetch: Optional[int] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+  ) -> AsyncIterator[dict]:
+    """Yields each whole page of a paginated response, with its `items` and `cursor`.
+
+    The arguments are the same as those of `iter_request`, plus `max_pages`, which stops the
+    iteration once that many pages have been returned. If `limit` is given, then the last page is
+    trimmed so that no more than that many items are returned in total.
+    """
+    return self.iter_request(
+      method=method,
+      sub_path=sub_path,
+      params=params,
+      body=body,
+      headers=headers,
+      operation_id=operation_id,
+      rate_limit=rate_limit,
+      prefetch=prefetch,
+      stream=False,
+      checkpoint=checkpoint,
+      limit=limit,
+    ).iter_pages(limit=limit, max_pages=max_pages)
 
   async def request(
     self,
@@ -103,13 +387,46 @@ class AsyncDialpadClient(AsyncDialpadResourcesMixin):
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
   ) -> dict:
-    response = await self._raw_request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
-    )
-    response.raise_for_status()
+    cache = self._cache
+    method = str(method).upper()
+    if method == 'GET' and (cache is not None or self._single_flight is not None):
+      key = ResponseCache.key(method, sub_path, params, self.company_id)
+    if cache is not None and method == 'GET':
+      cached = cache.get(key)
+      if cached is not MISS:
+        return self._to_model(operation_id, cached)
+
+      generation = cache.generation
+
+    async def send():
+      return await self._send(
+        method=method,
+        sub_path=sub_path,
+        params=params,
+        body=body,
+        headers=headers,
+        operation_id=operation_id,
+        rate_limit=rate_limit,
+      )
+
+    try:
+      if self._single_flight is not None and method == 'GET':
+        # Concurrent callers share the response, but each decodes its own copy of the body.
+        response = await self._single_flight.do(key, send)
+      else:
+        response = await send()
+    finally:
+      if cache is not None and method in MUTATING_METHODS:
+        cache.invalidate(sub_path)
 
     if response.status_code == 204:  # No Content
       return None
 
-    return response.json()
+    result = self._json.loads(response.content)
+    if cache is not None and method == 'GET':
+      cache.set(key, result, operation_id, generation)
+
+    return self._to_model(operation_id, result)
@@ -21,6 +21,8 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
   - /api/v2/accesscontrolpolicies/{id}/assignments
   - /api/v2/accesscontrolpolicies/{id}/unassign"""
 
+  __slots__ = ()
+
   async def assign(self, id: int, request_body: AssignmentPolicyMessage) -> PolicyAssignmentProto:
     """Access Control Policies -- Assign
 
@@ -37,7 +39,11 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/accesscontrolpolicies/{id}/assign', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}/assign',
+      body=request_body,
+      operation_id='accesscontrolpolicies.assign',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreatePolicyMessage) -> PolicyProto:
@@ -55,7 +61,11 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/accesscontrolpolicies', body=request_body
+      method='POST',
+      sub_path='/api/v2/accesscontrolpolicies',
+      body=request_body,
+      operation_id='accesscontrolpolicies.create',
+      rate_limit=(1200, 60),
     )
 
   async def delete(self, id: int) -> PolicyProto:
@@ -72,7 +82,12 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/accesscontrolpolicies/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}',
+      operation_id='accesscontrolpolicies.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> PolicyProto:
     """Access Control Policies -- Get
@@ -86,9 +101,14 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/accesscontrolpolicies/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}',
+      operation_id='accesscontrolpolicies.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(self, cursor: Optional[str] = None) -> AsyncIterator[PolicyProto]:
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[PolicyProto]:
     """Access Control Policies -- List Policies
 
     Gets all access control policies belonging to the company.
@@ -100,12 +120,15 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/accesscontrolpolicies', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/accesscontrolpolicies',
+      params={'cursor': cursor},
+      operation_id='accesscontrolpolicies.list',
+      rate_limit=(1200, 60),
+    )
 
-  async def list_assignments(
+  def list_assignments(
     self, id: int, cursor: Optional[str] = None
   ) -> AsyncIterator[PolicyAssignmentProto]:
     """Access Control Policies -- List Assignments
@@ -120,12 +143,13 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path=f'/api/v2/accesscontrolpolicies/{id}/assignments',
       params={'cursor': cursor},
-    ):
-      yield item
+      operation_id='accesscontrolpolicies.assignments',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(self, id: int, request_body: UpdatePolicyMessage) -> PolicyProto:
     """Access Control Policies -- Update
@@ -143,7 +167,11 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/accesscontrolpolicies/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}',
+      body=request_body,
+      operation_id='accesscontrolpolicies.update',
+      rate_limit=(1200, 60),
     )
 
   async def unassign(
@@ -164,5 +192,9 @@ class AsyncAccessControlPoliciesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/accesscontrolpolicies/{id}/unassign', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}/unassign',
+      body=request_body,
+      operation_id='accesscontrolpolicies.unassign',
+      rate_limit=(1200, 60),
     )
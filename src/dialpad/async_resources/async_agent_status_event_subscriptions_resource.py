@@ -15,6 +15,8 @@ class AsyncAgentStatusEventSubscriptionsResource(AsyncDialpadResource):
   - /api/v2/subscriptions/agent_status
   - /api/v2/subscriptions/agent_status/{id}"""
 
+  __slots__ = ()
+
   async def create(
     self, request_body: CreateAgentStatusEventSubscription
   ) -> AgentStatusEventSubscriptionProto:
@@ -36,7 +38,11 @@ class AsyncAgentStatusEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/subscriptions/agent_status', body=request_body
+      method='POST',
+      sub_path='/api/v2/subscriptions/agent_status',
+      body=request_body,
+      operation_id='webhook_agent_status_event_subscription.create',
+      rate_limit=(1200, 60),
     )
 
   async def delete(self, id: int) -> AgentStatusEventSubscriptionProto:
@@ -55,7 +61,12 @@ class AsyncAgentStatusEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/agent_status/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/agent_status/{id}',
+      operation_id='webhook_agent_status_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> AgentStatusEventSubscriptionProto:
     """Agent Status -- Get
@@ -73,11 +84,14 @@ class AsyncAgentStatusEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/subscriptions/agent_status/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/agent_status/{id}',
+      operation_id='webhook_agent_status_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
-    self, cursor: Optional[str] = None
-  ) -> AsyncIterator[AgentStatusEventSubscriptionProto]:
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[AgentStatusEventSubscriptionProto]:
     """Agent Status -- List
 
     Gets a list of all the agent status event subscriptions of a company.
@@ -93,10 +107,13 @@ class AsyncAgentStatusEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/subscriptions/agent_status', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/subscriptions/agent_status',
+      params={'cursor': cursor},
+      operation_id='webhook_agent_status_event_subscription.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, id: str, request_body: UpdateAgentStatusEventSubscription
@@ -118,5 +135,9 @@ class AsyncAgentStatusEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/agent_status/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/agent_status/{id}',
+      body=request_body,
+      operation_id='webhook_agent_status_event_subscription.update',
+      rate_limit=(1200, 60),
     )
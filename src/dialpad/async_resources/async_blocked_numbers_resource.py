@@ -17,6 +17,8 @@ class AsyncBlockedNumbersResource(AsyncDialpadResource):
   - /api/v2/blockednumbers/remove
   - /api/v2/blockednumbers/{number}"""
 
+  __slots__ = ()
+
   async def add(self, request_body: AddBlockedNumbersProto) -> None:
     """Blocked Number -- Add
 
@@ -30,7 +32,11 @@ class AsyncBlockedNumbersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/blockednumbers/add', body=request_body
+      method='POST',
+      sub_path='/api/v2/blockednumbers/add',
+      body=request_body,
+      operation_id='blockednumbers.add',
+      rate_limit=(1200, 60),
     )
 
   async def get(self, number: str) -> BlockedNumber:
@@ -45,9 +51,14 @@ class AsyncBlockedNumbersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/blockednumbers/{number}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/blockednumbers/{number}',
+      operation_id='blockednumbers.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(self, cursor: Optional[str] = None) -> AsyncIterator[BlockedNumber]:
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[BlockedNumber]:
     """Blocked Numbers -- List
 
     Lists all numbers that have been blocked via the API.
@@ -59,10 +70,13 @@ class AsyncBlockedNumbersResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/blockednumbers', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/blockednumbers',
+      params={'cursor': cursor},
+      operation_id='blockednumbers.list',
+      rate_limit=(1200, 60),
+    )
 
   async def remove(self, request_body: RemoveBlockedNumbersProto) -> None:
     """Blocked Number -- Remove
@@ -77,5 +91,9 @@ class AsyncBlockedNumbersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/blockednumbers/remove', body=request_body
+      method='POST',
+      sub_path='/api/v2/blockednumbers/remove',
+      body=request_body,
+      operation_id='blockednumbers.remove',
+      rate_limit=(1200, 60),
     )
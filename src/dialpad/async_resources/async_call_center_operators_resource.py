@@ -8,6 +8,8 @@ class AsyncCallCenterOperatorsResource(AsyncDialpadResource):
   Handles API operations for:
   - /api/v2/callcenters/operators/{id}/dutystatus"""
 
+  __slots__ = ()
+
   async def get_duty_status(self, id: int) -> OperatorDutyStatusProto:
     """Operator -- Get Duty Status
 
@@ -21,7 +23,10 @@ class AsyncCallCenterOperatorsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='GET', sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus'
+      method='GET',
+      sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus',
+      operation_id='callcenters.operators.get.dutystatus',
+      rate_limit=(1200, 60),
     )
 
   async def update_duty_status(
@@ -40,5 +45,9 @@ class AsyncCallCenterOperatorsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus',
+      body=request_body,
+      operation_id='callcenters.operators.dutystatus',
+      rate_limit=(1200, 60),
     )
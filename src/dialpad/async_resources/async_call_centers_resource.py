@@ -25,6 +25,8 @@ class AsyncCallCentersResource(AsyncDialpadResource):
   - /api/v2/callcenters/{id}/operators
   - /api/v2/callcenters/{id}/status"""
 
+  __slots__ = ()
+
   async def add_operator(
     self, id: int, request_body: AddCallCenterOperatorMessage
   ) -> UserOrRoomProto:
@@ -47,7 +49,11 @@ class AsyncCallCentersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/callcenters/{id}/operators', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/callcenters/{id}/operators',
+      body=request_body,
+      operation_id='callcenters.operators.post',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateCallCenterMessage) -> CallCenterProto:
@@ -64,7 +70,13 @@ class AsyncCallCentersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/callcenters', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/callcenters',
+      body=request_body,
+      operation_id='callcenters.create',
+      rate_limit=(1200, 60),
+    )
 
   async def delete(self, id: int) -> CallCenterProto:
     """Call Centers -- Delete
@@ -80,7 +92,12 @@ class AsyncCallCentersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/callcenters/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/callcenters/{id}',
+      operation_id='callcenters.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> CallCenterProto:
     """Call Centers -- Get
@@ -94,7 +111,12 @@ class AsyncCallCentersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/callcenters/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{id}',
+      operation_id='callcenters.get',
+      rate_limit=(1200, 60),
+    )
 
   async def get_operator_skill_level(
     self, call_center_id: int, user_id: int
@@ -112,7 +134,10 @@ class AsyncCallCentersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='GET', sub_path=f'/api/v2/callcenters/{call_center_id}/operators/{user_id}/skill'
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{call_center_id}/operators/{user_id}/skill',
+      operation_id='callcenters.operators.get.skilllevel',
+      rate_limit=(1200, 60),
     )
 
   async def get_status(self, id: int) -> CallCenterStatusProto:
@@ -129,9 +154,14 @@ class AsyncCallCentersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/callcenters/{id}/status')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{id}/status',
+      operation_id='callcenters.status',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self,
     cursor: Optional[str] = None,
     name_search: Optional[str] = None,
@@ -151,12 +181,13 @@ class AsyncCallCentersResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/callcenters',
       params={'cursor': cursor, 'office_id': office_id, 'name_search': name_search},
-    ):
-      yield item
+      operation_id='callcenters.listall',
+      rate_limit=(1200, 60),
+    )
 
   async def list_operators(self, id: int) -> OperatorCollection:
     """Operators -- List
@@ -170,7 +201,12 @@ class AsyncCallCentersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/callcenters/{id}/operators')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{id}/operators',
+      operation_id='callcenters.operators.get',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(self, id: int, request_body: UpdateCallCenterMessage) -> CallCenterProto:
     """Call Centers -- Update
@@ -188,7 +224,11 @@ class AsyncCallCentersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/callcenters/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/callcenters/{id}',
+      body=request_body,
+      operation_id='callcenters.update',
+      rate_limit=(1200, 60),
     )
 
   async def remove_operator(
@@ -211,7 +251,11 @@ class AsyncCallCentersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='DELETE', sub_path=f'/api/v2/callcenters/{id}/operators', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/callcenters/{id}/operators',
+      body=request_body,
+      operation_id='callcenters.operators.delete',
+      rate_limit=(1200, 60),
     )
 
   async def update_operator_skill_level(
@@ -234,4 +278,6 @@ class AsyncCallCentersResource(AsyncDialpadResource):
       method='PATCH',
       sub_path=f'/api/v2/callcenters/{call_center_id}/operators/{user_id}/skill',
       body=request_body,
+      operation_id='callcenters.operators.skilllevel',
+      rate_limit=(1200, 60),
     )
@@ -15,6 +15,8 @@ class AsyncCallEventSubscriptionsResource(AsyncDialpadResource):
   - /api/v2/subscriptions/call
   - /api/v2/subscriptions/call/{id}"""
 
+  __slots__ = ()
+
   async def create(self, request_body: CreateCallEventSubscription) -> CallEventSubscriptionProto:
     """Call Event -- Create
 
@@ -36,7 +38,11 @@ class AsyncCallEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/subscriptions/call', body=request_body
+      method='POST',
+      sub_path='/api/v2/subscriptions/call',
+      body=request_body,
+      operation_id='webhook_call_event_subscription.create',
+      rate_limit=(1200, 60),
     )
 
   async def delete(self, id: int) -> CallEventSubscriptionProto:
@@ -55,7 +61,12 @@ class AsyncCallEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/call/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/call/{id}',
+      operation_id='webhook_call_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> CallEventSubscriptionProto:
     """Call Event -- Get
@@ -73,9 +84,14 @@ class AsyncCallEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/subscriptions/call/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/call/{id}',
+      operation_id='webhook_call_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self,
     cursor: Optional[str] = None,
     target_id: Optional[int] = None,
@@ -112,12 +128,13 @@ class AsyncCallEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/subscriptions/call',
       params={'cursor': cursor, 'target_type': target_type, 'target_id': target_id},
-    ):
-      yield item
+      operation_id='webhook_call_event_subscription.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, id: int, request_body: UpdateCallEventSubscription
@@ -139,5 +156,9 @@ class AsyncCallEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/call/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/call/{id}',
+      body=request_body,
+      operation_id='webhook_call_event_subscription.update',
+      rate_limit=(1200, 60),
     )
@@ -13,6 +13,8 @@ class AsyncCallReviewShareLinksResource(AsyncDialpadResource):
   - /api/v2/callreviewsharelink
   - /api/v2/callreviewsharelink/{id}"""
 
+  __slots__ = ()
+
   async def create(self, request_body: CreateCallReviewShareLink) -> CallReviewShareLink:
     """Call Review Sharelink -- Create
 
@@ -28,7 +30,11 @@ class AsyncCallReviewShareLinksResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/callreviewsharelink', body=request_body
+      method='POST',
+      sub_path='/api/v2/callreviewsharelink',
+      body=request_body,
+      operation_id='call_review_share_link.create',
+      rate_limit=(250, 60),
     )
 
   async def delete(self, id: str) -> CallReviewShareLink:
@@ -45,7 +51,12 @@ class AsyncCallReviewShareLinksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/callreviewsharelink/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/callreviewsharelink/{id}',
+      operation_id='call_review_share_link.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: str) -> CallReviewShareLink:
     """Call Review Sharelink -- Get
@@ -61,7 +72,12 @@ class AsyncCallReviewShareLinksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/callreviewsharelink/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/callreviewsharelink/{id}',
+      operation_id='call_review_share_link.get',
+      rate_limit=(1200, 60),
+    )
 
   async def update(self, id: str, request_body: UpdateCallReviewShareLink) -> CallReviewShareLink:
     """Call Review Sharelink -- Update
@@ -79,5 +95,9 @@ class AsyncCallReviewShareLinksResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PUT', sub_path=f'/api/v2/callreviewsharelink/{id}', body=request_body
+      method='PUT',
+      sub_path=f'/api/v2/callreviewsharelink/{id}',
+      body=request_body,
+      operation_id='call_review_share_link.update',
+      rate_limit=(250, 60),
     )
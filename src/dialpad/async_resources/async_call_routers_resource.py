@@ -17,6 +17,8 @@ class AsyncCallRoutersResource(AsyncDialpadResource):
   - /api/v2/callrouters/{id}
   - /api/v2/callrouters/{id}/assign_number"""
 
+  __slots__ = ()
+
   async def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -31,7 +33,11 @@ class AsyncCallRoutersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/callrouters/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/callrouters/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_call_router_number.post',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateApiCallRouterMessage) -> ApiCallRouterProto:
@@ -46,7 +52,13 @@ class AsyncCallRoutersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/callrouters', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/callrouters',
+      body=request_body,
+      operation_id='callrouters.create',
+      rate_limit=(1200, 60),
+    )
 
   async def delete(self, id: str) -> None:
     """Call Router -- Delete
@@ -60,7 +72,12 @@ class AsyncCallRoutersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/callrouters/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/callrouters/{id}',
+      operation_id='callrouters.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> ApiCallRouterProto:
     """Call Router -- Get
@@ -74,9 +91,14 @@ class AsyncCallRoutersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/callrouters/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/callrouters/{id}',
+      operation_id='callrouters.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self, cursor: Optional[str] = None, office_id: Optional[int] = None
   ) -> AsyncIterator[ApiCallRouterProto]:
     """Call Router -- List
@@ -91,12 +113,13 @@ class AsyncCallRoutersResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/callrouters',
       params={'cursor': cursor, 'office_id': office_id},
-    ):
-      yield item
+      operation_id='callrouters.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, id: str, request_body: UpdateApiCallRouterMessage
@@ -114,5 +137,9 @@ class AsyncCallRoutersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/callrouters/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/callrouters/{id}',
+      body=request_body,
+      operation_id='callrouters.update',
+      rate_limit=(1, 300),
     )
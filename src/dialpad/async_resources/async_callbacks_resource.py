@@ -9,6 +9,8 @@ class AsyncCallbacksResource(AsyncDialpadResource):
   - /api/v2/callback
   - /api/v2/callback/validate"""
 
+  __slots__ = ()
+
   async def enqueue_callback(self, request_body: CallbackMessage) -> CallbackProto:
     """Call Back -- Enqueue
 
@@ -24,7 +26,13 @@ class AsyncCallbacksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/callback', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/callback',
+      body=request_body,
+      operation_id='call.callback',
+      rate_limit=(1200, 60),
+    )
 
   async def validate_callback(self, request_body: CallbackMessage) -> ValidateCallbackProto:
     """Call Back -- Validate
@@ -41,5 +49,9 @@ class AsyncCallbacksResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/callback/validate', body=request_body
+      method='POST',
+      sub_path='/api/v2/callback/validate',
+      body=request_body,
+      operation_id='call.validate_callback',
+      rate_limit=(1200, 60),
     )
@@ -28,6 +28,8 @@ class AsyncCallsResource(AsyncDialpadResource):
   - /api/v2/call/{id}/transfer
   - /api/v2/call/{id}/unpark"""
 
+  __slots__ = ()
+
   async def add_participant(self, id: int, request_body: AddParticipantMessage) -> RingCallProto:
     """Call -- Add Participant
 
@@ -42,7 +44,11 @@ class AsyncCallsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/call/{id}/participants/add', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/call/{id}/participants/add',
+      body=request_body,
+      operation_id='call.participants.add',
+      rate_limit=(1200, 60),
     )
 
   async def get(self, id: int) -> CallProto:
@@ -57,7 +63,12 @@ class AsyncCallsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/call/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/call/{id}',
+      operation_id='call.get_call_info',
+      rate_limit=(10, 60),
+    )
 
   async def hangup_call(self, id: int) -> None:
     """Call Actions -- Hang up
@@ -71,7 +82,12 @@ class AsyncCallsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='PUT', sub_path=f'/api/v2/call/{id}/actions/hangup')
+    return await self._request(
+      method='PUT',
+      sub_path=f'/api/v2/call/{id}/actions/hangup',
+      operation_id='call.actions.hangup',
+      rate_limit=(1200, 60),
+    )
 
   async def initiate_ivr_call(self, request_body: OutboundIVRMessage) -> InitiatedIVRCallProto:
     """Call -- Initiate IVR Call
@@ -90,7 +106,11 @@ class AsyncCallsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/call/initiate_ivr_call', body=request_body
+      method='POST',
+      sub_path='/api/v2/call/initiate_ivr_call',
+      body=request_body,
+      operation_id='call.initiate_ivr_call',
+      rate_limit=(1200, 60),
     )
 
   async def initiate_ring_call(self, request_body: RingCallMessage) -> RingCallProto:
@@ -107,9 +127,15 @@ class AsyncCallsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/call', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/call',
+      body=request_body,
+      operation_id='call.call',
+      rate_limit=(5, 60),
+    )
 
-  async def list(
+  def list(
     self,
     cursor: Optional[str] = None,
     started_after: Optional[int] = None,
@@ -156,7 +182,7 @@ class AsyncCallsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/call',
       params={
@@ -166,8 +192,9 @@ class AsyncCallsResource(AsyncDialpadResource):
         'target_id': target_id,
         'target_type': target_type,
       },
-    ):
-      yield item
+      operation_id='call.list',
+      rate_limit=(1200, 60),
+    )
 
   async def set_call_label(self, id: int, request_body: AddCallLabelsMessage) -> CallProto:
     """Label -- Set
@@ -185,7 +212,11 @@ class AsyncCallsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PUT', sub_path=f'/api/v2/call/{id}/labels', body=request_body
+      method='PUT',
+      sub_path=f'/api/v2/call/{id}/labels',
+      body=request_body,
+      operation_id='call.put_call_labels',
+      rate_limit=(250, 60),
     )
 
   async def transfer(self, id: int, request_body: TransferCallMessage) -> TransferredCallProto:
@@ -202,7 +233,11 @@ class AsyncCallsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/call/{id}/transfer', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/call/{id}/transfer',
+      body=request_body,
+      operation_id='call.transfer_call',
+      rate_limit=(1200, 60),
     )
 
   async def unpark(self, id: int, request_body: UnparkCallMessage) -> RingCallProto:
@@ -219,5 +254,9 @@ class AsyncCallsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/call/{id}/unpark', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/call/{id}/unpark',
+      body=request_body,
+      operation_id='call.unpark',
+      rate_limit=(1200, 60),
     )
@@ -15,6 +15,8 @@ class AsyncChangelogEventSubscriptionsResource(AsyncDialpadResource):
   - /api/v2/subscriptions/changelog
   - /api/v2/subscriptions/changelog/{id}"""
 
+  __slots__ = ()
+
   async def create(
     self, request_body: CreateChangeLogEventSubscription
   ) -> ChangeLogEventSubscriptionProto:
@@ -38,7 +40,11 @@ class AsyncChangelogEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/subscriptions/changelog', body=request_body
+      method='POST',
+      sub_path='/api/v2/subscriptions/changelog',
+      body=request_body,
+      operation_id='webhook_change_log_event_subscription.create',
+      rate_limit=(1200, 60),
     )
 
   async def delete(self, id: int) -> ChangeLogEventSubscriptionProto:
@@ -59,7 +65,12 @@ class AsyncChangelogEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/changelog/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/changelog/{id}',
+      operation_id='webhook_change_log_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> ChangeLogEventSubscriptionProto:
     """Change Log -- Get
@@ -79,11 +90,14 @@ class AsyncChangelogEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/subscriptions/changelog/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/changelog/{id}',
+      operation_id='webhook_change_log_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
-    self, cursor: Optional[str] = None
-  ) -> AsyncIterator[ChangeLogEventSubscriptionProto]:
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[ChangeLogEventSubscriptionProto]:
     """Change Log -- List
 
     Gets a list of all the change log event subscriptions of a company.
@@ -101,10 +115,13 @@ class AsyncChangelogEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/subscriptions/changelog', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/subscriptions/changelog',
+      params={'cursor': cursor},
+      operation_id='webhook_change_log_event_subscription.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, id: str, request_body: UpdateChangeLogEventSubscription
@@ -128,5 +145,9 @@ class AsyncChangelogEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/changelog/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/changelog/{id}',
+      body=request_body,
+      operation_id='webhook_change_log_event_subscription.update',
+      rate_limit=(1200, 60),
     )
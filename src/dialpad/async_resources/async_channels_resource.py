@@ -17,6 +17,8 @@ class AsyncChannelsResource(AsyncDialpadResource):
   - /api/v2/channels/{id}
   - /api/v2/channels/{id}/members"""
 
+  __slots__ = ()
+
   async def add_member(self, id: int, request_body: AddChannelMemberMessage) -> MembersProto:
     """Member -- Add
 
@@ -33,7 +35,11 @@ class AsyncChannelsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/channels/{id}/members', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/channels/{id}/members',
+      body=request_body,
+      operation_id='channels.members.post',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateChannelMessage) -> ChannelProto:
@@ -50,7 +56,13 @@ class AsyncChannelsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/channels', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/channels',
+      body=request_body,
+      operation_id='channels.post',
+      rate_limit=(1200, 60),
+    )
 
   async def delete(self, id: int) -> None:
     """Channel -- Delete
@@ -66,7 +78,12 @@ class AsyncChannelsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/channels/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/channels/{id}',
+      operation_id='channels.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> ChannelProto:
     """Channel -- Get
@@ -82,9 +99,14 @@ class AsyncChannelsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/channels/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/channels/{id}',
+      operation_id='channels.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self, cursor: Optional[str] = None, state: Optional[str] = None
   ) -> AsyncIterator[ChannelProto]:
     """Channel -- List
@@ -101,14 +123,15 @@ class AsyncChannelsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/channels', params={'cursor': cursor, 'state': state}
-    ):
-      yield item
-
-  async def list_members(
-    self, id: int, cursor: Optional[str] = None
-  ) -> AsyncIterator[MembersProto]:
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/channels',
+      params={'cursor': cursor, 'state': state},
+      operation_id='channels.list',
+      rate_limit=(1200, 60),
+    )
+
+  def list_members(self, id: int, cursor: Optional[str] = None) -> AsyncIterator[MembersProto]:
     """Members -- List
 
     List all the members from a channel
@@ -123,10 +146,13 @@ class AsyncChannelsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path=f'/api/v2/channels/{id}/members', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/channels/{id}/members',
+      params={'cursor': cursor},
+      operation_id='channels.members.list',
+      rate_limit=(1200, 60),
+    )
 
   async def remove_member(self, id: int, request_body: RemoveChannelMemberMessage) -> None:
     """Member -- Remove
@@ -144,5 +170,9 @@ class AsyncChannelsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='DELETE', sub_path=f'/api/v2/channels/{id}/members', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/channels/{id}/members',
+      body=request_body,
+      operation_id='channels.members.delete',
+      rate_limit=(1200, 60),
     )
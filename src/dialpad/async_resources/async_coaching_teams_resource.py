@@ -16,6 +16,8 @@ class AsyncCoachingTeamsResource(AsyncDialpadResource):
   - /api/v2/coachingteams/{id}
   - /api/v2/coachingteams/{id}/members"""
 
+  __slots__ = ()
+
   async def add_member(
     self, id: int, request_body: CoachingTeamMemberMessage
   ) -> CoachingTeamMemberProto:
@@ -34,7 +36,11 @@ class AsyncCoachingTeamsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/coachingteams/{id}/members', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/coachingteams/{id}/members',
+      body=request_body,
+      operation_id='coaching_team.members.add',
+      rate_limit=(1200, 60),
     )
 
   async def get(self, id: int) -> CoachingTeamProto:
@@ -49,9 +55,14 @@ class AsyncCoachingTeamsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/coachingteams/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/coachingteams/{id}',
+      operation_id='coaching_team.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(self, cursor: Optional[str] = None) -> AsyncIterator[CoachingTeamProto]:
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[CoachingTeamProto]:
     """Coaching Team -- List
 
     Get a list of all coaching teams in the company. Added on Feb 3rd, 2022 for API v2.
@@ -63,12 +74,15 @@ class AsyncCoachingTeamsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/coachingteams', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/coachingteams',
+      params={'cursor': cursor},
+      operation_id='coaching_team.listall',
+      rate_limit=(1200, 60),
+    )
 
-  async def list_members(self, id: int) -> AsyncIterator[CoachingTeamMemberProto]:
+  def list_members(self, id: int) -> AsyncIterator[CoachingTeamMemberProto]:
     """Coaching Team -- List Members
 
     Get a list of members of a coaching team. Added on Jul 30th, 2021 for API v2.
@@ -80,7 +94,9 @@ class AsyncCoachingTeamsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path=f'/api/v2/coachingteams/{id}/members'
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/coachingteams/{id}/members',
+      operation_id='coaching_team.members.get',
+      rate_limit=(1200, 60),
+    )
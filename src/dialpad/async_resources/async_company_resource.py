@@ -12,6 +12,8 @@ class AsyncCompanyResource(AsyncDialpadResource):
   - /api/v2/company
   - /api/v2/company/{id}/smsoptout"""
 
+  __slots__ = ()
+
   async def get(self) -> CompanyProto:
     """Company -- Get
 
@@ -25,9 +27,11 @@ class AsyncCompanyResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path='/api/v2/company')
+    return await self._request(
+      method='GET', sub_path='/api/v2/company', operation_id='company.get', rate_limit=(1200, 60)
+    )
 
-  async def get_sms_opt_out_list(
+  def get_sms_opt_out_list(
     self,
     id: str,
     opt_out_state: Literal['opted_back_in', 'opted_out'],
@@ -51,9 +55,10 @@ class AsyncCompanyResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path=f'/api/v2/company/{id}/smsoptout',
       params={'a2p_campaign_id': a2p_campaign_id, 'cursor': cursor, 'opt_out_state': opt_out_state},
-    ):
-      yield item
+      operation_id='company.sms_opt_out',
+      rate_limit=(250, 60),
+    )
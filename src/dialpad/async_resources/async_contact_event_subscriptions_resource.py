@@ -15,6 +15,8 @@ class AsyncContactEventSubscriptionsResource(AsyncDialpadResource):
   - /api/v2/subscriptions/contact
   - /api/v2/subscriptions/contact/{id}"""
 
+  __slots__ = ()
+
   async def create(
     self, request_body: CreateContactEventSubscription
   ) -> ContactEventSubscriptionProto:
@@ -36,7 +38,11 @@ class AsyncContactEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/subscriptions/contact', body=request_body
+      method='POST',
+      sub_path='/api/v2/subscriptions/contact',
+      body=request_body,
+      operation_id='webhook_contact_event_subscription.create',
+      rate_limit=(1200, 60),
     )
 
   async def delete(self, id: int) -> ContactEventSubscriptionProto:
@@ -57,7 +63,12 @@ class AsyncContactEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/contact/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/contact/{id}',
+      operation_id='webhook_contact_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> ContactEventSubscriptionProto:
     """Contact Event -- Get
@@ -77,11 +88,14 @@ class AsyncContactEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/subscriptions/contact/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/contact/{id}',
+      operation_id='webhook_contact_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
-    self, cursor: Optional[str] = None
-  ) -> AsyncIterator[ContactEventSubscriptionProto]:
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[ContactEventSubscriptionProto]:
     """Contact Event -- List
 
     Gets a list of all the contact event subscriptions of a company.
@@ -99,10 +113,13 @@ class AsyncContactEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/subscriptions/contact', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/subscriptions/contact',
+      params={'cursor': cursor},
+      operation_id='webhook_contact_event_subscription.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, id: int, request_body: UpdateContactEventSubscription
@@ -126,5 +143,9 @@ class AsyncContactEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/contact/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/contact/{id}',
+      body=request_body,
+      operation_id='webhook_contact_event_subscription.update',
+      rate_limit=(1200, 60),
     )
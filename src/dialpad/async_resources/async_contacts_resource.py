@@ -16,6 +16,8 @@ class AsyncContactsResource(AsyncDialpadResource):
   - /api/v2/contacts
   - /api/v2/contacts/{id}"""
 
+  __slots__ = ()
+
   async def create(self, request_body: CreateContactMessage) -> ContactProto:
     """Contact -- Create
 
@@ -28,7 +30,13 @@ class AsyncContactsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/contacts', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/contacts',
+      body=request_body,
+      operation_id='contacts.create',
+      rate_limit=(100, 60),
+    )
 
   async def create_or_update(self, request_body: CreateContactMessageWithUid) -> ContactProto:
     """Contact -- Create or Update
@@ -42,7 +50,13 @@ class AsyncContactsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='PUT', sub_path='/api/v2/contacts', body=request_body)
+    return await self._request(
+      method='PUT',
+      sub_path='/api/v2/contacts',
+      body=request_body,
+      operation_id='contacts.create_with_uid',
+      rate_limit=(100, 60),
+    )
 
   async def delete(self, id: str) -> ContactProto:
     """Contact -- Delete
@@ -56,7 +70,12 @@ class AsyncContactsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/contacts/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/contacts/{id}',
+      operation_id='contacts.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: str) -> ContactProto:
     """Contact -- Get
@@ -72,9 +91,14 @@ class AsyncContactsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/contacts/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/contacts/{id}',
+      operation_id='contacts.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self,
     cursor: Optional[str] = None,
     include_local: Optional[bool] = None,
@@ -95,12 +119,13 @@ class AsyncContactsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/contacts',
       params={'cursor': cursor, 'include_local': include_local, 'owner_id': owner_id},
-    ):
-      yield item
+      operation_id='contacts.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(self, id: str, request_body: UpdateContactMessage) -> ContactProto:
     """Contact -- Update
@@ -115,4 +140,10 @@ class AsyncContactsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='PATCH', sub_path=f'/api/v2/contacts/{id}', body=request_body)
+    return await self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/contacts/{id}',
+      body=request_body,
+      operation_id='contacts.update',
+      rate_limit=(1200, 60),
+    )
@@ -18,6 +18,8 @@ class AsyncCustomIVRsResource(AsyncDialpadResource):
   - /api/v2/customivrs/{ivr_id}
   - /api/v2/customivrs/{target_type}/{target_id}/{ivr_type}"""
 
+  __slots__ = ()
+
   async def assign(
     self,
     ivr_type: Literal[
@@ -125,6 +127,8 @@ class AsyncCustomIVRsResource(AsyncDialpadResource):
       method='PATCH',
       sub_path=f'/api/v2/customivrs/{target_type}/{target_id}/{ivr_type}',
       body=request_body,
+      operation_id='ivr.update',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateCustomIvrMessage) -> CustomIvrDetailsProto:
@@ -141,9 +145,15 @@ class AsyncCustomIVRsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/customivrs', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/customivrs',
+      body=request_body,
+      operation_id='ivr.create',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self,
     target_id: int,
     target_type: Literal[
@@ -176,12 +186,13 @@ class AsyncCustomIVRsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/customivrs',
       params={'cursor': cursor, 'target_type': target_type, 'target_id': target_id},
-    ):
-      yield item
+      operation_id='custom_ivrs.get',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, ivr_id: str, request_body: UpdateCustomIvrDetailsMessage
@@ -199,7 +210,11 @@ class AsyncCustomIVRsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/customivrs/{ivr_id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/customivrs/{ivr_id}',
+      body=request_body,
+      operation_id='ivr_details.update',
+      rate_limit=(1200, 60),
     )
 
   async def unassign(
@@ -307,4 +322,6 @@ class AsyncCustomIVRsResource(AsyncDialpadResource):
       method='DELETE',
       sub_path=f'/api/v2/customivrs/{target_type}/{target_id}/{ivr_type}',
       body=request_body,
+      operation_id='ivr.delete',
+      rate_limit=(1200, 60),
     )
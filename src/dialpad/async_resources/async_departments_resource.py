@@ -20,6 +20,8 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
   - /api/v2/departments/{id}
   - /api/v2/departments/{id}/operators"""
 
+  __slots__ = ()
+
   async def add_operator(self, id: int, request_body: AddOperatorMessage) -> UserOrRoomProto:
     """Operator -- Add
 
@@ -36,7 +38,11 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/departments/{id}/operators', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/departments/{id}/operators',
+      body=request_body,
+      operation_id='departments.operators.post',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateDepartmentMessage) -> DepartmentProto:
@@ -55,7 +61,13 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/departments', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/departments',
+      body=request_body,
+      operation_id='departments.create',
+      rate_limit=(1200, 60),
+    )
 
   async def delete(self, id: int) -> DepartmentProto:
     """Departments-- Delete
@@ -71,7 +83,12 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/departments/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/departments/{id}',
+      operation_id='departments.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> DepartmentProto:
     """Department -- Get
@@ -85,9 +102,14 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/departments/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/departments/{id}',
+      operation_id='departments.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self,
     cursor: Optional[str] = None,
     name_search: Optional[str] = None,
@@ -106,12 +128,13 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/departments',
       params={'cursor': cursor, 'office_id': office_id, 'name_search': name_search},
-    ):
-      yield item
+      operation_id='departments.listall',
+      rate_limit=(1200, 60),
+    )
 
   async def list_operators(self, id: int) -> OperatorCollection:
     """Operator -- List
@@ -125,7 +148,12 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/departments/{id}/operators')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/departments/{id}/operators',
+      operation_id='departments.operators.get',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(self, id: int, request_body: UpdateDepartmentMessage) -> DepartmentProto:
     """Departments-- Update
@@ -143,7 +171,11 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/departments/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/departments/{id}',
+      body=request_body,
+      operation_id='departments.update',
+      rate_limit=(1200, 60),
     )
 
   async def remove_operator(self, id: int, request_body: RemoveOperatorMessage) -> UserOrRoomProto:
@@ -162,5 +194,9 @@ class AsyncDepartmentsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='DELETE', sub_path=f'/api/v2/departments/{id}/operators', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/departments/{id}/operators',
+      body=request_body,
+      operation_id='departments.operators.delete',
+      rate_limit=(1200, 60),
     )
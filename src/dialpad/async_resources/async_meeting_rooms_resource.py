@@ -10,7 +10,9 @@ class AsyncMeetingRoomsResource(AsyncDialpadResource):
   Handles API operations for:
   - /api/v2/conference/rooms"""
 
-  async def list(self, cursor: Optional[str] = None) -> AsyncIterator[RoomProto]:
+  __slots__ = ()
+
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[RoomProto]:
     """Meeting Room -- List
 
     Lists all conference rooms.
@@ -24,7 +26,10 @@ class AsyncMeetingRoomsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/conference/rooms', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/conference/rooms',
+      params={'cursor': cursor},
+      operation_id='conference-rooms.list',
+      rate_limit=(1200, 60),
+    )
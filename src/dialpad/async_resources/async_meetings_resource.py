@@ -10,7 +10,9 @@ class AsyncMeetingsResource(AsyncDialpadResource):
   Handles API operations for:
   - /api/v2/conference/meetings"""
 
-  async def list(
+  __slots__ = ()
+
+  def list(
     self, cursor: Optional[str] = None, room_id: Optional[str] = None
   ) -> AsyncIterator[MeetingSummaryProto]:
     """Meeting Summary -- List
@@ -27,9 +29,10 @@ class AsyncMeetingsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/conference/meetings',
       params={'cursor': cursor, 'room_id': room_id},
-    ):
-      yield item
+      operation_id='conference-meetings.list',
+      rate_limit=(1200, 60),
+    )
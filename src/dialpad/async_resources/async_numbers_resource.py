@@ -21,6 +21,8 @@ class AsyncNumbersResource(AsyncDialpadResource):
   - /api/v2/numbers/{number}
   - /api/v2/numbers/{number}/assign"""
 
+  __slots__ = ()
+
   async def assign(self, number: str, request_body: AssignNumberTargetMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -38,7 +40,11 @@ class AsyncNumbersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/numbers/{number}/assign', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/numbers/{number}/assign',
+      body=request_body,
+      operation_id='numbers.assign_number.post',
+      rate_limit=(1200, 60),
     )
 
   async def auto_assign(self, request_body: AssignNumberTargetGenericMessage) -> NumberProto:
@@ -56,7 +62,13 @@ class AsyncNumbersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/numbers/assign', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/numbers/assign',
+      body=request_body,
+      operation_id='numbers.assign_target_number.post',
+      rate_limit=(1200, 60),
+    )
 
   async def format_number(
     self, country_code: Optional[str] = None, number: Optional[str] = None
@@ -79,6 +91,8 @@ class AsyncNumbersResource(AsyncDialpadResource):
       method='POST',
       sub_path='/api/v2/numbers/format',
       params={'country_code': country_code, 'number': number},
+      operation_id='format.post',
+      rate_limit=(1200, 60),
     )
 
   async def get(self, number: str) -> NumberProto:
@@ -97,9 +111,14 @@ class AsyncNumbersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/numbers/{number}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/numbers/{number}',
+      operation_id='numbers.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self, cursor: Optional[str] = None, status: Optional[str] = None
   ) -> AsyncIterator[NumberProto]:
     """Dialpad Number -- List
@@ -118,10 +137,13 @@ class AsyncNumbersResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/numbers', params={'cursor': cursor, 'status': status}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/numbers',
+      params={'cursor': cursor, 'status': status},
+      operation_id='numbers.list',
+      rate_limit=(1200, 60),
+    )
 
   async def swap(self, request_body: SwapNumberMessage) -> NumberProto:
     """Dialpad Number -- Swap
@@ -141,7 +163,13 @@ class AsyncNumbersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/numbers/swap', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/numbers/swap',
+      body=request_body,
+      operation_id='numbers.swap_number.post',
+      rate_limit=(1200, 60),
+    )
 
   async def unassign(self, number: str, release: Optional[bool] = None) -> NumberProto:
     """Dialpad Number -- Unassign
@@ -159,5 +187,9 @@ class AsyncNumbersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='DELETE', sub_path=f'/api/v2/numbers/{number}', params={'release': release}
+      method='DELETE',
+      sub_path=f'/api/v2/numbers/{number}',
+      params={'release': release},
+      operation_id='numbers.delete',
+      rate_limit=(1200, 60),
     )
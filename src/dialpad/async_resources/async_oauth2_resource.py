@@ -16,6 +16,8 @@ class AsyncOAuth2Resource(AsyncDialpadResource):
   - /oauth2/deauthorize
   - /oauth2/token"""
 
+  __slots__ = ()
+
   async def authorize_token(
     self,
     client_id: str,
@@ -50,13 +52,16 @@ class AsyncOAuth2Resource(AsyncDialpadResource):
         'client_id': client_id,
         'state': state,
       },
+      operation_id='oauth2.authorize.get',
     )
 
   async def deauthorize_token(self) -> None:
     """Token -- Deauthorize
 
     Revokes oauth2 tokens for a given oauth app."""
-    return await self._request(method='POST', sub_path='/oauth2/deauthorize')
+    return await self._request(
+      method='POST', sub_path='/oauth2/deauthorize', operation_id='oauth2.deauthorize.post'
+    )
 
   async def redeem_token(
     self, request_body: Union[AuthorizationCodeGrantBodySchema, RefreshTokenGrantBodySchema]
@@ -70,4 +75,6 @@ class AsyncOAuth2Resource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/oauth2/token', body=request_body)
+    return await self._request(
+      method='POST', sub_path='/oauth2/token', body=request_body, operation_id='oauth2.token.post'
+    )
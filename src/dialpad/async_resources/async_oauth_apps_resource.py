@@ -8,6 +8,8 @@ class AsyncOAuthAppsResource(AsyncDialpadResource):
   Handles API operations for:
   - /api/v2/oauth_apps/{id}/toggle"""
 
+  __slots__ = ()
+
   async def toggle(
     self,
     id: str,
@@ -28,5 +30,9 @@ class AsyncOAuthAppsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/oauth_apps/{id}/toggle', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/oauth_apps/{id}/toggle',
+      body=request_body,
+      operation_id='oauth_apps.toggle',
+      rate_limit=(1200, 60),
     )
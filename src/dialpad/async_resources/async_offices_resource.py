@@ -39,6 +39,8 @@ class AsyncOfficesResource(AsyncDialpadResource):
   - /api/v2/offices/{office_id}/plan
   - /api/v2/offices/{office_id}/teams"""
 
+  __slots__ = ()
+
   async def add_operator(self, id: int, request_body: AddOperatorMessage) -> UserOrRoomProto:
     """Operator -- Add
 
@@ -55,7 +57,11 @@ class AsyncOfficesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/offices/{id}/operators', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/offices/{id}/operators',
+      body=request_body,
+      operation_id='offices.operators.post',
+      rate_limit=(1200, 60),
     )
 
   async def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
@@ -74,7 +80,11 @@ class AsyncOfficesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/offices/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/offices/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_office_number.post',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateOfficeMessage) -> OfficeUpdateResponse:
@@ -89,7 +99,13 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/offices', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/offices',
+      body=request_body,
+      operation_id='offices.create',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> OfficeProto:
     """Office -- Get
@@ -105,7 +121,12 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/offices/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}',
+      operation_id='offices.get',
+      rate_limit=(1200, 60),
+    )
 
   async def get_billing_plan(self, office_id: int) -> PlanProto:
     """Billing Plan -- Get
@@ -121,7 +142,12 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/offices/{office_id}/plan')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/plan',
+      operation_id='plan.get',
+      rate_limit=(1200, 60),
+    )
 
   async def get_e911_address(self, id: int) -> E911GetProto:
     """E911 Address -- Get
@@ -137,9 +163,14 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/offices/{id}/e911')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}/e911',
+      operation_id='offices.e911.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self, active_only: Optional[bool] = None, cursor: Optional[str] = None
   ) -> AsyncIterator[OfficeProto]:
     """Office -- List
@@ -156,12 +187,13 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/offices',
       params={'cursor': cursor, 'active_only': active_only},
-    ):
-      yield item
+      operation_id='offices.list',
+      rate_limit=(1200, 60),
+    )
 
   async def list_available_licenses(self, office_id: int) -> AvailableLicensesProto:
     """Licenses -- List Available
@@ -178,10 +210,13 @@ class AsyncOfficesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='GET', sub_path=f'/api/v2/offices/{office_id}/available_licenses'
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/available_licenses',
+      operation_id='plan.available_licenses.get',
+      rate_limit=(1200, 60),
     )
 
-  async def list_call_centers(
+  def list_call_centers(
     self, office_id: int, cursor: Optional[str] = None
   ) -> AsyncIterator[CallCenterProto]:
     """Call Centers -- List
@@ -196,12 +231,15 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path=f'/api/v2/offices/{office_id}/callcenters', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/callcenters',
+      params={'cursor': cursor},
+      operation_id='callcenters.list',
+      rate_limit=(1200, 60),
+    )
 
-  async def list_coaching_teams(
+  def list_coaching_teams(
     self, office_id: int, cursor: Optional[str] = None
   ) -> AsyncIterator[CoachingTeamProto]:
     """Coaching Team -- List
@@ -216,12 +254,15 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path=f'/api/v2/offices/{office_id}/teams', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/teams',
+      params={'cursor': cursor},
+      operation_id='coaching_team.list',
+      rate_limit=(1200, 60),
+    )
 
-  async def list_departments(
+  def list_departments(
     self, office_id: int, cursor: Optional[str] = None
   ) -> AsyncIterator[DepartmentProto]:
     """Department -- List
@@ -236,10 +277,13 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path=f'/api/v2/offices/{office_id}/departments', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/departments',
+      params={'cursor': cursor},
+      operation_id='departments.list',
+      rate_limit=(1200, 60),
+    )
 
   async def list_offduty_statuses(self, id: int) -> OffDutyStatusesProto:
     """Off-Duty Status -- List
@@ -253,7 +297,12 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/offices/{id}/offdutystatuses')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}/offdutystatuses',
+      operation_id='offices.offdutystatuses.get',
+      rate_limit=(1200, 60),
+    )
 
   async def list_operators(self, id: int) -> OperatorCollection:
     """Operator -- List
@@ -267,7 +316,12 @@ class AsyncOfficesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/offices/{id}/operators')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}/operators',
+      operation_id='offices.operators.get',
+      rate_limit=(1200, 60),
+    )
 
   async def remove_operator(self, id: int, request_body: RemoveOperatorMessage) -> UserOrRoomProto:
     """Operator -- Remove
@@ -285,7 +339,11 @@ class AsyncOfficesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='DELETE', sub_path=f'/api/v2/offices/{id}/operators', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/offices/{id}/operators',
+      body=request_body,
+      operation_id='offices.operators.delete',
+      rate_limit=(1200, 60),
     )
 
   async def unassign_number(self, id: int, request_body: UnassignNumberMessage) -> NumberProto:
@@ -304,7 +362,11 @@ class AsyncOfficesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/offices/{id}/unassign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/offices/{id}/unassign_number',
+      body=request_body,
+      operation_id='numbers.office_unassign_number.post',
+      rate_limit=(1200, 60),
     )
 
   async def update_e911_address(self, id: int, request_body: E911UpdateMessage) -> E911GetProto:
@@ -323,5 +385,9 @@ class AsyncOfficesResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PUT', sub_path=f'/api/v2/offices/{id}/e911', body=request_body
+      method='PUT',
+      sub_path=f'/api/v2/offices/{id}/e911',
+      body=request_body,
+      operation_id='offices.e911.update',
+      rate_limit=(1200, 60),
     )
@@ -13,6 +13,8 @@ class AsyncRecordingShareLinksResource(AsyncDialpadResource):
   - /api/v2/recordingsharelink
   - /api/v2/recordingsharelink/{id}"""
 
+  __slots__ = ()
+
   async def create(self, request_body: CreateRecordingShareLink) -> RecordingShareLink:
     """Recording Sharelink -- Create
 
@@ -28,7 +30,11 @@ class AsyncRecordingShareLinksResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/recordingsharelink', body=request_body
+      method='POST',
+      sub_path='/api/v2/recordingsharelink',
+      body=request_body,
+      operation_id='recording_share_link.create',
+      rate_limit=(100, 60),
     )
 
   async def delete(self, id: str) -> RecordingShareLink:
@@ -45,7 +51,12 @@ class AsyncRecordingShareLinksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/recordingsharelink/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/recordingsharelink/{id}',
+      operation_id='recording_share_link.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: str) -> RecordingShareLink:
     """Recording Sharelink -- Get
@@ -61,7 +72,12 @@ class AsyncRecordingShareLinksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/recordingsharelink/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/recordingsharelink/{id}',
+      operation_id='recording_share_link.get',
+      rate_limit=(1200, 60),
+    )
 
   async def update(self, id: str, request_body: UpdateRecordingShareLink) -> RecordingShareLink:
     """Recording Sharelink -- Update
@@ -79,5 +95,9 @@ class AsyncRecordingShareLinksResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PUT', sub_path=f'/api/v2/recordingsharelink/{id}', body=request_body
+      method='PUT',
+      sub_path=f'/api/v2/recordingsharelink/{id}',
+      body=request_body,
+      operation_id='recording_share_link.update',
+      rate_limit=(100, 60),
     )
@@ -24,6 +24,8 @@ class AsyncRoomsResource(AsyncDialpadResource):
   - /api/v2/rooms/{parent_id}/deskphones
   - /api/v2/rooms/{parent_id}/deskphones/{id}"""
 
+  __slots__ = ()
+
   async def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -40,7 +42,11 @@ class AsyncRoomsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/rooms/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/rooms/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_room_number.post',
+      rate_limit=(1200, 60),
     )
 
   async def assign_phone_pin(
@@ -64,7 +70,11 @@ class AsyncRoomsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/rooms/international_pin', body=request_body
+      method='POST',
+      sub_path='/api/v2/rooms/international_pin',
+      body=request_body,
+      operation_id='deskphones.rooms.create_international_pin',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateRoomMessage) -> RoomProto:
@@ -81,7 +91,13 @@ class AsyncRoomsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/rooms', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/rooms',
+      body=request_body,
+      operation_id='rooms.post',
+      rate_limit=(1200, 60),
+    )
 
   async def delete(self, id: int) -> RoomProto:
     """Room -- Delete
@@ -97,7 +113,12 @@ class AsyncRoomsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/rooms/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/rooms/{id}',
+      operation_id='rooms.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def delete_room_phone(self, id: str, parent_id: int) -> None:
     """Room Phone -- Delete
@@ -113,7 +134,10 @@ class AsyncRoomsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='DELETE', sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}'
+      method='DELETE',
+      sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.rooms.delete',
+      rate_limit=(1200, 60),
     )
 
   async def get(self, id: int) -> RoomProto:
@@ -130,7 +154,9 @@ class AsyncRoomsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/rooms/{id}')
+    return await self._request(
+      method='GET', sub_path=f'/api/v2/rooms/{id}', operation_id='rooms.get', rate_limit=(1200, 60)
+    )
 
   async def get_room_phone(self, id: str, parent_id: int) -> DeskPhone:
     """Room Phone -- Get
@@ -145,9 +171,14 @@ class AsyncRoomsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.rooms.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self, cursor: Optional[str] = None, office_id: Optional[int] = None
   ) -> AsyncIterator[RoomProto]:
     """Room -- List
@@ -164,12 +195,15 @@ class AsyncRoomsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/rooms', params={'cursor': cursor, 'office_id': office_id}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/rooms',
+      params={'cursor': cursor, 'office_id': office_id},
+      operation_id='rooms.list',
+      rate_limit=(1200, 60),
+    )
 
-  async def list_room_phones(self, parent_id: int) -> AsyncIterator[DeskPhone]:
+  def list_room_phones(self, parent_id: int) -> AsyncIterator[DeskPhone]:
     """Room Phone -- List
 
     Gets all desk phones under a room. Added on May 17, 2018 for API v2.
@@ -181,10 +215,12 @@ class AsyncRoomsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path=f'/api/v2/rooms/{parent_id}/deskphones'
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/rooms/{parent_id}/deskphones',
+      operation_id='deskphones.rooms.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(self, id: int, request_body: UpdateRoomMessage) -> RoomProto:
     """Room -- Update
@@ -201,7 +237,13 @@ class AsyncRoomsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='PATCH', sub_path=f'/api/v2/rooms/{id}', body=request_body)
+    return await self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/rooms/{id}',
+      body=request_body,
+      operation_id='rooms.patch',
+      rate_limit=(1200, 60),
+    )
 
   async def unassign_number(self, id: int, request_body: UnassignNumberMessage) -> NumberProto:
     """Dialpad Number -- Unassign
@@ -219,5 +261,9 @@ class AsyncRoomsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/rooms/{id}/unassign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/rooms/{id}/unassign_number',
+      body=request_body,
+      operation_id='numbers.room_unassign_number.post',
+      rate_limit=(1200, 60),
     )
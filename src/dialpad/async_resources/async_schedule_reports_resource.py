@@ -14,6 +14,8 @@ class AsyncScheduleReportsResource(AsyncDialpadResource):
   - /api/v2/schedulereports
   - /api/v2/schedulereports/{id}"""
 
+  __slots__ = ()
+
   async def create(
     self, request_body: ProcessScheduleReportsMessage
   ) -> ScheduleReportsStatusEventSubscriptionProto:
@@ -30,7 +32,13 @@ class AsyncScheduleReportsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/schedulereports', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/schedulereports',
+      body=request_body,
+      operation_id='schedule_reports.create',
+      rate_limit=(1200, 60),
+    )
 
   async def delete(self, id: int) -> ScheduleReportsStatusEventSubscriptionProto:
     """Schedule reports -- Delete
@@ -46,7 +54,12 @@ class AsyncScheduleReportsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/schedulereports/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/schedulereports/{id}',
+      operation_id='schedule_reports.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> ScheduleReportsStatusEventSubscriptionProto:
     """Schedule reports -- Get
@@ -62,9 +75,14 @@ class AsyncScheduleReportsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/schedulereports/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/schedulereports/{id}',
+      operation_id='schedule_reports.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self, cursor: Optional[str] = None
   ) -> AsyncIterator[ScheduleReportsStatusEventSubscriptionProto]:
     """Schedule reports -- List
@@ -80,10 +98,13 @@ class AsyncScheduleReportsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/schedulereports', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/schedulereports',
+      params={'cursor': cursor},
+      operation_id='schedule_reports.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, id: int, request_body: ProcessScheduleReportsMessage
@@ -103,5 +124,9 @@ class AsyncScheduleReportsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/schedulereports/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/schedulereports/{id}',
+      body=request_body,
+      operation_id='schedule_reports.update',
+      rate_limit=(1200, 60),
     )
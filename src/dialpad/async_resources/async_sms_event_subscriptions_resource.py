@@ -15,6 +15,8 @@ class AsyncSmsEventSubscriptionsResource(AsyncDialpadResource):
   - /api/v2/subscriptions/sms
   - /api/v2/subscriptions/sms/{id}"""
 
+  __slots__ = ()
+
   async def create(self, request_body: CreateSmsEventSubscription) -> SmsEventSubscriptionProto:
     """SMS Event -- Create
 
@@ -38,7 +40,11 @@ class AsyncSmsEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path='/api/v2/subscriptions/sms', body=request_body
+      method='POST',
+      sub_path='/api/v2/subscriptions/sms',
+      body=request_body,
+      operation_id='webhook_sms_event_subscription.create',
+      rate_limit=(1200, 60),
     )
 
   async def delete(self, id: int) -> SmsEventSubscriptionProto:
@@ -57,7 +63,12 @@ class AsyncSmsEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/sms/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/sms/{id}',
+      operation_id='webhook_sms_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> SmsEventSubscriptionProto:
     """SMS Event -- Get
@@ -75,9 +86,14 @@ class AsyncSmsEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/subscriptions/sms/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/sms/{id}',
+      operation_id='webhook_sms_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(
+  def list(
     self,
     cursor: Optional[str] = None,
     target_id: Optional[int] = None,
@@ -114,12 +130,13 @@ class AsyncSmsEventSubscriptionsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/subscriptions/sms',
       params={'cursor': cursor, 'target_type': target_type, 'target_id': target_id},
-    ):
-      yield item
+      operation_id='webhook_sms_event_subscription.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(
     self, id: int, request_body: UpdateSmsEventSubscription
@@ -141,5 +158,9 @@ class AsyncSmsEventSubscriptionsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/sms/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/sms/{id}',
+      body=request_body,
+      operation_id='webhook_sms_event_subscription.update',
+      rate_limit=(1200, 60),
     )
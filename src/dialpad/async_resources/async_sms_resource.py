@@ -8,6 +8,8 @@ class AsyncSmsResource(AsyncDialpadResource):
   Handles API operations for:
   - /api/v2/sms"""
 
+  __slots__ = ()
+
   async def send(self, request_body: SendSMSMessage) -> SMSProto:
     """SMS -- Send
 
@@ -26,4 +28,10 @@ class AsyncSmsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/sms', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/sms',
+      body=request_body,
+      operation_id='sms.send',
+      rate_limit=(100, 60),
+    )
@@ -11,6 +11,8 @@ class AsyncUserDevicesResource(AsyncDialpadResource):
   - /api/v2/userdevices
   - /api/v2/userdevices/{id}"""
 
+  __slots__ = ()
+
   async def get(self, id: str) -> UserDeviceProto:
     """User Device -- Get
 
@@ -25,9 +27,14 @@ class AsyncUserDevicesResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/userdevices/{id}')
-
-  async def list(
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/userdevices/{id}',
+      operation_id='userdevices.get',
+      rate_limit=(1200, 60),
+    )
+
+  def list(
     self, cursor: Optional[str] = None, user_id: Optional[str] = None
   ) -> AsyncIterator[UserDeviceProto]:
     """User Device -- List
@@ -44,7 +51,10 @@ class AsyncUserDevicesResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/userdevices', params={'cursor': cursor, 'user_id': user_id}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/userdevices',
+      params={'cursor': cursor, 'user_id': user_id},
+      operation_id='userdevices.list',
+      rate_limit=(1200, 60),
+    )
@@ -49,6 +49,8 @@ class AsyncUsersResource(AsyncDialpadResource):
   - /api/v2/users/{parent_id}/deskphones
   - /api/v2/users/{parent_id}/deskphones/{id}"""
 
+  __slots__ = ()
+
   async def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -65,7 +67,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_user_number.post',
+      rate_limit=(1200, 60),
     )
 
   async def create(self, request_body: CreateUserMessage) -> UserProto:
@@ -82,7 +88,13 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/users', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/users',
+      body=request_body,
+      operation_id='users.create',
+      rate_limit=(1200, 60),
+    )
 
   async def delete(self, id: str) -> UserProto:
     """User -- Delete
@@ -98,7 +110,12 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/users/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/users/{id}',
+      operation_id='users.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def delete_deskphone(self, id: str, parent_id: int) -> None:
     """Desk Phone -- Delete
@@ -114,7 +131,10 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='DELETE', sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}'
+      method='DELETE',
+      sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.users.delete',
+      rate_limit=(1200, 60),
     )
 
   async def get(self, id: str) -> UserProto:
@@ -131,7 +151,9 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/users/{id}')
+    return await self._request(
+      method='GET', sub_path=f'/api/v2/users/{id}', operation_id='users.get', rate_limit=(1200, 60)
+    )
 
   async def get_caller_id(self, id: str) -> CallerIdProto:
     """Caller ID -- Get
@@ -147,7 +169,12 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/users/{id}/caller_id')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/users/{id}/caller_id',
+      operation_id='caller_id.users.get',
+      rate_limit=(1200, 60),
+    )
 
   async def get_deskphone(self, id: str, parent_id: int) -> DeskPhone:
     """Desk Phone -- Get
@@ -162,7 +189,12 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.users.get',
+      rate_limit=(1200, 60),
+    )
 
   async def get_e911_address(self, id: int) -> E911GetProto:
     """E911 Address -- Get
@@ -178,7 +210,12 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/users/{id}/e911')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/users/{id}/e911',
+      operation_id='users.e911.get',
+      rate_limit=(1200, 60),
+    )
 
   async def initiate_call(self, id: str, request_body: InitiateCallMessage) -> InitiatedCallProto:
     """Call -- Initiate
@@ -194,10 +231,14 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/initiate_call', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/initiate_call',
+      body=request_body,
+      operation_id='users.initiate_call',
+      rate_limit=(5, 60),
     )
 
-  async def list(
+  def list(
     self,
     company_admin: Optional[bool] = None,
     cursor: Optional[str] = None,
@@ -231,7 +272,7 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
+    return self._iter_request(
       method='GET',
       sub_path='/api/v2/users',
       params={
@@ -241,10 +282,11 @@ class AsyncUsersResource(AsyncDialpadResource):
         'email': email,
         'number': number,
       },
-    ):
-      yield item
+      operation_id='users.list',
+      rate_limit=(1200, 60),
+    )
 
-  async def list_deskphones(self, parent_id: int) -> AsyncIterator[DeskPhone]:
+  def list_deskphones(self, parent_id: int) -> AsyncIterator[DeskPhone]:
     """Desk Phone -- List
 
     Gets all desk phones under a user. Added on May 17, 2018 for API v2.
@@ -256,12 +298,14 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path=f'/api/v2/users/{parent_id}/deskphones'
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/users/{parent_id}/deskphones',
+      operation_id='deskphones.users.list',
+      rate_limit=(1200, 60),
+    )
 
-  async def list_personas(self, id: str) -> AsyncIterator[PersonaProto]:
+  def list_personas(self, id: str) -> AsyncIterator[PersonaProto]:
     """Persona -- List
 
     Provides a list of personas for a user.
@@ -277,8 +321,12 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(method='GET', sub_path=f'/api/v2/users/{id}/personas'):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/users/{id}/personas',
+      operation_id='users.personas.get',
+      rate_limit=(1200, 60),
+    )
 
   async def move_office(self, id: str, request_body: MoveOfficeMessage) -> UserProto:
     """User -- Switch Office
@@ -296,7 +344,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/move_office', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/move_office',
+      body=request_body,
+      operation_id='users.move_office.patch',
+      rate_limit=(1200, 60),
     )
 
   async def partial_update(self, id: str, request_body: UpdateUserMessage) -> UserProto:
@@ -314,7 +366,13 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='PATCH', sub_path=f'/api/v2/users/{id}', body=request_body)
+    return await self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}',
+      body=request_body,
+      operation_id='users.update',
+      rate_limit=(1200, 60),
+    )
 
   async def set_caller_id(self, id: str, request_body: SetCallerIdMessage) -> CallerIdProto:
     """Caller ID -- POST
@@ -332,7 +390,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/caller_id', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/caller_id',
+      body=request_body,
+      operation_id='caller_id.users.post',
+      rate_limit=(1200, 60),
     )
 
   async def set_e911_address(self, id: int, request_body: E911UpdateMessage) -> E911GetProto:
@@ -350,7 +412,13 @@ class AsyncUsersResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='PUT', sub_path=f'/api/v2/users/{id}/e911', body=request_body)
+    return await self._request(
+      method='PUT',
+      sub_path=f'/api/v2/users/{id}/e911',
+      body=request_body,
+      operation_id='users.e911.update',
+      rate_limit=(1200, 60),
+    )
 
   async def toggle_active_call_recording(
     self, id: int, request_body: UpdateActiveCallMessage
@@ -370,7 +438,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/activecall', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/activecall',
+      body=request_body,
+      operation_id='users.update_active_call',
+      rate_limit=(1200, 60),
     )
 
   async def toggle_active_call_vi(self, id: int, request_body: ToggleViMessage) -> ToggleViProto:
@@ -387,7 +459,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/togglevi', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/togglevi',
+      body=request_body,
+      operation_id='users.toggle_call_vi',
+      rate_limit=(1200, 60),
     )
 
   async def toggle_dnd(self, id: str, request_body: ToggleDNDMessage) -> ToggleDNDProto:
@@ -406,7 +482,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/togglednd', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/togglednd',
+      body=request_body,
+      operation_id='users.toggle_dnd',
+      rate_limit=(1200, 60),
     )
 
   async def trigger_screenpop(
@@ -427,7 +507,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/screenpop', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/screenpop',
+      body=request_body,
+      operation_id='screen_pop.initiate',
+      rate_limit=(5, 60),
     )
 
   async def unassign_number(self, id: int, request_body: UnassignNumberMessage) -> NumberProto:
@@ -446,7 +530,11 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/unassign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/unassign_number',
+      body=request_body,
+      operation_id='numbers.user_unassign_number.post',
+      rate_limit=(1200, 60),
     )
 
   async def update_user_status(self, id: int, request_body: SetStatusMessage) -> SetStatusProto:
@@ -463,5 +551,9 @@ class AsyncUsersResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/status', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/status',
+      body=request_body,
+      operation_id='users.update_status',
+      rate_limit=(1200, 60),
     )
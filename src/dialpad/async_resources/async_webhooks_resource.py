@@ -11,6 +11,8 @@ class AsyncWebhooksResource(AsyncDialpadResource):
   - /api/v2/webhooks
   - /api/v2/webhooks/{id}"""
 
+  __slots__ = ()
+
   async def create(self, request_body: CreateWebhook) -> WebhookProto:
     """Webhook -- Create
 
@@ -27,7 +29,13 @@ class AsyncWebhooksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/webhooks', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/webhooks',
+      body=request_body,
+      operation_id='webhooks.create',
+      rate_limit=(100, 60),
+    )
 
   async def delete(self, id: int) -> WebhookProto:
     """Webhook -- Delete
@@ -43,7 +51,12 @@ class AsyncWebhooksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/webhooks/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/webhooks/{id}',
+      operation_id='webhooks.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> WebhookProto:
     """Webhook -- Get
@@ -59,9 +72,14 @@ class AsyncWebhooksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/webhooks/{id}')
-
-  async def list(self, cursor: Optional[str] = None) -> AsyncIterator[WebhookProto]:
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/webhooks/{id}',
+      operation_id='webhooks.get',
+      rate_limit=(1200, 60),
+    )
+
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[WebhookProto]:
     """Webhook -- List
 
     Gets a list of all the webhooks that are associated with the company.
@@ -75,10 +93,13 @@ class AsyncWebhooksResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/webhooks', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/webhooks',
+      params={'cursor': cursor},
+      operation_id='webhooks.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(self, id: str, request_body: UpdateWebhook) -> WebhookProto:
     """Webhook -- Update
@@ -95,4 +116,10 @@ class AsyncWebhooksResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='PATCH', sub_path=f'/api/v2/webhooks/{id}', body=request_body)
+    return await self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/webhooks/{id}',
+      body=request_body,
+      operation_id='webhook.update',
+      rate_limit=(1200, 60),
+    )
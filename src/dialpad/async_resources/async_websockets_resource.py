@@ -15,6 +15,8 @@ class AsyncWebsocketsResource(AsyncDialpadResource):
   - /api/v2/websockets
   - /api/v2/websockets/{id}"""
 
+  __slots__ = ()
+
   async def create(self, request_body: CreateWebsocket) -> WebsocketProto:
     """Websocket -- Create
 
@@ -31,7 +33,13 @@ class AsyncWebsocketsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='POST', sub_path='/api/v2/websockets', body=request_body)
+    return await self._request(
+      method='POST',
+      sub_path='/api/v2/websockets',
+      body=request_body,
+      operation_id='websockets.create',
+      rate_limit=(250, 60),
+    )
 
   async def delete(self, id: int) -> WebsocketProto:
     """Websocket -- Delete
@@ -47,7 +55,12 @@ class AsyncWebsocketsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='DELETE', sub_path=f'/api/v2/websockets/{id}')
+    return await self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/websockets/{id}',
+      operation_id='websockets.delete',
+      rate_limit=(1200, 60),
+    )
 
   async def get(self, id: int) -> WebsocketProto:
     """Websocket -- Get
@@ -63,9 +76,14 @@ class AsyncWebsocketsResource(AsyncDialpadResource):
 
     Returns:
         A successful response"""
-    return await self._request(method='GET', sub_path=f'/api/v2/websockets/{id}')
+    return await self._request(
+      method='GET',
+      sub_path=f'/api/v2/websockets/{id}',
+      operation_id='websockets.get',
+      rate_limit=(1200, 60),
+    )
 
-  async def list(self, cursor: Optional[str] = None) -> AsyncIterator[WebsocketProto]:
+  def list(self, cursor: Optional[str] = None) -> AsyncIterator[WebsocketProto]:
     """Websocket -- List
 
     Gets a list of all the websockets that are associated with the company.
@@ -79,10 +97,13 @@ class AsyncWebsocketsResource(AsyncDialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    async for item in self._iter_request(
-      method='GET', sub_path='/api/v2/websockets', params={'cursor': cursor}
-    ):
-      yield item
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/websockets',
+      params={'cursor': cursor},
+      operation_id='websockets.list',
+      rate_limit=(1200, 60),
+    )
 
   async def partial_update(self, id: int, request_body: UpdateWebsocket) -> WebsocketProto:
     """Websocket -- Update
@@ -100,5 +121,9 @@ class AsyncWebsocketsResource(AsyncDialpadResource):
     Returns:
         A successful response"""
     return await self._request(
-      method='PATCH', sub_path=f'/api/v2/websockets/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/websockets/{id}',
+      body=request_body,
+      operation_id='websockets.update',
+      rate_limit=(1200, 60),
     )
@@ -1,7 +1,11 @@
 from typing import AsyncIterator, Optional
 
+from dialpad.rate_limit import RateLimit
+
 
 class AsyncDialpadResource(object):
+  __slots__ = ('_client',)
+
   def __init__(self, client):
     self._client = client
 
@@ -12,20 +16,35 @@ class AsyncDialpadResource(object):
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
   ) -> dict:
     return await self._client.request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
+      method=method,
+      sub_path=sub_path,
+      params=params,
+      body=body,
+      headers=headers,
+      operation_id=operation_id,
+      rate_limit=rate_limit,
     )
 
-  async def _iter_request(
+  def _iter_request(
     self,
     method: str = 'GET',
     sub_path: Optional[str] = None,
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
   ) -> AsyncIterator[dict]:
-    async for item in self._client.iter_request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
-    ):
-      yield item
+    return self._client.iter_request(
+      method=method,
+      sub_path=sub_path,
+      params=params,
+      body=body,
+      headers=headers,
+      operation_id=operation_id,
+      rate_limit=rate_limit,
+    )
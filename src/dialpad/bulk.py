@@ -0,0 +1,193 @@
+"""Running the same API operation for many keys (such as call IDs) concurrently.
+
+Results are yielded as they complete, while the keys that failed are collected separately so that
+they can be retried:
+
+    results = BulkResults(dp.transcripts.get, call_ids)
+    for call_id, transcript in results:
+      ...
+    retry_later(results.failed)
+"""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+  Any,
+  AsyncIterable,
+  AsyncIterator,
+  Awaitable,
+  Callable,
+  Dict,
+  Hashable,
+  Iterable,
+  Iterator,
+  Optional,
+  Tuple,
+  Union,
+)
+
+from .rate_limit import RateLimit, TokenBucket
+
+_DONE = object()
+
+
+def fallback_limiter(client, rate_limit: RateLimit) -> Optional[TokenBucket]:
+  """Returns a TokenBucket for an operation's documented rate limit, if the client has no limiter.
+
+  A client with a rate limiter already throttles every operation to its documented limit.
+  """
+  if client._rate_limiter is not None:
+    return None
+  return TokenBucket(*rate_limit)
+
+
+def field(response: Any, name: str) -> Any:
+  """Reads a field of a response (which is a model rather than a dict if the client has models)."""
+  return response.get(name) if isinstance(response, dict) else getattr(response, name)
+
+
+def _unique(keys: Iterable[Hashable]) -> Iterator[Hashable]:
+  seen = set()
+  for key in keys:
+    if key not in seen:
+      seen.add(key)
+      yield key
+
+
+class BulkResults:
+  """Calls `operation(key)` for each distinct key on a pool of threads.
+
+  Iterating yields `(key, result)` pairs in the order that they complete. Keys whose call raised are
+  recorded in `failed` (mapped to the error) instead. Keys are read lazily, with at most two per
+  worker in flight, so they can come from a paginated list that is still being fetched.
+
+  Args:
+      operation: The function to call with each key (such as `dp.transcripts.get`).
+      keys: The keys, of which duplicates are skipped.
+      max_workers: The number of concurrent calls.
+      limiter: A TokenBucket to throttle the calls with.
+      unique: Whether to skip duplicate keys. Otherwise, keys needn't be hashable (but `failed`
+        can't be used, so `operation` should catch its own errors).
+  """
+
+  def __init__(
+    self,
+    operation: Callable[[Any], Any],
+    keys: Iterable[Hashable],
+    max_workers: int = 8,
+    limiter: Optional[TokenBucket] = None,
+    unique: bool = True,
+  ):
+    self._operation = operation
+    self._keys = keys
+    self._max_workers = max_workers
+    self._limiter = limiter
+    self._unique = unique
+    self.failed: Dict[Hashable, BaseException] = {}
+
+  def _call(self, key: Hashable) -> Any:
+    if self._limiter is not None:
+      self._limiter.acquire()
+    return self._operation(key)
+
+  def __iter__(self) -> Iterator[Tuple[Hashable, Any]]:
+    keys = _unique(self._keys) if self._unique else iter(self._keys)
+    pending = {}
+    pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='dialpad-bulk')
+    try:
+      while True:
+        while len(pending) < self._max_workers * 2:
+          key = next(keys, _DONE)
+          if key is _DONE:
+            break
+          pending[pool.submit(self._call, key)] = key
+
+        if not pending:
+          return
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+          key = pending.pop(future)
+          error = future.exception()
+          if error is not None:
+            self.failed[key] = error
+            continue
+          yield key, future.result()
+    finally:
+      # Don't wait for the calls that are still in flight if the caller stopped early.
+      pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aunique(
+  keys: Union[Iterable[Hashable], AsyncIterable[Hashable]], unique: bool
+) -> AsyncIterator:
+  seen = set()
+  if not hasattr(keys, '__aiter__'):
+    keys = _as_async(keys)
+
+  async for key in keys:
+    if not unique:
+      yield key
+    elif key not in seen:
+      seen.add(key)
+      yield key
+
+
+async def _as_async(keys: Iterable[Hashable]) -> AsyncIterator[Hashable]:
+  for key in keys:
+    yield key
+
+
+class AsyncBulkResults:
+  """The async equivalent of BulkResults, with up to `concurrency` calls in flight at once.
+
+  `keys` may also be an async iterable (such as an AsyncDialpadClient list method's).
+  """
+
+  def __init__(
+    self,
+    operation: Callable[[Any], Awaitable[Any]],
+    keys: Union[Iterable[Hashable], AsyncIterable[Hashable]],
+    concurrency: int = 8,
+    limiter: Optional[TokenBucket] = None,
+    unique: bool = True,
+  ):
+    self._operation = operation
+    self._keys = keys
+    self._concurrency = concurrency
+    self._limiter = limiter
+    self._unique = unique
+    self.failed: Dict[Hashable, BaseException] = {}
+
+  async def _call(self, key: Hashable) -> Any:
+    if self._limiter is not None:
+      await self._limiter.acquire_async()
+    return await self._operation(key)
+
+  async def __aiter__(self) -> AsyncIterator[Tuple[Hashable, Any]]:
+    keys = _aunique(self._keys, self._unique)
+    pending = {}
+    try:
+      while True:
+        while keys is not None and len(pending) < self._concurrency:
+          try:
+            key = await keys.__anext__()
+          except StopAsyncIteration:
+            keys = None
+            break
+          pending[asyncio.ensure_future(self._call(key))] = key
+
+        if not pending:
+          return
+
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+          key = pending.pop(task)
+          error = task.exception()
+          if error is not None:
+            self.failed[key] = error
+            continue
+          yield key, task.result()
+    finally:
+      for task in pending:
+        task.cancel()
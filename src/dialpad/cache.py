@@ -0,0 +1,129 @@
+"""An opt-in, client-side cache of GET responses for read-mostly API resources."""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+CacheKey = Tuple[str, str, str, Optional[str]]
+
+# Returned by ResponseCache.get when there is no fresh entry for a key (None is a valid response).
+MISS = object()
+
+MUTATING_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+
+def _segments(path: str) -> Tuple[str, ...]:
+  return tuple(segment for segment in path.split('/') if segment)
+
+
+def _overlaps(a: Tuple[str, ...], b: Tuple[str, ...]) -> bool:
+  """Returns True if one of the paths is the same as, or nested beneath, the other."""
+  n = min(len(a), len(b))
+  return a[:n] == b[:n]
+
+
+class ResponseCache:
+  """A thread-safe TTL + LRU cache of decoded GET responses.
+
+  Entries are keyed by the request path, query params and company id, and expire after a TTL which
+  can be set per resource (e.g. `'users'`) or per operation (e.g. `'users.get'`). A TTL of 0
+  disables caching, so `ResponseCache(ttl=0, ttls={'users': 300})` only caches users. Once the
+  cache holds `maxsize` entries, the least recently used entry is evicted to make room.
+
+  Any POST, PUT, PATCH or DELETE issued by a client through the cache invalidates the entries for
+  that path, along with the entries for any path above or beneath it (so that deleting
+  `/api/v2/users/1` also invalidates `/api/v2/users/1/devices`).
+
+  A single ResponseCache is safe to share between threads, asyncio tasks and clients.
+  """
+
+  def __init__(
+    self, maxsize: int = 1024, ttl: float = 60.0, ttls: Optional[Dict[str, float]] = None
+  ):
+    if maxsize <= 0:
+      raise ValueError(f'Invalid cache size: {maxsize}')
+
+    self.maxsize = maxsize
+    self.ttl = ttl
+    self.ttls = dict(ttls or {})
+    self.hits = 0
+    self.misses = 0
+    # Bumped by each invalidation, so that a GET which was in flight at the time isn't cached.
+    self.generation = 0
+    self._entries: 'OrderedDict[CacheKey, Tuple[float, Any]]' = OrderedDict()
+    self._lock = threading.Lock()
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  @staticmethod
+  def key(
+    method: str, sub_path: str, params: Optional[dict] = None, company_id: Optional[str] = None
+  ) -> CacheKey:
+    """Returns the cache key for a request."""
+    return (
+      str(method).upper(),
+      '/' + '/'.join(_segments(sub_path)),
+      json.dumps(params or {}, sort_keys=True, default=str),
+      str(company_id) if company_id else None,
+    )
+
+  def ttl_for(self, operation_id: Optional[str]) -> float:
+    """Returns the TTL (in seconds) for responses to the given operation."""
+    if operation_id in self.ttls:
+      return self.ttls[operation_id]
+
+    resource = (operation_id or '').split('.')[0]
+    return self.ttls.get(resource, self.ttl)
+
+  def get(self, key: CacheKey) -> Any:
+    """Returns a copy of the fresh entry for the key, or MISS."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None or entry[0] <= time.monotonic():
+        self._entries.pop(key, None)
+        self.misses += 1
+        return MISS
+
+      self._entries.move_to_end(key)
+      self.hits += 1
+
+    # Callers are free to mutate the responses they get back, so each one gets its own copy.
+    return copy.deepcopy(entry[1])
+
+  def set(
+    self,
+    key: CacheKey,
+    value: Any,
+    operation_id: Optional[str] = None,
+    generation: Optional[int] = None,
+  ) -> None:
+    """Caches a response, unless the cache has been invalidated since `generation` was read."""
+    ttl = self.ttl_for(operation_id)
+    if ttl <= 0:
+      return
+
+    value = copy.deepcopy(value)
+    with self._lock:
+      if generation is not None and generation != self.generation:
+        return
+
+      self._entries[key] = (time.monotonic() + ttl, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.maxsize:
+        self._entries.popitem(last=False)
+
+  def invalidate(self, sub_path: str) -> None:
+    """Drops the entries for the given path, and any path above or beneath it."""
+    segments = _segments(sub_path)
+    with self._lock:
+      self.generation += 1
+      for key in [k for k in self._entries if _overlaps(_segments(k[1]), segments)]:
+        del self._entries[key]
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
@@ -0,0 +1,293 @@
+"""Parallel export of call history, by splitting a time range into concurrently-paginated shards."""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
+
+from .bulk import field
+from .checkpoint import Checkpoint
+from .schemas.call import CallProto
+
+logger = logging.getLogger(__name__)
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+# A half-open [start, end) window of call start times (in UTC ms-since-epoch).
+Shard = Tuple[int, int]
+
+
+def _shards(started_after: int, started_before: int, window_ms: int) -> Iterator[Shard]:
+  """Splits the time range into windows, most recent first to match the order of calls.list."""
+  end = started_before
+  while end > started_after + 1:
+    start = max(started_after + 1, end - window_ms)
+    yield start, end
+    end = start
+
+
+def _list_calls(client, shard: Shard, target_id: Optional[int], target_type: Optional[str]):
+  """Returns the (not yet started) calls.list iterator over the calls of a shard."""
+  return client.calls.list(
+    started_after=shard[0] - 1,
+    started_before=shard[1],
+    target_id=target_id,
+    target_type=target_type,
+  )
+
+
+def _split_if_dense(
+  shard: Shard, first_page, split_pages: int, min_window_ms: int
+) -> Optional[List[Shard]]:
+  """Returns the two halves of the shard if its first page suggests it spans many pages."""
+  start, end = shard
+  if not field(first_page, 'cursor') or end - start <= min_window_ms:
+    return None
+
+  timestamps = [
+    int(field(item, 'date_started'))
+    for item in field(first_page, 'items') or []
+    if field(item, 'date_started')
+  ]
+  if not timestamps:
+    return None
+
+  # Estimate how many pages the shard spans from the time range covered by the first page.
+  covered_ms = max(1, end - min(timestamps))
+  if (end - start) / covered_ms <= split_pages:
+    return None
+
+  middle = start + (end - start) // 2
+  logger.debug('Splitting dense shard %s into two halves at %s', shard, middle)
+  return [(middle, end), (start, middle)]
+
+
+class _Split(list):
+  """The result of a shard that was split in two rather than being fetched."""
+
+
+class _Part(list):
+  """Some of the calls of a shard, along with the checkpoint to continue from (if any)."""
+
+  def __init__(self, shard: Shard, checkpoint: Optional[Checkpoint]):
+    super().__init__()
+    self.shard = shard
+    self.checkpoint = checkpoint
+
+
+def _export_shard(
+  client,
+  shard: Shard,
+  checkpoint: Optional[Checkpoint],
+  target_id: Optional[int],
+  target_type: Optional[str],
+  split_pages: int,
+  min_window_ms: int,
+  part_pages: int,
+  stop: threading.Event,
+) -> Union[_Part, _Split, None]:
+  read = checkpoint.pages if checkpoint else 0
+  calls = _list_calls(client, shard, target_id, target_type).resume(checkpoint)
+  part = _Part(shard, checkpoint)
+  pages = calls.iter_pages(max_pages=read + part_pages)
+  try:
+    for page in pages:
+      if calls.pages == read and checkpoint is None:
+        halves = _split_if_dense(shard, page, split_pages, min_window_ms)
+        if halves:
+          return _Split(halves)
+
+      part.extend(field(page, 'items') or [])
+      # The export was stopped early, so there's no point in fetching the rest of the shard.
+      if stop.is_set():
+        return None
+  finally:
+    pages.close()
+
+  # Continue from the checkpoint in another part, unless the last page has been read.
+  if calls.cursor and calls.pages > read:
+    part.checkpoint = calls.checkpoint
+  else:
+    part.checkpoint = None
+  return part
+
+
+def export_calls(
+  client,
+  started_after: int,
+  started_before: int,
+  target_id: Optional[int] = None,
+  target_type: Optional[str] = None,
+  window_ms: int = DAY_MS,
+  min_window_ms: int = 60 * 1000,
+  split_pages: int = 20,
+  max_workers: int = 8,
+  part_pages: int = 10,
+) -> Iterator[CallProto]:
+  """Exports calls that started within a time range, paginating time windows concurrently.
+
+  The range is split into `window_ms` shards which are fetched on a pool of `max_workers` threads.
+  Shards whose first page suggests that they span more than `split_pages` pages are split in half
+  (down to `min_window_ms`) so that dense periods don't serialize the export. Calls are yielded in
+  the same reverse-chronological order as `client.calls.list()`.
+
+  Args:
+      client: The DialpadClient to export calls with.
+      started_after: Only includes calls that started after this timestamp (UTC ms-since-epoch).
+      started_before: Only includes calls that started before this timestamp (UTC ms-since-epoch).
+      target_id: The ID of a target to filter against.
+      target_type: The target type associated with the target ID.
+      window_ms: The initial width of each shard.
+      min_window_ms: The narrowest shard that will be split.
+      split_pages: The estimated number of pages beyond which a shard will be split.
+      max_workers: The number of shards that are fetched concurrently.
+      part_pages: The number of pages of a shard that are fetched (and held) at a time, before
+        the rest of the shard is fetched.
+
+  Returns:
+      An iterator of CallProto items.
+  """
+  shards = _shards(started_after, started_before, window_ms)
+  stop = threading.Event()
+  pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dialpad-export')
+
+  def submit(shard: Shard, checkpoint: Optional[Checkpoint] = None):
+    return pool.submit(
+      _export_shard,
+      client,
+      shard,
+      checkpoint,
+      target_id,
+      target_type,
+      split_pages,
+      min_window_ms,
+      part_pages,
+      stop,
+    )
+
+  # Futures are kept in output order, and a couple of shards are kept queued up per worker so
+  # that the pool stays busy while the oldest shard is being consumed.
+  pending = deque()
+  try:
+    while True:
+      while len(pending) < max_workers * 2:
+        shard = next(shards, None)
+        if shard is None:
+          break
+        pending.append(submit(shard))
+
+      if not pending:
+        return
+
+      result = pending.popleft().result()
+      if isinstance(result, _Split):
+        pending.extendleft(reversed([submit(half) for half in result]))
+        continue
+
+      # The rest of the shard is fetched while this part of it is being consumed.
+      if result.checkpoint is not None:
+        pending.appendleft(submit(result.shard, result.checkpoint))
+
+      yield from result
+  finally:
+    # Shards that are being fetched stop after their current page, rather than blocking the caller.
+    stop.set()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _export_shard_async(
+  client,
+  shard: Shard,
+  checkpoint: Optional[Checkpoint],
+  target_id: Optional[int],
+  target_type: Optional[str],
+  split_pages: int,
+  min_window_ms: int,
+  part_pages: int,
+  semaphore: asyncio.Semaphore,
+) -> Union[_Part, _Split]:
+  async with semaphore:
+    read = checkpoint.pages if checkpoint else 0
+    calls = _list_calls(client, shard, target_id, target_type).resume(checkpoint)
+    part = _Part(shard, checkpoint)
+    pages = calls.iter_pages(max_pages=read + part_pages)
+    try:
+      async for page in pages:
+        if calls.pages == read and checkpoint is None:
+          halves = _split_if_dense(shard, page, split_pages, min_window_ms)
+          if halves:
+            return _Split(halves)
+
+        part.extend(field(page, 'items') or [])
+    finally:
+      await pages.aclose()
+
+    if calls.cursor and calls.pages > read:
+      part.checkpoint = calls.checkpoint
+    else:
+      part.checkpoint = None
+    return part
+
+
+async def export_calls_async(
+  client,
+  started_after: int,
+  started_before: int,
+  target_id: Optional[int] = None,
+  target_type: Optional[str] = None,
+  window_ms: int = DAY_MS,
+  min_window_ms: int = 60 * 1000,
+  split_pages: int = 20,
+  concurrency: int = 8,
+  part_pages: int = 10,
+) -> AsyncIterator[CallProto]:
+  """Exports calls that started within a time range, paginating time windows concurrently.
+
+  This is the AsyncDialpadClient equivalent of `export_calls`, where up to `concurrency` shards are
+  fetched at once by separate tasks.
+  """
+  shards = _shards(started_after, started_before, window_ms)
+  semaphore = asyncio.Semaphore(concurrency)
+
+  def submit(shard: Shard, checkpoint: Optional[Checkpoint] = None) -> asyncio.Task:
+    return asyncio.ensure_future(
+      _export_shard_async(
+        client,
+        shard,
+        checkpoint,
+        target_id,
+        target_type,
+        split_pages,
+        min_window_ms,
+        part_pages,
+        semaphore,
+      )
+    )
+
+  pending = deque()
+  try:
+    while True:
+      while len(pending) < concurrency * 2:
+        shard = next(shards, None)
+        if shard is None:
+          break
+        pending.append(submit(shard))
+
+      if not pending:
+        return
+
+      result = await pending.popleft()
+      if isinstance(result, _Split):
+        pending.extendleft(reversed([submit(half) for half in result]))
+        continue
+
+      if result.checkpoint is not None:
+        pending.appendleft(submit(result.shard, result.checkpoint))
+
+      for item in result:
+        yield item
+  finally:
+    for task in pending:
+      task.cancel()
@@ -0,0 +1,422 @@
+"""Resumable iteration over paginated responses, with optional persistent checkpoints."""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, NamedTuple, Optional, Type
+
+from .models.base import Model
+
+
+class Checkpoint(NamedTuple):
+  """The position of a paginated iterator, from which a later iteration can resume.
+
+  Attributes:
+      cursor: The cursor of the page that is being read (None for the first page).
+      pages: The number of pages that have been read in full.
+      offset: The number of items of the current page that have already been returned.
+  """
+
+  cursor: Optional[str] = None
+  pages: int = 0
+  offset: int = 0
+
+  @property
+  def done(self) -> bool:
+    """Whether every page has been read."""
+    return self.pages > 0 and self.cursor is None
+
+  def to_dict(self) -> dict:
+    return self._asdict()
+
+  @classmethod
+  def from_dict(cls, data: dict) -> 'Checkpoint':
+    return cls(**{field: data[field] for field in cls._fields if field in data})
+
+
+def checkpoint_key(
+  method: str = 'GET',
+  sub_path: Optional[str] = None,
+  params: Optional[dict] = None,
+  company_id: Optional[str] = None,
+) -> str:
+  """Identifies a paginated request in a CheckpointStore, regardless of its cursor."""
+  # Unset params aren't sent, so they don't distinguish one request from another.
+  params = {k: v for k, v in (params or {}).items() if k != 'cursor' and v is not None}
+  return json.dumps(
+    [
+      str(method).upper(),
+      f'/{(sub_path or "").strip("/")}',
+      params,
+      str(company_id) if company_id else None,
+    ],
+    sort_keys=True,
+    default=str,
+  )
+
+
+class CheckpointStore:
+  """Base class for the stores that checkpoints are saved to between pages."""
+
+  def load(self, key: str) -> Optional[Checkpoint]:
+    raise NotImplementedError
+
+  def save(self, key: str, checkpoint: Checkpoint) -> None:
+    raise NotImplementedError
+
+  def clear(self, key: str) -> None:
+    raise NotImplementedError
+
+
+class FileCheckpointStore(CheckpointStore):
+  """Saves checkpoints to a JSON file, which is replaced atomically on each save."""
+
+  def __init__(self, path: str):
+    self.path = path
+    self._lock = threading.Lock()
+
+  def _read(self) -> Dict[str, dict]:
+    try:
+      with open(self.path, encoding='utf-8') as f:
+        return json.load(f)
+    except FileNotFoundError:
+      return {}
+
+  def _write(self, checkpoints: Dict[str, dict]) -> None:
+    tmp_path = f'{self.path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+      json.dump(checkpoints, f)
+    os.replace(tmp_path, self.path)
+
+  def load(self, key: str) -> Optional[Checkpoint]:
+    with self._lock:
+      data = self._read().get(key)
+    return Checkpoint.from_dict(data) if data is not None else None
+
+  def save(self, key: str, checkpoint: Checkpoint) -> None:
+    with self._lock:
+      checkpoints = self._read()
+      checkpoints[key] = checkpoint.to_dict()
+      self._write(checkpoints)
+
+  def clear(self, key: str) -> None:
+    with self._lock:
+      checkpoints = self._read()
+      if checkpoints.pop(key, None) is not None:
+        self._write(checkpoints)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+  """Saves checkpoints to a table in a SQLite database."""
+
+  def __init__(self, path: str, table: str = 'dialpad_checkpoints'):
+    if not table.isidentifier():
+      raise ValueError(f'Invalid table name "{table}"')
+
+    self.path = path
+    self.table = table
+    with self._connect() as conn:
+      conn.execute(
+        f'CREATE TABLE IF NOT EXISTS {table} '
+        '(key TEXT PRIMARY KEY, cursor TEXT, pages INTEGER, item_offset INTEGER)'
+      )
+
+  def _connect(self) -> sqlite3.Connection:
+    # A connection per operation, so that the store can be shared between threads.
+    return sqlite3.connect(self.path)
+
+  def load(self, key: str) -> Optional[Checkpoint]:
+    conn = self._connect()
+    try:
+      row = conn.execute(
+        f'SELECT cursor, pages, item_offset FROM {self.table} WHERE key = ?', (key,)
+      ).fetchone()
+    finally:
+      conn.close()
+    return Checkpoint(*row) if row else None
+
+  def save(self, key: str, checkpoint: Checkpoint) -> None:
+    conn = self._connect()
+    try:
+      with conn:
+        conn.execute(
+          f'INSERT OR REPLACE INTO {self.table} (key, cursor, pages, item_offset) '
+          'VALUES (?, ?, ?, ?)',
+          (key, *checkpoint),
+        )
+    finally:
+      conn.close()
+
+  def clear(self, key: str) -> None:
+    conn = self._connect()
+    try:
+      with conn:
+        conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+    finally:
+      conn.close()
+
+
+class _PageIteratorBase:
+  def __init__(
+    self,
+    fetch_pages: Callable[[Optional[str]], Any],
+    model: Optional[Type[Model]] = None,
+    store: Optional[CheckpointStore] = None,
+    key: Optional[str] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    limit: Optional[int] = None,
+  ):
+    self._fetch_pages = fetch_pages
+    self._limit = limit
+    self._model = model
+    self._store = store
+    self._key = key
+    self._start = checkpoint
+    self._items = None
+    self.cursor: Optional[str] = None
+    self.pages = 0
+    self.offset = 0
+
+  @property
+  def checkpoint(self) -> Checkpoint:
+    """The position of the iterator, which can be passed to `resume` to continue from there."""
+    return Checkpoint(self.cursor, self.pages, self.offset)
+
+  def resume(self, checkpoint: Optional[Checkpoint]):
+    """Resumes from a checkpoint (rather than from the start) once iteration begins."""
+    if self._items is not None:
+      raise RuntimeError('Cannot resume an iterator that has already started')
+
+    self._start = checkpoint
+    return self
+
+  def _begin(self) -> Optional[Checkpoint]:
+    start = self._start
+    if start is None and self._store is not None:
+      start = self._store.load(self._key)
+
+    if start is not None:
+      self.cursor, self.pages, self.offset = start
+
+    return start
+
+  def _started(self, items):
+    if self._items is not None:
+      raise RuntimeError('The iterator has already started')
+
+    self._items = items
+    return items
+
+  def _to_page(self, page: dict):
+    return self._model.from_dict(page) if self._model is not None else page
+
+  def _page_items(self, page: dict) -> list:
+    if self._model is not None and 'items' in page:
+      return self._model.from_dict(page).items or []
+    return page.get('items') or []
+
+  def _end_page(self, page: dict) -> bool:
+    """Advances past a page, and returns whether there are more to read."""
+    self.cursor = page.get('cursor') or None
+    self.pages += 1
+    self.offset = 0
+    if self._store is not None:
+      if self.cursor:
+        self._store.save(self._key, self.checkpoint)
+      else:
+        self._store.clear(self._key)
+
+    return bool(self.cursor)
+
+
+class PageIterator(_PageIteratorBase):
+  """Iterates over the items of a paginated response, keeping track of its position.
+
+  The `cursor`, `pages` and `offset` attributes (or the `checkpoint` property) report how far the
+  iteration has got. If a CheckpointStore is given, then the checkpoint is saved to it after each
+  page has been read, loaded from it when iteration begins, and cleared once the last page has been
+  read; so an iteration that was interrupted picks up from the start of the page it was on.
+
+  If `limit` is given, then iteration stops (and the page that was being read is released) once
+  that many items have been returned.
+  """
+
+  def __iter__(self) -> 'PageIterator':
+    return self
+
+  def __next__(self) -> Any:
+    if self._items is None:
+      self._items = self._iter_items()
+    return next(self._items)
+
+  def iter_pages(
+    self, limit: Optional[int] = None, max_pages: Optional[int] = None
+  ) -> Iterator[Any]:
+    """Yields whole pages (with their `items` and `cursor`) rather than individual items.
+
+    Each page is only counted as read once the next one is requested, so the checkpoint of an
+    iteration that stops part-way through a page points back to the start of that page.
+
+    Args:
+        limit: Stop once this many items have been returned, trimming the last page to fit.
+        max_pages: Stop once this many pages have been returned.
+    """
+    return self._started(self._iter_whole_pages(limit, max_pages))
+
+  def close(self) -> None:
+    if self._items is not None:
+      self._items.close()
+
+  def _iter_items(self) -> Iterator[Any]:
+    start = self._begin()
+    if start is not None and start.done:
+      return
+
+    skip = self.offset
+    remaining = self._limit
+    if remaining == 0:
+      return
+
+    pages = self._fetch_pages(self.cursor)
+    try:
+      for page in pages:
+        for item in self._page_items(page):
+          if skip:
+            skip -= 1
+            continue
+
+          self.offset += 1
+          yield item
+          if remaining is not None:
+            remaining -= 1
+            if not remaining:
+              return
+
+        # Only the last part of each page has its cursor.
+        if 'cursor' in page and not self._end_page(page):
+          return
+    finally:
+      pages.close()
+
+  def _iter_whole_pages(self, limit: Optional[int], max_pages: Optional[int]) -> Iterator[Any]:
+    start = self._begin()
+    if (start is not None and start.done) or limit == 0 or max_pages == 0:
+      return
+
+    skip = self.offset
+    returned = 0
+    items = []
+    pages = self._fetch_pages(self.cursor)
+    try:
+      for part in pages:
+        # Streamed pages arrive in parts, and only the last part of each page has its cursor.
+        items.extend(part.get('items') or [])
+        if 'cursor' not in part:
+          continue
+
+        page = dict(part, items=items[skip:])
+        items = []
+        skip = 0
+        if limit is not None and returned + len(page['items']) > limit:
+          page['items'] = page['items'][: limit - returned]
+          yield self._to_page(page)
+          self.offset += len(page['items'])
+          return
+
+        returned += len(page['items'])
+        yield self._to_page(page)
+        if not self._end_page(page) or self.pages == max_pages or returned == limit:
+          return
+    finally:
+      pages.close()
+
+
+class AsyncPageIterator(_PageIteratorBase):
+  """The async counterpart of PageIterator."""
+
+  def __aiter__(self) -> 'AsyncPageIterator':
+    return self
+
+  async def __anext__(self) -> Any:
+    if self._items is None:
+      self._items = self._iter_items()
+    return await self._items.__anext__()
+
+  def iter_pages(
+    self, limit: Optional[int] = None, max_pages: Optional[int] = None
+  ) -> AsyncIterator[Any]:
+    """Yields whole pages (with their `items` and `cursor`) rather than individual items.
+
+    See PageIterator.iter_pages.
+    """
+    return self._started(self._iter_whole_pages(limit, max_pages))
+
+  async def aclose(self) -> None:
+    if self._items is not None:
+      await self._items.aclose()
+
+  async def _iter_items(self) -> AsyncIterator[Any]:
+    start = self._begin()
+    if start is not None and start.done:
+      return
+
+    skip = self.offset
+    remaining = self._limit
+    if remaining == 0:
+      return
+
+    pages = self._fetch_pages(self.cursor)
+    try:
+      async for page in pages:
+        for item in self._page_items(page):
+          if skip:
+            skip -= 1
+            continue
+
+          self.offset += 1
+          yield item
+          if remaining is not None:
+            remaining -= 1
+            if not remaining:
+              return
+
+        # Only the last part of each page has its cursor.
+        if 'cursor' in page and not self._end_page(page):
+          return
+    finally:
+      await pages.aclose()
+
+  async def _iter_whole_pages(
+    self, limit: Optional[int], max_pages: Optional[int]
+  ) -> AsyncIterator[Any]:
+    start = self._begin()
+    if (start is not None and start.done) or limit == 0 or max_pages == 0:
+      return
+
+    skip = self.offset
+    returned = 0
+    items = []
+    pages = self._fetch_pages(self.cursor)
+    try:
+      async for part in pages:
+        # Streamed pages arrive in parts, and only the last part of each page has its cursor.
+        items.extend(part.get('items') or [])
+        if 'cursor' not in part:
+          continue
+
+        page = dict(part, items=items[skip:])
+        items = []
+        skip = 0
+        if limit is not None and returned + len(page['items']) > limit:
+          page['items'] = page['items'][: limit - returned]
+          yield self._to_page(page)
+          self.offset += len(page['items'])
+          return
+
+        returned += len(page['items'])
+        yield self._to_page(page)
+        if not self._end_page(page) or self.pages == max_pages or returned == limit:
+          return
+    finally:
+      await pages.aclose()
@@ -1,11 +1,51 @@
-from typing import Iterator, Optional
+import time
+from functools import cached_property
+from typing import Dict, Iterator, Optional, Tuple, Union
 
 import requests
+import requests.adapters
 
+from .cache import MISS, MUTATING_METHODS, ResponseCache
+from .checkpoint import Checkpoint, CheckpointStore, PageIterator, checkpoint_key
+from .coalesce import SingleFlight
+from .download import GzipDecoder
+from .json_codec import JSONCodec, get_codec
+from .json_stream import CHUNK_SIZE, ItemsParser
+from .models.base import response_model
+from .prefetch import prefetch_iter
+from .rate_limit import RateLimit, RateLimiter
 from .resources import DialpadResourcesMixin
+from .retry import RetryPolicy
 
 hosts = dict(live='https://dialpad.com', sandbox='https://sandbox.dialpad.com')
 
+# Either a single timeout (in seconds), or a (connect timeout, read timeout) tuple.
+Timeout = Union[float, Tuple[float, float]]
+
+
+def build_session(
+  pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False
+) -> requests.Session:
+  """Builds a requests.Session with connection pools of the given size.
+
+  The resulting session can be shared between several DialpadClient instances (via the `session`
+  constructor argument) so that they all draw from the same pool of kept-alive connections.
+
+  Args:
+      pool_connections: The number of per-host connection pools to keep.
+      pool_maxsize: The maximum number of connections to keep open to each host. This should be at
+        least as large as the number of threads that make requests concurrently.
+      pool_block: Whether to wait for a free connection (rather than opening and then discarding an
+        extra one) when all of a host's connections are in use.
+  """
+  session = requests.Session()
+  adapter = requests.adapters.HTTPAdapter(
+    pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+  )
+  session.mount('https://', adapter)
+  session.mount('http://', adapter)
+  return session
+
 
 class DialpadClient(DialpadResourcesMixin):
   def __init__(
@@ -14,11 +54,39 @@ class DialpadClient(DialpadResourcesMixin):
     sandbox: bool = False,
     base_url: Optional[str] = None,
     company_id: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    prefetch_pages: int = 0,
+    cache: Optional[ResponseCache] = None,
+    coalesce_requests: bool = False,
+    json_codec: Optional[Union[str, JSONCodec]] = None,
+    models: bool = False,
+    stream_pages: bool = False,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    session: Optional[requests.Session] = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    timeout: Optional[Timeout] = None,
+    keep_alive: bool = True,
   ):
     self._token = token
-    self._session = requests.Session()
+    self._owns_session = session is None
+    self._session = session or build_session(
+      pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
+    self._timeout = timeout
+    self._keep_alive = keep_alive
     self._base_url = base_url or hosts.get('sandbox' if sandbox else 'live')
     self._company_id = company_id
+    self._rate_limiter = rate_limiter
+    self._retry_policy = retry_policy
+    self._prefetch_pages = prefetch_pages
+    self._cache = cache
+    self._json = get_codec(json_codec)
+    self._models = models
+    self._stream_pages = stream_pages
+    self._checkpoint_store = checkpoint_store
+    self._single_flight = SingleFlight() if coalesce_requests else None
 
   @property
   def company_id(self):
@@ -32,6 +100,80 @@ class DialpadClient(DialpadResourcesMixin):
   def company_id(self):
     del self._company_id
 
+  def __enter__(self) -> 'DialpadClient':
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    self.close()
+
+  def close(self) -> None:
+    """Releases the client's pooled connections (unless its session was supplied by the caller)."""
+    if self._owns_session:
+      self._session.close()
+    self._forget_resources()
+
+  def _forget_resources(self) -> None:
+    # The memoized resources refer back to the client, so dropping them breaks that cycle and lets
+    # the client be freed as soon as it's unreferenced, rather than by the cyclic GC.
+    for name in list(vars(self)):
+      if isinstance(getattr(type(self), name, None), cached_property):
+        del self.__dict__[name]
+
+  def pool_stats(self) -> Dict[str, dict]:
+    """Returns connection pool statistics for each host that the session has connected to.
+
+    Returns:
+        A dict mapping each host's URL to a dict with the number of `connections` that have been
+        opened, the number of `requests` that have been sent, the number of `idle` connections
+        that are ready for reuse, and the `maxsize` of the pool.
+    """
+    stats = {}
+    for adapter in set(self._session.adapters.values()):
+      pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+      if pools is None:
+        continue
+
+      for key in pools.keys():
+        pool = pools[key]
+        stats[f'{pool.scheme}://{pool.host}:{pool.port}'] = {
+          'connections': pool.num_connections,
+          'requests': pool.num_requests,
+          # urllib3 pre-fills the pool with placeholders for connections that haven't been opened.
+          'idle': sum(1 for conn in pool.pool.queue if conn is not None) if pool.pool else 0,
+          'maxsize': pool.pool.maxsize if pool.pool else 0,
+        }
+
+    return stats
+
+  def _to_model(self, operation_id: Optional[str], data: Optional[dict]):
+    """Converts a decoded response into its Model, when the client is in model mode."""
+    if not self._models or data is None:
+      return data
+
+    model = response_model(operation_id)
+    return model.from_dict(data) if model else data
+
+  def stream_download(self, url: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Streams a file (such as a stats export's `download_url`) over the client's pooled connections.
+
+    The file is yielded in chunks as it downloads, and decompressed along the way if it's gzipped
+    (whether in transit or as a file). The API token isn't sent, as download URLs are pre-signed.
+    """
+    response = self._session.get(url, stream=True, timeout=self._timeout)
+    try:
+      response.raise_for_status()
+      gzip = GzipDecoder()
+      for chunk in response.iter_content(chunk_size):
+        data = gzip.feed(chunk)
+        if data:
+          yield data
+
+      data = gzip.close()
+      if data:
+        yield data
+    finally:
+      response.close()
+
   def _url(self, path: str) -> str:
     return f'{self._base_url}/{path.lstrip("/")}'
 
@@ -42,6 +184,9 @@ class DialpadClient(DialpadResourcesMixin):
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    stream: bool = False,
   ) -> requests.Response:
     url = self._url(sub_path)
     headers = headers or dict()
@@ -49,49 +194,231 @@ class DialpadClient(DialpadResourcesMixin):
       headers.update({'DP-Company-ID': str(self.company_id)})
 
     headers.update({'Authorization': 'Bearer %s' % self._token})
+    if not self._keep_alive:
+      headers.update({'Connection': 'close'})
+
+    data = None
+    if body is not None:
+      headers.setdefault('Content-Type', 'application/json')
+      data = self._json.dumps(body)
+
     if str(method).upper() in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']:
+      if self._rate_limiter:
+        self._rate_limiter.acquire(operation_id, rate_limit)
+
       return getattr(self._session, str(method).lower())(
         url,
         headers=headers,
         params=params,
-        json=body,
+        data=data,
+        timeout=self._timeout,
+        stream=stream,
       )
     raise ValueError('Unsupported method "%s"' % method)
 
-  def iter_request(
+  def _send(
     self,
     method: str = 'GET',
     sub_path: Optional[str] = None,
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    stream: bool = False,
+  ) -> requests.Response:
+    """Sends a request, retrying transient failures according to the retry policy (if any)."""
+    policy = self._retry_policy
+    if policy:
+      policy.record_request()
+
+    attempt = 0
+    while True:
+      attempt += 1
+      try:
+        response = self._raw_request(
+          method=method,
+          sub_path=sub_path,
+          params=params,
+          body=body,
+          headers=headers,
+          operation_id=operation_id,
+          rate_limit=rate_limit,
+          stream=stream,
+        )
+      except (requests.ConnectionError, requests.Timeout):
+        if not policy or not policy.should_retry(method, attempt):
+          raise
+
+        time.sleep(policy.backoff(attempt))
+        continue
+
+      if policy and policy.should_retry(method, attempt, response.status_code):
+        response.close()
+        time.sleep(policy.backoff(attempt, response.headers.get('Retry-After')))
+        continue
+
+      if stream and not response.ok:
+        # Read the error's body, so that it's available from the exception.
+        response.content
+      response.raise_for_status()
+      return response
+
+  def _iter_pages(
+    self,
+    method: str = 'GET',
+    sub_path: Optional[str] = None,
+    params: Optional[dict] = None,
+    body: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    stream: bool = False,
   ) -> Iterator[dict]:
+    """Yields the decoded body of each page of a paginated response, following the cursors.
+
+    If `stream` is set, then each page's body is parsed as it arrives, and each batch of items is
+    yielded (as a partial page, with only an `items` field) as soon as it has been parsed, followed
+    by the page's other fields once the whole body has been read.
+
+    The last (or only) part of each page always has a `cursor` field, which is None for the last
+    page.
+    """
     # Ensure that we have a mutable copy of params.
     params = dict(params or {})
-    response = self._raw_request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
-    )
-    response.raise_for_status()
+    while True:
+      response = self._send(
+        method=method,
+        sub_path=sub_path,
+        params=params,
+        body=body,
+        headers=headers,
+        operation_id=operation_id,
+        rate_limit=rate_limit,
+        stream=stream,
+      )
+      if response.status_code == 204:  # No Content
+        response.close()
+        return
 
-    if response.status_code == 204:  # No Content
-      return
+      if stream:
+        parser = ItemsParser(self._json.loads)
+        try:
+          for chunk in response.iter_content(CHUNK_SIZE):
+            items = parser.feed(chunk)
+            if items:
+              yield {'items': items}
+        finally:
+          response.close()
 
-    response_json = response.json()
-    if 'items' in response_json:
-      yield from (response_json['items'] or [])
+        page = parser.close()
+        page.setdefault('cursor', None)
+        yield page
+      else:
+        page = self._json.loads(response.content)
+        page.setdefault('cursor', None)
+        yield page
 
-    while response_json.get('cursor', None):
-      params['cursor'] = response_json['cursor']
-      response = self._raw_request(
-        method=method, sub_path=sub_path, params=params, body=body, headers=headers
-      )
-      response.raise_for_status()
-      if response.status_code == 204:  # No Content
+      if not page.get('cursor', None):
         return
 
-      response_json = response.json()
-      if 'items' in response_json:
-        yield from (response_json['items'] or [])
+      params['cursor'] = page['cursor']
+
+  def iter_request(
+    self,
+    method: str = 'GET',
+    sub_path: Optional[str] = None,
+    params: Optional[dict] = None,
+    body: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    prefetch: Optional[int] = None,
+    stream: Optional[bool] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    limit: Optional[int] = None,
+  ) -> PageIterator:
+    """Returns an iterator over the items from each page of a paginated response.
+
+    If `prefetch` (which defaults to the client's `prefetch_pages`) is non-zero, then up to that
+    many pages will be requested ahead of the caller by a background thread.
+
+    If `stream` (which defaults to the client's `stream_pages`) is set, then items are yielded as
+    each page's body is parsed, rather than once the whole page has been downloaded.
+
+    If `checkpoint` is given, then iteration resumes from that position rather than from the start
+    (or from the position that was saved to the client's `checkpoint_store`).
+
+    If `limit` is given, then iteration stops once that many items have been returned. It is also
+    sent as the `limit` query parameter of operations that accept one, so that no more items than
+    that are requested.
+    """
+    stream = self._stream_pages if stream is None else stream
+    if limit is not None and params and 'limit' in params and params['limit'] is None:
+      params = dict(params, limit=limit)
+
+    prefetch = self._prefetch_pages if prefetch is None else prefetch
+
+    def fetch_pages(cursor: Optional[str]) -> Iterator[dict]:
+      page_params = dict(params or {})
+      if cursor:
+        page_params['cursor'] = cursor
+
+      pages = self._iter_pages(
+        method=method,
+        sub_path=sub_path,
+        params=page_params,
+        body=body,
+        headers=headers,
+        operation_id=operation_id,
+        rate_limit=rate_limit,
+        stream=stream,
+      )
+      return prefetch_iter(pages, prefetch) if prefetch else pages
+
+    store = self._checkpoint_store
+    return PageIterator(
+      fetch_pages,
+      model=response_model(operation_id) if self._models else None,
+      store=store,
+      key=checkpoint_key(method, sub_path, params, self.company_id) if store else None,
+      checkpoint=checkpoint,
+      limit=limit,
+    )
+
+  def iter_pages(
+    self,
+    method: str = 'GET',
+    sub_path: Optional[str] = None,
+    params: Optional[dict] = None,
+    body: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
+    prefetch: Optional[int] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+  ) -> Iterator[dict]:
+    """Yields each whole page of a paginated response, with its `items` and `cursor`.
+
+    The arguments are the same as those of `iter_request`, plus `max_pages`, which stops the
+    iteration once that many pages have been returned. If `limit` is given, then the last page is
+    trimmed so that no more than that many items are returned in total.
+    """
+    return self.iter_request(
+      method=method,
+      sub_path=sub_path,
+      params=params,
+      body=body,
+      headers=headers,
+      operation_id=operation_id,
+      rate_limit=rate_limit,
+      prefetch=prefetch,
+      stream=False,
+      checkpoint=checkpoint,
+      limit=limit,
+    ).iter_pages(limit=limit, max_pages=max_pages)
 
   def request(
     self,
@@ -100,13 +427,46 @@ class DialpadClient(DialpadResourcesMixin):
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
   ) -> dict:
-    response = self._raw_request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
-    )
-    response.raise_for_status()
+    cache = self._cache
+    method = str(method).upper()
+    if method == 'GET' and (cache is not None or self._single_flight is not None):
+      key = ResponseCache.key(method, sub_path, params, self.company_id)
+    if cache is not None and method == 'GET':
+      cached = cache.get(key)
+      if cached is not MISS:
+        return self._to_model(operation_id, cached)
+
+      generation = cache.generation
+
+    def send():
+      return self._send(
+        method=method,
+        sub_path=sub_path,
+        params=params,
+        body=body,
+        headers=headers,
+        operation_id=operation_id,
+        rate_limit=rate_limit,
+      )
+
+    try:
+      if self._single_flight is not None and method == 'GET':
+        # Concurrent callers share the response, but each decodes its own copy of the body.
+        response = self._single_flight.do(key, send)
+      else:
+        response = send()
+    finally:
+      if cache is not None and method in MUTATING_METHODS:
+        cache.invalidate(sub_path)
 
     if response.status_code == 204:  # No Content
       return None
 
-    return response.json()
+    result = self._json.loads(response.content)
+    if cache is not None and method == 'GET':
+      cache.set(key, result, operation_id, generation)
+
+    return self._to_model(operation_id, result)
@@ -0,0 +1,73 @@
+"""Single-flight coalescing of identical requests that are in flight at the same time."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+  """Shares the result of a call between all of the threads that make it concurrently.
+
+  The first thread to call `do` with a given key runs the function, and any thread that calls `do`
+  with the same key before it returns waits for (and receives) the same result or exception.
+  """
+
+  def __init__(self):
+    self.coalesced = 0
+    self._calls: Dict[Hashable, Future] = {}
+    self._lock = threading.Lock()
+
+  def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+    with self._lock:
+      future = self._calls.get(key)
+      leader = future is None
+      if leader:
+        future = self._calls[key] = Future()
+      else:
+        self.coalesced += 1
+
+    if not leader:
+      return future.result()
+
+    try:
+      result = fn()
+    except BaseException as e:
+      future.set_exception(e)
+      raise
+    else:
+      future.set_result(result)
+      return result
+    finally:
+      with self._lock:
+        del self._calls[key]
+
+
+class AsyncSingleFlight:
+  """Shares the result of a coroutine between all of the tasks that await it concurrently.
+
+  The coroutine runs in its own task, so cancelling one of the callers (even the first) doesn't
+  cancel the call for the others.
+  """
+
+  def __init__(self):
+    self.coalesced = 0
+    self._calls: Dict[Hashable, asyncio.Task] = {}
+
+  async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+    task = self._calls.get(key)
+    if task is not None:
+      self.coalesced += 1
+    else:
+      task = self._calls[key] = asyncio.ensure_future(fn())
+      task.add_done_callback(lambda t: self._done(key, t))
+
+    return await asyncio.shield(task)
+
+  def _done(self, key: Hashable, task: asyncio.Task) -> None:
+    if self._calls.get(key) is task:
+      del self._calls[key]
+
+    # Mark the exception as retrieved, in case every caller was cancelled.
+    if not task.cancelled():
+      task.exception()
@@ -0,0 +1,350 @@
+"""Syncing contacts from another system (such as a CRM) into Dialpad, sending only what changed.
+
+The existing contacts are paged into a local index that holds a hash of each one's fields, and the
+source records are diffed against it. Only the contacts that are new, changed or (optionally) gone
+are then created, updated or deleted, concurrently and within each operation's rate limit. Updates
+only send the fields that changed, and a field that a record leaves out is left as it is (whereas
+one that it sets to None or empty is cleared):
+
+    from dialpad import DialpadClient
+    from dialpad.contact_sync import sync_contacts
+
+    dp = DialpadClient(token='API_TOKEN_HERE')
+    records = (
+      {'uid': row.id, 'first_name': row.first, 'last_name': row.last, 'emails': [row.email]}
+      for row in crm_rows
+    )
+    for result in sync_contacts(dp, records, delete_missing=True):
+      if result.error:
+        print(f'Failed to {result.action} {result.key}: {result.error}')
+"""
+
+import hashlib
+import json
+import logging
+from typing import (
+  Any,
+  AsyncIterable,
+  AsyncIterator,
+  Callable,
+  Dict,
+  Hashable,
+  Iterable,
+  Iterator,
+  NamedTuple,
+  Optional,
+  Tuple,
+  Union,
+)
+
+from .bulk import AsyncBulkResults, BulkResults, fallback_limiter, field
+from .models.base import Model
+from .operation_rate_limits import OPERATION_RATE_LIMITS
+from .rate_limit import TokenBucket
+from .schemas.contact import ContactProto, CreateContactMessageWithUid
+
+# The fields that are compared, and sent (if they changed) when a contact is updated.
+SYNCED_FIELDS = (
+  'company_name',
+  'emails',
+  'extension',
+  'first_name',
+  'job_title',
+  'last_name',
+  'phones',
+  'urls',
+)
+_LIST_FIELDS = ('emails', 'phones', 'urls')
+
+# The ContactsResource method and operation id of each action.
+_ACTIONS: Dict[str, Tuple[str, str]] = {
+  'create': ('create_or_update', 'contacts.create_with_uid'),
+  'update': ('partial_update', 'contacts.update'),
+  'delete': ('delete', 'contacts.delete'),
+}
+
+logger = logging.getLogger(__name__)
+
+ContactKey = Callable[[dict], Hashable]
+
+
+def default_key(contact: dict) -> Optional[str]:
+  """Matches contacts by their primary email (case-insensitively), or else their primary phone."""
+  emails = contact.get('emails')
+  if emails:
+    return emails[0].lower()
+  phones = contact.get('phones')
+  return phones[0] if phones else None
+
+
+def _field_hash(name: str, value: Any) -> bytes:
+  value = value or None
+  if name == 'emails' and value:
+    # Emails are case-insensitive, and may be normalized by Dialpad.
+    value = [email.lower() for email in value]
+  return hashlib.blake2b(json.dumps(value).encode('utf-8'), digest_size=8).digest()
+
+
+def contact_hash(contact: dict) -> Tuple[bytes, ...]:
+  """Hashes each synced field of a contact (or a source record), to tell which have changed."""
+  return tuple(_field_hash(name, contact.get(name)) for name in SYNCED_FIELDS)
+
+
+def _to_dict(contact: Union[ContactProto, Model]) -> dict:
+  return contact.to_dict() if isinstance(contact, Model) else contact
+
+
+class ContactIndex:
+  """The existing contacts, as a map of their keys to their IDs and field hashes."""
+
+  def __init__(self, contacts: Iterable[ContactProto] = (), key: ContactKey = default_key):
+    self.key = key
+    self.entries: Dict[Hashable, Tuple[str, Tuple[bytes, ...]]] = {}
+    for contact in contacts:
+      self.add(contact)
+
+  def add(self, contact: ContactProto) -> None:
+    contact = _to_dict(contact)
+    key = self.key(contact)
+    # Contacts without a key can't be matched, and the first of any duplicates wins.
+    if key is not None and key not in self.entries:
+      self.entries[key] = (contact['id'], contact_hash(contact))
+
+  def __len__(self) -> int:
+    return len(self.entries)
+
+  @classmethod
+  def fetch(cls, client, key: ContactKey = default_key, **list_params) -> 'ContactIndex':
+    """Pages through `contacts.list` (which accepts `owner_id` and `include_local`)."""
+    return cls(client.contacts.list(**list_params), key=key)
+
+  @classmethod
+  async def fetch_async(
+    cls, client, key: ContactKey = default_key, **list_params
+  ) -> 'ContactIndex':
+    """The AsyncDialpadClient equivalent of `fetch`."""
+    index = cls(key=key)
+    async for contact in client.contacts.list(**list_params):
+      index.add(contact)
+    return index
+
+
+class SyncAction(NamedTuple):
+  """A change to make: 'create', 'update' or 'delete' the contact with the given key."""
+
+  action: str
+  key: Hashable
+  contact_id: Optional[str] = None
+  body: Optional[dict] = None
+
+
+class SyncResult(NamedTuple):
+  """The outcome of a SyncAction."""
+
+  action: str
+  key: Hashable
+  contact_id: Optional[str] = None
+  response: Optional[ContactProto] = None
+  error: Optional[BaseException] = None
+
+
+class _Differ:
+  """Diffs source records against the index as they're read, remembering which keys were seen."""
+
+  def __init__(self, index: ContactIndex):
+    self.index = index
+    self.seen = set()
+    # The IDs of the contacts that creates were applied to, and whether any creates failed.
+    self.created_ids = set()
+    self.failed_creates = False
+
+  def diff(self, record: CreateContactMessageWithUid) -> Optional[SyncAction]:
+    key = self.index.key(record)
+    if key is None or key in self.seen:
+      return None
+
+    self.seen.add(key)
+    entry = self.index.entries.get(key)
+    if entry is None:
+      return SyncAction('create', key, body=record)
+
+    contact_id, hashes = entry
+    # Only the fields that the record has and that changed are sent, with those that it explicitly
+    # empties being cleared.
+    body = {
+      name: record[name] or ([] if name in _LIST_FIELDS else '')
+      for name, digest in zip(SYNCED_FIELDS, hashes)
+      if name in record and _field_hash(name, record[name]) != digest
+    }
+    if not body:
+      return None
+    return SyncAction('update', key, contact_id, body)
+
+  def applied(self, result: SyncResult) -> None:
+    if result.action == 'create':
+      if result.error is not None:
+        self.failed_creates = True
+      else:
+        self.created_ids.add(result.contact_id)
+
+  def deletes(self) -> Iterator[SyncAction]:
+    # A record whose key changed misses the index, and is created by its uid, which Dialpad applies
+    # to the existing contact. So contacts that creates were applied to are kept, and nothing is
+    # deleted if a create failed, since it might have been meant for a contact that's missing.
+    if self.failed_creates:
+      logger.warning('Not deleting any missing contacts, since some of the creates failed')
+      return
+
+    for key, (contact_id, _) in self.index.entries.items():
+      if key not in self.seen and contact_id not in self.created_ids:
+        yield SyncAction('delete', key, contact_id)
+
+
+def diff_contacts(
+  index: ContactIndex, records: Iterable[CreateContactMessageWithUid], delete_missing: bool = False
+) -> Iterator[SyncAction]:
+  """Yields the actions that would bring the indexed contacts in line with the source records.
+
+  Records with the same key as an earlier one are ignored. The deletions (of indexed contacts which
+  none of the records matched) come last, once every record has been read. Since this doesn't apply
+  the creates, a record whose key changed shows up as both a create and a delete (whereas
+  `sync_contacts` keeps the contact that the create was applied to).
+  """
+  differ = _Differ(index)
+  for record in records:
+    action = differ.diff(record)
+    if action is not None:
+      yield action
+
+  if delete_missing:
+    yield from differ.deletes()
+
+
+class _Applier:
+  """Applies SyncActions with the ContactsResource, throttling each operation to its rate limit."""
+
+  def __init__(self, client):
+    self.contacts = client.contacts
+    self.limiters: Dict[str, Optional[TokenBucket]] = {
+      action: fallback_limiter(client, OPERATION_RATE_LIMITS[operation_id])
+      for action, (_, operation_id) in _ACTIONS.items()
+    }
+
+  def _args(self, action: SyncAction) -> tuple:
+    if action.action == 'create':
+      return (action.body,)
+    if action.action == 'update':
+      return (action.contact_id, action.body)
+    return (action.contact_id,)
+
+  def _result(self, action: SyncAction, response: Any) -> SyncResult:
+    contact_id = action.contact_id
+    if contact_id is None and response is not None:
+      contact_id = field(response, 'id')
+    return SyncResult(action.action, action.key, contact_id, response)
+
+  def apply(self, action: SyncAction) -> SyncResult:
+    method = getattr(self.contacts, _ACTIONS[action.action][0])
+    try:
+      limiter = self.limiters[action.action]
+      if limiter is not None:
+        limiter.acquire()
+      return self._result(action, method(*self._args(action)))
+    except Exception as e:
+      return SyncResult(action.action, action.key, action.contact_id, error=e)
+
+  async def apply_async(self, action: SyncAction) -> SyncResult:
+    method = getattr(self.contacts, _ACTIONS[action.action][0])
+    try:
+      limiter = self.limiters[action.action]
+      if limiter is not None:
+        await limiter.acquire_async()
+      return self._result(action, await method(*self._args(action)))
+    except Exception as e:
+      return SyncResult(action.action, action.key, action.contact_id, error=e)
+
+
+def sync_contacts(
+  client,
+  records: Iterable[CreateContactMessageWithUid],
+  key: ContactKey = default_key,
+  delete_missing: bool = False,
+  index: Optional[ContactIndex] = None,
+  max_workers: int = 8,
+  **list_params,
+) -> Iterator[SyncResult]:
+  """Creates, updates and deletes contacts so that they match the source records.
+
+  New contacts are created with `create_or_update` (so records need a `uid`), changed ones are
+  updated with `partial_update`, and unchanged ones are left alone. Deletions are only made once
+  every create and update has been, and skip the contacts that the creates were applied to (such as
+  one whose email changed). If any create fails, nothing is deleted.
+
+  Args:
+      client: The DialpadClient to sync the contacts with.
+      records: The source records, which are read lazily.
+      key: The function that matches records with contacts (by their primary email or phone, by
+        default). It's given both the records and the existing contacts.
+      delete_missing: Whether to delete the existing contacts that no record matched.
+      index: The ContactIndex to diff against, instead of fetching it with `contacts.list`.
+      max_workers: The number of changes that are made concurrently.
+      list_params: Passed on to `contacts.list` (such as `owner_id`) when fetching the index.
+
+  Returns:
+      An iterator of the SyncResults of the changes, in the order that they're made.
+  """
+  if index is None:
+    index = ContactIndex.fetch(client, key=key, **list_params)
+
+  applier = _Applier(client)
+  differ = _Differ(index)
+  actions = filter(None, map(differ.diff, records))
+  for _, result in BulkResults(applier.apply, actions, max_workers=max_workers, unique=False):
+    differ.applied(result)
+    yield result
+
+  if delete_missing:
+    deletes = BulkResults(applier.apply, differ.deletes(), max_workers=max_workers, unique=False)
+    for _, result in deletes:
+      yield result
+
+
+async def sync_contacts_async(
+  client,
+  records: Union[Iterable[CreateContactMessageWithUid], AsyncIterable[CreateContactMessageWithUid]],
+  key: ContactKey = default_key,
+  delete_missing: bool = False,
+  index: Optional[ContactIndex] = None,
+  concurrency: int = 8,
+  **list_params,
+) -> AsyncIterator[SyncResult]:
+  """The AsyncDialpadClient equivalent of `sync_contacts`, with up to `concurrency` at once."""
+  if index is None:
+    index = await ContactIndex.fetch_async(client, key=key, **list_params)
+
+  differ = _Differ(index)
+
+  async def actions():
+    if hasattr(records, '__aiter__'):
+      async for record in records:
+        action = differ.diff(record)
+        if action is not None:
+          yield action
+    else:
+      for record in records:
+        action = differ.diff(record)
+        if action is not None:
+          yield action
+
+  applier = _Applier(client)
+  results = AsyncBulkResults(applier.apply_async, actions(), concurrency=concurrency, unique=False)
+  async for _, result in results:
+    differ.applied(result)
+    yield result
+
+  if delete_missing:
+    deletes = AsyncBulkResults(
+      applier.apply_async, differ.deletes(), concurrency=concurrency, unique=False
+    )
+    async for _, result in deletes:
+      yield result
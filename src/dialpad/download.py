@@ -0,0 +1,128 @@
+"""Incremental decoding of downloaded files, such as the CSV files that stats exports produce."""
+
+import codecs
+import csv
+import zlib
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+class GzipDecoder:
+  """Decompresses a stream of chunks if (and only if) it's gzip-compressed.
+
+  Files that are themselves gzipped aren't decompressed by the HTTP clients (which only undo a
+  gzip Content-Encoding), so the stream's first bytes are checked for the gzip magic number.
+  """
+
+  def __init__(self):
+    self._head = b''
+    self._gzipped: Optional[bool] = None
+    self._decompressor = None
+
+  def feed(self, chunk: bytes) -> bytes:
+    if self._gzipped is None:
+      self._head += chunk
+      if len(self._head) < len(_GZIP_MAGIC):
+        return b''
+
+      self._gzipped = self._head.startswith(_GZIP_MAGIC)
+      chunk, self._head = self._head, b''
+
+    if not self._gzipped:
+      return chunk
+
+    output = []
+    while chunk:
+      if self._decompressor is None:
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+      output.append(self._decompressor.decompress(chunk))
+      # A gzip file can consist of several members, each with its own header.
+      chunk = self._decompressor.unused_data
+      if self._decompressor.eof:
+        self._decompressor = None
+
+    return b''.join(output)
+
+  def close(self) -> bytes:
+    if self._decompressor is not None:
+      if not self._decompressor.eof:
+        raise ValueError('The gzipped download ended unexpectedly')
+    return self._head
+
+
+class CSVRecordParser:
+  """Parses the rows of a CSV file into dicts (keyed by the header row) as its bytes arrive.
+
+  Quoted fields may span several lines, so lines are gathered until their quotes are balanced
+  before they're handed to the csv module.
+  """
+
+  def __init__(self, encoding: str = 'utf-8-sig'):
+    self._decoder = codecs.getincrementaldecoder(encoding)()
+    self._partial = ''
+    self._pending: List[str] = []
+    self._quotes = 0
+    self._input = deque()
+    self._reader = csv.reader(iter(self._input.popleft, None))
+    self._header: Optional[List[str]] = None
+
+  def feed(self, chunk: bytes) -> List[dict]:
+    """Adds a chunk of the file, and returns the rows that it completed."""
+    lines = (self._partial + self._decoder.decode(chunk)).split('\n')
+    self._partial = lines.pop()
+    return [row for row in map(self._feed_line, lines) if row is not None]
+
+  def close(self) -> List[dict]:
+    """Returns the last row, once the whole file has been fed in."""
+    text = self._partial + self._decoder.decode(b'', final=True)
+    self._partial = ''
+    rows = [self._feed_line(text)] if text else []
+    if self._pending:
+      raise ValueError('The CSV download ended in the middle of a quoted field')
+    return [row for row in rows if row is not None]
+
+  def _feed_line(self, line: str) -> Optional[dict]:
+    if line.endswith('\r'):
+      line = line[:-1]
+
+    self._pending.append(line)
+    self._quotes += line.count('"')
+    if self._quotes % 2:
+      return None
+
+    self._input.append('\n'.join(self._pending))
+    self._pending = []
+    self._quotes = 0
+    row = next(self._reader)
+    if self._header is None:
+      self._header = row
+      return None
+
+    if not row:
+      return None
+
+    return dict(zip(self._header, row))
+
+
+def iter_csv_records(chunks: Iterable[bytes], encoding: str = 'utf-8-sig') -> Iterator[dict]:
+  """Yields the rows of a CSV file from the chunks of its download (see `stream_download`)."""
+  parser = CSVRecordParser(encoding)
+  for chunk in chunks:
+    yield from parser.feed(chunk)
+
+  yield from parser.close()
+
+
+async def aiter_csv_records(
+  chunks: AsyncIterable[bytes], encoding: str = 'utf-8-sig'
+) -> AsyncIterator[dict]:
+  """The async equivalent of `iter_csv_records`."""
+  parser = CSVRecordParser(encoding)
+  async for chunk in chunks:
+    for row in parser.feed(chunk):
+      yield row
+
+  for row in parser.close():
+    yield row
@@ -0,0 +1,214 @@
+"""Verifying, decoding and dispatching the events that Dialpad sends to webhooks and websockets.
+
+When a webhook (or websocket) has a secret, each payload is sent as a JWT that's signed with it
+(see `WebhookProto.signature`); otherwise it's sent as plain JSON. Events are classified by their
+subscription type (call, SMS, contact or agent status) and handed to the handlers registered for
+that type, which run on a bounded pool of worker threads.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from .bulk import field
+from .json_codec import JSONCodec, get_codec
+from .schemas.signature import SignatureProto
+
+logger = logging.getLogger(__name__)
+
+_HASHES = {'HS256': hashlib.sha256, 'HS384': hashlib.sha384, 'HS512': hashlib.sha512}
+
+# The event types, as named by the event subscription resources.
+CALL = 'call'
+SMS = 'sms'
+CONTACT = 'contact'
+AGENT_STATUS = 'agent_status'
+UNKNOWN = 'unknown'
+
+
+class Event(NamedTuple):
+  """A decoded event, along with its type (such as `CALL`).
+
+  The payload of a call event is a CallProto, and that of an SMS event is an SMSProto.
+  """
+
+  type: str
+  payload: Dict[str, Any]
+
+
+def classify_event(payload: Dict[str, Any]) -> str:
+  """Works out an event's type from the fields of its payload."""
+  if 'call_id' in payload and 'state' in payload:
+    return CALL
+  if 'message_status' in payload or 'message_delivery_result' in payload:
+    return SMS
+  if 'text' in payload and 'direction' in payload:
+    return SMS
+  if 'availability_status' in payload or 'on_duty_status' in payload:
+    return AGENT_STATUS
+  if 'contact_event_type' in payload or 'contact' in payload:
+    return CONTACT
+  return UNKNOWN
+
+
+def signature_options(signature: Optional[SignatureProto]) -> Dict[str, Any]:
+  """Returns the `secret` and `algo` of the `signature` of a WebhookProto or WebsocketProto.
+
+  The signature may be a dict, or a model if the client has `models=True`.
+  """
+  if signature is None:
+    return {'secret': None, 'algo': 'HS256'}
+
+  signature_type = field(signature, 'type') or 'jwt'
+  if signature_type != 'jwt':
+    raise ValueError(f'Unsupported signature type "{signature_type}"')
+  return {'secret': field(signature, 'secret'), 'algo': field(signature, 'algo') or 'HS256'}
+
+
+def _b64decode(data: bytes) -> bytes:
+  return base64.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+class EventDecoder:
+  """Verifies the signatures of event payloads and decodes them.
+
+  The HMAC key is set up once, and copied for each payload rather than being derived again.
+
+  Args:
+      secret: The webhook's (or websocket's) secret, or None if payloads aren't signed.
+      algo: The JWT algorithm that payloads are signed with ('HS256', 'HS384' or 'HS512').
+      json_codec: The JSON codec to decode payloads with (see dialpad.json_codec.get_codec).
+      classify: The function that works out the type of an event from its payload.
+  """
+
+  def __init__(
+    self,
+    secret: Optional[str] = None,
+    algo: str = 'HS256',
+    json_codec: Optional[Union[str, JSONCodec]] = None,
+    classify: Callable[[Dict[str, Any]], str] = classify_event,
+  ):
+    algo = algo.upper()
+    if algo not in _HASHES:
+      raise ValueError(
+        f'Unsupported signature algorithm "{algo}" (expected one of {list(_HASHES)})'
+      )
+
+    self.algo = algo
+    self._mac = hmac.new(secret.encode('utf-8'), digestmod=_HASHES[algo]) if secret else None
+    self._json = get_codec(json_codec)
+    self._classify = classify
+
+  def _verify(self, data: bytes) -> bytes:
+    """Returns the payload of a JWT, once its signature has been checked."""
+    parts = data.strip().split(b'.')
+    if len(parts) != 3:
+      raise ValueError('The payload is not a JWT')
+
+    header, payload, signature = parts
+    try:
+      alg = self._json.loads(_b64decode(header)).get('alg')
+      signature = _b64decode(signature)
+    except Exception as e:
+      raise ValueError(f'The JWT is malformed: {e}') from e
+
+    if alg != self.algo:
+      raise PermissionError(f'The JWT is signed with "{alg}" rather than "{self.algo}"')
+
+    mac = self._mac.copy()
+    mac.update(header + b'.' + payload)
+    if not hmac.compare_digest(mac.digest(), signature):
+      raise PermissionError('The JWT signature is invalid')
+
+    return _b64decode(payload)
+
+  def decode(self, data: Union[bytes, str]) -> Event:
+    """Verifies (if there's a secret) and decodes a payload.
+
+    Raises:
+        PermissionError: If the payload's signature is invalid.
+        ValueError: If the payload is malformed.
+    """
+    if isinstance(data, str):
+      data = data.encode('utf-8')
+    if self._mac is not None:
+      data = self._verify(data)
+
+    try:
+      payload = self._json.loads(data)
+    except Exception as e:
+      # Codecs such as msgspec raise their own errors, rather than ValueErrors.
+      raise ValueError(f'The payload is not valid JSON: {e}') from e
+    if not isinstance(payload, dict):
+      raise ValueError('The event payload is not a JSON object')
+    return Event(self._classify(payload), payload)
+
+
+Handler = Callable[[Event], Any]
+
+
+class EventHandlers:
+  """The handlers that are registered for each type of event."""
+
+  def __init__(self):
+    self._handlers: Dict[str, List[Handler]] = {}
+
+  def on(self, event_type: str = '*') -> Callable[[Handler], Handler]:
+    """Registers a handler for events of a type (such as `CALL`), or for all events with '*'."""
+
+    def register(handler: Handler) -> Handler:
+      self._handlers.setdefault(event_type, []).append(handler)
+      return handler
+
+    return register
+
+  def handlers(self, event: Event) -> List[Handler]:
+    return self._handlers.get(event.type, []) + self._handlers.get('*', [])
+
+
+class EventDispatcher(EventHandlers):
+  """Runs the handlers of each event on a pool of `max_workers` threads.
+
+  At most `queue_size` events wait for a worker; once that many are waiting, `dispatch` turns new
+  events away (so that the sender can retry them later) rather than letting the backlog grow. Async
+  handlers are run to completion on the worker thread.
+  """
+
+  def __init__(self, max_workers: int = 4, queue_size: int = 100):
+    super().__init__()
+    self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dialpad-events')
+    self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+
+  def _run(self, event: Event) -> None:
+    try:
+      for handler in self.handlers(event):
+        try:
+          result = handler(event)
+          if asyncio.iscoroutine(result):
+            asyncio.run(result)
+        except Exception:
+          logger.exception('Handler %r failed on a %s event', handler, event.type)
+    finally:
+      self._slots.release()
+
+  def dispatch(self, event: Event) -> bool:
+    """Queues the event for its handlers, returning False if the queue is full."""
+    if not self._slots.acquire(blocking=False):
+      return False
+
+    try:
+      self._pool.submit(self._run, event)
+    except RuntimeError:
+      # The dispatcher has been closed.
+      self._slots.release()
+      raise
+    return True
+
+  def close(self, wait: bool = True) -> None:
+    """Stops accepting events, waiting for the queued ones to be handled if `wait` is True."""
+    self._pool.shutdown(wait=wait)
@@ -0,0 +1,87 @@
+"""Pluggable JSON encoding of request bodies, and decoding of response bodies.
+
+The clients use the fastest codec that is installed (orjson, then msgspec, then the standard
+library), and decode responses directly from their raw bytes.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+  import orjson
+except ImportError:  # pragma: no cover
+  orjson = None
+
+try:
+  import msgspec
+except ImportError:  # pragma: no cover
+  msgspec = None
+
+
+class JSONCodec:
+  """Encodes objects to, and decodes objects from, UTF-8 JSON bytes using the standard library."""
+
+  name = 'json'
+
+  def dumps(self, obj: Any) -> bytes:
+    return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+  def loads(self, data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+  name = 'orjson'
+
+  def __init__(self):
+    if orjson is None:
+      raise ImportError(
+        'The orjson JSON codec requires the orjson package (pip install python-dialpad[orjson]).'
+      )
+
+  def dumps(self, obj: Any) -> bytes:
+    return orjson.dumps(obj)
+
+  def loads(self, data: Union[bytes, str]) -> Any:
+    return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+  name = 'msgspec'
+
+  def __init__(self):
+    if msgspec is None:
+      raise ImportError(
+        'The msgspec JSON codec requires the msgspec package (pip install python-dialpad[msgspec]).'
+      )
+
+    self._encoder = msgspec.json.Encoder()
+    self._decoder = msgspec.json.Decoder()
+
+  def dumps(self, obj: Any) -> bytes:
+    return self._encoder.encode(obj)
+
+  def loads(self, data: Union[bytes, str]) -> Any:
+    return self._decoder.decode(data)
+
+
+CODECS = {codec.name: codec for codec in (JSONCodec, OrjsonCodec, MsgspecCodec)}
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+  """Returns a JSON codec.
+
+  Args:
+      codec: A JSONCodec instance, the name of a codec ('orjson', 'msgspec' or 'json'), or None
+        to use the fastest codec that is installed.
+  """
+  if isinstance(codec, JSONCodec):
+    return codec
+
+  if codec is None:
+    codec = 'orjson' if orjson else 'msgspec' if msgspec else 'json'
+
+  if codec not in CODECS:
+    raise ValueError(f'Unknown JSON codec "{codec}" (expected one of {", ".join(CODECS)})')
+
+  return CODECS[codec]()
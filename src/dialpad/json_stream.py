@@ -0,0 +1,123 @@
+"""Incremental parsing of paginated list responses, as their bodies are streamed in."""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# The size of the chunks that streamed response bodies are read in.
+CHUNK_SIZE = 64 * 1024
+
+# A complete string, the start of an incomplete string, or a structural character. The separators
+# only matter at the top two levels of the page, so they're skipped over within the items.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|"|[{}\[\],:]', re.S)
+_NESTED_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|"|[{}\[\]]', re.S)
+
+
+class ItemsParser:
+  """An event-based parser for the body of a paginated list response.
+
+  The body is fed in chunk by chunk, and each element of the top-level `items` array is decoded as
+  soon as it is complete, so only the item currently being parsed needs to be held in memory rather
+  than the whole page. The page's other fields (such as the `cursor`) are returned by `close`.
+
+  Only the boundaries of the items are found here; the items themselves are decoded with `loads`
+  (which should accept bytes), so that the client's JSON codec still does the heavy lifting.
+  """
+
+  def __init__(self, loads: Callable[[bytes], Any] = json.loads):
+    self._loads = loads
+    self._buf = bytearray()
+    self._pos = 0
+    self._depth = 0
+    # Where the value (or item) that is currently being read begins in the buffer.
+    self._start: Optional[int] = None
+    self._key: Optional[str] = None
+    self._expect_key = False
+    self._in_items = False
+    self._done = False
+    self._fields: Dict[str, Any] = {}
+
+  def feed(self, chunk: bytes) -> List[Any]:
+    """Adds a chunk of the body, and returns any items that it completed."""
+    buf = self._buf
+    buf += chunk
+    items = []
+    while not self._done:
+      nested = self._depth > 2 or (self._depth == 2 and not self._in_items)
+      match = (_NESTED_TOKEN if nested else _TOKEN).search(buf, self._pos)
+      if match is None:
+        self._pos = len(buf)
+        break
+
+      token = match.group()
+      if token == b'"':
+        # The string continues in the next chunk.
+        self._pos = match.start()
+        break
+
+      self._pos = match.end()
+      if nested:
+        self._depth += 1 if token in b'{[' else -1 if token in b'}]' else 0
+      elif self._depth == 0:
+        if token != b'{':
+          raise ValueError('Expected a paginated response body to be a JSON object')
+        self._depth = 1
+        self._expect_key = True
+      elif self._depth == 1:
+        self._on_top_level_token(token, match)
+      elif token == b',':
+        self._add_item(items, match.start())
+        self._start = match.end()
+      elif token == b']':
+        self._add_item(items, match.start())
+        self._in_items = False
+        self._start = None
+        self._depth = 1
+      else:
+        self._depth += 1 if token in b'{[' else -1 if token in b'}]' else 0
+
+    # Drop everything that has been consumed, so that the buffer only ever holds the current item.
+    consumed = self._pos if self._start is None else self._start
+    del buf[:consumed]
+    self._pos -= consumed
+    if self._start is not None:
+      self._start -= consumed
+
+    return items
+
+  def close(self) -> Dict[str, Any]:
+    """Returns the page's fields other than the items, once the whole body has been fed in."""
+    if not self._done:
+      raise ValueError('The paginated response body ended unexpectedly')
+
+    return self._fields
+
+  def _on_top_level_token(self, token: bytes, match: re.Match) -> None:
+    if token[:1] == b'"':
+      if self._expect_key:
+        self._key = self._loads(token)
+        self._expect_key = False
+    elif token == b':':
+      self._start = match.end()
+    elif (
+      token == b'[' and self._key == 'items' and not self._buf[self._start : match.start()].strip()
+    ):
+      self._in_items = True
+      self._start = match.end()
+      self._depth = 2
+    elif token in b'{[':
+      self._depth = 2
+    elif token in b',}':
+      if self._start is not None:
+        self._fields[self._key] = self._loads(bytes(self._buf[self._start : match.start()]))
+        self._start = None
+
+      self._expect_key = True
+      if token == b'}':
+        self._depth = 0
+        self._done = True
+
+  def _add_item(self, items: List[Any], end: int) -> None:
+    raw = self._buf[self._start : end].strip()
+    if raw:
+      items.append(self._loads(bytes(raw)))
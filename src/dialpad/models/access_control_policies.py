@@ -0,0 +1,225 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.user import UserProto
+
+
+class AssignmentPolicyMessage(Model):
+  """Policy assignment message."""
+
+  __slots__ = ('target_id', 'target_type', 'user_id')
+  target_id: Optional[int]
+  'Required if the policy is associated with a target (Office or Contact Center). Not required for a company level policy.'
+  target_type: Optional[Literal['callcenter', 'company', 'office']]
+  'Policy permissions applied at this target level. Defaults to company target type.'
+  user_id: int
+  "The user's id to be assigned to the policy."
+
+
+class CreatePolicyMessage(Model):
+  """Create access control policy message."""
+
+  __slots__ = ('description', 'name', 'owner_id', 'permission_sets', 'target_type')
+  description: Optional[str]
+  '[single-line only]\n\nOptional description for the policy. Max 200 characters.'
+  name: str
+  '[single-line only]\n\nA human-readable display name for the policy. Max 50 characters.'
+  owner_id: int
+  'Owner for this policy i.e company admin.'
+  permission_sets: list[
+    Literal[
+      'agent_settings_write',
+      'agents_admins_manage_agents_settings_write',
+      'agents_admins_skill_level_write',
+      'auto_call_recording_and_transcription_settings_write',
+      'business_hours_write',
+      'call_blocking_spam_prevention_settings_write',
+      'call_dispositions_settings_write',
+      'call_routing_hours_settings_write',
+      'cc_call_settings_write',
+      'chrome_extension_compliance_settings_write',
+      'csat_surveys_write',
+      'dashboard_and_alerts_write',
+      'dialpad_ai_settings_write',
+      'holiday_hours_settings_write',
+      'integrations_settings_write',
+      'name_language_description_settings_write',
+      'number_settings_write',
+      'supervisor_settings_write',
+    ]
+  ]
+  'List of permission associated with this policy.'
+  target_type: Optional[Literal['callcenter', 'company', 'office']]
+  'Policy permissions applied at this target level. Defaults to company target type.'
+
+
+class PolicyProto(Model):
+  """API custom access control policy proto definition."""
+
+  __slots__ = (
+    'company_id',
+    'date_created',
+    'date_updated',
+    'description',
+    'id',
+    'name',
+    'owner_id',
+    'permission_sets',
+    'state',
+    'target_type',
+  )
+  company_id: int
+  "The company's id to which this policy belongs to."
+  date_created: Optional[str]
+  'A timestamp indicating when this custom policy was created.'
+  date_updated: Optional[str]
+  'A timestamp indicating when this custom policy was last modified.'
+  description: Optional[str]
+  '[single-line only]\n\nDescription for the custom policy.'
+  id: int
+  'The API custom policy ID.'
+  name: str
+  '[single-line only]\n\nA human-readable display name for the custom policy name.'
+  owner_id: int
+  'Target that created this policy i.e company admin.'
+  permission_sets: list[
+    Literal[
+      'agent_settings_read',
+      'agent_settings_write',
+      'agents_admins_manage_agents_settings_read',
+      'agents_admins_manage_agents_settings_write',
+      'agents_admins_skill_level_read',
+      'agents_admins_skill_level_write',
+      'auto_call_recording_and_transcription_settings_read',
+      'auto_call_recording_and_transcription_settings_write',
+      'business_hours_read',
+      'business_hours_write',
+      'call_blocking_spam_prevention_settings_read',
+      'call_blocking_spam_prevention_settings_write',
+      'call_dispositions_settings_read',
+      'call_dispositions_settings_write',
+      'call_routing_hours_settings_read',
+      'call_routing_hours_settings_write',
+      'cc_call_settings_read',
+      'cc_call_settings_write',
+      'chrome_extension_compliance_settings_read',
+      'chrome_extension_compliance_settings_write',
+      'csat_surveys_read',
+      'csat_surveys_write',
+      'dashboard_and_alerts_read',
+      'dashboard_and_alerts_write',
+      'dialpad_ai_settings_read',
+      'dialpad_ai_settings_write',
+      'holiday_hours_settings_read',
+      'holiday_hours_settings_write',
+      'integrations_settings_read',
+      'integrations_settings_write',
+      'name_language_description_settings_read',
+      'name_language_description_settings_write',
+      'number_settings_read',
+      'number_settings_write',
+      'supervisor_settings_read',
+      'supervisor_settings_write',
+    ]
+  ]
+  'List of permission associated with this custom policy.'
+  state: Literal['active', 'deleted']
+  'Policy state. ex. active or deleted.'
+  target_type: Optional[Literal['callcenter', 'company', 'office']]
+  'Target level at which the policy permissions are applied. Defaults to company'
+
+
+class PoliciesCollection(Model):
+  """Collection of custom policies."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [PolicyProto]}
+  cursor: Optional[str]
+  'A cursor string that can be used to fetch the subsequent page.'
+  items: Optional[list[PolicyProto]]
+  'A list containing the first page of results.'
+
+
+class PolicyTargetProto(Model):
+  """Model representation of the PolicyTargetProto schema."""
+
+  __slots__ = ('target_id', 'target_type')
+  target_id: int
+  'All targets associated with the policy.'
+  target_type: Optional[Literal['callcenter', 'company', 'office']]
+  'Policy permissions applied at this target level. Defaults to company target type.'
+
+
+class PolicyAssignmentProto(Model):
+  """Model representation of the PolicyAssignmentProto schema."""
+
+  __slots__ = ('policy_targets', 'user')
+  _nested = {'policy_targets': [PolicyTargetProto], 'user': UserProto}
+  policy_targets: Optional[list[PolicyTargetProto]]
+  'Policy targets associated with the role.'
+  user: Optional[UserProto]
+  'The user associated to the role.'
+
+
+class PolicyAssignmentCollection(Model):
+  """Collection of policy assignments."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [PolicyAssignmentProto]}
+  cursor: Optional[str]
+  'A cursor string that can be used to fetch the subsequent page.'
+  items: Optional[list[PolicyAssignmentProto]]
+  'A list containing the first page of results.'
+
+
+class UnassignmentPolicyMessage(Model):
+  """Policy unassignment message."""
+
+  __slots__ = ('target_id', 'target_type', 'unassign_all', 'user_id')
+  target_id: Optional[int]
+  'Required if the policy is associated with a target (Office or Contact Center). Not required for a company level policy or if unassign_all is True.'
+  target_type: Optional[Literal['callcenter', 'company', 'office']]
+  'Policy permissions applied at this target level. Defaults to company target type.'
+  unassign_all: Optional[bool]
+  'Unassign all associated target groups from the user for a policy.'
+  user_id: int
+  "The user's id to be assigned to the policy."
+
+
+class UpdatePolicyMessage(Model):
+  """Update policy message."""
+
+  __slots__ = ('description', 'name', 'permission_sets', 'state', 'user_id')
+  description: Optional[str]
+  '[single-line only]\n\nOptional description for the policy.'
+  name: Optional[str]
+  '[single-line only]\n\nA human-readable display name for the policy.'
+  permission_sets: Optional[
+    list[
+      Literal[
+        'agent_settings_write',
+        'agents_admins_manage_agents_settings_write',
+        'agents_admins_skill_level_write',
+        'auto_call_recording_and_transcription_settings_write',
+        'business_hours_write',
+        'call_blocking_spam_prevention_settings_write',
+        'call_dispositions_settings_write',
+        'call_routing_hours_settings_write',
+        'cc_call_settings_write',
+        'chrome_extension_compliance_settings_write',
+        'csat_surveys_write',
+        'dashboard_and_alerts_write',
+        'dialpad_ai_settings_write',
+        'holiday_hours_settings_write',
+        'integrations_settings_write',
+        'name_language_description_settings_write',
+        'number_settings_write',
+        'supervisor_settings_write',
+      ]
+    ]
+  ]
+  'List of permission associated with this policy.'
+  state: Optional[Literal['active']]
+  'Restore a deleted policy.'
+  user_id: Optional[int]
+  'user id updating this policy. Must be a company admin'
@@ -0,0 +1,57 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.webhook import WebhookProto
+from dialpad.models.websocket import WebsocketProto
+
+
+class AgentStatusEventSubscriptionProto(Model):
+  """Agent-status event subscription."""
+
+  __slots__ = ('agent_type', 'enabled', 'id', 'webhook', 'websocket')
+  _nested = {'webhook': WebhookProto, 'websocket': WebsocketProto}
+  agent_type: Literal['callcenter']
+  'The agent type this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the this agent status event subscription is enabled.'
+  id: Optional[int]
+  "The event subscription's ID, which is generated after creating an event subscription successfully."
+  webhook: Optional[WebhookProto]
+  "The webhook's ID, which is generated after creating a webhook successfully."
+  websocket: Optional[WebsocketProto]
+  "The websocket's ID, which is generated after creating a webhook successfully."
+
+
+class AgentStatusEventSubscriptionCollection(Model):
+  """Collection of agent status event subscriptions."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [AgentStatusEventSubscriptionProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[AgentStatusEventSubscriptionProto]]
+  'A list of SMS event subscriptions.'
+
+
+class CreateAgentStatusEventSubscription(Model):
+  """Model representation of the CreateAgentStatusEventSubscription schema."""
+
+  __slots__ = ('agent_type', 'enabled', 'endpoint_id')
+  agent_type: Literal['callcenter']
+  'The agent type this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the this agent status event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully."
+
+
+class UpdateAgentStatusEventSubscription(Model):
+  """Model representation of the UpdateAgentStatusEventSubscription schema."""
+
+  __slots__ = ('agent_type', 'enabled', 'endpoint_id')
+  agent_type: Optional[Literal['callcenter']]
+  'The agent type this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the this agent status event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully. If you plan to pair this event subscription with another logging endpoint,\nplease provide a valid webhook ID here."
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class AppSettingProto(Model):
+  """App settings object."""
+
+  __slots__ = ('enabled', 'is_preferred_service', 'settings')
+  enabled: Optional[bool]
+  'Whether or not the OAuth app is enabled for the target.'
+  is_preferred_service: Optional[bool]
+  'Whether or not Oauth app is preferred service for screen pop.'
+  settings: Optional[dict]
+  'A dynamic object that maps settings to their values.\n\nIt includes all standard settings, i.e. call_logging_enabled, call_recording_logging_enabled,\nvoicemail_logging_enabled and sms_logging_enabled, and any custom settings this OAuth app supports.'
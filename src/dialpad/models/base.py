@@ -0,0 +1,95 @@
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, ClassVar, Dict, Optional, Type
+
+
+class Model:
+  """Base class for the slotted models that are generated from the API schemas.
+
+  Each model has the same fields as the TypedDict of the same name in dialpad.schemas, but stores
+  them in `__slots__` rather than in a dict, which takes a fraction of the memory per record and
+  makes field access a plain attribute lookup. Fields that are missing from a response are set to
+  None, and fields that the schema doesn't define are dropped.
+  """
+
+  __slots__ = ()
+
+  # Maps field names to the Model class of their value (or to a one-item list of the Model class,
+  # for lists of nested objects).
+  _nested: ClassVar[Dict[str, Any]] = {}
+
+  def __init__(self, **fields: Any):
+    unknown = set(fields).difference(self.__slots__)
+    if unknown:
+      raise TypeError(f'{type(self).__name__} has no fields named {", ".join(sorted(unknown))}')
+
+    for name in self.__slots__:
+      setattr(self, name, fields.get(name))
+
+  @classmethod
+  def from_dict(cls, data: dict) -> 'Model':
+    """Builds a model (and any nested models) from a decoded JSON object."""
+    self = cls.__new__(cls)
+    nested = cls._nested
+    for name in cls.__slots__:
+      value = data.get(name)
+      if value is not None and name in nested:
+        model = nested[name]
+        if isinstance(model, list):
+          value = [model[0].from_dict(item) for item in value]
+        else:
+          value = model.from_dict(value)
+
+      setattr(self, name, value)
+
+    return self
+
+  def to_dict(self) -> dict:
+    """Converts the model (and any nested models) back into a JSON-compatible dict."""
+    data = {}
+    for name in self.__slots__:
+      value = getattr(self, name)
+      if value is None:
+        continue
+
+      if isinstance(value, Model):
+        value = value.to_dict()
+      elif isinstance(value, list):
+        value = [item.to_dict() if isinstance(item, Model) else item for item in value]
+
+      data[name] = value
+
+    return data
+
+  def __eq__(self, other: Any) -> bool:
+    if type(other) is not type(self):
+      return NotImplemented
+
+    return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+  def __repr__(self) -> str:
+    fields = ', '.join(
+      f'{name}={getattr(self, name)!r}'
+      for name in self.__slots__
+      if getattr(self, name) is not None
+    )
+    return f'{type(self).__name__}({fields})'
+
+
+# Operations which aren't part of the public API spec, and so are missing from RESPONSE_MODELS.
+_EXTRA_RESPONSE_MODELS = {
+  'oauth_apps.toggle': 'oauth_app.ToggleOAuthAppProto',
+}
+
+
+@lru_cache(maxsize=None)
+def response_model(operation_id: Optional[str]) -> Optional[Type[Model]]:
+  """Returns the Model of the given operation's response body, if it has one."""
+  from .responses import RESPONSE_MODELS
+
+  model_path = RESPONSE_MODELS.get(operation_id) or _EXTRA_RESPONSE_MODELS.get(operation_id)
+  if not model_path:
+    return None
+
+  module_name, class_name = model_path.rsplit('.', 1)
+  return getattr(import_module(f'dialpad.models.{module_name}'), class_name)
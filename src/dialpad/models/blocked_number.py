@@ -0,0 +1,38 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class AddBlockedNumbersProto(Model):
+  """Model representation of the AddBlockedNumbersProto schema."""
+
+  __slots__ = ('numbers',)
+  numbers: Optional[list[str]]
+  'A list of E164 formatted numbers.'
+
+
+class BlockedNumber(Model):
+  """Blocked number."""
+
+  __slots__ = ('number',)
+  number: Optional[str]
+  'A phone number (e164 format).'
+
+
+class BlockedNumberCollection(Model):
+  """Collection of blocked numbers."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [BlockedNumber]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[BlockedNumber]]
+  'A list of blocked numbers.'
+
+
+class RemoveBlockedNumbersProto(Model):
+  """Model representation of the RemoveBlockedNumbersProto schema."""
+
+  __slots__ = ('numbers',)
+  numbers: Optional[list[str]]
+  'A list of E164 formatted numbers.'
@@ -0,0 +1,23 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class ApiCallRouterBreadcrumb(Model):
+  """Call routing breadcrumb."""
+
+  __slots__ = ('breadcrumb_type', 'date', 'request', 'response', 'target_id', 'target_type', 'url')
+  breadcrumb_type: Optional[Literal['callrouter', 'external_api']]
+  'Breadcrumb type'
+  date: Optional[int]
+  'Date when this breadcrumb was added'
+  request: Optional[dict]
+  'The HTTP request payload associated with this breadcrumb'
+  response: Optional[dict]
+  'The HTTP response associated with this breadcrumb'
+  target_id: Optional[int]
+  'The target id'
+  target_type: Optional[str]
+  'The target type from call'
+  url: Optional[str]
+  'The URL that should be used to drive call routing decisions.'
@@ -0,0 +1,445 @@
+from typing import Literal, Optional, Union
+
+from dialpad.models.base import Model
+from dialpad.models.breadcrumbs import ApiCallRouterBreadcrumb
+from dialpad.models.userdevice import UserDeviceProto
+
+
+class ActiveCallProto(Model):
+  """Active call."""
+
+  __slots__ = ('call_state', 'id', 'is_recording')
+  call_state: Optional[str]
+  'The current state of the call.'
+  id: Optional[int]
+  'A unique number ID automatically assigned to each call.'
+  is_recording: Optional[bool]
+  'A boolean indicating whether the call is currently being recorded.'
+
+
+class AddCallLabelsMessage(Model):
+  """Create labels for a call"""
+
+  __slots__ = ('labels',)
+  labels: Optional[list[str]]
+  'The list of labels to attach to the call'
+
+
+class NumberTransferDestination(Model):
+  """Model representation of the NumberTransferDestination schema."""
+
+  __slots__ = ('number',)
+  number: str
+  'The phone number which the call should be transferred to.'
+
+
+class TargetTransferDestination(Model):
+  """Model representation of the TargetTransferDestination schema."""
+
+  __slots__ = ('target_id', 'target_type')
+  target_id: int
+  'The ID of the target that will be used to transfer the call.'
+  target_type: Literal['callcenter', 'department', 'office', 'user']
+  'Type of target that will be used to transfer the call.'
+
+
+class AddParticipantMessage(Model):
+  """Add participant into a Call."""
+
+  __slots__ = ('participant',)
+  participant: Union[NumberTransferDestination, TargetTransferDestination]
+  'New member of the call to add. Can be a number or a Target. In case of a target, it must have a primary number assigned.'
+
+
+class CallContactProto(Model):
+  """Call contact."""
+
+  __slots__ = ('email', 'id', 'name', 'phone', 'type')
+  email: Optional[str]
+  'The primary email address of the contact.'
+  id: Optional[str]
+  'A unique number ID for the contact.'
+  name: Optional[str]
+  '[single-line only]\n\nName of contact.'
+  phone: Optional[str]
+  'The primary phone number of the contact.'
+  type: Optional[str]
+  'Type of the contact.'
+
+
+class CallRecordingDetailsProto(Model):
+  """Call recording details."""
+
+  __slots__ = ('duration', 'id', 'recording_type', 'start_time', 'url')
+  duration: Optional[int]
+  'The duration of the recording in milliseconds'
+  id: Optional[str]
+  'The recording ID'
+  recording_type: Optional[Literal['admincallrecording', 'callrecording', 'voicemail']]
+  'The recording type'
+  start_time: Optional[int]
+  'The recording start timestamp'
+  url: Optional[str]
+  'The access URL of the recording'
+
+
+class CallProto(Model):
+  """Call."""
+
+  __slots__ = (
+    'admin_call_recording_share_links',
+    'call_id',
+    'call_recording_share_links',
+    'contact',
+    'csat_recording_urls',
+    'csat_score',
+    'csat_transcriptions',
+    'custom_data',
+    'date_connected',
+    'date_ended',
+    'date_rang',
+    'date_started',
+    'direction',
+    'duration',
+    'entry_point_call_id',
+    'entry_point_target',
+    'event_timestamp',
+    'external_number',
+    'group_id',
+    'internal_number',
+    'is_transferred',
+    'labels',
+    'master_call_id',
+    'mos_score',
+    'operator_call_id',
+    'proxy_target',
+    'recording_details',
+    'routing_breadcrumbs',
+    'screen_recording_urls',
+    'state',
+    'target',
+    'total_duration',
+    'transcription_text',
+    'voicemail_share_link',
+    'was_recorded',
+  )
+  _nested = {
+    'contact': CallContactProto,
+    'entry_point_target': CallContactProto,
+    'proxy_target': CallContactProto,
+    'recording_details': [CallRecordingDetailsProto],
+    'routing_breadcrumbs': [ApiCallRouterBreadcrumb],
+    'target': CallContactProto,
+  }
+  admin_call_recording_share_links: Optional[list[str]]
+  'A list of admin call recording share links.'
+  call_id: Optional[int]
+  'A unique number ID automatically assigned to each call.'
+  call_recording_share_links: Optional[list[str]]
+  'A list of call recording share links.'
+  contact: Optional[CallContactProto]
+  'This is the contact involved in the call.'
+  csat_recording_urls: Optional[list[str]]
+  'A list of CSAT urls related to the call.'
+  csat_score: Optional[str]
+  'CSAT score related to the call.'
+  csat_transcriptions: Optional[list[str]]
+  'A list of CSAT texts related to the call.'
+  custom_data: Optional[str]
+  'Any custom data.'
+  date_connected: Optional[int]
+  'Timestamp when Dialpad connected the call.'
+  date_ended: Optional[int]
+  'Timestamp when the call was hung up.'
+  date_rang: Optional[int]
+  'Timestamp when Dialpad first detects an inbound call toa mainline, department, or person.'
+  date_started: Optional[int]
+  'Timestamp when the call began in the Dialpad system before being connected.'
+  direction: Optional[str]
+  'Call direction. Indicates whether a call was outbound or inbound.'
+  duration: Optional[float]
+  'Duration of the call in milliseconds.'
+  entry_point_call_id: Optional[int]
+  'Call ID of the associated entry point call.'
+  entry_point_target: Optional[CallContactProto]
+  'Where a call initially dialed for inbound calls to Dialpad.'
+  event_timestamp: Optional[int]
+  'Timestamp of when this call event happened.'
+  external_number: Optional[str]
+  'The phone number external to your organization.'
+  group_id: Optional[str]
+  'Unique ID of the department, mainline, or call queue associated with the call.'
+  internal_number: Optional[str]
+  'The phone number internal to your organization.'
+  is_transferred: Optional[bool]
+  'Boolean indicating whether or not the call was transferred.'
+  labels: Optional[list[str]]
+  "The label's associated to this call."
+  master_call_id: Optional[int]
+  'The master id of the specified call.'
+  mos_score: Optional[float]
+  'Mean Opinion Score'
+  operator_call_id: Optional[int]
+  'The id of operator.'
+  proxy_target: Optional[CallContactProto]
+  'Caller ID used by the Dialpad user for outbound calls.'
+  recording_details: Optional[list[CallRecordingDetailsProto]]
+  'List of associated recording details.'
+  routing_breadcrumbs: Optional[list[ApiCallRouterBreadcrumb]]
+  'The routing breadcrumbs'
+  screen_recording_urls: Optional[list[str]]
+  'A list of screen recording urls.'
+  state: Optional[str]
+  'Current call state.'
+  target: Optional[CallContactProto]
+  'This is the target that the Dialpad user dials or receives a call from.'
+  total_duration: Optional[float]
+  'Duration of the call in milliseconds, including ring time.'
+  transcription_text: Optional[str]
+  'Text of call transcription.'
+  voicemail_share_link: Optional[str]
+  'Share link to the voicemail recording.'
+  was_recorded: Optional[bool]
+  'Boolean indicating whether or not the call was recorded.'
+
+
+class CallCollection(Model):
+  """Collection of calls."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [CallProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[CallProto]]
+  'A list of calls.'
+
+
+class CallTransferDestination(Model):
+  """Model representation of the CallTransferDestination schema."""
+
+  __slots__ = ('call_id',)
+  call_id: int
+  'The id of the ongoing call which the call should be transferred to.'
+
+
+class CallbackMessage(Model):
+  """Model representation of the CallbackMessage schema."""
+
+  __slots__ = ('call_center_id', 'phone_number')
+  call_center_id: Optional[int]
+  'The ID of a call center that will be used to fulfill the callback.'
+  phone_number: Optional[str]
+  'The e164-formatted number to call back'
+
+
+class CallbackProto(Model):
+  """Note: Position indicates the new callback request's position in the queue, with 1 being at the front."""
+
+  __slots__ = ('position',)
+  position: Optional[int]
+  "Indicates the new callback request's position in the queue, with 1 being at the front."
+
+
+class InitiateCallMessage(Model):
+  """Model representation of the InitiateCallMessage schema."""
+
+  __slots__ = ('custom_data', 'group_id', 'group_type', 'outbound_caller_id', 'phone_number')
+  custom_data: Optional[str]
+  'Extra data to associate with the call. This will be passed through to any subscribed call events.'
+  group_id: Optional[int]
+  'The ID of a group that will be used to initiate the call.'
+  group_type: Optional[Literal['callcenter', 'department', 'office']]
+  'The type of a group that will be used to initiate the call.'
+  outbound_caller_id: Optional[str]
+  'The e164-formatted number shown to the call recipient (or "blocked").\n\nIf set to "blocked", the recipient will receive a call from "unknown caller". The number can be the caller\'s number, or the caller\'s group number if the group is provided,\nor the caller\'s company reserved number.'
+  phone_number: Optional[str]
+  'The e164-formatted number to call.'
+
+
+class InitiatedCallProto(Model):
+  """Initiated call."""
+
+  __slots__ = ('device',)
+  _nested = {'device': UserDeviceProto}
+  device: Optional[UserDeviceProto]
+  'The device used to initiate the call.'
+
+
+class InitiatedIVRCallProto(Model):
+  """Initiated IVR call."""
+
+  __slots__ = ('call_id',)
+  call_id: int
+  'The ID of the initiated call.'
+
+
+class OutboundIVRMessage(Model):
+  """Model representation of the OutboundIVRMessage schema."""
+
+  __slots__ = ('custom_data', 'outbound_caller_id', 'phone_number', 'target_id', 'target_type')
+  custom_data: Optional[str]
+  'Extra data to associate with the call. This will be passed through to any subscribed call events.'
+  outbound_caller_id: Optional[str]
+  'The e164-formatted number shown to the call recipient (or "blocked").'
+  phone_number: str
+  'The e164-formatted number to call.'
+  target_id: int
+  'The ID of a group that will be used to initiate the call.'
+  target_type: Literal['callcenter', 'department', 'office']
+  'The type of a group that will be used to initiate the call.'
+
+
+class RingCallMessage(Model):
+  """Model representation of the RingCallMessage schema."""
+
+  __slots__ = (
+    'custom_data',
+    'device_id',
+    'group_id',
+    'group_type',
+    'is_consult',
+    'outbound_caller_id',
+    'phone_number',
+    'user_id',
+  )
+  custom_data: Optional[str]
+  'Extra data to associate with the call. This will be passed through to any subscribed call events.'
+  device_id: Optional[str]
+  "The device's id."
+  group_id: Optional[int]
+  'The ID of a group that will be used to initiate the call.'
+  group_type: Optional[Literal['callcenter', 'department', 'office']]
+  'The type of a group that will be used to initiate the call.'
+  is_consult: Optional[bool]
+  'Enables the creation of a second call. If there is an ongoing call, it puts it on hold.'
+  outbound_caller_id: Optional[str]
+  'The e164-formatted number shown to the call recipient (or "blocked").\n\nIf set to "blocked", the recipient will receive a call from "unknown caller". The number can be the caller\'s number, or the caller\'s group number if the group is provided, or the caller\'s company reserved number.'
+  phone_number: str
+  'The e164-formatted number to call.'
+  user_id: int
+  'The id of the user who should make the outbound call.'
+
+
+class RingCallProto(Model):
+  """Ringing call."""
+
+  __slots__ = ('call_id',)
+  call_id: Optional[int]
+  'The ID of the created call.'
+
+
+class ToggleViMessage(Model):
+  """Model representation of the ToggleViMessage schema."""
+
+  __slots__ = ('enable_vi', 'vi_locale')
+  enable_vi: Optional[bool]
+  'Whether or not call vi should be enabled.'
+  vi_locale: Optional[
+    Literal[
+      'en-au',
+      'en-ca',
+      'en-de',
+      'en-fr',
+      'en-gb',
+      'en-it',
+      'en-jp',
+      'en-mx',
+      'en-nl',
+      'en-nz',
+      'en-pt',
+      'en-us',
+      'es-au',
+      'es-ca',
+      'es-de',
+      'es-es',
+      'es-fr',
+      'es-gb',
+      'es-it',
+      'es-jp',
+      'es-mx',
+      'es-nl',
+      'es-nz',
+      'es-pt',
+      'es-us',
+      'fr-au',
+      'fr-ca',
+      'fr-de',
+      'fr-es',
+      'fr-fr',
+      'fr-gb',
+      'fr-it',
+      'fr-jp',
+      'fr-mx',
+      'fr-nl',
+      'fr-nz',
+      'fr-pt',
+      'fr-us',
+    ]
+  ]
+  'The locale to use for vi.'
+
+
+class ToggleViProto(Model):
+  """VI state."""
+
+  __slots__ = ('call_state', 'enable_vi', 'id', 'vi_locale')
+  call_state: Optional[str]
+  'Current call state.'
+  enable_vi: Optional[bool]
+  'Whether vi is enabled.'
+  id: Optional[int]
+  'The id of the toggled call.'
+  vi_locale: Optional[str]
+  'The locale used for vi.'
+
+
+class TransferCallMessage(Model):
+  """Model representation of the TransferCallMessage schema."""
+
+  __slots__ = ('custom_data', 'to', 'transfer_state')
+  custom_data: Optional[str]
+  'Extra data to associate with the call. This will be passed through to any subscribed call events.'
+  to: Optional[Union[CallTransferDestination, NumberTransferDestination, TargetTransferDestination]]
+  'Destination of the call that will be transfer. It can be a single option between a number, \nan existing call or a target'
+  transfer_state: Optional[Literal['hold', 'parked', 'preanswer', 'voicemail']]
+  "The state which the call should take when it's transferred to."
+
+
+class TransferredCallProto(Model):
+  """Transferred call."""
+
+  __slots__ = ('call_id', 'transferred_to_number', 'transferred_to_state')
+  call_id: Optional[int]
+  "The call's id."
+  transferred_to_number: Optional[str]
+  'The phone number which the call has been transferred to.'
+  transferred_to_state: Optional[Literal['hold', 'parked', 'preanswer', 'voicemail']]
+  'The state which the call has been transferred to.'
+
+
+class UnparkCallMessage(Model):
+  """Model representation of the UnparkCallMessage schema."""
+
+  __slots__ = ('user_id',)
+  user_id: int
+  'The id of the user who should unpark the call.'
+
+
+class UpdateActiveCallMessage(Model):
+  """Model representation of the UpdateActiveCallMessage schema."""
+
+  __slots__ = ('is_recording', 'play_message', 'recording_type')
+  is_recording: Optional[bool]
+  'Whether or not recording should be enabled.'
+  play_message: Optional[bool]
+  'Whether or not to play a message to indicate the call is being recorded (or recording has stopped).'
+  recording_type: Optional[Literal['all', 'group', 'user']]
+  'Whether or not to toggle recording for the operator call (personal recording),\nthe group call (department recording), or both.\n\nOnly applicable for group calls (call centers, departments, etc.)'
+
+
+class ValidateCallbackProto(Model):
+  """Callback (validation)."""
+
+  __slots__ = ('success',)
+  success: Optional[bool]
+  'Whether the callback request would have been queued successfully.'
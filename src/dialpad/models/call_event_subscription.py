@@ -0,0 +1,251 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.webhook import WebhookProto
+from dialpad.models.websocket import WebsocketProto
+
+
+class CallEventSubscriptionProto(Model):
+  """Call event subscription."""
+
+  __slots__ = (
+    'call_states',
+    'enabled',
+    'group_calls_only',
+    'id',
+    'target_id',
+    'target_type',
+    'webhook',
+    'websocket',
+  )
+  _nested = {'webhook': WebhookProto, 'websocket': WebsocketProto}
+  call_states: Optional[
+    list[
+      Literal[
+        'admin',
+        'admin_recording',
+        'ai_playbook',
+        'all',
+        'barge',
+        'blocked',
+        'call_transcription',
+        'calling',
+        'connected',
+        'csat',
+        'dispositions',
+        'eavesdrop',
+        'hangup',
+        'hold',
+        'merged',
+        'missed',
+        'monitor',
+        'parked',
+        'pcsat',
+        'postcall',
+        'preanswer',
+        'queued',
+        'recap_action_items',
+        'recap_outcome',
+        'recap_purposes',
+        'recap_summary',
+        'recording',
+        'ringing',
+        'takeover',
+        'transcription',
+        'voicemail',
+        'voicemail_uploaded',
+      ]
+    ]
+  ]
+  "The call event subscription's list of call states."
+  enabled: Optional[bool]
+  'Whether or not the call event subscription is enabled.'
+  group_calls_only: Optional[bool]
+  'Call event subscription for group calls only.'
+  id: Optional[int]
+  "The event subscription's ID, which is generated after creating an event subscription successfully."
+  target_id: Optional[int]
+  'The ID of the specific target for which events should be sent.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The target type.'
+  webhook: Optional[WebhookProto]
+  "The webhook that's associated with this event subscription."
+  websocket: Optional[WebsocketProto]
+  "The websocket's ID, which is generated after creating a webhook successfully."
+
+
+class CallEventSubscriptionCollection(Model):
+  """Collection of call event subscriptions."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [CallEventSubscriptionProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[CallEventSubscriptionProto]]
+  'A list of call event subscriptions.'
+
+
+class CreateCallEventSubscription(Model):
+  """Model representation of the CreateCallEventSubscription schema."""
+
+  __slots__ = (
+    'call_states',
+    'enabled',
+    'endpoint_id',
+    'group_calls_only',
+    'target_id',
+    'target_type',
+  )
+  call_states: Optional[
+    list[
+      Literal[
+        'admin',
+        'admin_recording',
+        'ai_playbook',
+        'all',
+        'barge',
+        'blocked',
+        'call_transcription',
+        'calling',
+        'connected',
+        'csat',
+        'dispositions',
+        'eavesdrop',
+        'hangup',
+        'hold',
+        'merged',
+        'missed',
+        'monitor',
+        'parked',
+        'pcsat',
+        'postcall',
+        'preanswer',
+        'queued',
+        'recap_action_items',
+        'recap_outcome',
+        'recap_purposes',
+        'recap_summary',
+        'recording',
+        'ringing',
+        'takeover',
+        'transcription',
+        'voicemail',
+        'voicemail_uploaded',
+      ]
+    ]
+  ]
+  "The call event subscription's list of call states."
+  enabled: Optional[bool]
+  'Whether or not the call event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully."
+  group_calls_only: Optional[bool]
+  'Call event subscription for group calls only.'
+  target_id: Optional[int]
+  'The ID of the specific target for which events should be sent.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The target type.'
+
+
+class UpdateCallEventSubscription(Model):
+  """Model representation of the UpdateCallEventSubscription schema."""
+
+  __slots__ = (
+    'call_states',
+    'enabled',
+    'endpoint_id',
+    'group_calls_only',
+    'target_id',
+    'target_type',
+  )
+  call_states: Optional[
+    list[
+      Literal[
+        'admin',
+        'admin_recording',
+        'ai_playbook',
+        'all',
+        'barge',
+        'blocked',
+        'call_transcription',
+        'calling',
+        'connected',
+        'csat',
+        'dispositions',
+        'eavesdrop',
+        'hangup',
+        'hold',
+        'merged',
+        'missed',
+        'monitor',
+        'parked',
+        'pcsat',
+        'postcall',
+        'preanswer',
+        'queued',
+        'recap_action_items',
+        'recap_outcome',
+        'recap_purposes',
+        'recap_summary',
+        'recording',
+        'ringing',
+        'takeover',
+        'transcription',
+        'voicemail',
+        'voicemail_uploaded',
+      ]
+    ]
+  ]
+  "The call event subscription's list of call states."
+  enabled: Optional[bool]
+  'Whether or not the call event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully. If you plan to pair this event subscription with another logging endpoint,\nplease provide a valid webhook ID here."
+  group_calls_only: Optional[bool]
+  'Call event subscription for group calls only.'
+  target_id: Optional[int]
+  'The ID of the specific target for which events should be sent.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The target type.'
@@ -0,0 +1,11 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class CompanyCallLabels(Model):
+  """Company Labels."""
+
+  __slots__ = ('labels',)
+  labels: Optional[list[str]]
+  'The labels associated to this company.'
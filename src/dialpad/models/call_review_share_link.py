@@ -0,0 +1,35 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class CallReviewShareLink(Model):
+  """Reponse for the call review share link."""
+
+  __slots__ = ('access_link', 'call_id', 'id', 'privacy')
+  access_link: Optional[str]
+  'The access link where the call review can be listened or downloaded.'
+  call_id: Optional[int]
+  "The call's id."
+  id: Optional[str]
+  "The call review share link's ID."
+  privacy: Optional[Literal['company', 'public']]
+  'The privacy state of the call review sharel link.'
+
+
+class CreateCallReviewShareLink(Model):
+  """Input for POST request to create a call review share link."""
+
+  __slots__ = ('call_id', 'privacy')
+  call_id: Optional[int]
+  "The call's id."
+  privacy: Optional[Literal['company', 'public']]
+  "The privacy state of the recording share link, 'company' will be set as default."
+
+
+class UpdateCallReviewShareLink(Model):
+  """Input for PUT request to update a call review share link."""
+
+  __slots__ = ('privacy',)
+  privacy: Literal['company', 'public']
+  'The privacy state of the recording share link'
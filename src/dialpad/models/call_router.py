@@ -0,0 +1,149 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.signature import SignatureProto
+
+
+class ApiCallRouterProto(Model):
+  """API call router."""
+
+  __slots__ = (
+    'default_target_id',
+    'default_target_type',
+    'enabled',
+    'id',
+    'name',
+    'office_id',
+    'phone_numbers',
+    'routing_url',
+    'signature',
+  )
+  _nested = {'signature': SignatureProto}
+  default_target_id: Optional[int]
+  'The ID of the target that should be used as a fallback destination for calls if the call router is disabled or fails.'
+  default_target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The entity type of the default target.'
+  enabled: Optional[bool]
+  'If set to False, the call router will skip the routing url and instead forward calls straight to the default target.'
+  id: Optional[int]
+  "The API call router's ID."
+  name: Optional[str]
+  '[single-line only]\n\nA human-readable display name for the router.'
+  office_id: Optional[int]
+  'The ID of the office to which this router belongs.'
+  phone_numbers: Optional[list[str]]
+  'The phone numbers that will cause inbound calls to hit this call router.'
+  routing_url: Optional[str]
+  'The URL that should be used to drive call routing decisions.'
+  signature: Optional[SignatureProto]
+  'The signature that will be used to sign JWTs for routing requests.'
+
+
+class ApiCallRouterCollection(Model):
+  """Collection of API call routers."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [ApiCallRouterProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[ApiCallRouterProto]]
+  'A list of call routers.'
+
+
+class CreateApiCallRouterMessage(Model):
+  """Model representation of the CreateApiCallRouterMessage schema."""
+
+  __slots__ = (
+    'default_target_id',
+    'default_target_type',
+    'enabled',
+    'name',
+    'office_id',
+    'routing_url',
+    'secret',
+  )
+  default_target_id: int
+  'The ID of the target that should be used as a fallback destination for calls if the call router is disabled or fails.'
+  default_target_type: Literal[
+    'callcenter',
+    'callrouter',
+    'channel',
+    'coachinggroup',
+    'coachingteam',
+    'department',
+    'office',
+    'room',
+    'staffgroup',
+    'unknown',
+    'user',
+  ]
+  'The entity type of the default target.'
+  enabled: Optional[bool]
+  'If set to False, the call router will skip the routing url and instead forward calls straight to the default target.'
+  name: str
+  '[single-line only]\n\nA human-readable display name for the router.'
+  office_id: int
+  'The ID of the office to which this router belongs.'
+  routing_url: str
+  'The URL that should be used to drive call routing decisions.'
+  secret: Optional[str]
+  "[single-line only]\n\nThe call router's signature secret. This is a plain text string that you should generate with a minimum length of 32 characters."
+
+
+class UpdateApiCallRouterMessage(Model):
+  """Model representation of the UpdateApiCallRouterMessage schema."""
+
+  __slots__ = (
+    'default_target_id',
+    'default_target_type',
+    'enabled',
+    'name',
+    'office_id',
+    'reset_error_count',
+    'routing_url',
+    'secret',
+  )
+  default_target_id: Optional[int]
+  'The ID of the target that should be used as a fallback destination for calls if the call router is disabled or fails.'
+  default_target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The entity type of the default target.'
+  enabled: Optional[bool]
+  'If set to False, the call router will skip the routing url and instead forward calls straight to the default target.'
+  name: Optional[str]
+  '[single-line only]\n\nA human-readable display name for the router.'
+  office_id: Optional[int]
+  'The ID of the office to which this router belongs.'
+  reset_error_count: Optional[bool]
+  'Sets the auto-disablement routing error count back to zero.\n\nCall routers maintain a count of the number of errors that have occured within the past hour, and automatically become disabled when that count exceeds 10.\n\nSetting enabled to true via the API will not reset that count, which means that the router will likely become disabled again after one more error. In most cases, this will be useful for testing fixes in your routing API, but in some circumstances it may be desirable to reset that counter.'
+  routing_url: Optional[str]
+  'The URL that should be used to drive call routing decisions.'
+  secret: Optional[str]
+  "[single-line only]\n\nThe call router's signature secret. This is a plain text string that you should generate with a minimum length of 32 characters."
@@ -0,0 +1,50 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class GroupProto(Model):
+  """Group caller ID."""
+
+  __slots__ = ('caller_id', 'display_name')
+  caller_id: Optional[str]
+  'A caller id from the operator group. (e164-formatted)'
+  display_name: Optional[str]
+  '[single-line only]\n\nThe operator group display name'
+
+
+class CallerIdProto(Model):
+  """Caller ID."""
+
+  __slots__ = (
+    'caller_id',
+    'forwarding_numbers',
+    'groups',
+    'id',
+    'office_main_line',
+    'phone_numbers',
+    'primary_phone',
+  )
+  _nested = {'groups': [GroupProto]}
+  caller_id: Optional[str]
+  'The caller id number for the user'
+  forwarding_numbers: Optional[list[str]]
+  "A list of phone numbers that should be dialed in addition to the user's Dialpad number(s)\nupon receiving a call."
+  groups: Optional[list[GroupProto]]
+  'The groups from the user'
+  id: int
+  'The ID of the user.'
+  office_main_line: Optional[str]
+  'The office main line number'
+  phone_numbers: Optional[list[str]]
+  'A list of phone numbers belonging to this user.'
+  primary_phone: Optional[str]
+  'The user primary phone number'
+
+
+class SetCallerIdMessage(Model):
+  """Model representation of the SetCallerIdMessage schema."""
+
+  __slots__ = ('caller_id',)
+  caller_id: str
+  "Phone number (e164 formatted) that will be defined as a Caller ID for the target. Use 'blocked' to block the Caller ID."
@@ -0,0 +1,51 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+from dialpad.models.webhook import WebhookProto
+from dialpad.models.websocket import WebsocketProto
+
+
+class ChangeLogEventSubscriptionProto(Model):
+  """Change log event subscription."""
+
+  __slots__ = ('enabled', 'id', 'webhook', 'websocket')
+  _nested = {'webhook': WebhookProto, 'websocket': WebsocketProto}
+  enabled: Optional[bool]
+  'Whether or not the change log event subscription is enabled.'
+  id: Optional[int]
+  "The event subscription's ID, which is generated after creating an event subscription successfully."
+  webhook: Optional[WebhookProto]
+  "The webhook's ID, which is generated after creating a webhook successfully."
+  websocket: Optional[WebsocketProto]
+  "The websocket's ID, which is generated after creating a webhook successfully."
+
+
+class ChangeLogEventSubscriptionCollection(Model):
+  """Collection of change log event subscriptions."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [ChangeLogEventSubscriptionProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[ChangeLogEventSubscriptionProto]]
+  'A list of change log event subscriptions.'
+
+
+class CreateChangeLogEventSubscription(Model):
+  """Model representation of the CreateChangeLogEventSubscription schema."""
+
+  __slots__ = ('enabled', 'endpoint_id')
+  enabled: Optional[bool]
+  'Whether or not the this change log event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully."
+
+
+class UpdateChangeLogEventSubscription(Model):
+  """Model representation of the UpdateChangeLogEventSubscription schema."""
+
+  __slots__ = ('enabled', 'endpoint_id')
+  enabled: Optional[bool]
+  'Whether or not the change log event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully. If you plan to pair this event subscription with another logging endpoint,\nplease provide a valid webhook ID here."
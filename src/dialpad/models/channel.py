@@ -0,0 +1,38 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class ChannelProto(Model):
+  """Channel."""
+
+  __slots__ = ('id', 'name')
+  id: Optional[int]
+  'The channel id.'
+  name: str
+  '[single-line only]\n\nThe channel name.'
+
+
+class ChannelCollection(Model):
+  """Collection of channels."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [ChannelProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of results.'
+  items: Optional[list[ChannelProto]]
+  'A list of channels.'
+
+
+class CreateChannelMessage(Model):
+  """Model representation of the CreateChannelMessage schema."""
+
+  __slots__ = ('description', 'name', 'privacy_type', 'user_id')
+  description: str
+  'The description of the channel.'
+  name: str
+  '[single-line only]\n\nThe name of the channel.'
+  privacy_type: Literal['private', 'public']
+  'The privacy type of the channel.'
+  user_id: Optional[int]
+  'The ID of the user who owns the channel. Just for company level API key.'
@@ -0,0 +1,180 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class CoachingTeamProto(Model):
+  """Coaching team."""
+
+  __slots__ = (
+    'allow_trainee_eavesdrop',
+    'company_id',
+    'country',
+    'id',
+    'name',
+    'office_id',
+    'phone_numbers',
+    'ring_seconds',
+    'state',
+    'team_description',
+  )
+  allow_trainee_eavesdrop: Optional[bool]
+  'The boolean to tell if trainees are allowed to eavesdrop.'
+  company_id: Optional[int]
+  "The company's id."
+  country: Optional[str]
+  'The country in which the coaching team is situated.'
+  id: Optional[int]
+  'Id of the coaching team.'
+  name: Optional[str]
+  '[single-line only]\n\nName of the coaching team.'
+  office_id: Optional[int]
+  "The office's id."
+  phone_numbers: Optional[list[str]]
+  'The phone number(s) assigned to this coaching team.'
+  ring_seconds: Optional[int]
+  'The number of seconds to ring the main line before going to voicemail.\n\n(or an other-wise-specified no_operators_action).'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The enablement state of the team.'
+  team_description: Optional[str]
+  'Description of the coaching team.'
+
+
+class CoachingTeamCollection(Model):
+  """Collection of coaching team."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [CoachingTeamProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of results.'
+  items: Optional[list[CoachingTeamProto]]
+  'A list of coaching teams.'
+
+
+class CoachingTeamMemberProto(Model):
+  """Coaching team member."""
+
+  __slots__ = (
+    'admin_office_ids',
+    'company_id',
+    'country',
+    'date_active',
+    'date_added',
+    'date_first_login',
+    'do_not_disturb',
+    'emails',
+    'extension',
+    'first_name',
+    'forwarding_numbers',
+    'id',
+    'image_url',
+    'is_admin',
+    'is_available',
+    'is_on_duty',
+    'is_online',
+    'is_super_admin',
+    'job_title',
+    'language',
+    'last_name',
+    'license',
+    'location',
+    'muted',
+    'office_id',
+    'phone_numbers',
+    'role',
+    'state',
+    'status_message',
+    'timezone',
+  )
+  admin_office_ids: Optional[list[int]]
+  'The list of ids of offices where the user is an admin.'
+  company_id: Optional[int]
+  "The id of user's company."
+  country: Optional[str]
+  'Country of the user.'
+  date_active: Optional[str]
+  'The date when the user is activated.'
+  date_added: Optional[str]
+  'The date when the user is added.'
+  date_first_login: Optional[str]
+  'The date when the user is logged in first time.'
+  do_not_disturb: Optional[bool]
+  'Boolean to tell if the user is on DND.'
+  emails: Optional[list[str]]
+  'Emails of the user.'
+  extension: Optional[str]
+  'Extension of the user.'
+  first_name: Optional[str]
+  '[single-line only]\n\nFirst name of the user.'
+  forwarding_numbers: Optional[list[str]]
+  'The list of forwarding numbers set for the user.'
+  id: int
+  'Unique id of the user.'
+  image_url: Optional[str]
+  "Link to the user's profile image."
+  is_admin: Optional[bool]
+  'Boolean to tell if the user is admin.'
+  is_available: Optional[bool]
+  'Boolean to tell if the user is available.'
+  is_on_duty: Optional[bool]
+  'Boolean to tell if the user is on duty.'
+  is_online: Optional[bool]
+  'Boolean to tell if the user is online.'
+  is_super_admin: Optional[bool]
+  'Boolean to tell if the user is super admin.'
+  job_title: Optional[str]
+  '[single-line only]\n\nJob title of the user.'
+  language: Optional[str]
+  'Language of the user.'
+  last_name: Optional[str]
+  '[single-line only]\n\nLast name of the User.'
+  license: Optional[
+    Literal[
+      'admins',
+      'agents',
+      'dpde_all',
+      'dpde_one',
+      'lite_lines',
+      'lite_support_agents',
+      'magenta_lines',
+      'talk',
+    ]
+  ]
+  'License of the user.'
+  location: Optional[str]
+  '[single-line only]\n\nThe self-reported location of the user.'
+  muted: Optional[bool]
+  'Boolean to tell if the user is muted.'
+  office_id: Optional[int]
+  "Id of the user's office."
+  phone_numbers: Optional[list[str]]
+  'The list of phone numbers assigned to the user.'
+  role: Literal['coach', 'trainee']
+  'The role of the user within the coaching team.'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The enablement state of the user.'
+  status_message: Optional[str]
+  '[single-line only]\n\nStatus message set by the user.'
+  timezone: Optional[str]
+  'Timezone of the user.'
+
+
+class CoachingTeamMemberCollection(Model):
+  """Collection of coaching team members."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [CoachingTeamMemberProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of results.'
+  items: Optional[list[CoachingTeamMemberProto]]
+  'A list of team members.'
+
+
+class CoachingTeamMemberMessage(Model):
+  """Coaching team membership."""
+
+  __slots__ = ('member_id', 'role')
+  member_id: str
+  'The id of the user added to the coaching team.'
+  role: Literal['coach', 'trainee']
+  'The role of the user added.'
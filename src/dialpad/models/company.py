@@ -0,0 +1,34 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class CompanyProto(Model):
+  """Company."""
+
+  __slots__ = (
+    'account_type',
+    'admin_email',
+    'country',
+    'domain',
+    'id',
+    'name',
+    'office_count',
+    'state',
+  )
+  account_type: Optional[Literal['enterprise', 'free', 'pro', 'standard']]
+  'Company pricing tier.'
+  admin_email: Optional[str]
+  'Email address of the company administrator.'
+  country: Optional[str]
+  'Primary country of the company.'
+  domain: Optional[str]
+  '[single-line only]\n\nDomain name of user emails.'
+  id: Optional[int]
+  "The company's id."
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the company.'
+  office_count: Optional[int]
+  'The number of offices belonging to this company'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'Enablement state of the company.'
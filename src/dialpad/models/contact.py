@@ -0,0 +1,174 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class ContactProto(Model):
+  """Contact."""
+
+  __slots__ = (
+    'company_name',
+    'display_name',
+    'emails',
+    'extension',
+    'first_name',
+    'id',
+    'job_title',
+    'last_name',
+    'owner_id',
+    'phones',
+    'primary_email',
+    'primary_phone',
+    'trunk_group',
+    'type',
+    'urls',
+  )
+  company_name: Optional[str]
+  '[single-line only]\n\nThe name of the company that this contact is employed by.'
+  display_name: Optional[str]
+  '[single-line only]\n\nThe formatted name that will be displayed for this contact.'
+  emails: Optional[list[str]]
+  'The email addresses associated with this contact.'
+  extension: Optional[str]
+  "The contact's extension number."
+  first_name: Optional[str]
+  '[single-line only]\n\nThe given name of the contact.'
+  id: Optional[str]
+  'The ID of the contact.'
+  job_title: Optional[str]
+  '[single-line only]\n\nThe job title of this contact.'
+  last_name: Optional[str]
+  '[single-line only]\n\nThe family name of the contact.'
+  owner_id: Optional[str]
+  'The ID of the entity that owns this contact.'
+  phones: Optional[list[str]]
+  'The phone numbers associated with this contact.'
+  primary_email: Optional[str]
+  'The email address to display in a context where only one email can be shown.'
+  primary_phone: Optional[str]
+  'The primary phone number to be used when calling this contact.'
+  trunk_group: Optional[str]
+  '[Deprecated]'
+  type: Optional[Literal['local', 'shared']]
+  'Either shared or local.'
+  urls: Optional[list[str]]
+  'A list of websites associated with or belonging to this contact.'
+
+
+class ContactCollection(Model):
+  """Collection of contacts."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [ContactProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[ContactProto]]
+  'A list of contact objects.'
+
+
+class CreateContactMessage(Model):
+  """Model representation of the CreateContactMessage schema."""
+
+  __slots__ = (
+    'company_name',
+    'emails',
+    'extension',
+    'first_name',
+    'job_title',
+    'last_name',
+    'owner_id',
+    'phones',
+    'trunk_group',
+    'urls',
+  )
+  company_name: Optional[str]
+  "[single-line only]\n\nThe contact's company name."
+  emails: Optional[list[str]]
+  "The contact's emails.\n\nThe first email in the list is the contact's primary email."
+  extension: Optional[str]
+  "The contact's extension number."
+  first_name: str
+  "[single-line only]\n\nThe contact's first name."
+  job_title: Optional[str]
+  "[single-line only]\n\nThe contact's job title."
+  last_name: str
+  "[single-line only]\n\nThe contact's last name."
+  owner_id: Optional[str]
+  'The id of the user who will own this contact.\n\nIf provided, a local contact will be created for this user. Otherwise, the contact will be created as a shared contact in your company.'
+  phones: Optional[list[str]]
+  "The contact's phone numbers.\n\nThe phone number must be in e164 format. The first number in the list is the contact's primary phone."
+  trunk_group: Optional[str]
+  '[Deprecated]'
+  urls: Optional[list[str]]
+  'A list of websites associated with or belonging to this contact.'
+
+
+class CreateContactMessageWithUid(Model):
+  """Model representation of the CreateContactMessageWithUid schema."""
+
+  __slots__ = (
+    'company_name',
+    'emails',
+    'extension',
+    'first_name',
+    'job_title',
+    'last_name',
+    'phones',
+    'trunk_group',
+    'uid',
+    'urls',
+  )
+  company_name: Optional[str]
+  "[single-line only]\n\nThe contact's company name."
+  emails: Optional[list[str]]
+  "The contact's emails.\n\nThe first email in the list is the contact's primary email."
+  extension: Optional[str]
+  "The contact's extension number."
+  first_name: str
+  "[single-line only]\n\nThe contact's first name."
+  job_title: Optional[str]
+  "[single-line only]\n\nThe contact's job title."
+  last_name: str
+  "[single-line only]\n\nThe contact's last name."
+  phones: Optional[list[str]]
+  "The contact's phone numbers.\n\nThe phone number must be in e164 format. The first number in the list is the contact's primary phone."
+  trunk_group: Optional[str]
+  '[Deprecated]'
+  uid: str
+  "The unique id to be included as part of the contact's generated id."
+  urls: Optional[list[str]]
+  'A list of websites associated with or belonging to this contact.'
+
+
+class UpdateContactMessage(Model):
+  """Model representation of the UpdateContactMessage schema."""
+
+  __slots__ = (
+    'company_name',
+    'emails',
+    'extension',
+    'first_name',
+    'job_title',
+    'last_name',
+    'phones',
+    'trunk_group',
+    'urls',
+  )
+  company_name: Optional[str]
+  "[single-line only]\n\nThe contact's company name."
+  emails: Optional[list[str]]
+  "The contact's emails.\n\nThe first email in the list is the contact's primary email."
+  extension: Optional[str]
+  "The contact's extension number."
+  first_name: Optional[str]
+  "[single-line only]\n\nThe contact's first name."
+  job_title: Optional[str]
+  "[single-line only]\n\nThe contact's job title."
+  last_name: Optional[str]
+  "[single-line only]\n\nThe contact's last name."
+  phones: Optional[list[str]]
+  "The contact's phone numbers.\n\nThe phone number must be in e164 format. The first number in the list is the contact's primary phone."
+  trunk_group: Optional[str]
+  '[Deprecated]'
+  urls: Optional[list[str]]
+  'A list of websites associated with or belonging to this contact.'
@@ -0,0 +1,57 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.webhook import WebhookProto
+from dialpad.models.websocket import WebsocketProto
+
+
+class ContactEventSubscriptionProto(Model):
+  """Contact event subscription."""
+
+  __slots__ = ('contact_type', 'enabled', 'id', 'webhook', 'websocket')
+  _nested = {'webhook': WebhookProto, 'websocket': WebsocketProto}
+  contact_type: Optional[Literal['local', 'shared']]
+  'The contact type this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the contact event subscription is enabled.'
+  id: Optional[int]
+  'The ID of the contact event subscription object.'
+  webhook: Optional[WebhookProto]
+  "The webhook's ID, which is generated after creating a webhook successfully."
+  websocket: Optional[WebsocketProto]
+  "The websocket's ID, which is generated after creating a webhook successfully."
+
+
+class ContactEventSubscriptionCollection(Model):
+  """Collection of contact event subscriptions."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [ContactEventSubscriptionProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[ContactEventSubscriptionProto]]
+  'A list event subscriptions.'
+
+
+class CreateContactEventSubscription(Model):
+  """Model representation of the CreateContactEventSubscription schema."""
+
+  __slots__ = ('contact_type', 'enabled', 'endpoint_id')
+  contact_type: Literal['local', 'shared']
+  'The contact type this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the contact event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully."
+
+
+class UpdateContactEventSubscription(Model):
+  """Model representation of the UpdateContactEventSubscription schema."""
+
+  __slots__ = ('contact_type', 'enabled', 'endpoint_id')
+  contact_type: Literal['local', 'shared']
+  'The contact type this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the contact event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully. If you plan to pair this event subscription with another logging endpoint,\nplease provide a valid webhook ID here."
@@ -0,0 +1,219 @@
+from typing import Annotated, Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class CreateCustomIvrMessage(Model):
+  """Model representation of the CreateCustomIvrMessage schema."""
+
+  __slots__ = ('description', 'file', 'ivr_type', 'name', 'target_id', 'target_type')
+  description: Optional[str]
+  '[single-line only]\n\nThe description of the new IVR. Max 256 characters.'
+  file: Annotated[str, 'base64']
+  'An MP3 audio file. The file needs to be Base64-encoded.'
+  ivr_type: Literal[
+    'ASK_FIRST_OPERATOR_NOT_AVAILABLE',
+    'AUTO_RECORDING',
+    'CALLAI_AUTO_RECORDING',
+    'CG_AUTO_RECORDING',
+    'CLOSED',
+    'CLOSED_DEPARTMENT_INTRO',
+    'CLOSED_MENU',
+    'CLOSED_MENU_OPTION',
+    'CSAT_INTRO',
+    'CSAT_OUTRO',
+    'CSAT_PREAMBLE',
+    'CSAT_QUESTION',
+    'DEPARTMENT_INTRO',
+    'GREETING',
+    'HOLD_AGENT_READY',
+    'HOLD_APPREC',
+    'HOLD_CALLBACK_ACCEPT',
+    'HOLD_CALLBACK_ACCEPTED',
+    'HOLD_CALLBACK_CONFIRM',
+    'HOLD_CALLBACK_CONFIRM_NUMBER',
+    'HOLD_CALLBACK_DIFFERENT_NUMBER',
+    'HOLD_CALLBACK_DIRECT',
+    'HOLD_CALLBACK_FULFILLED',
+    'HOLD_CALLBACK_INVALID_NUMBER',
+    'HOLD_CALLBACK_KEYPAD',
+    'HOLD_CALLBACK_REJECT',
+    'HOLD_CALLBACK_REJECTED',
+    'HOLD_CALLBACK_REQUEST',
+    'HOLD_CALLBACK_REQUESTED',
+    'HOLD_CALLBACK_SAME_NUMBER',
+    'HOLD_CALLBACK_TRY_AGAIN',
+    'HOLD_CALLBACK_UNDIALABLE',
+    'HOLD_ESCAPE_VM_EIGHT',
+    'HOLD_ESCAPE_VM_FIVE',
+    'HOLD_ESCAPE_VM_FOUR',
+    'HOLD_ESCAPE_VM_NINE',
+    'HOLD_ESCAPE_VM_ONE',
+    'HOLD_ESCAPE_VM_POUND',
+    'HOLD_ESCAPE_VM_SEVEN',
+    'HOLD_ESCAPE_VM_SIX',
+    'HOLD_ESCAPE_VM_STAR',
+    'HOLD_ESCAPE_VM_TEN',
+    'HOLD_ESCAPE_VM_THREE',
+    'HOLD_ESCAPE_VM_TWO',
+    'HOLD_ESCAPE_VM_ZERO',
+    'HOLD_INTERRUPT',
+    'HOLD_INTRO',
+    'HOLD_MUSIC',
+    'HOLD_POSITION_EIGHT',
+    'HOLD_POSITION_FIVE',
+    'HOLD_POSITION_FOUR',
+    'HOLD_POSITION_MORE',
+    'HOLD_POSITION_NINE',
+    'HOLD_POSITION_ONE',
+    'HOLD_POSITION_SEVEN',
+    'HOLD_POSITION_SIX',
+    'HOLD_POSITION_TEN',
+    'HOLD_POSITION_THREE',
+    'HOLD_POSITION_TWO',
+    'HOLD_POSITION_ZERO',
+    'HOLD_WAIT',
+    'MENU',
+    'MENU_OPTION',
+    'NEXT_TARGET',
+    'VM_DROP_MESSAGE',
+    'VM_UNAVAILABLE',
+    'VM_UNAVAILABLE_CLOSED',
+  ]
+  'Type of IVR.'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the new IVR. Max 100 characters.'
+  target_id: int
+  'The ID of the target to which you want to assign this IVR.'
+  target_type: Literal['callcenter', 'coachingteam', 'department', 'office', 'user']
+  'The type of the target to which you want to assign this IVR.'
+
+
+class CustomIvrDetailsProto(Model):
+  """Custom IVR details."""
+
+  __slots__ = ('date_added', 'description', 'id', 'name', 'selected', 'text')
+  date_added: Optional[int]
+  'Date when this IVR was added.'
+  description: Optional[str]
+  '[single-line only]\n\nThe description of the IVR.'
+  id: Optional[int]
+  'Id of this IVR.'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of this IVR.'
+  selected: Optional[bool]
+  'True if this IVR is selected for this type of IVR.'
+  text: Optional[str]
+  'The text for this IVR if there is no mp3.'
+
+
+class CustomIvrProto(Model):
+  """Custom IVR."""
+
+  __slots__ = ('ivr_type', 'ivrs')
+  _nested = {'ivrs': [CustomIvrDetailsProto]}
+  ivr_type: Optional[
+    Literal[
+      'ASK_FIRST_OPERATOR_NOT_AVAILABLE',
+      'AUTO_RECORDING',
+      'CALLAI_AUTO_RECORDING',
+      'CG_AUTO_RECORDING',
+      'CLOSED',
+      'CLOSED_DEPARTMENT_INTRO',
+      'CLOSED_MENU',
+      'CLOSED_MENU_OPTION',
+      'CSAT_INTRO',
+      'CSAT_OUTRO',
+      'CSAT_PREAMBLE',
+      'CSAT_QUESTION',
+      'DEPARTMENT_INTRO',
+      'GREETING',
+      'HOLD_AGENT_READY',
+      'HOLD_APPREC',
+      'HOLD_CALLBACK_ACCEPT',
+      'HOLD_CALLBACK_ACCEPTED',
+      'HOLD_CALLBACK_CONFIRM',
+      'HOLD_CALLBACK_CONFIRM_NUMBER',
+      'HOLD_CALLBACK_DIFFERENT_NUMBER',
+      'HOLD_CALLBACK_DIRECT',
+      'HOLD_CALLBACK_FULFILLED',
+      'HOLD_CALLBACK_INVALID_NUMBER',
+      'HOLD_CALLBACK_KEYPAD',
+      'HOLD_CALLBACK_REJECT',
+      'HOLD_CALLBACK_REJECTED',
+      'HOLD_CALLBACK_REQUEST',
+      'HOLD_CALLBACK_REQUESTED',
+      'HOLD_CALLBACK_SAME_NUMBER',
+      'HOLD_CALLBACK_TRY_AGAIN',
+      'HOLD_CALLBACK_UNDIALABLE',
+      'HOLD_ESCAPE_VM_EIGHT',
+      'HOLD_ESCAPE_VM_FIVE',
+      'HOLD_ESCAPE_VM_FOUR',
+      'HOLD_ESCAPE_VM_NINE',
+      'HOLD_ESCAPE_VM_ONE',
+      'HOLD_ESCAPE_VM_POUND',
+      'HOLD_ESCAPE_VM_SEVEN',
+      'HOLD_ESCAPE_VM_SIX',
+      'HOLD_ESCAPE_VM_STAR',
+      'HOLD_ESCAPE_VM_TEN',
+      'HOLD_ESCAPE_VM_THREE',
+      'HOLD_ESCAPE_VM_TWO',
+      'HOLD_ESCAPE_VM_ZERO',
+      'HOLD_INTERRUPT',
+      'HOLD_INTRO',
+      'HOLD_MUSIC',
+      'HOLD_POSITION_EIGHT',
+      'HOLD_POSITION_FIVE',
+      'HOLD_POSITION_FOUR',
+      'HOLD_POSITION_MORE',
+      'HOLD_POSITION_NINE',
+      'HOLD_POSITION_ONE',
+      'HOLD_POSITION_SEVEN',
+      'HOLD_POSITION_SIX',
+      'HOLD_POSITION_TEN',
+      'HOLD_POSITION_THREE',
+      'HOLD_POSITION_TWO',
+      'HOLD_POSITION_ZERO',
+      'HOLD_WAIT',
+      'MENU',
+      'MENU_OPTION',
+      'NEXT_TARGET',
+      'VM_DROP_MESSAGE',
+      'VM_UNAVAILABLE',
+      'VM_UNAVAILABLE_CLOSED',
+    ]
+  ]
+  'Type of IVR.'
+  ivrs: Optional[list[CustomIvrDetailsProto]]
+  'A list of IVR detail objects.'
+
+
+class CustomIvrCollection(Model):
+  """Collection of Custom IVRs."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [CustomIvrProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[CustomIvrProto]]
+  'A list of IVRs.'
+
+
+class UpdateCustomIvrDetailsMessage(Model):
+  """Model representation of the UpdateCustomIvrDetailsMessage schema."""
+
+  __slots__ = ('description', 'name')
+  description: Optional[str]
+  '[single-line only]\n\nThe description of the IVR.'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of this IVR.'
+
+
+class UpdateCustomIvrMessage(Model):
+  """Model representation of the UpdateCustomIvrMessage schema."""
+
+  __slots__ = ('ivr_id', 'select_option')
+  ivr_id: int
+  'The id of the ivr that you want to use for the ivr type.'
+  select_option: Optional[Literal['inbound', 'outbound']]
+  'For call center auto call recording only. Set ivr for inbound or outbound. Default is both.'
@@ -0,0 +1,81 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class DeskPhone(Model):
+  """Desk phone."""
+
+  __slots__ = (
+    'byod',
+    'device_model',
+    'firmware_version',
+    'id',
+    'mac_address',
+    'name',
+    'owner_id',
+    'owner_type',
+    'password',
+    'phone_number',
+    'port',
+    'realm',
+    'ring_notification',
+    'sip_transport_type',
+    'type',
+  )
+  byod: Optional[bool]
+  'Boolean indicating whether this desk phone was purchased through Dialpad.'
+  device_model: Optional[str]
+  '[single-line only]\n\nThe model name of the device.'
+  firmware_version: Optional[str]
+  '[single-line only]\n\nThe firmware version currently loaded onto the device.'
+  id: Optional[str]
+  'The ID of the desk phone.'
+  mac_address: Optional[str]
+  '[single-line only]\n\nThe MAC address of the device.'
+  name: Optional[str]
+  '[single-line only]\n\nA user-prescibed name for this device.'
+  owner_id: Optional[int]
+  'The ID of the device owner.'
+  owner_type: Optional[Literal['room', 'user']]
+  'The entity type of the device owner.'
+  password: Optional[str]
+  '[single-line only]\n\nA password required to make calls on with the device.'
+  phone_number: Optional[str]
+  'The phone number associated with this device.'
+  port: Optional[int]
+  'The SIP port number.'
+  realm: Optional[str]
+  'The SIP realm that this device should use.'
+  ring_notification: Optional[bool]
+  'A boolean indicating whether this device should ring when the user receives a call.'
+  sip_transport_type: Optional[Literal['tls']]
+  'The SIP transport layer protocol.'
+  type: Optional[
+    Literal[
+      'ata',
+      'audiocodes',
+      'c2t',
+      'ciscompp',
+      'dect',
+      'grandstream',
+      'mini',
+      'mitel',
+      'obi',
+      'polyandroid',
+      'polycom',
+      'sip',
+      'tickiot',
+      'yealink',
+    ]
+  ]
+  'User phone, or room phone.'
+
+
+class DeskPhoneCollection(Model):
+  """Collection of desk phones."""
+
+  __slots__ = ('items',)
+  _nested = {'items': [DeskPhone]}
+  items: Optional[list[DeskPhone]]
+  'A list of desk phones.'
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class FormatNumberResponse(Model):
+  """Formatted number."""
+
+  __slots__ = ('area_code', 'country_code', 'e164_number', 'local_number')
+  area_code: Optional[str]
+  'First portion of local formatted number. e.g. "(555)"'
+  country_code: Optional[str]
+  'Abbreviated country name in ISO 3166-1 alpha-2 format. e.g. "US"'
+  e164_number: Optional[str]
+  'Number in local format.\n\ne.g. "(555) 555-5555"'
+  local_number: Optional[str]
+  'Number in E.164 format. e.g. "+15555555555"'
@@ -0,0 +1,84 @@
+from typing import Literal, Optional, Union
+
+from dialpad.models.base import Model
+
+
+class ReservedLineType(Model):
+  """Reserved number fax line assignment."""
+
+  __slots__ = ('number', 'type')
+  number: str
+  'A phone number to assign. (e164-formatted)'
+  type: str
+  'Type of line.'
+
+
+class SearchLineType(Model):
+  """Search fax line assignment."""
+
+  __slots__ = ('area_code', 'type')
+  area_code: str
+  "An area code in which to find an available phone number for assignment. If there is no area code provided, office's area code will be used."
+  type: str
+  'Type of line.'
+
+
+class Target(Model):
+  """Model representation of the Target schema."""
+
+  __slots__ = ('target_id', 'target_type')
+  target_id: int
+  'The ID of the target to assign the fax line to.'
+  target_type: Literal['department', 'user']
+  'Type of the target to assign the fax line to.'
+
+
+class TollfreeLineType(Model):
+  """Tollfree fax line assignment."""
+
+  __slots__ = ('type',)
+  type: str
+  'Type of line.'
+
+
+class CreateFaxNumberMessage(Model):
+  """Model representation of the CreateFaxNumberMessage schema."""
+
+  __slots__ = ('line', 'target')
+  _nested = {'target': Target}
+  line: Union[ReservedLineType, SearchLineType, TollfreeLineType]
+  'Line to assign.'
+  target: Target
+  'The target to assign the number to.'
+
+
+class FaxNumberProto(Model):
+  """Fax number details."""
+
+  __slots__ = ('area_code', 'company_id', 'number', 'office_id', 'target_id', 'target_type')
+  area_code: Optional[str]
+  'The area code of the number.'
+  company_id: Optional[int]
+  'The ID of the associated company.'
+  number: str
+  'A mock parameter for testing.'
+  office_id: Optional[int]
+  'The ID of the associate office.'
+  target_id: Optional[int]
+  'The ID of the target to which this number is assigned.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The type of the target to which this number is assigned.'
@@ -0,0 +1,861 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.room import RoomProto
+from dialpad.models.user import UserProto
+
+
+class AddCallCenterOperatorMessage(Model):
+  """Model representation of the AddCallCenterOperatorMessage schema."""
+
+  __slots__ = ('keep_paid_numbers', 'license_type', 'role', 'skill_level', 'user_id')
+  keep_paid_numbers: Optional[bool]
+  'Whether or not to keep phone numbers when switching to a support license.\n\nNote: Phone numbers require additional number licenses under a support license.'
+  license_type: Optional[Literal['agents', 'lite_support_agents']]
+  'The type of license to assign to the new operator if a license is required.\n(`agents` or `lite_support_agents`). Defaults to `agents`'
+  role: Optional[Literal['admin', 'operator', 'supervisor']]
+  'The role the user should assume.'
+  skill_level: Optional[int]
+  'Skill level of the operator. Integer value in range 1 - 100. Default 100.'
+  user_id: int
+  'The ID of the user.'
+
+
+class AddOperatorMessage(Model):
+  """Model representation of the AddOperatorMessage schema."""
+
+  __slots__ = ('operator_id', 'operator_type', 'role')
+  operator_id: int
+  'ID of the operator to add.'
+  operator_type: Literal['room', 'user']
+  'Type of the operator to add. (`user` or `room`)'
+  role: Optional[Literal['admin', 'operator']]
+  'The role of the new operator. (`operator` or `admin`)'
+
+
+class AutoCallRecording(Model):
+  """Model representation of the AutoCallRecording schema."""
+
+  __slots__ = ('allow_pause_recording', 'call_recording_inbound', 'call_recording_outbound')
+  allow_pause_recording: Optional[bool]
+  'Allow agents to stop/restart a recording during a call. Default is False.'
+  call_recording_inbound: Optional[bool]
+  'Whether or not inbound calls to this call center get automatically recorded. Default is False.'
+  call_recording_outbound: Optional[bool]
+  'Whether or not outbound calls from this call center get automatically recorded. Default is False.'
+
+
+class AdvancedSettings(Model):
+  """Model representation of the AdvancedSettings schema."""
+
+  __slots__ = ('auto_call_recording', 'max_wrap_up_seconds')
+  _nested = {'auto_call_recording': AutoCallRecording}
+  auto_call_recording: Optional[AutoCallRecording]
+  'Choose which calls to and from this call center get automatically recorded. Recordings are only available to administrators of this call center, which can be found in the Dialpad app and the Calls List.'
+  max_wrap_up_seconds: Optional[int]
+  'Include a post-call wrap-up time before agents can receive their next call. Default is 0.'
+
+
+class Alerts(Model):
+  """Model representation of the Alerts schema."""
+
+  __slots__ = ('cc_service_level', 'cc_service_level_seconds')
+  cc_service_level: Optional[int]
+  'Alert supervisors when the service level drops below how many percent. Default is 95%.'
+  cc_service_level_seconds: Optional[int]
+  'Inbound calls should be answered within how many seconds. Default is 60.'
+
+
+class AvailabilityStatusProto(Model):
+  """Availability Status for a Call Center."""
+
+  __slots__ = ('name', 'status')
+  name: Optional[str]
+  '[single-line only]\n\nA descriptive name for the status. If the Call Center is within any holiday, it displays it.'
+  status: str
+  'Status of this Call Center. It can be open, closed, holiday_open or holiday_closed'
+
+
+class HoldQueueCallCenter(Model):
+  """Model representation of the HoldQueueCallCenter schema."""
+
+  __slots__ = (
+    'allow_queue_callback',
+    'announce_position',
+    'announcement_interval_seconds',
+    'max_hold_count',
+    'max_hold_seconds',
+    'queue_callback_dtmf',
+    'queue_callback_threshold',
+    'queue_escape_dtmf',
+    'stay_in_queue_after_closing',
+    'unattended_queue',
+  )
+  allow_queue_callback: Optional[bool]
+  'Whether or not to allow callers to request a callback. Default is False.'
+  announce_position: Optional[bool]
+  'Whether or not to let callers know their place in the queue. This option is not available when a maximum queue wait time of less than 2 minutes is selected. Default is True.'
+  announcement_interval_seconds: Optional[int]
+  'Hold announcement interval wait time. Default is 2 min.'
+  max_hold_count: Optional[int]
+  'If all operators are busy on other calls, send callers to a hold queue. This is to specify your queue size. Choose from 1-1000. Default is 50.'
+  max_hold_seconds: Optional[int]
+  'Maximum queue wait time in seconds. Choose from 30s to 18000s (3 hours). Default is 900s (15 min).'
+  queue_callback_dtmf: Optional[str]
+  'Allow callers to request a callback when the queue has more than queue_callback_threshold number of calls by pressing one of the followings: [0,1,2,3,4,5,6,7,8,9,*,#]. Default is 9.'
+  queue_callback_threshold: Optional[int]
+  'Allow callers to request a callback when the queue has more than this number of calls. Default is 5.'
+  queue_escape_dtmf: Optional[str]
+  'Allow callers to exit the hold queue to voicemail by pressing one of the followings:\n[0,1,2,3,4,5,6,7,8,9,*,#]. Default is *.'
+  stay_in_queue_after_closing: Optional[bool]
+  'Whether or not to allow existing calls to stay in queue after the call center has closed. Default is False.'
+  unattended_queue: Optional[bool]
+  'Whether or not to allow callers to be placed in your hold queue when no agents are available. Default is False.'
+
+
+class DtmfOptions(Model):
+  """DTMF routing options."""
+
+  __slots__ = ('action', 'action_target_id', 'action_target_type')
+  action: Optional[
+    Literal[
+      'bridge_target',
+      'company_directory',
+      'department',
+      'directory',
+      'disabled',
+      'extension',
+      'menu',
+      'message',
+      'operator',
+      'person',
+      'scripted_ivr',
+      'voicemail',
+    ]
+  ]
+  'The routing action type.'
+  action_target_id: Optional[int]
+  'The ID of the target that should be dialed.'
+  action_target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'contact',
+      'contactgroup',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The type of the target that should be dialed.'
+
+
+class DtmfMapping(Model):
+  """Model representation of the DtmfMapping schema."""
+
+  __slots__ = ('input', 'options')
+  _nested = {'options': DtmfOptions}
+  input: Optional[str]
+  'The DTMF key associated with this menu item. (0-9)'
+  options: Optional[DtmfOptions]
+  'The action that should be taken if the input key is pressed.'
+
+
+class RoutingOptionsInner(Model):
+  """Group routing options for open or closed states."""
+
+  __slots__ = (
+    'action',
+    'action_target_id',
+    'action_target_type',
+    'dtmf',
+    'operator_routing',
+    'try_dial_operators',
+  )
+  _nested = {'dtmf': [DtmfMapping]}
+  action: Literal[
+    'bridge_target',
+    'company_directory',
+    'department',
+    'directory',
+    'disabled',
+    'extension',
+    'menu',
+    'message',
+    'operator',
+    'person',
+    'scripted_ivr',
+    'voicemail',
+  ]
+  'The action that should be taken if no operators are available.'
+  action_target_id: Optional[int]
+  'The ID of the Target that inbound calls should be routed to.'
+  action_target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'contact',
+      'contactgroup',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The type of the Target that inbound calls should be routed to.'
+  dtmf: Optional[list[DtmfMapping]]
+  'DTMF menu options.'
+  operator_routing: Optional[
+    Literal['fixedorder', 'longestidle', 'mostskilled', 'random', 'roundrobin', 'simultaneous']
+  ]
+  'The routing strategy that should be used when dialing operators.'
+  try_dial_operators: bool
+  'Whether operators should be dialed on inbound calls.'
+
+
+class RoutingOptions(Model):
+  """Group routing options."""
+
+  __slots__ = ('closed', 'open')
+  _nested = {'closed': RoutingOptionsInner, 'open': RoutingOptionsInner}
+  closed: RoutingOptionsInner
+  'Routing options to use during off hours.'
+  open: RoutingOptionsInner
+  'Routing options to use during open hours.'
+
+
+class VoiceIntelligence(Model):
+  """Model representation of the VoiceIntelligence schema."""
+
+  __slots__ = ('allow_pause', 'auto_start')
+  allow_pause: Optional[bool]
+  'Allow individual users to start and stop Vi during calls. Default is True.'
+  auto_start: Optional[bool]
+  'Auto start Vi for this call center. Default is True.'
+
+
+class CallCenterProto(Model):
+  """Call center."""
+
+  __slots__ = (
+    'advanced_settings',
+    'alerts',
+    'availability_status',
+    'country',
+    'first_action',
+    'friday_hours',
+    'group_description',
+    'hold_queue',
+    'hours_on',
+    'id',
+    'monday_hours',
+    'name',
+    'no_operators_action',
+    'office_id',
+    'phone_numbers',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'state',
+    'sunday_hours',
+    'thursday_hours',
+    'timezone',
+    'tuesday_hours',
+    'voice_intelligence',
+    'wednesday_hours',
+  )
+  _nested = {
+    'advanced_settings': AdvancedSettings,
+    'alerts': Alerts,
+    'hold_queue': HoldQueueCallCenter,
+    'routing_options': RoutingOptions,
+    'voice_intelligence': VoiceIntelligence,
+  }
+  advanced_settings: Optional[AdvancedSettings]
+  'Configure call center advanced settings.'
+  alerts: Optional[Alerts]
+  'Set when alerts will be triggered.'
+  availability_status: Optional[Literal['closed', 'holiday_closed', 'holiday_open', 'open']]
+  'Availability status of the group.'
+  country: Optional[str]
+  'The country in which the user group resides.'
+  first_action: Optional[Literal['menu', 'operators']]
+  'The initial action to take upon receiving a new call.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation. Default value is ["08:00", "18:00"]'
+  group_description: Optional[str]
+  'The description of the call center.'
+  hold_queue: Optional[HoldQueueCallCenter]
+  'Configure how the calls are sent to a hold queue when all operators are busy on other calls.'
+  hours_on: Optional[bool]
+  'The time frame when the call center wants to receive calls. Default value is false, which means the call center will always take calls (24/7).'
+  id: Optional[int]
+  'The ID of the group entity.'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation. To specify when hours_on is set to True. e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM. Default value is ["08:00", "18:00"].'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the group.'
+  no_operators_action: Optional[
+    Literal[
+      'bridge_target',
+      'company_directory',
+      'department',
+      'directory',
+      'disabled',
+      'extension',
+      'menu',
+      'message',
+      'operator',
+      'person',
+      'scripted_ivr',
+      'voicemail',
+    ]
+  ]
+  'The action to take if there are no operators available to accept an inbound call.'
+  office_id: Optional[int]
+  'The ID of the office in which this group resides.'
+  phone_numbers: Optional[list[str]]
+  'A list of phone numbers belonging to this group.'
+  ring_seconds: Optional[int]
+  'The number of seconds to allow the group line to ring before going to voicemail.'
+  routing_options: Optional[RoutingOptions]
+  'Call routing options for this group.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation. Default is empty array.'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The current enablement state of this group.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation. Default is empty array.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation. Default value is ["08:00", "18:00"]'
+  timezone: Optional[str]
+  'The timezone of the group.'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation. Default value is ["08:00", "18:00"]'
+  voice_intelligence: Optional[VoiceIntelligence]
+  'Configure voice intelligence.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation. Default value is ["08:00", "18:00"]'
+
+
+class CallCenterCollection(Model):
+  """Collection of call centers."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [CallCenterProto]}
+  cursor: Optional[str]
+  'A cursor string that can be used to fetch the subsequent page.'
+  items: Optional[list[CallCenterProto]]
+  'A list containing the first page of results.'
+
+
+class CallCenterStatusProto(Model):
+  """Status information for a Call Center."""
+
+  __slots__ = ('availability', 'capacity', 'longest_call_wait_time', 'on_duty_operators', 'pending')
+  _nested = {'availability': AvailabilityStatusProto}
+  availability: AvailabilityStatusProto
+  'Availability of the Call Center.'
+  capacity: int
+  'The number of available operators.'
+  longest_call_wait_time: int
+  'The longest queued call, in seconds.'
+  on_duty_operators: int
+  'The amount of operators On Duty'
+  pending: int
+  'The number of on-hold calls.'
+
+
+class CreateCallCenterMessage(Model):
+  """Model representation of the CreateCallCenterMessage schema."""
+
+  __slots__ = (
+    'advanced_settings',
+    'alerts',
+    'friday_hours',
+    'group_description',
+    'hold_queue',
+    'hours_on',
+    'monday_hours',
+    'name',
+    'office_id',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'sunday_hours',
+    'thursday_hours',
+    'tuesday_hours',
+    'voice_intelligence',
+    'wednesday_hours',
+  )
+  _nested = {
+    'advanced_settings': AdvancedSettings,
+    'alerts': Alerts,
+    'hold_queue': HoldQueueCallCenter,
+    'routing_options': RoutingOptions,
+    'voice_intelligence': VoiceIntelligence,
+  }
+  advanced_settings: Optional[AdvancedSettings]
+  'Configure advanced call center settings.'
+  alerts: Optional[Alerts]
+  'Set when alerts will be triggered.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation. Default value is ["08:00", "18:00"].'
+  group_description: Optional[str]
+  'The description of the call center. Max 256 characters.'
+  hold_queue: Optional[HoldQueueCallCenter]
+  'Configure how the calls are sent to a hold queue when all operators are busy on other calls.'
+  hours_on: Optional[bool]
+  'The time frame when the call center wants to receive calls. Default value is false, which means the call center will always take calls (24/7).'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation. To specify when hours_on is set to True. e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM. Default value is ["08:00", "18:00"].'
+  name: str
+  '[single-line only]\n\nThe name of the call center. Max 100 characters.'
+  office_id: int
+  'The id of the office to which the call center belongs..'
+  ring_seconds: Optional[int]
+  'The number of seconds to allow the group line to ring before going to voicemail. Choose from 10 seconds to 45 seconds. Default is 30 seconds.'
+  routing_options: Optional[RoutingOptions]
+  'Call routing options for this group.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation. Default is empty array.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation. Default is empty array.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation. Default value is ["08:00", "18:00"].'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation. Default value is ["08:00", "18:00"].'
+  voice_intelligence: Optional[VoiceIntelligence]
+  'Configure voice intelligence.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation. Default value is ["08:00", "18:00"].'
+
+
+class HoldQueueDepartment(Model):
+  """Model representation of the HoldQueueDepartment schema."""
+
+  __slots__ = ('allow_queuing', 'max_hold_count', 'max_hold_seconds')
+  allow_queuing: Optional[bool]
+  'Whether or not send callers to a hold queue, if all operators are busy on other calls. Default is False.'
+  max_hold_count: Optional[int]
+  'If all operators are busy on other calls, send callers to a hold queue. This is to specify your queue size. Choose from 1-50. Default is 50.'
+  max_hold_seconds: Optional[int]
+  'Maximum queue wait time in seconds. Choose from 30s to 18000s (3 hours). Default is 900s (15 min).'
+
+
+class CreateDepartmentMessage(Model):
+  """Model representation of the CreateDepartmentMessage schema."""
+
+  __slots__ = (
+    'auto_call_recording',
+    'friday_hours',
+    'group_description',
+    'hold_queue',
+    'hours_on',
+    'monday_hours',
+    'name',
+    'office_id',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'sunday_hours',
+    'thursday_hours',
+    'tuesday_hours',
+    'voice_intelligence',
+    'wednesday_hours',
+  )
+  _nested = {
+    'hold_queue': HoldQueueDepartment,
+    'routing_options': RoutingOptions,
+    'voice_intelligence': VoiceIntelligence,
+  }
+  auto_call_recording: Optional[bool]
+  'Whether or not automatically record all calls of this department. Default is False.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation. Default value is ["08:00", "18:00"].'
+  group_description: Optional[str]
+  'The description of the department. Max 256 characters.'
+  hold_queue: Optional[HoldQueueDepartment]
+  'Configure how the calls are sent to a hold queue when all operators are busy on other calls.'
+  hours_on: Optional[bool]
+  'The time frame when the department wants to receive calls. Default value is false, which means the call center will always take calls (24/7).'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation. To specify when hours_on is set to True. e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM. Default value is ["08:00", "18:00"].'
+  name: str
+  '[single-line only]\n\nThe name of the department. Max 100 characters.'
+  office_id: int
+  'The id of the office to which the department belongs..'
+  ring_seconds: Optional[int]
+  'The number of seconds to allow the group line to ring before going to voicemail. Choose from 10 seconds to 45 seconds. Default is 30 seconds.'
+  routing_options: Optional[RoutingOptions]
+  'Call routing options for this group.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation. Default is empty array.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation. Default is empty array.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation. Default value is ["08:00", "18:00"].'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation. Default value is ["08:00", "18:00"].'
+  voice_intelligence: Optional[VoiceIntelligence]
+  'Configure voice intelligence.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation. Default value is ["08:00", "18:00"].'
+
+
+class DepartmentProto(Model):
+  """Department."""
+
+  __slots__ = (
+    'auto_call_recording',
+    'availability_status',
+    'country',
+    'first_action',
+    'friday_hours',
+    'group_description',
+    'hold_queue',
+    'hours_on',
+    'id',
+    'monday_hours',
+    'name',
+    'no_operators_action',
+    'office_id',
+    'phone_numbers',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'state',
+    'sunday_hours',
+    'thursday_hours',
+    'timezone',
+    'tuesday_hours',
+    'voice_intelligence',
+    'wednesday_hours',
+  )
+  _nested = {
+    'hold_queue': HoldQueueDepartment,
+    'routing_options': RoutingOptions,
+    'voice_intelligence': VoiceIntelligence,
+  }
+  auto_call_recording: Optional[bool]
+  'Whether or not automatically record all calls of this department. Default is False.'
+  availability_status: Optional[Literal['closed', 'holiday_closed', 'holiday_open', 'open']]
+  'Availability status of the group.'
+  country: Optional[str]
+  'The country in which the user group resides.'
+  first_action: Optional[Literal['menu', 'operators']]
+  'The initial action to take upon receiving a new call.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation. Default value is ["08:00", "18:00"]'
+  group_description: Optional[str]
+  'The description of the call center.'
+  hold_queue: Optional[HoldQueueDepartment]
+  'Configure how the calls are sent to a hold queue when all operators are busy on other calls.'
+  hours_on: Optional[bool]
+  'The time frame when the call center wants to receive calls. Default value is false, which means the call center will always take calls (24/7).'
+  id: Optional[int]
+  'The ID of the group entity.'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation. To specify when hours_on is set to True. e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM. Default value is ["08:00", "18:00"].'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the group.'
+  no_operators_action: Optional[
+    Literal[
+      'bridge_target',
+      'company_directory',
+      'department',
+      'directory',
+      'disabled',
+      'extension',
+      'menu',
+      'message',
+      'operator',
+      'person',
+      'scripted_ivr',
+      'voicemail',
+    ]
+  ]
+  'The action to take if there are no operators available to accept an inbound call.'
+  office_id: Optional[int]
+  'The ID of the office in which this group resides.'
+  phone_numbers: Optional[list[str]]
+  'A list of phone numbers belonging to this group.'
+  ring_seconds: Optional[int]
+  'The number of seconds to allow the group line to ring before going to voicemail.'
+  routing_options: Optional[RoutingOptions]
+  'Call routing options for this group.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation. Default is empty array.'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The current enablement state of this group.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation. Default is empty array.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation. Default value is ["08:00", "18:00"]'
+  timezone: Optional[str]
+  'The timezone of the group.'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation. Default value is ["08:00", "18:00"]'
+  voice_intelligence: Optional[VoiceIntelligence]
+  'Configure voice intelligence.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation. Default value is ["08:00", "18:00"]'
+
+
+class DepartmentCollection(Model):
+  """Collection of departments."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [DepartmentProto]}
+  cursor: Optional[str]
+  'A cursor string that can be used to fetch the subsequent page.'
+  items: Optional[list[DepartmentProto]]
+  'A list containing the first page of results.'
+
+
+class OperatorCollection(Model):
+  """Operators can be users or rooms."""
+
+  __slots__ = ('rooms', 'users')
+  _nested = {'rooms': [RoomProto], 'users': [UserProto]}
+  rooms: Optional[list[RoomProto]]
+  'A list of rooms that can currently act as operators for this group.'
+  users: Optional[list[UserProto]]
+  'A list of users who are currently operators of this group.'
+
+
+class OperatorDutyStatusProto(Model):
+  """Model representation of the OperatorDutyStatusProto schema."""
+
+  __slots__ = (
+    'duty_status_reason',
+    'duty_status_started',
+    'on_duty',
+    'on_duty_started',
+    'on_duty_status',
+    'user_id',
+  )
+  duty_status_reason: Optional[str]
+  '[single-line only]\n\nA description of this status.'
+  duty_status_started: Optional[int]
+  'The time stamp, in UTC, when the current on duty status changed.'
+  on_duty: Optional[bool]
+  'Whether the operator is currently on duty or off duty.'
+  on_duty_started: Optional[int]
+  'The time stamp, in UTC, when this operator became available for contact center calls.'
+  on_duty_status: Optional[
+    Literal['available', 'busy', 'occupied', 'occupied-end', 'unavailable', 'wrapup', 'wrapup-end']
+  ]
+  "A description of operator's on duty status."
+  user_id: Optional[int]
+  'The ID of the operator.'
+
+
+class OperatorSkillLevelProto(Model):
+  """Model representation of the OperatorSkillLevelProto schema."""
+
+  __slots__ = ('call_center_id', 'skill_level', 'user_id')
+  call_center_id: Optional[int]
+  "The call center's id."
+  skill_level: Optional[int]
+  'New skill level of the operator.'
+  user_id: Optional[int]
+  'The ID of the operator.'
+
+
+class RemoveCallCenterOperatorMessage(Model):
+  """Model representation of the RemoveCallCenterOperatorMessage schema."""
+
+  __slots__ = ('user_id',)
+  user_id: int
+  'ID of the operator to remove.'
+
+
+class RemoveOperatorMessage(Model):
+  """Model representation of the RemoveOperatorMessage schema."""
+
+  __slots__ = ('operator_id', 'operator_type')
+  operator_id: int
+  'ID of the operator to remove.'
+  operator_type: Literal['room', 'user']
+  'Type of the operator to remove (`user` or `room`).'
+
+
+class UpdateCallCenterMessage(Model):
+  """Model representation of the UpdateCallCenterMessage schema."""
+
+  __slots__ = (
+    'advanced_settings',
+    'alerts',
+    'friday_hours',
+    'group_description',
+    'hold_queue',
+    'hours_on',
+    'monday_hours',
+    'name',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'sunday_hours',
+    'thursday_hours',
+    'tuesday_hours',
+    'voice_intelligence',
+    'wednesday_hours',
+  )
+  _nested = {
+    'advanced_settings': AdvancedSettings,
+    'alerts': Alerts,
+    'hold_queue': HoldQueueCallCenter,
+    'routing_options': RoutingOptions,
+    'voice_intelligence': VoiceIntelligence,
+  }
+  advanced_settings: Optional[AdvancedSettings]
+  'Configure advanced call center settings.'
+  alerts: Optional[Alerts]
+  'Set when alerts will be triggered.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation. Default value is ["08:00", "18:00"].'
+  group_description: Optional[str]
+  'The description of the call center. Max 256 characters.'
+  hold_queue: Optional[HoldQueueCallCenter]
+  'Configure how the calls are sent to a hold queue when all operators are busy on other calls.'
+  hours_on: Optional[bool]
+  'The time frame when the call center wants to receive calls. Default value is false, which means the call center will always take calls (24/7).'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation. To specify when hours_on is set to True. e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM. Default value is ["08:00", "18:00"].'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the call center. Max 100 characters.'
+  ring_seconds: Optional[int]
+  'The number of seconds to allow the group line to ring before going to voicemail. Choose from 10 seconds to 45 seconds. Default is 30 seconds.'
+  routing_options: Optional[RoutingOptions]
+  'Call routing options for this group.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation. Default is empty array.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation. Default is empty array.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation. Default value is ["08:00", "18:00"].'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation. Default value is ["08:00", "18:00"].'
+  voice_intelligence: Optional[VoiceIntelligence]
+  'Configure voice intelligence.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation. Default value is ["08:00", "18:00"].'
+
+
+class UpdateDepartmentMessage(Model):
+  """Model representation of the UpdateDepartmentMessage schema."""
+
+  __slots__ = (
+    'auto_call_recording',
+    'friday_hours',
+    'group_description',
+    'hold_queue',
+    'hours_on',
+    'monday_hours',
+    'name',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'sunday_hours',
+    'thursday_hours',
+    'tuesday_hours',
+    'voice_intelligence',
+    'wednesday_hours',
+  )
+  _nested = {
+    'hold_queue': HoldQueueDepartment,
+    'routing_options': RoutingOptions,
+    'voice_intelligence': VoiceIntelligence,
+  }
+  auto_call_recording: Optional[bool]
+  'Whether or not automatically record all calls of this department. Default is False.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation. Default value is ["08:00", "18:00"].'
+  group_description: Optional[str]
+  'The description of the department. Max 256 characters.'
+  hold_queue: Optional[HoldQueueDepartment]
+  'Configure how the calls are sent to a hold queue when all operators are busy on other calls.'
+  hours_on: Optional[bool]
+  'The time frame when the department wants to receive calls. Default value is false, which means the call center will always take calls (24/7).'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation. To specify when hours_on is set to True. e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM. Default value is ["08:00", "18:00"].'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the department. Max 100 characters.'
+  ring_seconds: Optional[int]
+  'The number of seconds to allow the group line to ring before going to voicemail. Choose from 10 seconds to 45 seconds. Default is 30 seconds.'
+  routing_options: Optional[RoutingOptions]
+  'Call routing options for this group.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation. Default is empty array.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation. Default is empty array.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation. Default value is ["08:00", "18:00"].'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation. Default value is ["08:00", "18:00"].'
+  voice_intelligence: Optional[VoiceIntelligence]
+  'Configure voice intelligence.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation. Default value is ["08:00", "18:00"].'
+
+
+class UpdateOperatorDutyStatusMessage(Model):
+  """Model representation of the UpdateOperatorDutyStatusMessage schema."""
+
+  __slots__ = ('duty_status_reason', 'on_duty')
+  duty_status_reason: Optional[str]
+  '[single-line only]\n\nA description of this status.'
+  on_duty: bool
+  'True if this status message indicates an "on-duty" status.'
+
+
+class UpdateOperatorSkillLevelMessage(Model):
+  """Model representation of the UpdateOperatorSkillLevelMessage schema."""
+
+  __slots__ = ('skill_level',)
+  skill_level: int
+  'New skill level to set the operator in the call center. It must be an integer value between 0 and 100.'
+
+
+class UserOrRoomProto(Model):
+  """Operator."""
+
+  __slots__ = (
+    'company_id',
+    'country',
+    'id',
+    'image_url',
+    'is_on_duty',
+    'name',
+    'office_id',
+    'phone_numbers',
+    'state',
+  )
+  company_id: Optional[int]
+  'The company to which this entity belongs.'
+  country: Optional[str]
+  'The country in which the entity resides.'
+  id: Optional[int]
+  'The ID of this entity.'
+  image_url: Optional[str]
+  "The url of this entity's profile image."
+  is_on_duty: Optional[bool]
+  'Whether the entity is currently acting as an operator.'
+  name: Optional[str]
+  "[single-line only]\n\nThe entity's name."
+  office_id: Optional[int]
+  'The office in which this entity resides.'
+  phone_numbers: Optional[list[str]]
+  'The phone numbers associated with this entity.'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The current enablement state of this entity.'
@@ -0,0 +1,40 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class AddChannelMemberMessage(Model):
+  """Input to add members to a channel"""
+
+  __slots__ = ('user_id',)
+  user_id: int
+  'The user id.'
+
+
+class MembersProto(Model):
+  """Channel member."""
+
+  __slots__ = ('id', 'name')
+  id: Optional[int]
+  'The user id.'
+  name: Optional[str]
+  '[single-line only]\n\nThe user name.'
+
+
+class MembersCollection(Model):
+  """Collection of channel members."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [MembersProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of results.'
+  items: Optional[list[MembersProto]]
+  'A list of membser from channels.'
+
+
+class RemoveChannelMemberMessage(Model):
+  """Input to remove members from a channel"""
+
+  __slots__ = ('user_id',)
+  user_id: int
+  'The user id.'
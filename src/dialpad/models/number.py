@@ -0,0 +1,208 @@
+from typing import Literal, Optional, Union
+
+from dialpad.models.base import Model
+
+
+class AreaCodeSwap(Model):
+  """Swap number with a number in the specified area code."""
+
+  __slots__ = ('area_code', 'type')
+  area_code: Optional[str]
+  'An area code in which to find an available phone number for assignment.'
+  type: str
+  'Type of swap.'
+
+
+class AssignNumberMessage(Model):
+  """Model representation of the AssignNumberMessage schema."""
+
+  __slots__ = ('area_code', 'number', 'primary')
+  area_code: Optional[str]
+  'An area code in which to find an available phone number for assignment.'
+  number: Optional[str]
+  'A phone number to assign. (e164-formatted)'
+  primary: Optional[bool]
+  'A boolean indicating whether this should become the primary phone number.'
+
+
+class AssignNumberTargetGenericMessage(Model):
+  """Model representation of the AssignNumberTargetGenericMessage schema."""
+
+  __slots__ = ('area_code', 'number', 'primary', 'target_id', 'target_type')
+  area_code: Optional[str]
+  'An area code in which to find an available phone number for assignment.'
+  number: Optional[str]
+  'A phone number to assign. (e164-formatted)'
+  primary: Optional[bool]
+  "A boolean indicating whether this should become the target's primary phone number."
+  target_id: int
+  'The ID of the target to reassign this number to.'
+  target_type: Literal[
+    'callcenter',
+    'callrouter',
+    'channel',
+    'coachinggroup',
+    'coachingteam',
+    'department',
+    'office',
+    'room',
+    'staffgroup',
+    'unknown',
+    'user',
+  ]
+  'The type of the target.'
+
+
+class AssignNumberTargetMessage(Model):
+  """Model representation of the AssignNumberTargetMessage schema."""
+
+  __slots__ = ('primary', 'target_id', 'target_type')
+  primary: Optional[bool]
+  "A boolean indicating whether this should become the target's primary phone number."
+  target_id: int
+  'The ID of the target to reassign this number to.'
+  target_type: Literal[
+    'callcenter',
+    'callrouter',
+    'channel',
+    'coachinggroup',
+    'coachingteam',
+    'department',
+    'office',
+    'room',
+    'staffgroup',
+    'unknown',
+    'user',
+  ]
+  'The type of the target.'
+
+
+class AutoSwap(Model):
+  """Swap number with an auto-assigned number."""
+
+  __slots__ = ('type',)
+  type: str
+  'Type of swap.'
+
+
+class NumberProto(Model):
+  """Number details."""
+
+  __slots__ = (
+    'area_code',
+    'company_id',
+    'deleted',
+    'number',
+    'office_id',
+    'status',
+    'target_id',
+    'target_type',
+    'type',
+  )
+  area_code: Optional[str]
+  'The area code of the number.'
+  company_id: Optional[int]
+  'The ID of the associated company.'
+  deleted: Optional[bool]
+  'A boolean indicating whether this number has been ported out of Dialpad.'
+  number: Optional[str]
+  'The e164-formatted number.'
+  office_id: Optional[int]
+  'The ID of the associate office.'
+  status: Optional[
+    Literal[
+      'available',
+      'call_center',
+      'call_router',
+      'department',
+      'dynamic_caller',
+      'office',
+      'pending',
+      'porting',
+      'room',
+      'user',
+    ]
+  ]
+  'The current assignment status of this number.'
+  target_id: Optional[int]
+  'The ID of the target to which this number is assigned.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The type of the target to which this number is assigned.'
+  type: Optional[Literal['free', 'local', 'mobile', 'softbank', 'tollfree']]
+  'The number type.'
+
+
+class NumberCollection(Model):
+  """Collection of numbers."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [NumberProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[NumberProto]]
+  'A list of phone numbers.'
+
+
+class ProvidedNumberSwap(Model):
+  """Swap number with provided number."""
+
+  __slots__ = ('number', 'type')
+  number: Optional[str]
+  'A phone number to swap. (e164-formatted)'
+  type: str
+  'Type of swap.'
+
+
+class Target(Model):
+  """Model representation of the Target schema."""
+
+  __slots__ = ('target_id', 'target_type')
+  target_id: int
+  'The ID of the target to swap number.'
+  target_type: Literal[
+    'callcenter',
+    'callrouter',
+    'channel',
+    'coachinggroup',
+    'coachingteam',
+    'department',
+    'office',
+    'room',
+    'staffgroup',
+    'unknown',
+    'user',
+  ]
+  'The type of the target.'
+
+
+class SwapNumberMessage(Model):
+  """Model representation of the SwapNumberMessage schema."""
+
+  __slots__ = ('swap_details', 'target')
+  _nested = {'target': Target}
+  swap_details: Optional[Union[AreaCodeSwap, AutoSwap, ProvidedNumberSwap]]
+  'Type of number swap (area_code, auto, provided_number).'
+  target: Target
+  'The target for swap number.'
+
+
+class UnassignNumberMessage(Model):
+  """Model representation of the UnassignNumberMessage schema."""
+
+  __slots__ = ('number',)
+  number: str
+  'A phone number to unassign. (e164-formatted)'
@@ -0,0 +1,49 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class AuthorizationCodeGrantBodySchema(Model):
+  """Used to redeem an access token via authorization code."""
+
+  __slots__ = ('client_id', 'client_secret', 'code', 'code_verifier', 'grant_type')
+  client_id: Optional[str]
+  'The client_id of the oauth app.\n\nNote: must either be provided in the request body, or in a basic authorization header.'
+  client_secret: Optional[str]
+  'The client_secret of the oauth app.\n\nNote: must either be provided in the request body, or in a basic authorization header.'
+  code: str
+  'The authorization code that resulted from the oauth2 authorization redirect.'
+  code_verifier: Optional[str]
+  'The PKCE code verifier corresponding to the initial PKCE code challenge, if applicable.'
+  grant_type: Literal['authorization_code']
+  'The type of OAuth grant which is being requested.'
+
+
+class AuthorizeTokenResponseBodySchema(Model):
+  """Model representation of the AuthorizeTokenResponseBodySchema schema."""
+
+  __slots__ = ('access_token', 'expires_in', 'id_token', 'refresh_token', 'token_type')
+  access_token: Optional[str]
+  'A static access token.'
+  expires_in: Optional[int]
+  'The number of seconds after which the access token will become expired.'
+  id_token: Optional[str]
+  'User ID token (if using OpenID Connect)'
+  refresh_token: Optional[str]
+  'The refresh token that can be used to obtain a new token pair when this one expires.'
+  token_type: Optional[str]
+  'The type of the access_token being issued.'
+
+
+class RefreshTokenGrantBodySchema(Model):
+  """Used to exchange a refresh token for a short-lived access token and another refresh token."""
+
+  __slots__ = ('client_id', 'client_secret', 'grant_type', 'refresh_token')
+  client_id: Optional[str]
+  'The client_id of the oauth app.\n\nNote: must either be provided in the request body, or in a basic authorization header.'
+  client_secret: Optional[str]
+  'The client_secret of the oauth app.\n\nNote: must either be provided in the request body, or in a basic authorization header.'
+  grant_type: Literal['refresh_token']
+  'The type of OAuth grant which is being requested.'
+  refresh_token: str
+  'The current refresh token which is being traded in for a new token pair.'
@@ -0,0 +1,29 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class ToggleOAuthAppMessage(Model):
+  """Request body for enabling or disabling an OAuth app for a given target."""
+
+  __slots__ = ('enable', 'target_id', 'target_type')
+  enable: bool
+  'Whether or not the OAuth app should be enabled.'
+  target_id: Optional[int]
+  'The id of the target that the OAuth app should be toggled for.'
+  target_type: Optional[Literal['callcenter', 'company', 'department', 'office', 'user']]
+  'The type of the target that the OAuth app should be toggled for.'
+
+
+class ToggleOAuthAppProto(Model):
+  """OAuth app toggle state."""
+
+  __slots__ = ('oauth_app_id', 'target_id', 'target_type', 'is_enabled')
+  oauth_app_id: Optional[str]
+  "The OAuth app's id."
+  target_id: Optional[int]
+  'The id of the target that the OAuth app is connected.'
+  target_type: Optional[str]
+  'The type of the target that the OAuth app is connected.'
+  is_enabled: Optional[bool]
+  'Whether or not OAuth app is enabled.'
@@ -0,0 +1,426 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.group import RoutingOptions, VoiceIntelligence
+from dialpad.models.plan import BillingContactMessage, BillingPointOfContactMessage, PlanProto
+
+
+class E911Message(Model):
+  """E911 address."""
+
+  __slots__ = ('address', 'address2', 'city', 'country', 'state', 'zip')
+  address: str
+  '[single-line only]\n\nLine 1 of the E911 address.'
+  address2: Optional[str]
+  '[single-line only]\n\nLine 2 of the E911 address.'
+  city: str
+  '[single-line only]\n\nCity of the E911 address.'
+  country: str
+  'Country of the E911 address.'
+  state: str
+  '[single-line only]\n\nState or Province of the E911 address.'
+  zip: str
+  '[single-line only]\n\nZip code of the E911 address.'
+
+
+class CreateOfficeMessage(Model):
+  """Secondary Office creation."""
+
+  __slots__ = (
+    'annual_commit_monthly_billing',
+    'auto_call_recording',
+    'billing_address',
+    'billing_contact',
+    'country',
+    'currency',
+    'e911_address',
+    'first_action',
+    'friday_hours',
+    'group_description',
+    'hours_on',
+    'international_enabled',
+    'invoiced',
+    'mainline_number',
+    'monday_hours',
+    'name',
+    'no_operators_action',
+    'plan_period',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'sunday_hours',
+    'thursday_hours',
+    'timezone',
+    'tuesday_hours',
+    'unified_billing',
+    'use_same_address',
+    'voice_intelligence',
+    'wednesday_hours',
+  )
+  _nested = {
+    'billing_address': BillingContactMessage,
+    'billing_contact': BillingPointOfContactMessage,
+    'e911_address': E911Message,
+    'routing_options': RoutingOptions,
+    'voice_intelligence': VoiceIntelligence,
+  }
+  annual_commit_monthly_billing: bool
+  "A flag indicating if the primary office's plan is categorized as annual commit monthly billing."
+  auto_call_recording: Optional[bool]
+  'Whether or not automatically record all calls of this office. Default is False.'
+  billing_address: BillingContactMessage
+  'The billing address of this created office.'
+  billing_contact: Optional[BillingPointOfContactMessage]
+  'The billing contact information of this created office.'
+  country: Literal[
+    'AR',
+    'AT',
+    'AU',
+    'BD',
+    'BE',
+    'BG',
+    'BH',
+    'BR',
+    'CA',
+    'CH',
+    'CI',
+    'CL',
+    'CN',
+    'CO',
+    'CR',
+    'CY',
+    'CZ',
+    'DE',
+    'DK',
+    'DO',
+    'DP',
+    'EC',
+    'EE',
+    'EG',
+    'ES',
+    'FI',
+    'FR',
+    'GB',
+    'GH',
+    'GR',
+    'GT',
+    'HK',
+    'HR',
+    'HU',
+    'ID',
+    'IE',
+    'IL',
+    'IN',
+    'IS',
+    'IT',
+    'JP',
+    'KE',
+    'KH',
+    'KR',
+    'KZ',
+    'LK',
+    'LT',
+    'LU',
+    'LV',
+    'MA',
+    'MD',
+    'MM',
+    'MT',
+    'MX',
+    'MY',
+    'NG',
+    'NL',
+    'NO',
+    'NZ',
+    'PA',
+    'PE',
+    'PH',
+    'PK',
+    'PL',
+    'PR',
+    'PT',
+    'PY',
+    'RO',
+    'RU',
+    'SA',
+    'SE',
+    'SG',
+    'SI',
+    'SK',
+    'SV',
+    'TH',
+    'TR',
+    'TW',
+    'UA',
+    'US',
+    'UY',
+    'VE',
+    'VN',
+    'ZA',
+  ]
+  'The office country.'
+  currency: Literal['AUD', 'CAD', 'EUR', 'GBP', 'JPY', 'NZD', 'USD']
+  "The office's billing currency."
+  e911_address: Optional[E911Message]
+  'The emergency address of the created office.\n\nRequired for country codes of US, CA, AU, FR, GB, NZ.'
+  first_action: Optional[Literal['menu', 'operators']]
+  'The desired action when the office receives a call.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation. Default value is ["08:00", "18:00"].'
+  group_description: Optional[str]
+  'The description of the office. Max 256 characters.'
+  hours_on: Optional[bool]
+  'The time frame when the office wants to receive calls. Default value is false, which means the office will always take calls (24/7).'
+  international_enabled: Optional[bool]
+  'A flag indicating if the primary office is able to make international phone calls.'
+  invoiced: bool
+  'A flag indicating if the payment will be paid by invoice.'
+  mainline_number: Optional[str]
+  'The mainline of the office.'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation. To specify when hours_on is set to True. e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM. Default value is ["08:00", "18:00"].'
+  name: str
+  '[single-line only]\n\nThe office name.'
+  no_operators_action: Optional[
+    Literal[
+      'bridge_target',
+      'company_directory',
+      'department',
+      'directory',
+      'disabled',
+      'extension',
+      'menu',
+      'message',
+      'operator',
+      'person',
+      'scripted_ivr',
+      'voicemail',
+    ]
+  ]
+  'The action to take if there is no one available to answer calls.'
+  plan_period: Literal['monthly', 'yearly']
+  'The frequency at which the company will be billed.'
+  ring_seconds: Optional[int]
+  'The number of seconds to allow the group line to ring before going to voicemail. Choose from 10 seconds to 45 seconds.'
+  routing_options: Optional[RoutingOptions]
+  'Call routing options for this group.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation. Default is empty array.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation. Default is empty array.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation. Default value is ["08:00", "18:00"].'
+  timezone: Optional[str]
+  'Timezone using a tz database name.'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation. Default value is ["08:00", "18:00"].'
+  unified_billing: bool
+  'A flag indicating if to send a unified invoice.'
+  use_same_address: Optional[bool]
+  'A flag indicating if the billing address and the emergency address are the same.'
+  voice_intelligence: Optional[VoiceIntelligence]
+  'Configure voice intelligence.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation. Default value is ["08:00", "18:00"].'
+
+
+class E911GetProto(Model):
+  """E911 address."""
+
+  __slots__ = ('address', 'address2', 'city', 'country', 'state', 'zip')
+  address: Optional[str]
+  '[single-line only]\n\nLine 1 of the E911 address.'
+  address2: Optional[str]
+  '[single-line only]\n\nLine 2 of the E911 address.'
+  city: Optional[str]
+  '[single-line only]\n\nCity of the E911 address.'
+  country: Optional[str]
+  'Country of the E911 address.'
+  state: Optional[str]
+  '[single-line only]\n\nState or Province of the E911 address.'
+  zip: Optional[str]
+  '[single-line only]\n\nZip code of the E911 address.'
+
+
+class E911UpdateMessage(Model):
+  """Model representation of the E911UpdateMessage schema."""
+
+  __slots__ = (
+    'address',
+    'address2',
+    'city',
+    'country',
+    'state',
+    'update_all',
+    'use_validated_option',
+    'zip',
+  )
+  address: str
+  '[single-line only]\n\nLine 1 of the new E911 address.'
+  address2: Optional[str]
+  '[single-line only]\n\nLine 2 of the new E911 address.'
+  city: str
+  '[single-line only]\n\nCity of the new E911 address.'
+  country: str
+  'Country of the new E911 address.'
+  state: str
+  '[single-line only]\n\nState or Province of the new E911 address.'
+  update_all: Optional[bool]
+  'Update E911 for all users in this office.'
+  use_validated_option: Optional[bool]
+  'Whether to use the validated address option from our service.'
+  zip: str
+  '[single-line only]\n\nZip code of the new E911 address.'
+
+
+class OffDutyStatusesProto(Model):
+  """Off-duty statuses."""
+
+  __slots__ = ('id', 'off_duty_statuses')
+  id: Optional[int]
+  'The office ID.'
+  off_duty_statuses: Optional[list[str]]
+  'The off-duty statuses configured for this office.'
+
+
+class OfficeSettings(Model):
+  """Model representation of the OfficeSettings schema."""
+
+  __slots__ = (
+    'allow_device_guest_login',
+    'block_caller_id_disabled',
+    'bridged_target_recording_allowed',
+    'disable_desk_phone_self_provision',
+    'disable_ivr_voicemail',
+    'no_recording_message_on_user_calls',
+    'set_caller_id_disabled',
+  )
+  allow_device_guest_login: Optional[bool]
+  'Allows guests to use desk phones within the office.'
+  block_caller_id_disabled: Optional[bool]
+  'Whether the block-caller-ID option is disabled.'
+  bridged_target_recording_allowed: Optional[bool]
+  'Whether recordings are enabled for sub-groups of this office.\n(e.g. departments or call centers).'
+  disable_desk_phone_self_provision: Optional[bool]
+  'Whether desk-phone self-provisioning is disabled.'
+  disable_ivr_voicemail: Optional[bool]
+  'Whether the default IVR voicemail feature is disabled.'
+  no_recording_message_on_user_calls: Optional[bool]
+  'Whether recording of user calls should be disabled.'
+  set_caller_id_disabled: Optional[bool]
+  'Whether the caller-ID option is disabled.'
+
+
+class OfficeProto(Model):
+  """Office."""
+
+  __slots__ = (
+    'availability_status',
+    'country',
+    'e911_address',
+    'first_action',
+    'friday_hours',
+    'id',
+    'is_primary_office',
+    'monday_hours',
+    'name',
+    'no_operators_action',
+    'office_id',
+    'office_settings',
+    'phone_numbers',
+    'ring_seconds',
+    'routing_options',
+    'saturday_hours',
+    'state',
+    'sunday_hours',
+    'thursday_hours',
+    'timezone',
+    'tuesday_hours',
+    'wednesday_hours',
+  )
+  _nested = {
+    'e911_address': E911GetProto,
+    'office_settings': OfficeSettings,
+    'routing_options': RoutingOptions,
+  }
+  availability_status: Optional[Literal['closed', 'holiday_closed', 'holiday_open', 'open']]
+  'Availability status of the office.'
+  country: Optional[str]
+  'The country in which the office is situated.'
+  e911_address: Optional[E911GetProto]
+  'The e911 address of the office.'
+  first_action: Optional[Literal['menu', 'operators']]
+  'The desired action when the office receives a call.'
+  friday_hours: Optional[list[str]]
+  'The Friday hours of operation.'
+  id: Optional[int]
+  "The office's id."
+  is_primary_office: Optional[bool]
+  'A flag indicating if the office is a primary office of its company.'
+  monday_hours: Optional[list[str]]
+  'The Monday hours of operation.\n(e.g. ["08:00", "12:00", "14:00", "18:00"] => open from 8AM to Noon, and from 2PM to 6PM.)'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the office.'
+  no_operators_action: Optional[
+    Literal[
+      'bridge_target',
+      'company_directory',
+      'department',
+      'directory',
+      'disabled',
+      'extension',
+      'menu',
+      'message',
+      'operator',
+      'person',
+      'scripted_ivr',
+      'voicemail',
+    ]
+  ]
+  'The action to take if there is no one available to answer calls.'
+  office_id: Optional[int]
+  "The office's id."
+  office_settings: Optional[OfficeSettings]
+  'Office-specific settings object.'
+  phone_numbers: Optional[list[str]]
+  'The phone number(s) assigned to this office.'
+  ring_seconds: Optional[int]
+  'The number of seconds to ring the main line before going to voicemail.\n(or an other-wise-specified no_operators_action).'
+  routing_options: Optional[RoutingOptions]
+  'Specific call routing action to take when the office is open or closed.'
+  saturday_hours: Optional[list[str]]
+  'The Saturday hours of operation.'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The enablement-state of the office.'
+  sunday_hours: Optional[list[str]]
+  'The Sunday hours of operation.'
+  thursday_hours: Optional[list[str]]
+  'The Thursday hours of operation.'
+  timezone: Optional[str]
+  'Timezone of the office.'
+  tuesday_hours: Optional[list[str]]
+  'The Tuesday hours of operation.'
+  wednesday_hours: Optional[list[str]]
+  'The Wednesday hours of operation.'
+
+
+class OfficeCollection(Model):
+  """Collection of offices."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [OfficeProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of results.'
+  items: Optional[list[OfficeProto]]
+  'A list of offices.'
+
+
+class OfficeUpdateResponse(Model):
+  """Office update."""
+
+  __slots__ = ('office', 'plan')
+  _nested = {'office': OfficeProto, 'plan': PlanProto}
+  office: Optional[OfficeProto]
+  'The updated office object.'
+  plan: Optional[PlanProto]
+  'The updated office plan object.'
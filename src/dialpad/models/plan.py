@@ -0,0 +1,135 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class AvailableLicensesProto(Model):
+  """Available licenses."""
+
+  __slots__ = (
+    'additional_number_lines',
+    'contact_center_lines',
+    'fax_lines',
+    'room_lines',
+    'sell_lines',
+    'talk_lines',
+    'tollfree_additional_number_lines',
+    'tollfree_room_lines',
+    'tollfree_uberconference_lines',
+    'uberconference_lines',
+  )
+  additional_number_lines: Optional[int]
+  'The number of additional-number lines allocated for this plan.\n\nadditional-number lines are consumed when multiple numbers are assigned to a target. i.e. if any callable entity has more than one direct number, one additional-number line is consumed for each number after the first number. This line type is available for all account types.'
+  contact_center_lines: Optional[int]
+  'The number of contact-center lines allocated for this plan.\n\nContact-center lines are consumed for new users that can serve as call center agents, but does\n*not* include a primary number for the user. This line type is only available for pro and enterprise accounts.'
+  fax_lines: Optional[int]
+  'The number of fax lines allocated for this plan.\n\nFax lines are consumed when a fax number is assigned to a user, office, department etc. Fax lines can be used with or without a physical fax machine, as received faxes are exposed as PDFs in the Dialpad app. This line type is available for all account types.'
+  room_lines: Optional[int]
+  'The number of room lines allocated for this plan.\n\nRoom lines are consumed when a new room with a dedicated number is created. This line type is available for all account types.'
+  sell_lines: Optional[int]
+  'The number of sell lines allocated for this plan.\n\nSell lines are consumed for new users that can serve as call center agents and includes a primary number for that user. This line type is only available for pro and enterprise accounts.'
+  talk_lines: Optional[int]
+  'The number of talk lines allocated for this plan.\n\nTalk lines are consumed when a new user with a primary number is created. This line type is available for all account types, and does not include the ability for the user to be a call center agent.'
+  tollfree_additional_number_lines: Optional[int]
+  'The number of toll-free-additional-number lines allocated for this plan.\n\nThese are functionally equivalent to additional-number lines, except that the number is a toll-free number. This line type is available for all account types.'
+  tollfree_room_lines: Optional[int]
+  "The number of toll-free room lines allocated for this plan.\n\nThese are functionally equivalent to room lines, except that the room's primary number is a toll-free number (subsequent numbers for a given room will still consume additional-number/toll-free-additional-number lines rather than multiple room lines). This line type is available for all account types."
+  tollfree_uberconference_lines: Optional[int]
+  "The number of toll-free uberconference lines allocated for this plan.\n\nUberconference lines are consumed when a direct number is allocated for a User's uberconference room. This line type is available for all account types."
+  uberconference_lines: Optional[int]
+  "The number of uberconference lines available for this office.\n\nUberconference lines are consumed when a direct number is allocated for a User's uberconference room. This line type is available for all account types."
+
+
+class BillingContactMessage(Model):
+  """Billing contact."""
+
+  __slots__ = ('address_line_1', 'address_line_2', 'city', 'country', 'postal_code', 'region')
+  address_line_1: str
+  '[single-line only]\n\nThe first line of the billing address.'
+  address_line_2: Optional[str]
+  '[single-line only]\n\nThe second line of the billing address.'
+  city: str
+  '[single-line only]\n\nThe billing address city.'
+  country: str
+  'The billing address country.'
+  postal_code: str
+  '[single-line only]\n\nThe billing address postal code.'
+  region: str
+  '[single-line only]\n\nThe billing address region.'
+
+
+class BillingContactProto(Model):
+  """Model representation of the BillingContactProto schema."""
+
+  __slots__ = ('address_line_1', 'address_line_2', 'city', 'country', 'postal_code', 'region')
+  address_line_1: Optional[str]
+  '[single-line only]\n\nThe first line of the billing address.'
+  address_line_2: Optional[str]
+  '[single-line only]\n\nThe second line of the billing address.'
+  city: Optional[str]
+  '[single-line only]\n\nThe billing address city.'
+  country: Optional[str]
+  'The billing address country.'
+  postal_code: Optional[str]
+  '[single-line only]\n\nThe billing address postal code.'
+  region: Optional[str]
+  '[single-line only]\n\nThe billing address region.'
+
+
+class BillingPointOfContactMessage(Model):
+  """Model representation of the BillingPointOfContactMessage schema."""
+
+  __slots__ = ('email', 'name', 'phone')
+  email: str
+  'The contact email.'
+  name: str
+  '[single-line only]\n\nThe contact name.'
+  phone: Optional[str]
+  'The contact phone number.'
+
+
+class PlanProto(Model):
+  """Billing plan."""
+
+  __slots__ = (
+    'additional_number_lines',
+    'balance',
+    'contact_center_lines',
+    'fax_lines',
+    'next_billing_date',
+    'ppu_address',
+    'room_lines',
+    'sell_lines',
+    'talk_lines',
+    'tollfree_additional_number_lines',
+    'tollfree_room_lines',
+    'tollfree_uberconference_lines',
+    'uberconference_lines',
+  )
+  _nested = {'ppu_address': BillingContactProto}
+  additional_number_lines: Optional[int]
+  'The number of additional-number lines allocated for this plan.\n\nadditional-number lines are consumed when multiple numbers are assigned to a target. i.e. if any callable entity has more than one direct number, one additional-number line is consumed for each number after the first number. This line type is available for all account types.'
+  balance: Optional[str]
+  'The remaining balance for this plan.\n\nThe balance will be expressed as string-encoded floating point values and will be provided in terms of USD.'
+  contact_center_lines: Optional[int]
+  'The number of contact-center lines allocated for this plan.\n\nContact-center lines are consumed for new users that can serve as call center agents, but does\n*not* include a primary number for the user. This line type is only available for pro and enterprise accounts.'
+  fax_lines: Optional[int]
+  'The number of fax lines allocated for this plan.\n\nFax lines are consumed when a fax number is assigned to a user, office, department etc. Fax lines can be used with or without a physical fax machine, as received faxes are exposed as PDFs in the Dialpad app. This line type is available for all account types.'
+  next_billing_date: Optional[int]
+  'The UTC timestamp of the start of the next billing cycle.'
+  ppu_address: Optional[BillingContactProto]
+  'The "Place of Primary Use" address.'
+  room_lines: Optional[int]
+  'The number of room lines allocated for this plan.\n\nRoom lines are consumed when a new room with a dedicated number is created. This line type is available for all account types.'
+  sell_lines: Optional[int]
+  'The number of sell lines allocated for this plan.\n\nSell lines are consumed for new users that can serve as call center agents and includes a primary number for that user. This line type is only available for pro and enterprise accounts.'
+  talk_lines: Optional[int]
+  'The number of talk lines allocated for this plan.\n\nTalk lines are consumed when a new user with a primary number is created. This line type is available for all account types, and does not include the ability for the user to be a call center agent.'
+  tollfree_additional_number_lines: Optional[int]
+  'The number of toll-free-additional-number lines allocated for this plan.\n\nThese are functionally equivalent to additional-number lines, except that the number is a toll-free number. This line type is available for all account types.'
+  tollfree_room_lines: Optional[int]
+  "The number of toll-free room lines allocated for this plan.\n\nThese are functionally equivalent to room lines, except that the room's primary number is a toll-free number (subsequent numbers for a given room will still consume additional-number/toll-free-additional-number lines rather than multiple room lines). This line type is available for all account types."
+  tollfree_uberconference_lines: Optional[int]
+  "The number of toll-free uberconference lines allocated for this plan.\n\nUberconference lines are consumed when a direct number is allocated for a User's uberconference room. This line type is available for all account types."
+  uberconference_lines: Optional[int]
+  "The number of uberconference lines available for this office.\n\nUberconference lines are consumed when a direct number is allocated for a User's uberconference room. This line type is available for all account types."
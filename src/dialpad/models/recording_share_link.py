@@ -0,0 +1,54 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class CreateRecordingShareLink(Model):
+  """Model representation of the CreateRecordingShareLink schema."""
+
+  __slots__ = ('privacy', 'recording_id', 'recording_type')
+  privacy: Optional[Literal['admin', 'company', 'owner', 'public']]
+  'The privacy state of the recording share link.'
+  recording_id: str
+  "The recording entity's ID."
+  recording_type: Literal['admincallrecording', 'callrecording', 'voicemail']
+  'The type of the recording entity shared via the link.'
+
+
+class RecordingShareLink(Model):
+  """Recording share link."""
+
+  __slots__ = (
+    'access_link',
+    'call_id',
+    'created_by_id',
+    'date_added',
+    'id',
+    'item_id',
+    'privacy',
+    'type',
+  )
+  access_link: Optional[str]
+  'The access link where recording can be listened or downloaded.'
+  call_id: Optional[int]
+  "The call's id."
+  created_by_id: Optional[int]
+  'The ID of the target who created the link.'
+  date_added: Optional[str]
+  'The date when the recording share link is created.'
+  id: Optional[str]
+  "The recording share link's ID."
+  item_id: Optional[str]
+  'The ID of the recording entity shared via the link.'
+  privacy: Optional[Literal['admin', 'company', 'owner', 'public']]
+  'The privacy state of the recording share link.'
+  type: Optional[Literal['admincallrecording', 'callrecording', 'voicemail']]
+  'The type of the recording entity shared via the link.'
+
+
+class UpdateRecordingShareLink(Model):
+  """Model representation of the UpdateRecordingShareLink schema."""
+
+  __slots__ = ('privacy',)
+  privacy: Literal['admin', 'company', 'owner', 'public']
+  'The privacy state of the recording share link.'
@@ -0,0 +1,187 @@
+"""Maps each API operation id to the Model of its response."""
+
+RESPONSE_MODELS = {
+  'accesscontrolpolicies.assign': 'access_control_policies.PolicyAssignmentProto',
+  'accesscontrolpolicies.assignments': 'access_control_policies.PolicyAssignmentCollection',
+  'accesscontrolpolicies.create': 'access_control_policies.PolicyProto',
+  'accesscontrolpolicies.delete': 'access_control_policies.PolicyProto',
+  'accesscontrolpolicies.get': 'access_control_policies.PolicyProto',
+  'accesscontrolpolicies.list': 'access_control_policies.PoliciesCollection',
+  'accesscontrolpolicies.unassign': 'access_control_policies.PolicyAssignmentProto',
+  'accesscontrolpolicies.update': 'access_control_policies.PolicyProto',
+  'app_settings.get': 'app.setting.AppSettingProto',
+  'blockednumbers.get': 'blocked_number.BlockedNumber',
+  'blockednumbers.list': 'blocked_number.BlockedNumberCollection',
+  'call.call': 'call.RingCallProto',
+  'call.callback': 'call.CallbackProto',
+  'call.get_call_info': 'call.CallProto',
+  'call.initiate_ivr_call': 'call.InitiatedIVRCallProto',
+  'call.list': 'call.CallCollection',
+  'call.participants.add': 'call.RingCallProto',
+  'call.put_call_labels': 'call.CallProto',
+  'call.transfer_call': 'call.TransferredCallProto',
+  'call.unpark': 'call.RingCallProto',
+  'call.validate_callback': 'call.ValidateCallbackProto',
+  'call_review_share_link.create': 'call_review_share_link.CallReviewShareLink',
+  'call_review_share_link.delete': 'call_review_share_link.CallReviewShareLink',
+  'call_review_share_link.get': 'call_review_share_link.CallReviewShareLink',
+  'call_review_share_link.update': 'call_review_share_link.CallReviewShareLink',
+  'callcenters.create': 'group.CallCenterProto',
+  'callcenters.delete': 'group.CallCenterProto',
+  'callcenters.get': 'group.CallCenterProto',
+  'callcenters.list': 'group.CallCenterCollection',
+  'callcenters.listall': 'group.CallCenterCollection',
+  'callcenters.operators.delete': 'group.UserOrRoomProto',
+  'callcenters.operators.dutystatus': 'group.OperatorDutyStatusProto',
+  'callcenters.operators.get': 'group.OperatorCollection',
+  'callcenters.operators.get.dutystatus': 'group.OperatorDutyStatusProto',
+  'callcenters.operators.get.skilllevel': 'group.OperatorSkillLevelProto',
+  'callcenters.operators.post': 'group.UserOrRoomProto',
+  'callcenters.operators.skilllevel': 'group.OperatorSkillLevelProto',
+  'callcenters.status': 'group.CallCenterStatusProto',
+  'callcenters.update': 'group.CallCenterProto',
+  'caller_id.users.get': 'caller_id.CallerIdProto',
+  'caller_id.users.post': 'caller_id.CallerIdProto',
+  'calllabel.list': 'call_label.CompanyCallLabels',
+  'callrouters.create': 'call_router.ApiCallRouterProto',
+  'callrouters.get': 'call_router.ApiCallRouterProto',
+  'callrouters.list': 'call_router.ApiCallRouterCollection',
+  'callrouters.update': 'call_router.ApiCallRouterProto',
+  'channels.get': 'channel.ChannelProto',
+  'channels.list': 'channel.ChannelCollection',
+  'channels.members.list': 'member_channel.MembersCollection',
+  'channels.members.post': 'member_channel.MembersProto',
+  'channels.post': 'channel.ChannelProto',
+  'coaching_team.get': 'coaching_team.CoachingTeamProto',
+  'coaching_team.list': 'coaching_team.CoachingTeamCollection',
+  'coaching_team.listall': 'coaching_team.CoachingTeamCollection',
+  'coaching_team.members.add': 'coaching_team.CoachingTeamMemberProto',
+  'coaching_team.members.get': 'coaching_team.CoachingTeamMemberCollection',
+  'company.get': 'company.CompanyProto',
+  'company.sms_opt_out': 'sms_opt_out.SmsOptOutListProto',
+  'conference-meetings.list': 'uberconference.meeting.MeetingSummaryCollection',
+  'conference-rooms.list': 'uberconference.room.RoomCollection',
+  'contacts.create': 'contact.ContactProto',
+  'contacts.create_with_uid': 'contact.ContactProto',
+  'contacts.delete': 'contact.ContactProto',
+  'contacts.get': 'contact.ContactProto',
+  'contacts.list': 'contact.ContactCollection',
+  'contacts.update': 'contact.ContactProto',
+  'custom_ivrs.get': 'custom_ivr.CustomIvrCollection',
+  'departments.create': 'group.DepartmentProto',
+  'departments.delete': 'group.DepartmentProto',
+  'departments.get': 'group.DepartmentProto',
+  'departments.list': 'group.DepartmentCollection',
+  'departments.listall': 'group.DepartmentCollection',
+  'departments.operators.delete': 'group.UserOrRoomProto',
+  'departments.operators.get': 'group.OperatorCollection',
+  'departments.operators.post': 'group.UserOrRoomProto',
+  'departments.update': 'group.DepartmentProto',
+  'deskphones.rooms.create_international_pin': 'room.InternationalPinProto',
+  'deskphones.rooms.get': 'deskphone.DeskPhone',
+  'deskphones.rooms.list': 'deskphone.DeskPhoneCollection',
+  'deskphones.users.get': 'deskphone.DeskPhone',
+  'deskphones.users.list': 'deskphone.DeskPhoneCollection',
+  'faxline.create': 'faxline.FaxNumberProto',
+  'format.post': 'e164_format.FormatNumberResponse',
+  'ivr.create': 'custom_ivr.CustomIvrDetailsProto',
+  'ivr.delete': 'custom_ivr.CustomIvrDetailsProto',
+  'ivr.update': 'custom_ivr.CustomIvrProto',
+  'ivr_details.update': 'custom_ivr.CustomIvrDetailsProto',
+  'numbers.assign_call_router_number.post': 'number.NumberProto',
+  'numbers.assign_number.post': 'number.NumberProto',
+  'numbers.assign_office_number.post': 'number.NumberProto',
+  'numbers.assign_room_number.post': 'number.NumberProto',
+  'numbers.assign_target_number.post': 'number.NumberProto',
+  'numbers.assign_user_number.post': 'number.NumberProto',
+  'numbers.delete': 'number.NumberProto',
+  'numbers.get': 'number.NumberProto',
+  'numbers.list': 'number.NumberCollection',
+  'numbers.office_unassign_number.post': 'number.NumberProto',
+  'numbers.room_unassign_number.post': 'number.NumberProto',
+  'numbers.swap_number.post': 'number.NumberProto',
+  'numbers.user_unassign_number.post': 'number.NumberProto',
+  'oauth2.token.post': 'oauth.AuthorizeTokenResponseBodySchema',
+  'offices.create': 'office.OfficeUpdateResponse',
+  'offices.e911.get': 'office.E911GetProto',
+  'offices.e911.update': 'office.E911GetProto',
+  'offices.get': 'office.OfficeProto',
+  'offices.list': 'office.OfficeCollection',
+  'offices.offdutystatuses.get': 'office.OffDutyStatusesProto',
+  'offices.operators.delete': 'group.UserOrRoomProto',
+  'offices.operators.get': 'group.OperatorCollection',
+  'offices.operators.post': 'group.UserOrRoomProto',
+  'plan.available_licenses.get': 'plan.AvailableLicensesProto',
+  'plan.get': 'plan.PlanProto',
+  'recording_share_link.create': 'recording_share_link.RecordingShareLink',
+  'recording_share_link.delete': 'recording_share_link.RecordingShareLink',
+  'recording_share_link.get': 'recording_share_link.RecordingShareLink',
+  'recording_share_link.update': 'recording_share_link.RecordingShareLink',
+  'rooms.delete': 'room.RoomProto',
+  'rooms.get': 'room.RoomProto',
+  'rooms.list': 'room.RoomCollection',
+  'rooms.patch': 'room.RoomProto',
+  'rooms.post': 'room.RoomProto',
+  'schedule_reports.create': 'schedule_reports.ScheduleReportsStatusEventSubscriptionProto',
+  'schedule_reports.delete': 'schedule_reports.ScheduleReportsStatusEventSubscriptionProto',
+  'schedule_reports.get': 'schedule_reports.ScheduleReportsStatusEventSubscriptionProto',
+  'schedule_reports.list': 'schedule_reports.ScheduleReportsCollection',
+  'schedule_reports.update': 'schedule_reports.ScheduleReportsStatusEventSubscriptionProto',
+  'screen_pop.initiate': 'screen_pop.InitiateScreenPopResponse',
+  'sms.send': 'sms.SMSProto',
+  'stats.create': 'stats.ProcessingProto',
+  'stats.get': 'stats.StatsProto',
+  'transcripts.get': 'transcript.TranscriptProto',
+  'transcripts.get_url': 'transcript.TranscriptUrlProto',
+  'userdevices.get': 'userdevice.UserDeviceProto',
+  'userdevices.list': 'userdevice.UserDeviceCollection',
+  'users.create': 'user.UserProto',
+  'users.delete': 'user.UserProto',
+  'users.e911.get': 'office.E911GetProto',
+  'users.e911.update': 'office.E911GetProto',
+  'users.get': 'user.UserProto',
+  'users.initiate_call': 'call.InitiatedCallProto',
+  'users.list': 'user.UserCollection',
+  'users.move_office.patch': 'user.UserProto',
+  'users.personas.get': 'user.PersonaCollection',
+  'users.toggle_call_vi': 'call.ToggleViProto',
+  'users.toggle_dnd': 'user.ToggleDNDProto',
+  'users.update': 'user.UserProto',
+  'users.update_active_call': 'call.ActiveCallProto',
+  'users.update_status': 'user.SetStatusProto',
+  'webhook.update': 'webhook.WebhookProto',
+  'webhook_agent_status_event_subscription.create': 'agent_status_event_subscription.AgentStatusEventSubscriptionProto',
+  'webhook_agent_status_event_subscription.delete': 'agent_status_event_subscription.AgentStatusEventSubscriptionProto',
+  'webhook_agent_status_event_subscription.get': 'agent_status_event_subscription.AgentStatusEventSubscriptionProto',
+  'webhook_agent_status_event_subscription.list': 'agent_status_event_subscription.AgentStatusEventSubscriptionCollection',
+  'webhook_agent_status_event_subscription.update': 'agent_status_event_subscription.AgentStatusEventSubscriptionProto',
+  'webhook_call_event_subscription.create': 'call_event_subscription.CallEventSubscriptionProto',
+  'webhook_call_event_subscription.delete': 'call_event_subscription.CallEventSubscriptionProto',
+  'webhook_call_event_subscription.get': 'call_event_subscription.CallEventSubscriptionProto',
+  'webhook_call_event_subscription.list': 'call_event_subscription.CallEventSubscriptionCollection',
+  'webhook_call_event_subscription.update': 'call_event_subscription.CallEventSubscriptionProto',
+  'webhook_change_log_event_subscription.create': 'change_log_event_subscription.ChangeLogEventSubscriptionProto',
+  'webhook_change_log_event_subscription.delete': 'change_log_event_subscription.ChangeLogEventSubscriptionProto',
+  'webhook_change_log_event_subscription.get': 'change_log_event_subscription.ChangeLogEventSubscriptionProto',
+  'webhook_change_log_event_subscription.list': 'change_log_event_subscription.ChangeLogEventSubscriptionCollection',
+  'webhook_change_log_event_subscription.update': 'change_log_event_subscription.ChangeLogEventSubscriptionProto',
+  'webhook_contact_event_subscription.create': 'contact_event_subscription.ContactEventSubscriptionProto',
+  'webhook_contact_event_subscription.delete': 'contact_event_subscription.ContactEventSubscriptionProto',
+  'webhook_contact_event_subscription.get': 'contact_event_subscription.ContactEventSubscriptionProto',
+  'webhook_contact_event_subscription.list': 'contact_event_subscription.ContactEventSubscriptionCollection',
+  'webhook_contact_event_subscription.update': 'contact_event_subscription.ContactEventSubscriptionProto',
+  'webhook_sms_event_subscription.create': 'sms_event_subscription.SmsEventSubscriptionProto',
+  'webhook_sms_event_subscription.delete': 'sms_event_subscription.SmsEventSubscriptionProto',
+  'webhook_sms_event_subscription.get': 'sms_event_subscription.SmsEventSubscriptionProto',
+  'webhook_sms_event_subscription.list': 'sms_event_subscription.SmsEventSubscriptionCollection',
+  'webhook_sms_event_subscription.update': 'sms_event_subscription.SmsEventSubscriptionProto',
+  'webhooks.create': 'webhook.WebhookProto',
+  'webhooks.delete': 'webhook.WebhookProto',
+  'webhooks.get': 'webhook.WebhookProto',
+  'webhooks.list': 'webhook.WebhookCollection',
+  'websockets.create': 'websocket.WebsocketProto',
+  'websockets.delete': 'websocket.WebsocketProto',
+  'websockets.get': 'websocket.WebsocketProto',
+  'websockets.list': 'websocket.WebsocketCollection',
+  'websockets.update': 'websocket.WebsocketProto',
+}
@@ -0,0 +1,91 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class CreateInternationalPinProto(Model):
+  """Input to create a PIN for protected international calls from room."""
+
+  __slots__ = ('customer_ref',)
+  customer_ref: Optional[str]
+  '[single-line only]\n\nAn identifier to be printed in the usage summary. Typically used for identifying the person who requested the PIN.'
+
+
+class CreateRoomMessage(Model):
+  """Model representation of the CreateRoomMessage schema."""
+
+  __slots__ = ('name', 'office_id')
+  name: str
+  '[single-line only]\n\nThe name of the room.'
+  office_id: int
+  'The office in which this room resides.'
+
+
+class InternationalPinProto(Model):
+  """Full response body for get pin operation."""
+
+  __slots__ = ('customer_ref', 'expires_on', 'pin')
+  customer_ref: Optional[str]
+  '[single-line only]\n\nAn identifier to be printed in the usage summary. Typically used for identifying the person who requested the PIN.'
+  expires_on: Optional[str]
+  'A time after which the PIN will no longer be valid.'
+  pin: Optional[str]
+  'A PIN that must be entered to make international calls.'
+
+
+class RoomProto(Model):
+  """Room."""
+
+  __slots__ = (
+    'company_id',
+    'country',
+    'id',
+    'image_url',
+    'is_free',
+    'is_on_duty',
+    'name',
+    'office_id',
+    'phone_numbers',
+    'state',
+  )
+  company_id: Optional[int]
+  "The ID of this room's company."
+  country: Optional[str]
+  'The country in which the room resides.'
+  id: Optional[int]
+  'The ID of the room.'
+  image_url: Optional[str]
+  'The profile image to use when displaying this room in the Dialpad app.'
+  is_free: Optional[bool]
+  'A boolean indicating whether this room is consuming a license with an associated cost.'
+  is_on_duty: Optional[bool]
+  'A boolean indicating whether this room is actively acting as an operator.'
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the room.'
+  office_id: Optional[int]
+  "The ID of this room's office."
+  phone_numbers: Optional[list[str]]
+  'The phone numbers assigned to this room.'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The current enablement state of this room.'
+
+
+class RoomCollection(Model):
+  """Collection of rooms."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [RoomProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[RoomProto]]
+  'A list of rooms.'
+
+
+class UpdateRoomMessage(Model):
+  """Model representation of the UpdateRoomMessage schema."""
+
+  __slots__ = ('name', 'phone_numbers')
+  name: Optional[str]
+  '[single-line only]\n\nThe name of the room.'
+  phone_numbers: Optional[list[str]]
+  'A list of all phone numbers assigned to the room.\n\nNumbers can be re-ordered or removed from this list to unassign them.'
@@ -0,0 +1,136 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.webhook import WebhookProto
+from dialpad.models.websocket import WebsocketProto
+
+
+class ProcessScheduleReportsMessage(Model):
+  """Model representation of the ProcessScheduleReportsMessage schema."""
+
+  __slots__ = (
+    'at',
+    'coaching_group',
+    'enabled',
+    'endpoint_id',
+    'frequency',
+    'name',
+    'on_day',
+    'report_type',
+    'target_id',
+    'target_type',
+    'timezone',
+  )
+  at: int
+  'Hour of the day when the report will execute considering the frequency and timezones between 0 and 23  e.g. 10 will be 10:00 am.'
+  coaching_group: Optional[bool]
+  'Whether the the statistics should be for trainees of the coach group with the given target_id.'
+  enabled: Optional[bool]
+  'Whether or not this schedule reports event subscription is enabled.'
+  endpoint_id: int
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully."
+  frequency: Literal['daily', 'monthly', 'weekly']
+  'How often the report will execute.'
+  name: str
+  '[single-line only]\n\nThe name of the schedule reports.'
+  on_day: int
+  'The day of the week or month when the report will execute considering the frequency. daily=0, weekly=0-6, monthly=0-30.'
+  report_type: Literal[
+    'call_logs', 'daily_statistics', 'recordings', 'user_statistics', 'voicemails'
+  ]
+  'The type of report that will be generated.'
+  target_id: Optional[int]
+  "The target's id."
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  "Target's type."
+  timezone: Optional[str]
+  'Timezone using a tz database name.'
+
+
+class ScheduleReportsStatusEventSubscriptionProto(Model):
+  """Schedule report status event subscription."""
+
+  __slots__ = (
+    'at',
+    'coaching_group',
+    'enabled',
+    'frequency',
+    'id',
+    'name',
+    'on_day',
+    'report_type',
+    'target_id',
+    'target_type',
+    'timezone',
+    'webhook',
+    'websocket',
+  )
+  _nested = {'webhook': WebhookProto, 'websocket': WebsocketProto}
+  at: Optional[int]
+  'Hour of the day when the report will execute considering the frequency and timezones between 0 and 23  e.g. 10 will be 10:00 am.'
+  coaching_group: Optional[bool]
+  'Whether the the statistics should be for trainees of the coach group with the given target_id.'
+  enabled: Optional[bool]
+  'Whether or not the this agent status event subscription is enabled.'
+  frequency: Optional[str]
+  'The frequency of the schedule reports.'
+  id: Optional[int]
+  "The schedule reports subscription's ID, which is generated after creating an schedule reports subscription successfully."
+  name: Optional[str]
+  '[single-line only]\n\nThe day to be send the schedule reports.'
+  on_day: Optional[int]
+  'The day of the week or month when the report will execute considering the frequency. daily=0, weekly=0-6, monthly=0-30.'
+  report_type: Literal[
+    'call_logs', 'daily_statistics', 'recordings', 'user_statistics', 'voicemails'
+  ]
+  'The report options filters.'
+  target_id: Optional[int]
+  "The target's id."
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'company',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  "Target's type."
+  timezone: Optional[str]
+  'Timezone using a tz database name.'
+  webhook: Optional[WebhookProto]
+  "The webhook's ID, which is generated after creating a webhook successfully."
+  websocket: Optional[WebsocketProto]
+  "The websocket's ID, which is generated after creating a webhook successfully."
+
+
+class ScheduleReportsCollection(Model):
+  """Schedule reports collection."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [ScheduleReportsStatusEventSubscriptionProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of results.'
+  items: Optional[list[ScheduleReportsStatusEventSubscriptionProto]]
+  'A list of schedule reports.'
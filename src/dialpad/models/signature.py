@@ -0,0 +1,15 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class SignatureProto(Model):
+  """Signature settings."""
+
+  __slots__ = ('algo', 'secret', 'type')
+  algo: Optional[str]
+  'The hash algorithm used to compute the signature.'
+  secret: Optional[str]
+  '[single-line only]\n\nThe secret string that will be used to sign the payload.'
+  type: Optional[str]
+  'The signature token type.\n\n(i.e. `jwt`)'
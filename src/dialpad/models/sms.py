@@ -0,0 +1,146 @@
+from typing import Annotated, Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class SMSProto(Model):
+  """SMS message."""
+
+  __slots__ = (
+    'contact_id',
+    'created_date',
+    'device_type',
+    'direction',
+    'from_number',
+    'id',
+    'message_delivery_result',
+    'message_status',
+    'target_id',
+    'target_type',
+    'text',
+    'to_numbers',
+    'user_id',
+  )
+  contact_id: Optional[str]
+  'The ID of the specific contact which SMS should be sent to.'
+  created_date: Optional[str]
+  'Date of SMS creation.'
+  device_type: Optional[
+    Literal[
+      'android',
+      'ata',
+      'audiocodes',
+      'c2t',
+      'ciscompp',
+      'dect',
+      'dpmroom',
+      'grandstream',
+      'harness',
+      'iframe_cti_extension',
+      'iframe_front',
+      'iframe_hubspot',
+      'iframe_ms_teams',
+      'iframe_open_cti',
+      'iframe_salesforce',
+      'iframe_service_titan',
+      'iframe_zendesk',
+      'ipad',
+      'iphone',
+      'mini',
+      'mitel',
+      'msteams',
+      'native',
+      'obi',
+      'packaged_app',
+      'polyandroid',
+      'polycom',
+      'proxy',
+      'public_api',
+      'salesforce',
+      'sip',
+      'tickiot',
+      'web',
+      'yealink',
+    ]
+  ]
+  'The device type.'
+  direction: Optional[Literal['inbound', 'outbound']]
+  'SMS direction.'
+  from_number: Optional[str]
+  'The phone number from which the SMS was sent.'
+  id: Optional[int]
+  'The ID of the SMS.'
+  message_delivery_result: Optional[
+    Literal[
+      'accepted',
+      'internal_error',
+      'invalid_destination',
+      'invalid_source',
+      'no_route',
+      'not_supported',
+      'rejected',
+      'rejected_spam',
+      'time_out',
+    ]
+  ]
+  'The final message delivery result.'
+  message_status: Optional[Literal['failed', 'pending', 'success']]
+  'The status of the SMS.'
+  target_id: Optional[int]
+  "The target's id."
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  "Target's type."
+  text: Optional[str]
+  'The contents of the message that was sent.'
+  to_numbers: Optional[list[str]]
+  'Up to 10 E164-formatted phone numbers who received the SMS.'
+  user_id: Optional[int]
+  'The ID of the user who sent the SMS.'
+
+
+class SendSMSMessage(Model):
+  """Model representation of the SendSMSMessage schema."""
+
+  __slots__ = (
+    'channel_hashtag',
+    'from_number',
+    'infer_country_code',
+    'media',
+    'sender_group_id',
+    'sender_group_type',
+    'text',
+    'to_numbers',
+    'user_id',
+  )
+  channel_hashtag: Optional[str]
+  '[single-line only]\n\nThe hashtag of the channel which should receive the SMS.'
+  from_number: Optional[str]
+  'The number of who sending the SMS. The number must be assigned to user or a user group. It will override user_id and sender_group_id.'
+  infer_country_code: Optional[bool]
+  "If true, to_numbers will be assumed to be from the specified user's country, and the E164 format requirement will be relaxed."
+  media: Optional[Annotated[str, 'base64']]
+  'Base64-encoded media attachment (will cause the message to be sent as MMS).\n(Max 500 KiB raw file size)'
+  sender_group_id: Optional[int]
+  'The ID of an office, department, or call center that the User should send the message on behalf of.'
+  sender_group_type: Optional[Literal['callcenter', 'department', 'office']]
+  "The sender group's type (i.e. office, department, or callcenter)."
+  text: Optional[str]
+  'The contents of the message that should be sent.'
+  to_numbers: Optional[list[str]]
+  'Up to 10 E164-formatted phone numbers who should receive the SMS.'
+  user_id: Optional[int]
+  'The ID of the user who should be the sender of the SMS.'
@@ -0,0 +1,149 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+from dialpad.models.webhook import WebhookProto
+from dialpad.models.websocket import WebsocketProto
+
+
+class CreateSmsEventSubscription(Model):
+  """Model representation of the CreateSmsEventSubscription schema."""
+
+  __slots__ = (
+    'direction',
+    'enabled',
+    'endpoint_id',
+    'include_internal',
+    'status',
+    'target_id',
+    'target_type',
+  )
+  direction: Literal['all', 'inbound', 'outbound']
+  'The SMS direction this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the SMS event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully."
+  include_internal: Optional[bool]
+  'Whether or not to trigger SMS events for SMS sent between two users from the same company.'
+  status: Optional[bool]
+  'Whether or not to update on each SMS delivery status.'
+  target_id: Optional[int]
+  'The ID of the specific target for which events should be sent.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  "The target's type."
+
+
+class SmsEventSubscriptionProto(Model):
+  """Model representation of the SmsEventSubscriptionProto schema."""
+
+  __slots__ = (
+    'direction',
+    'enabled',
+    'id',
+    'include_internal',
+    'status',
+    'target_id',
+    'target_type',
+    'webhook',
+    'websocket',
+  )
+  _nested = {'webhook': WebhookProto, 'websocket': WebsocketProto}
+  direction: Optional[Literal['all', 'inbound', 'outbound']]
+  'The SMS direction this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the SMS event subscription is enabled.'
+  id: Optional[int]
+  'The ID of the SMS event subscription.'
+  include_internal: Optional[bool]
+  'Whether or not to trigger SMS events for SMS sent between two users from the same company.'
+  status: Optional[bool]
+  'Whether or not to update on each SMS delivery status.'
+  target_id: Optional[int]
+  'The ID of the specific target for which events should be sent.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  "The target's type."
+  webhook: Optional[WebhookProto]
+  "The webhook that's associated with this event subscription."
+  websocket: Optional[WebsocketProto]
+  "The websocket's ID, which is generated after creating a webhook successfully."
+
+
+class SmsEventSubscriptionCollection(Model):
+  """Collection of sms event subscriptions."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [SmsEventSubscriptionProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[SmsEventSubscriptionProto]]
+  'A list of SMS event subscriptions.'
+
+
+class UpdateSmsEventSubscription(Model):
+  """Model representation of the UpdateSmsEventSubscription schema."""
+
+  __slots__ = (
+    'direction',
+    'enabled',
+    'endpoint_id',
+    'include_internal',
+    'status',
+    'target_id',
+    'target_type',
+  )
+  direction: Optional[Literal['all', 'inbound', 'outbound']]
+  'The SMS direction this event subscription subscribes to.'
+  enabled: Optional[bool]
+  'Whether or not the SMS event subscription is enabled.'
+  endpoint_id: Optional[int]
+  "The logging endpoint's ID, which is generated after creating a webhook or websocket successfully. If you plan to pair this event subscription with another logging endpoint,\nplease provide a valid webhook ID here."
+  include_internal: Optional[bool]
+  'Whether or not to trigger SMS events for SMS sent between two users from the same company.'
+  status: Optional[bool]
+  'Whether or not to update on each SMS delivery status.'
+  target_id: Optional[int]
+  'The ID of the specific target for which events should be sent.'
+  target_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  "The target's type."
@@ -0,0 +1,44 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class TranscriptLineProto(Model):
+  """Transcript line."""
+
+  __slots__ = ('contact_id', 'content', 'name', 'time', 'type', 'user_id')
+  contact_id: Optional[str]
+  'The ID of the contact who was speaking.'
+  content: Optional[str]
+  'The transcribed text.'
+  name: Optional[str]
+  'The name of the call participant who was speaking.'
+  time: Optional[str]
+  'The time at which the line was spoken.'
+  type: Optional[
+    Literal['ai_question', 'custom_moment', 'moment', 'real_time_moment', 'transcript']
+  ]
+  'Either "moment" or "transcript".'
+  user_id: Optional[int]
+  'The ID of the user who was speaking.'
+
+
+class TranscriptProto(Model):
+  """Transcript."""
+
+  __slots__ = ('call_id', 'lines')
+  _nested = {'lines': [TranscriptLineProto]}
+  call_id: Optional[int]
+  "The call's id."
+  lines: Optional[list[TranscriptLineProto]]
+  'An array of individual lines of the transcript.'
+
+
+class TranscriptUrlProto(Model):
+  """Transcript URL."""
+
+  __slots__ = ('call_id', 'url')
+  call_id: Optional[int]
+  "The call's id."
+  url: Optional[str]
+  'The url with which the call transcript can be accessed.'
@@ -0,0 +1,93 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class MeetingParticipantProto(Model):
+  """Public API representation of an UberConference meeting participant."""
+
+  __slots__ = (
+    'call_in_method',
+    'display_name',
+    'email',
+    'is_organizer',
+    'name',
+    'phone',
+    'phone_number',
+    'talk_time',
+  )
+  call_in_method: Optional[str]
+  'The method this participant used to joined the meeting.'
+  display_name: Optional[str]
+  'Name of the meeting participant.'
+  email: Optional[str]
+  'The email address of the participant. (if applicable)'
+  is_organizer: Optional[bool]
+  "Whether or not the participant is the meeting's organizer."
+  name: Optional[str]
+  'Name of the meeting participant.'
+  phone: Optional[str]
+  'The number that the participant dialed in from. (if applicable)'
+  phone_number: Optional[str]
+  'The number that the participant dialed in from. (if applicable)'
+  talk_time: Optional[int]
+  'The amount of time this participant was speaking. (in milliseconds)'
+
+
+class MeetingRecordingProto(Model):
+  """Public API representation of an UberConference meeting recording."""
+
+  __slots__ = ('size', 'url')
+  size: Optional[str]
+  'Human-readable size of the recording files. (e.g. 14.3MB)'
+  url: Optional[str]
+  'The URL of the audio recording of the meeting.'
+
+
+class MeetingSummaryProto(Model):
+  """Public API representation of an UberConference meeting."""
+
+  __slots__ = (
+    'duration_ms',
+    'end_time',
+    'host_name',
+    'id',
+    'participants',
+    'recordings',
+    'room_id',
+    'start_time',
+    'title',
+    'transcript_url',
+  )
+  _nested = {'participants': [MeetingParticipantProto], 'recordings': [MeetingRecordingProto]}
+  duration_ms: Optional[int]
+  'The duration of the meeting in milliseconds.'
+  end_time: Optional[str]
+  'The time at which the meeting was ended. (ISO-8601 format)'
+  host_name: Optional[str]
+  'The name of the host of the meeting.'
+  id: Optional[str]
+  'The ID of the meeting.'
+  participants: Optional[list[MeetingParticipantProto]]
+  'The list of users that participated in the meeting.'
+  recordings: Optional[list[MeetingRecordingProto]]
+  'A list of recordings from the meeting.'
+  room_id: Optional[str]
+  'The ID of the conference room in which the meeting took place.'
+  start_time: Optional[str]
+  'The time at which the first participant joined the meeting. (ISO-8601 format)'
+  title: Optional[str]
+  'The name of the meeting.'
+  transcript_url: Optional[str]
+  'The URL of the meeting transcript.'
+
+
+class MeetingSummaryCollection(Model):
+  """Collection of rooms for get all room operations."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [MeetingSummaryProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request.\n\nUse the cursor provided in the previous response.'
+  items: Optional[list[MeetingSummaryProto]]
+  'A list of meeting summaries.'
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+
+
+class RoomProto(Model):
+  """Public API representation of an UberConference room."""
+
+  __slots__ = ('company_name', 'display_name', 'email', 'id', 'number', 'path')
+  company_name: Optional[str]
+  'The name of the company that owns the room.'
+  display_name: Optional[str]
+  'The name of the room.'
+  email: Optional[str]
+  'The email associated with the room owner.'
+  id: Optional[str]
+  'The ID of the meeting room.'
+  number: Optional[str]
+  'The e164-formatted dial-in number for the room.'
+  path: Optional[str]
+  'The access URL for the meeting room.'
+
+
+class RoomCollection(Model):
+  """Collection of rooms for get all room operations."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [RoomProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request.\n\nUse the cursor provided in the previous response.'
+  items: Optional[list[RoomProto]]
+  'A list of meeting rooms.'
@@ -0,0 +1,379 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class CreateUserMessage(Model):
+  """Model representation of the CreateUserMessage schema."""
+
+  __slots__ = ('auto_assign', 'email', 'first_name', 'last_name', 'license', 'office_id')
+  auto_assign: Optional[bool]
+  'If set to true, a number will be automatically assigned.'
+  email: str
+  "The user's email."
+  first_name: Optional[str]
+  "[single-line only]\n\nThe user's first name."
+  last_name: Optional[str]
+  "[single-line only]\n\nThe user's last name."
+  license: Optional[
+    Literal[
+      'admins',
+      'agents',
+      'dpde_all',
+      'dpde_one',
+      'lite_lines',
+      'lite_support_agents',
+      'magenta_lines',
+      'talk',
+    ]
+  ]
+  "The user's license type. This affects billing for the user."
+  office_id: int
+  "The user's office id."
+
+
+class E911UpdateMessage(Model):
+  """Model representation of the E911UpdateMessage schema."""
+
+  __slots__ = ('address', 'address2', 'city', 'country', 'state', 'use_validated_option', 'zip')
+  address: str
+  '[single-line only]\n\nLine 1 of the new E911 address.'
+  address2: Optional[str]
+  '[single-line only]\n\nLine 2 of the new E911 address.'
+  city: str
+  '[single-line only]\n\nCity of the new E911 address.'
+  country: str
+  'Country of the new E911 address.'
+  state: str
+  '[single-line only]\n\nState or Province of the new E911 address.'
+  use_validated_option: Optional[bool]
+  'Whether to use the validated address option from our service.'
+  zip: str
+  '[single-line only]\n\nZip of the new E911 address.'
+
+
+class GroupDetailsProto(Model):
+  """Model representation of the GroupDetailsProto schema."""
+
+  __slots__ = ('do_not_disturb', 'group_id', 'group_type', 'role')
+  do_not_disturb: Optional[bool]
+  'Whether the user is currently in do-not-disturb mode for this group.'
+  group_id: Optional[int]
+  'The ID of the group.'
+  group_type: Optional[
+    Literal[
+      'callcenter',
+      'callrouter',
+      'channel',
+      'coachinggroup',
+      'coachingteam',
+      'department',
+      'office',
+      'room',
+      'staffgroup',
+      'unknown',
+      'user',
+    ]
+  ]
+  'The group type.'
+  role: Optional[Literal['admin', 'operator', 'supervisor']]
+  "The user's role in the group."
+
+
+class MoveOfficeMessage(Model):
+  """Model representation of the MoveOfficeMessage schema."""
+
+  __slots__ = ('office_id',)
+  office_id: Optional[int]
+  "The user's office id. When provided, the user will be moved to this office."
+
+
+class PersonaProto(Model):
+  """Persona."""
+
+  __slots__ = ('caller_id', 'id', 'image_url', 'name', 'phone_numbers', 'type')
+  caller_id: Optional[str]
+  'Persona caller ID shown to receivers of calls from this persona.'
+  id: Optional[int]
+  "The user's id."
+  image_url: Optional[str]
+  'Persona image URL.'
+  name: Optional[str]
+  '[single-line only]\n\nPersona name.'
+  phone_numbers: Optional[list[str]]
+  'List of persona phone numbers.'
+  type: Optional[str]
+  'Persona type.\n\n(corresponds to a target type)'
+
+
+class PersonaCollection(Model):
+  """Collection of personas."""
+
+  __slots__ = ('items',)
+  _nested = {'items': [PersonaProto]}
+  items: Optional[list[PersonaProto]]
+  'A list of user personas.'
+
+
+class PresenceStatus(Model):
+  """Model representation of the PresenceStatus schema."""
+
+  __slots__ = ('message', 'provider', 'type')
+  message: Optional[str]
+  'The presence status message to be updated.'
+  provider: Optional[str]
+  'The provider requesting the presence status update.'
+  type: Optional[Literal['conference', 'default']]
+  'Predefined templates will be only used for the supported types.\n\nAccepts the following types:\n- `default` -- status message template: "{provider}: {message}"\n- `conference` -- status message template: "On {provider}: in the {message} meeting"\n\n`provider` and `message` should be chosen with the message template in mind.'
+
+
+class SetStatusMessage(Model):
+  """Model representation of the SetStatusMessage schema."""
+
+  __slots__ = ('expiration', 'status_message')
+  expiration: Optional[int]
+  'The expiration of this status. None for no expiration.'
+  status_message: Optional[str]
+  'The status message for the user.'
+
+
+class SetStatusProto(Model):
+  """Set user status."""
+
+  __slots__ = ('expiration', 'id', 'status_message')
+  expiration: Optional[int]
+  'The expiration of this status. None for no expiration.'
+  id: Optional[int]
+  "The user's id.\n\n('me' can be used if you are using a user level API key)"
+  status_message: Optional[str]
+  'The status message for the user.'
+
+
+class ToggleDNDMessage(Model):
+  """Model representation of the ToggleDNDMessage schema."""
+
+  __slots__ = ('do_not_disturb', 'group_id', 'group_type')
+  do_not_disturb: bool
+  'Determines if DND is ON or OFF.'
+  group_id: Optional[int]
+  "The ID of the group which the user's DND status will be updated for."
+  group_type: Optional[Literal['callcenter', 'department', 'office']]
+  "The type of the group which the user's DND status will be updated for."
+
+
+class ToggleDNDProto(Model):
+  """DND toggle."""
+
+  __slots__ = ('do_not_disturb', 'group_id', 'group_type', 'id')
+  do_not_disturb: Optional[bool]
+  'Boolean to tell if the user is on DND.'
+  group_id: Optional[int]
+  "The ID of the group which the user's DND status will be updated for."
+  group_type: Optional[Literal['callcenter', 'department', 'office']]
+  "The type of the group which the user's DND status will be updated for."
+  id: Optional[int]
+  "The user's id.\n\n('me' can be used if you are using a user level API key)"
+
+
+class UpdateUserMessage(Model):
+  """Model representation of the UpdateUserMessage schema."""
+
+  __slots__ = (
+    'admin_office_ids',
+    'emails',
+    'extension',
+    'first_name',
+    'forwarding_numbers',
+    'international_dialing_enabled',
+    'is_super_admin',
+    'job_title',
+    'keep_paid_numbers',
+    'last_name',
+    'license',
+    'office_id',
+    'phone_numbers',
+    'presence_status',
+    'state',
+  )
+  _nested = {'presence_status': PresenceStatus}
+  admin_office_ids: Optional[list[int]]
+  'The list of admin office IDs.\n\nThis is used to set the user as an office admin for the offices with the provided IDs.'
+  emails: Optional[list[str]]
+  "The user's emails.\n\nThis can be used to add, remove, or re-order emails. The first email in the list is the user's primary email."
+  extension: Optional[str]
+  "The user's new extension number.\n\nExtensions are optional in Dialpad and turned off by default. If you want extensions please contact support to enable them."
+  first_name: Optional[str]
+  "[single-line only]\n\nThe user's first name."
+  forwarding_numbers: Optional[list[str]]
+  "A list of phone numbers that should be dialed in addition to the user's Dialpad number(s)\nupon receiving a call."
+  international_dialing_enabled: Optional[bool]
+  'Whether or not the user is enabled to dial internationally.'
+  is_super_admin: Optional[bool]
+  'Whether or not the user is a super admin. (company level administrator)'
+  job_title: Optional[str]
+  "[single-line only]\n\nThe user's job title."
+  keep_paid_numbers: Optional[bool]
+  'Whether or not to keep phone numbers when switching to a support license.\n\nNote: Phone numbers require additional number licenses under a support license.'
+  last_name: Optional[str]
+  "[single-line only]\n\nThe user's last name."
+  license: Optional[
+    Literal[
+      'admins',
+      'agents',
+      'dpde_all',
+      'dpde_one',
+      'lite_lines',
+      'lite_support_agents',
+      'magenta_lines',
+      'talk',
+    ]
+  ]
+  "The user's license type.\n\nChanging this affects billing for the user. For a Sell license, specify the type as `agents`. For a Support license, specify the type as `support`."
+  office_id: Optional[int]
+  "The user's office id.\n\nIf provided, the user will be moved to this office. For international offices, the user must not have phone numbers assigned. Once the transfer is complete, your admin can add the phone numbers via the user assign number API. Only supported on paid accounts and there must be enough licenses to transfer the user to the destination office."
+  phone_numbers: Optional[list[str]]
+  'A list of the phone number(s) assigned to this user.\n\nThis can be used to re-order or remove numbers. To assign a new number, use the assign number API instead.'
+  presence_status: Optional[PresenceStatus]
+  'The presence status can be seen when you hover your mouse over the presence state indicator.\n\nNOTE: this is only used for Highfive and will be deprecated soon.\n\nPresence status will be set to "{provider}: {message}" when both are provided. Otherwise,\npresence status will be set to "{provider}".\n\n"type" is optional and presence status will only include predefined templates when "type" is provided. Please refer to the "type" parameter to check the supported types.\n\nTo clear the presence status, make an api call with the "presence_status" param set to empty or null. ex: `"presence_status": {}` or `"presence_status": null`\n\nTranslations will be available for the text in predefined templates. Translations for others should be provided.'
+  state: Optional[Literal['active', 'suspended']]
+  "The user's state.\n\nThis is used to suspend or re-activate a user."
+
+
+class UserProto(Model):
+  """User."""
+
+  __slots__ = (
+    'admin_office_ids',
+    'company_id',
+    'country',
+    'date_active',
+    'date_added',
+    'date_first_login',
+    'display_name',
+    'do_not_disturb',
+    'duty_status_reason',
+    'duty_status_started',
+    'emails',
+    'extension',
+    'first_name',
+    'forwarding_numbers',
+    'group_details',
+    'id',
+    'image_url',
+    'international_dialing_enabled',
+    'is_admin',
+    'is_available',
+    'is_on_duty',
+    'is_online',
+    'is_super_admin',
+    'job_title',
+    'language',
+    'last_name',
+    'license',
+    'location',
+    'muted',
+    'office_id',
+    'on_duty_started',
+    'on_duty_status',
+    'phone_numbers',
+    'state',
+    'status_message',
+    'timezone',
+  )
+  _nested = {'group_details': [GroupDetailsProto]}
+  admin_office_ids: Optional[list[int]]
+  'A list of office IDs for which this user has admin privilages.'
+  company_id: Optional[int]
+  "The id of the user's company."
+  country: Optional[str]
+  'The country in which the user resides.'
+  date_active: Optional[str]
+  'The date when the user activated their Dialpad account.'
+  date_added: Optional[str]
+  'A timestamp indicating when this user was created.'
+  date_first_login: Optional[str]
+  'A timestamp indicating the first time that this user logged in to Dialpad.'
+  display_name: Optional[str]
+  "The user's name, for display purposes."
+  do_not_disturb: Optional[bool]
+  'A boolean indicating whether the user is currently in "Do not disturb" mode.'
+  duty_status_reason: Optional[str]
+  '[single-line only]\n\nA description of this status.'
+  duty_status_started: Optional[str]
+  'The timestamp, in UTC, when the current on duty status changed.'
+  emails: Optional[list[str]]
+  'A list of email addresses belonging to this user.'
+  extension: Optional[str]
+  'The extension that should be associated with this user in the company or office IVR directory.'
+  first_name: Optional[str]
+  '[single-line only]\n\nThe given name of the user.'
+  forwarding_numbers: Optional[list[str]]
+  "A list of phone numbers that should be dialed in addition to the user's Dialpad number(s)\nupon receiving a call."
+  group_details: Optional[list[GroupDetailsProto]]
+  'Details regarding the groups that this user is a member of.'
+  id: Optional[int]
+  "The user's id."
+  image_url: Optional[str]
+  "The url of the user's profile image."
+  international_dialing_enabled: Optional[bool]
+  'Whether or not the user is enabled to dial internationally.'
+  is_admin: Optional[bool]
+  'A boolean indicating whether this user has administor privilages.'
+  is_available: Optional[bool]
+  'A boolean indicating whether the user is not currently on a call.'
+  is_on_duty: Optional[bool]
+  'A boolean indicating whether this user is currently acting as an operator.'
+  is_online: Optional[bool]
+  'A boolean indicating whether the user currently has an active Dialpad device.'
+  is_super_admin: Optional[bool]
+  'A boolean indicating whether this user has company-wide administor privilages.'
+  job_title: Optional[str]
+  "[single-line only]\n\nThe user's job title."
+  language: Optional[str]
+  'The preferred spoken language of the user.'
+  last_name: Optional[str]
+  '[single-line only]\n\nThe family name of the user.'
+  license: Optional[
+    Literal[
+      'admins',
+      'agents',
+      'dpde_all',
+      'dpde_one',
+      'lite_lines',
+      'lite_support_agents',
+      'magenta_lines',
+      'talk',
+    ]
+  ]
+  'The license type that has been allocated to this user.'
+  location: Optional[str]
+  '[single-line only]\n\nThe self-reported location of the user.'
+  muted: Optional[bool]
+  'A boolean indicating whether the user has muted thier microphone.'
+  office_id: Optional[int]
+  "The ID of the user's office."
+  on_duty_started: Optional[str]
+  'The timestamp, in UTC, when this operator became available for contact center calls.'
+  on_duty_status: Optional[
+    Literal['available', 'busy', 'occupied', 'occupied-end', 'unavailable', 'wrapup', 'wrapup-end']
+  ]
+  "A description of operator's on duty status."
+  phone_numbers: Optional[list[str]]
+  'A list of phone numbers belonging to this user.'
+  state: Optional[Literal['active', 'cancelled', 'deleted', 'pending', 'suspended']]
+  'The current enablement state of the user.'
+  status_message: Optional[str]
+  '[single-line only]\n\nA message indicating the activity that the user is currently engaged in.'
+  timezone: Optional[str]
+  'The timezone that this user abides by.'
+
+
+class UserCollection(Model):
+  """Collection of users."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [UserProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[UserProto]]
+  'A list of users.'
@@ -0,0 +1,85 @@
+from typing import Literal, Optional
+
+from dialpad.models.base import Model
+
+
+class UserDeviceProto(Model):
+  """Dialpad user device."""
+
+  __slots__ = (
+    'app_version',
+    'date_created',
+    'date_registered',
+    'date_updated',
+    'display_name',
+    'id',
+    'phone_number',
+    'type',
+    'user_id',
+  )
+  app_version: Optional[str]
+  'The device firmware version, or Dialpad app version.'
+  date_created: Optional[str]
+  'The time at which this device was created.'
+  date_registered: Optional[str]
+  'The most recent time at which the device registered with the backend.\n\nDevices register with the backend roughly once per hour, with the exception of mobile devices\n(iphone, ipad, android) for which this field will always be blank.'
+  date_updated: Optional[str]
+  'The most recent time at which the device data was modified.'
+  display_name: Optional[str]
+  '[single-line only]\n\nThe name of this device.'
+  id: Optional[str]
+  'The ID of the device.'
+  phone_number: Optional[str]
+  'The phone number associated with this device.'
+  type: Optional[
+    Literal[
+      'android',
+      'ata',
+      'audiocodes',
+      'c2t',
+      'ciscompp',
+      'dect',
+      'dpmroom',
+      'grandstream',
+      'harness',
+      'iframe_cti_extension',
+      'iframe_front',
+      'iframe_hubspot',
+      'iframe_ms_teams',
+      'iframe_open_cti',
+      'iframe_salesforce',
+      'iframe_service_titan',
+      'iframe_zendesk',
+      'ipad',
+      'iphone',
+      'mini',
+      'mitel',
+      'msteams',
+      'native',
+      'obi',
+      'packaged_app',
+      'polyandroid',
+      'polycom',
+      'proxy',
+      'public_api',
+      'salesforce',
+      'sip',
+      'tickiot',
+      'web',
+      'yealink',
+    ]
+  ]
+  'The device type.'
+  user_id: Optional[int]
+  'The ID of the user who owns the device.'
+
+
+class UserDeviceCollection(Model):
+  """Collection of user devices."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [UserDeviceProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request.\n\nUse the cursor provided in the previous response.'
+  items: Optional[list[UserDeviceProto]]
+  'A list of user devices.'
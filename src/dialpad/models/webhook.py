@@ -0,0 +1,48 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+from dialpad.models.signature import SignatureProto
+
+
+class CreateWebhook(Model):
+  """Model representation of the CreateWebhook schema."""
+
+  __slots__ = ('hook_url', 'secret')
+  hook_url: str
+  "The webhook's URL. Triggered events will be sent to the url provided here."
+  secret: Optional[str]
+  "[single-line only]\n\nWebhook's signature secret that's used to confirm the validity of the request."
+
+
+class UpdateWebhook(Model):
+  """Model representation of the UpdateWebhook schema."""
+
+  __slots__ = ('hook_url', 'secret')
+  hook_url: Optional[str]
+  "The webhook's URL. Triggered events will be sent to the url provided here."
+  secret: Optional[str]
+  "[single-line only]\n\nWebhook's signature secret that's used to confirm the validity of the request."
+
+
+class WebhookProto(Model):
+  """Webhook."""
+
+  __slots__ = ('hook_url', 'id', 'signature')
+  _nested = {'signature': SignatureProto}
+  hook_url: Optional[str]
+  "The webhook's URL. Triggered events will be sent to the url provided here."
+  id: Optional[int]
+  "The webhook's ID, which is generated after creating a webhook successfully."
+  signature: Optional[SignatureProto]
+  "Webhook's signature containing the secret."
+
+
+class WebhookCollection(Model):
+  """Collection of webhooks."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [WebhookProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[WebhookProto]]
+  'A list of webhook objects.'
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from dialpad.models.base import Model
+from dialpad.models.signature import SignatureProto
+
+
+class CreateWebsocket(Model):
+  """Model representation of the CreateWebsocket schema."""
+
+  __slots__ = ('secret',)
+  secret: Optional[str]
+  "[single-line only]\n\nWebsocket's signature secret that's used to confirm the validity of the request."
+
+
+class UpdateWebsocket(Model):
+  """Model representation of the UpdateWebsocket schema."""
+
+  __slots__ = ('secret',)
+  secret: Optional[str]
+  "[single-line only]\n\nWebsocket's signature secret that's used to confirm the validity of the request."
+
+
+class WebsocketProto(Model):
+  """Websocket."""
+
+  __slots__ = ('id', 'signature', 'websocket_url')
+  _nested = {'signature': SignatureProto}
+  id: Optional[int]
+  "The webhook's ID, which is generated after creating a webhook successfully."
+  signature: Optional[SignatureProto]
+  "Webhook's signature containing the secret."
+  websocket_url: Optional[str]
+  "The websocket's URL. Users need to connect to this url to get event payloads via websocket."
+
+
+class WebsocketCollection(Model):
+  """Collection of webhooks."""
+
+  __slots__ = ('cursor', 'items')
+  _nested = {'items': [WebsocketProto]}
+  cursor: Optional[str]
+  'A token used to return the next page of a previous request. Use the cursor provided in the previous response.'
+  items: Optional[list[WebsocketProto]]
+  'A list of websocket objects.'
@@ -0,0 +1,194 @@
+"""Maps each API operation id to its documented (requests, period) rate limit."""
+
+OPERATION_RATE_LIMITS = {
+  'accesscontrolpolicies.assign': (1200, 60),
+  'accesscontrolpolicies.assignments': (1200, 60),
+  'accesscontrolpolicies.create': (1200, 60),
+  'accesscontrolpolicies.delete': (1200, 60),
+  'accesscontrolpolicies.get': (1200, 60),
+  'accesscontrolpolicies.list': (1200, 60),
+  'accesscontrolpolicies.unassign': (1200, 60),
+  'accesscontrolpolicies.update': (1200, 60),
+  'app_settings.get': (1200, 60),
+  'blockednumbers.add': (1200, 60),
+  'blockednumbers.get': (1200, 60),
+  'blockednumbers.list': (1200, 60),
+  'blockednumbers.remove': (1200, 60),
+  'call.actions.hangup': (1200, 60),
+  'call.call': (5, 60),
+  'call.callback': (1200, 60),
+  'call.get_call_info': (10, 60),
+  'call.initiate_ivr_call': (1200, 60),
+  'call.list': (1200, 60),
+  'call.participants.add': (1200, 60),
+  'call.put_call_labels': (250, 60),
+  'call.transfer_call': (1200, 60),
+  'call.unpark': (1200, 60),
+  'call.validate_callback': (1200, 60),
+  'call_review_share_link.create': (250, 60),
+  'call_review_share_link.delete': (1200, 60),
+  'call_review_share_link.get': (1200, 60),
+  'call_review_share_link.update': (250, 60),
+  'callcenters.create': (1200, 60),
+  'callcenters.delete': (1200, 60),
+  'callcenters.get': (1200, 60),
+  'callcenters.list': (1200, 60),
+  'callcenters.listall': (1200, 60),
+  'callcenters.operators.delete': (1200, 60),
+  'callcenters.operators.dutystatus': (1200, 60),
+  'callcenters.operators.get': (1200, 60),
+  'callcenters.operators.get.dutystatus': (1200, 60),
+  'callcenters.operators.get.skilllevel': (1200, 60),
+  'callcenters.operators.post': (1200, 60),
+  'callcenters.operators.skilllevel': (1200, 60),
+  'callcenters.status': (1200, 60),
+  'callcenters.update': (1200, 60),
+  'caller_id.users.get': (1200, 60),
+  'caller_id.users.post': (1200, 60),
+  'calllabel.list': (1200, 60),
+  'callrouters.create': (1200, 60),
+  'callrouters.delete': (1200, 60),
+  'callrouters.get': (1200, 60),
+  'callrouters.list': (1200, 60),
+  'callrouters.update': (1, 300),
+  'channels.delete': (1200, 60),
+  'channels.get': (1200, 60),
+  'channels.list': (1200, 60),
+  'channels.members.delete': (1200, 60),
+  'channels.members.list': (1200, 60),
+  'channels.members.post': (1200, 60),
+  'channels.post': (1200, 60),
+  'coaching_team.get': (1200, 60),
+  'coaching_team.list': (1200, 60),
+  'coaching_team.listall': (1200, 60),
+  'coaching_team.members.add': (1200, 60),
+  'coaching_team.members.get': (1200, 60),
+  'company.get': (1200, 60),
+  'company.sms_opt_out': (250, 60),
+  'conference-meetings.list': (1200, 60),
+  'conference-rooms.list': (1200, 60),
+  'contacts.create': (100, 60),
+  'contacts.create_with_uid': (100, 60),
+  'contacts.delete': (1200, 60),
+  'contacts.get': (1200, 60),
+  'contacts.list': (1200, 60),
+  'contacts.update': (1200, 60),
+  'custom_ivrs.get': (1200, 60),
+  'departments.create': (1200, 60),
+  'departments.delete': (1200, 60),
+  'departments.get': (1200, 60),
+  'departments.list': (1200, 60),
+  'departments.listall': (1200, 60),
+  'departments.operators.delete': (1200, 60),
+  'departments.operators.get': (1200, 60),
+  'departments.operators.post': (1200, 60),
+  'departments.update': (1200, 60),
+  'deskphones.rooms.create_international_pin': (1200, 60),
+  'deskphones.rooms.delete': (1200, 60),
+  'deskphones.rooms.get': (1200, 60),
+  'deskphones.rooms.list': (1200, 60),
+  'deskphones.users.delete': (1200, 60),
+  'deskphones.users.get': (1200, 60),
+  'deskphones.users.list': (1200, 60),
+  'faxline.create': (1200, 60),
+  'format.post': (1200, 60),
+  'ivr.create': (1200, 60),
+  'ivr.delete': (1200, 60),
+  'ivr.update': (1200, 60),
+  'ivr_details.update': (1200, 60),
+  'numbers.assign_call_router_number.post': (1200, 60),
+  'numbers.assign_number.post': (1200, 60),
+  'numbers.assign_office_number.post': (1200, 60),
+  'numbers.assign_room_number.post': (1200, 60),
+  'numbers.assign_target_number.post': (1200, 60),
+  'numbers.assign_user_number.post': (1200, 60),
+  'numbers.delete': (1200, 60),
+  'numbers.get': (1200, 60),
+  'numbers.list': (1200, 60),
+  'numbers.office_unassign_number.post': (1200, 60),
+  'numbers.room_unassign_number.post': (1200, 60),
+  'numbers.swap_number.post': (1200, 60),
+  'numbers.user_unassign_number.post': (1200, 60),
+  'offices.create': (1200, 60),
+  'offices.e911.get': (1200, 60),
+  'offices.e911.update': (1200, 60),
+  'offices.get': (1200, 60),
+  'offices.list': (1200, 60),
+  'offices.offdutystatuses.get': (1200, 60),
+  'offices.operators.delete': (1200, 60),
+  'offices.operators.get': (1200, 60),
+  'offices.operators.post': (1200, 60),
+  'plan.available_licenses.get': (1200, 60),
+  'plan.get': (1200, 60),
+  'recording_share_link.create': (100, 60),
+  'recording_share_link.delete': (1200, 60),
+  'recording_share_link.get': (1200, 60),
+  'recording_share_link.update': (100, 60),
+  'rooms.delete': (1200, 60),
+  'rooms.get': (1200, 60),
+  'rooms.list': (1200, 60),
+  'rooms.patch': (1200, 60),
+  'rooms.post': (1200, 60),
+  'schedule_reports.create': (1200, 60),
+  'schedule_reports.delete': (1200, 60),
+  'schedule_reports.get': (1200, 60),
+  'schedule_reports.list': (1200, 60),
+  'schedule_reports.update': (1200, 60),
+  'screen_pop.initiate': (5, 60),
+  'sms.send': (100, 60),
+  'stats.create': (200, 3600),
+  'stats.get': (1200, 60),
+  'transcripts.get': (1200, 60),
+  'transcripts.get_url': (1200, 60),
+  'userdevices.get': (1200, 60),
+  'userdevices.list': (1200, 60),
+  'users.create': (1200, 60),
+  'users.delete': (1200, 60),
+  'users.e911.get': (1200, 60),
+  'users.e911.update': (1200, 60),
+  'users.get': (1200, 60),
+  'users.initiate_call': (5, 60),
+  'users.list': (1200, 60),
+  'users.move_office.patch': (1200, 60),
+  'users.personas.get': (1200, 60),
+  'users.toggle_call_vi': (1200, 60),
+  'users.toggle_dnd': (1200, 60),
+  'users.update': (1200, 60),
+  'users.update_active_call': (1200, 60),
+  'users.update_status': (1200, 60),
+  'webhook.update': (1200, 60),
+  'webhook_agent_status_event_subscription.create': (1200, 60),
+  'webhook_agent_status_event_subscription.delete': (1200, 60),
+  'webhook_agent_status_event_subscription.get': (1200, 60),
+  'webhook_agent_status_event_subscription.list': (1200, 60),
+  'webhook_agent_status_event_subscription.update': (1200, 60),
+  'webhook_call_event_subscription.create': (1200, 60),
+  'webhook_call_event_subscription.delete': (1200, 60),
+  'webhook_call_event_subscription.get': (1200, 60),
+  'webhook_call_event_subscription.list': (1200, 60),
+  'webhook_call_event_subscription.update': (1200, 60),
+  'webhook_change_log_event_subscription.create': (1200, 60),
+  'webhook_change_log_event_subscription.delete': (1200, 60),
+  'webhook_change_log_event_subscription.get': (1200, 60),
+  'webhook_change_log_event_subscription.list': (1200, 60),
+  'webhook_change_log_event_subscription.update': (1200, 60),
+  'webhook_contact_event_subscription.create': (1200, 60),
+  'webhook_contact_event_subscription.delete': (1200, 60),
+  'webhook_contact_event_subscription.get': (1200, 60),
+  'webhook_contact_event_subscription.list': (1200, 60),
+  'webhook_contact_event_subscription.update': (1200, 60),
+  'webhook_sms_event_subscription.create': (1200, 60),
+  'webhook_sms_event_subscription.delete': (1200, 60),
+  'webhook_sms_event_subscription.get': (1200, 60),
+  'webhook_sms_event_subscription.list': (1200, 60),
+  'webhook_sms_event_subscription.update': (1200, 60),
+  'webhooks.create': (100, 60),
+  'webhooks.delete': (1200, 60),
+  'webhooks.get': (1200, 60),
+  'webhooks.list': (1200, 60),
+  'websockets.create': (250, 60),
+  'websockets.delete': (1200, 60),
+  'websockets.get': (1200, 60),
+  'websockets.list': (1200, 60),
+  'websockets.update': (1200, 60),
+}
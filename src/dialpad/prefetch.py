@@ -0,0 +1,98 @@
+"""Utilities for fetching pages of paginated responses ahead of the consumer."""
+
+import asyncio
+import queue
+import threading
+from typing import AsyncIterator, Iterator, TypeVar
+
+T = TypeVar('T')
+
+# Marks the end of the stream in the prefetch buffer.
+_DONE = object()
+
+
+def prefetch_iter(source: Iterator[T], depth: int) -> Iterator[T]:
+  """Consumes `source` on a background thread, buffering up to `depth` items ahead of the caller.
+
+  Exceptions raised by `source` are re-raised to the caller once the items before them have been
+  consumed. If the caller stops iterating early, the background thread stops as well.
+  """
+  buffer = queue.Queue(maxsize=depth)
+  stopped = threading.Event()
+
+  def put(entry: tuple) -> bool:
+    # Poll so that the producer notices when the consumer has gone away.
+    while not stopped.is_set():
+      try:
+        buffer.put(entry, timeout=0.1)
+        return True
+      except queue.Full:
+        continue
+    return False
+
+  def produce() -> None:
+    error = None
+    try:
+      for item in source:
+        if not put((item, None)):
+          return
+    except BaseException as e:
+      error = e
+    finally:
+      # Always mark the end, so that the consumer isn't left waiting (unless it's gone already).
+      put((_DONE, error))
+
+  threading.Thread(target=produce, name='dialpad-prefetch', daemon=True).start()
+  try:
+    while True:
+      item, error = buffer.get()
+      if item is _DONE:
+        if error:
+          raise error
+        return
+
+      yield item
+  finally:
+    stopped.set()
+
+
+async def prefetch_aiter(source: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+  """Consumes `source` in a separate task, buffering up to `depth` items ahead of the caller.
+
+  Exceptions raised by `source` are re-raised to the caller once the items before them have been
+  consumed. If the caller stops iterating early, the task is cancelled and `source` is closed.
+  """
+  buffer = asyncio.Queue(maxsize=depth)
+
+  async def produce() -> None:
+    error = None
+    try:
+      async for item in source:
+        await buffer.put((item, None))
+    except asyncio.CancelledError:
+      # The consumer has gone away, so there's no one to tell.
+      raise
+    except BaseException as e:
+      error = e
+    await buffer.put((_DONE, error))
+
+  task = asyncio.ensure_future(produce())
+  try:
+    while True:
+      item, error = await buffer.get()
+      if item is _DONE:
+        if error:
+          raise error
+        return
+
+      yield item
+  finally:
+    task.cancel()
+    try:
+      await task
+    except asyncio.CancelledError:
+      pass
+
+    aclose = getattr(source, 'aclose', None)
+    if aclose is not None:
+      await aclose()
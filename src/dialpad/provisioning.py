@@ -0,0 +1,203 @@
+"""Bulk provisioning of users, such as when onboarding a whole office.
+
+Each user is created, and then set up with any follow-up actions (moving them to another office,
+assigning a number, setting their caller ID and their E911 address) in that order. The move comes
+first so that the number, caller ID and E911 address are set up in the user's final office, rather
+than in one that they're about to leave. Many users are provisioned concurrently, and each operation is
+kept within its documented rate limit:
+
+    import csv
+
+    from dialpad import DialpadClient
+    from dialpad.provisioning import UserProvisioning, provision_users
+
+    dp = DialpadClient(token='API_TOKEN_HERE')
+    rows = (
+      UserProvisioning(
+        user={'email': row['email'], 'office_id': office_id},
+        assign_number={'area_code': row['area_code']},
+      )
+      for row in csv.DictReader(open('new_hires.csv'))
+    )
+    for result in provision_users(dp, rows):
+      if not result.ok:
+        print(f'Row {result.index} failed at {result.failed_step}: {result.error}')
+"""
+
+from typing import (
+  Any,
+  AsyncIterable,
+  AsyncIterator,
+  Dict,
+  Iterable,
+  Iterator,
+  NamedTuple,
+  Optional,
+  Tuple,
+  Union,
+)
+
+from .bulk import AsyncBulkResults, BulkResults, fallback_limiter, field
+from .operation_rate_limits import OPERATION_RATE_LIMITS
+from .rate_limit import TokenBucket
+from .schemas.caller_id import SetCallerIdMessage
+from .schemas.number import AssignNumberMessage
+from .schemas.user import CreateUserMessage, E911UpdateMessage, MoveOfficeMessage
+
+# The steps, in the order that they're applied, along with the UsersResource method that applies
+# each of them and its operation id (whose documented rate limit the step is throttled to).
+_STEPS: Tuple[Tuple[str, str, str], ...] = (
+  ('create', 'create', 'users.create'),
+  ('move_office', 'move_office', 'users.move_office.patch'),
+  ('assign_number', 'assign_number', 'numbers.assign_user_number.post'),
+  ('caller_id', 'set_caller_id', 'caller_id.users.post'),
+  ('e911_address', 'set_e911_address', 'users.e911.update'),
+)
+
+
+class UserProvisioning(NamedTuple):
+  """A user to create, along with the follow-up actions to apply to them."""
+
+  user: CreateUserMessage
+  move_office: Optional[MoveOfficeMessage] = None
+  assign_number: Optional[AssignNumberMessage] = None
+  caller_id: Optional[SetCallerIdMessage] = None
+  e911_address: Optional[E911UpdateMessage] = None
+
+
+class ProvisioningResult(NamedTuple):
+  """The outcome of provisioning a user.
+
+  `responses` maps each step that got a response ('create', 'move_office', and so on) to it.
+  If a step failed, it's named by `failed_step` (along with its `error`), and the steps after it
+  were skipped. A user that was created before a later step failed has a `user_id`, so that the
+  remaining steps can be retried without creating the user again.
+  """
+
+  index: int
+  request: UserProvisioning
+  user_id: Optional[int] = None
+  responses: Optional[Dict[str, Any]] = None
+  failed_step: Optional[str] = None
+  error: Optional[BaseException] = None
+
+  @property
+  def ok(self) -> bool:
+    return self.failed_step is None
+
+
+def _as_provisioning(row: Union[UserProvisioning, CreateUserMessage]) -> UserProvisioning:
+  # A bare CreateUserMessage is a user without any follow-up actions.
+  return row if isinstance(row, UserProvisioning) else UserProvisioning(user=row)
+
+
+class _Provisioner:
+  """Applies the steps for each user, throttling each operation to its rate limit."""
+
+  def __init__(self, client):
+    self.users = client.users
+    # The requests that are waiting to be provisioned, by their index (which is what's passed to the
+    # workers, since the requests themselves aren't hashable).
+    self.pending: Dict[int, UserProvisioning] = {}
+    self.limiters: Dict[str, Optional[TokenBucket]] = {
+      operation_id: fallback_limiter(client, OPERATION_RATE_LIMITS[operation_id])
+      for _, _, operation_id in _STEPS
+    }
+
+  def _steps(self, request: UserProvisioning):
+    """Yields the (step, method name, operation id) of each step that the request calls for."""
+    for step, method, operation_id in _STEPS:
+      if step == 'create' or getattr(request, step) is not None:
+        yield step, method, operation_id
+
+  def _args(self, step: str, request: UserProvisioning, user_id: Optional[int]) -> tuple:
+    if step == 'create':
+      return (request.user,)
+    return (user_id, getattr(request, step))
+
+  def add(self, index: int, row: Union[UserProvisioning, CreateUserMessage]) -> int:
+    self.pending[index] = _as_provisioning(row)
+    return index
+
+  def provision(self, index: int) -> ProvisioningResult:
+    request = self.pending.pop(index)
+    user_id = None
+    responses = {}
+    for step, method, operation_id in self._steps(request):
+      try:
+        limiter = self.limiters[operation_id]
+        if limiter is not None:
+          limiter.acquire()
+        responses[step] = getattr(self.users, method)(*self._args(step, request, user_id))
+        if step == 'create':
+          user_id = int(field(responses[step], 'id'))
+      except Exception as e:
+        return ProvisioningResult(index, request, user_id, responses, step, e)
+
+    return ProvisioningResult(index, request, user_id, responses)
+
+  async def provision_async(self, index: int) -> ProvisioningResult:
+    request = self.pending.pop(index)
+    user_id = None
+    responses = {}
+    for step, method, operation_id in self._steps(request):
+      try:
+        limiter = self.limiters[operation_id]
+        if limiter is not None:
+          await limiter.acquire_async()
+        responses[step] = await getattr(self.users, method)(*self._args(step, request, user_id))
+        if step == 'create':
+          user_id = int(field(responses[step], 'id'))
+      except Exception as e:
+        return ProvisioningResult(index, request, user_id, responses, step, e)
+
+    return ProvisioningResult(index, request, user_id, responses)
+
+
+def provision_users(
+  client,
+  requests: Iterable[Union[UserProvisioning, CreateUserMessage]],
+  max_workers: int = 8,
+) -> Iterator[ProvisioningResult]:
+  """Provisions users concurrently, yielding a ProvisioningResult for each as it finishes.
+
+  Args:
+      client: The DialpadClient to provision the users with.
+      requests: The users to provision, as UserProvisioning rows (or as CreateUserMessages, for
+        users without any follow-up actions). They're read lazily, so they can be streamed.
+      max_workers: The number of users that are provisioned concurrently.
+
+  Returns:
+      An iterator of the ProvisioningResults, in the order that they finish. Their `index` is the
+      position of their request.
+  """
+  provisioner = _Provisioner(client)
+  indexes = (provisioner.add(index, row) for index, row in enumerate(requests))
+  for _, result in BulkResults(provisioner.provision, indexes, max_workers=max_workers):
+    yield result
+
+
+async def provision_users_async(
+  client,
+  requests: Union[
+    Iterable[Union[UserProvisioning, CreateUserMessage]],
+    AsyncIterable[Union[UserProvisioning, CreateUserMessage]],
+  ],
+  concurrency: int = 8,
+) -> AsyncIterator[ProvisioningResult]:
+  """The AsyncDialpadClient equivalent of `provision_users`, with up to `concurrency` at once."""
+  provisioner = _Provisioner(client)
+
+  async def indexes():
+    index = 0
+    if hasattr(requests, '__aiter__'):
+      async for row in requests:
+        yield provisioner.add(index, row)
+        index += 1
+    else:
+      for index, row in enumerate(requests):
+        yield provisioner.add(index, row)
+
+  results = AsyncBulkResults(provisioner.provision_async, indexes(), concurrency=concurrency)
+  async for _, result in results:
+    yield result
@@ -0,0 +1,94 @@
+"""Client-side enforcement of the per-operation rate limits documented in the Dialpad API spec."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# A (requests, period_seconds) pair, as emitted by the resource generator.
+RateLimit = Tuple[int, float]
+
+
+class TokenBucket:
+  """A thread-safe token bucket that refills continuously at `requests / period` tokens per second.
+
+  Callers reserve a token up-front and then wait out any deficit, which allows the same bucket to be
+  shared between threads and asyncio tasks without holding the lock while sleeping.
+  """
+
+  def __init__(self, requests: int, period: float):
+    if requests <= 0 or period <= 0:
+      raise ValueError(f'Invalid rate limit: {requests} per {period}s')
+
+    self.capacity = float(requests)
+    self.rate = requests / period
+    self._tokens = self.capacity
+    self._updated = time.monotonic()
+    self._lock = threading.Lock()
+
+  def reserve(self) -> float:
+    """Takes a token, and returns the number of seconds to wait before it may be used."""
+    with self._lock:
+      now = time.monotonic()
+      self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+      self._updated = now
+      self._tokens -= 1
+      if self._tokens >= 0:
+        return 0.0
+
+      return -self._tokens / self.rate
+
+  def acquire(self) -> None:
+    delay = self.reserve()
+    if delay:
+      time.sleep(delay)
+
+  async def acquire_async(self) -> None:
+    delay = self.reserve()
+    if delay:
+      await asyncio.sleep(delay)
+
+
+class RateLimiter:
+  """Maintains a token bucket per API operation.
+
+  The generated resource methods pass along the operation id and the rate limit documented in the
+  API spec, so by default each operation is throttled to its documented limit. `overrides` can be
+  used to adjust the limit for specific operations (e.g. `{'sms.send': (800, 60)}` for keys on a
+  higher SMS tier).
+
+  A single RateLimiter can be shared between several clients that use the same API key.
+  """
+
+  def __init__(self, overrides: Optional[Dict[str, RateLimit]] = None):
+    self._overrides = dict(overrides or {})
+    self._buckets: Dict[str, TokenBucket] = {}
+    self._lock = threading.Lock()
+
+  def bucket(
+    self, operation_id: Optional[str], rate_limit: Optional[RateLimit] = None
+  ) -> Optional[TokenBucket]:
+    """Returns the token bucket for the given operation, or None if it isn't rate limited."""
+    if not operation_id:
+      return None
+
+    rate_limit = self._overrides.get(operation_id, rate_limit)
+    if not rate_limit:
+      return None
+
+    with self._lock:
+      if operation_id not in self._buckets:
+        self._buckets[operation_id] = TokenBucket(*rate_limit)
+      return self._buckets[operation_id]
+
+  def acquire(self, operation_id: Optional[str], rate_limit: Optional[RateLimit] = None) -> None:
+    bucket = self.bucket(operation_id, rate_limit)
+    if bucket:
+      bucket.acquire()
+
+  async def acquire_async(
+    self, operation_id: Optional[str], rate_limit: Optional[RateLimit] = None
+  ) -> None:
+    bucket = self.bucket(operation_id, rate_limit)
+    if bucket:
+      await bucket.acquire_async()
@@ -1,43 +1,102 @@
 # This is an auto-generated resource package. Please do not edit it directly.
 
-from .access_control_policies_resource import AccessControlPoliciesResource
-from .agent_status_event_subscriptions_resource import AgentStatusEventSubscriptionsResource
-from .app_settings_resource import AppSettingsResource
-from .blocked_numbers_resource import BlockedNumbersResource
-from .call_center_operators_resource import CallCenterOperatorsResource
-from .call_centers_resource import CallCentersResource
-from .call_event_subscriptions_resource import CallEventSubscriptionsResource
-from .call_labels_resource import CallLabelsResource
-from .call_review_share_links_resource import CallReviewShareLinksResource
-from .call_routers_resource import CallRoutersResource
-from .callbacks_resource import CallbacksResource
-from .calls_resource import CallsResource
-from .changelog_event_subscriptions_resource import ChangelogEventSubscriptionsResource
-from .channels_resource import ChannelsResource
-from .coaching_teams_resource import CoachingTeamsResource
-from .company_resource import CompanyResource
-from .contact_event_subscriptions_resource import ContactEventSubscriptionsResource
-from .contacts_resource import ContactsResource
-from .custom_ivrs_resource import CustomIVRsResource
-from .departments_resource import DepartmentsResource
-from .fax_lines_resource import FaxLinesResource
-from .meeting_rooms_resource import MeetingRoomsResource
-from .meetings_resource import MeetingsResource
-from .numbers_resource import NumbersResource
-from .oauth2_resource import OAuth2Resource
-from .oauth_apps_resource import OAuthAppsResource
-from .offices_resource import OfficesResource
-from .recording_share_links_resource import RecordingShareLinksResource
-from .rooms_resource import RoomsResource
-from .schedule_reports_resource import ScheduleReportsResource
-from .sms_event_subscriptions_resource import SmsEventSubscriptionsResource
-from .sms_resource import SmsResource
-from .stats_resource import StatsResource
-from .transcripts_resource import TranscriptsResource
-from .user_devices_resource import UserDevicesResource
-from .users_resource import UsersResource
-from .webhooks_resource import WebhooksResource
-from .websockets_resource import WebsocketsResource
+from functools import cached_property
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from .access_control_policies_resource import AccessControlPoliciesResource
+  from .agent_status_event_subscriptions_resource import AgentStatusEventSubscriptionsResource
+  from .app_settings_resource import AppSettingsResource
+  from .blocked_numbers_resource import BlockedNumbersResource
+  from .call_center_operators_resource import CallCenterOperatorsResource
+  from .call_centers_resource import CallCentersResource
+  from .call_event_subscriptions_resource import CallEventSubscriptionsResource
+  from .call_labels_resource import CallLabelsResource
+  from .call_review_share_links_resource import CallReviewShareLinksResource
+  from .call_routers_resource import CallRoutersResource
+  from .callbacks_resource import CallbacksResource
+  from .calls_resource import CallsResource
+  from .changelog_event_subscriptions_resource import ChangelogEventSubscriptionsResource
+  from .channels_resource import ChannelsResource
+  from .coaching_teams_resource import CoachingTeamsResource
+  from .company_resource import CompanyResource
+  from .contact_event_subscriptions_resource import ContactEventSubscriptionsResource
+  from .contacts_resource import ContactsResource
+  from .custom_ivrs_resource import CustomIVRsResource
+  from .departments_resource import DepartmentsResource
+  from .fax_lines_resource import FaxLinesResource
+  from .meeting_rooms_resource import MeetingRoomsResource
+  from .meetings_resource import MeetingsResource
+  from .numbers_resource import NumbersResource
+  from .oauth2_resource import OAuth2Resource
+  from .oauth_apps_resource import OAuthAppsResource
+  from .offices_resource import OfficesResource
+  from .recording_share_links_resource import RecordingShareLinksResource
+  from .rooms_resource import RoomsResource
+  from .schedule_reports_resource import ScheduleReportsResource
+  from .sms_event_subscriptions_resource import SmsEventSubscriptionsResource
+  from .sms_resource import SmsResource
+  from .stats_resource import StatsResource
+  from .transcripts_resource import TranscriptsResource
+  from .user_devices_resource import UserDevicesResource
+  from .users_resource import UsersResource
+  from .webhooks_resource import WebhooksResource
+  from .websockets_resource import WebsocketsResource
+
+_RESOURCE_MODULES = {
+  'AccessControlPoliciesResource': '.access_control_policies_resource',
+  'AgentStatusEventSubscriptionsResource': '.agent_status_event_subscriptions_resource',
+  'AppSettingsResource': '.app_settings_resource',
+  'BlockedNumbersResource': '.blocked_numbers_resource',
+  'CallCenterOperatorsResource': '.call_center_operators_resource',
+  'CallCentersResource': '.call_centers_resource',
+  'CallEventSubscriptionsResource': '.call_event_subscriptions_resource',
+  'CallLabelsResource': '.call_labels_resource',
+  'CallReviewShareLinksResource': '.call_review_share_links_resource',
+  'CallRoutersResource': '.call_routers_resource',
+  'CallbacksResource': '.callbacks_resource',
+  'CallsResource': '.calls_resource',
+  'ChangelogEventSubscriptionsResource': '.changelog_event_subscriptions_resource',
+  'ChannelsResource': '.channels_resource',
+  'CoachingTeamsResource': '.coaching_teams_resource',
+  'CompanyResource': '.company_resource',
+  'ContactEventSubscriptionsResource': '.contact_event_subscriptions_resource',
+  'ContactsResource': '.contacts_resource',
+  'CustomIVRsResource': '.custom_ivrs_resource',
+  'DepartmentsResource': '.departments_resource',
+  'FaxLinesResource': '.fax_lines_resource',
+  'MeetingRoomsResource': '.meeting_rooms_resource',
+  'MeetingsResource': '.meetings_resource',
+  'NumbersResource': '.numbers_resource',
+  'OAuth2Resource': '.oauth2_resource',
+  'OAuthAppsResource': '.oauth_apps_resource',
+  'OfficesResource': '.offices_resource',
+  'RecordingShareLinksResource': '.recording_share_links_resource',
+  'RoomsResource': '.rooms_resource',
+  'ScheduleReportsResource': '.schedule_reports_resource',
+  'SmsEventSubscriptionsResource': '.sms_event_subscriptions_resource',
+  'SmsResource': '.sms_resource',
+  'StatsResource': '.stats_resource',
+  'TranscriptsResource': '.transcripts_resource',
+  'UserDevicesResource': '.user_devices_resource',
+  'UsersResource': '.users_resource',
+  'WebhooksResource': '.webhooks_resource',
+  'WebsocketsResource': '.websockets_resource',
+}
+
+
+def __getattr__(name: str):
+  if name not in _RESOURCE_MODULES:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  resource_class = getattr(import_module(_RESOURCE_MODULES[name], __name__), name)
+  globals()[name] = resource_class
+  return resource_class
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_RESOURCE_MODULES))
 
 
 class DialpadResourcesMixin:
@@ -45,348 +104,427 @@ class DialpadResourcesMixin:
 
   This mixin is used by the DialpadClient class to provide easy access
   to all API resources as properties.
+
+  Each resource is instantiated on first access, and then memoized for the lifetime of the
+  client.
   """
 
-  @property
-  def access_control_policies(self) -> AccessControlPoliciesResource:
+  @cached_property
+  def access_control_policies(self) -> 'AccessControlPoliciesResource':
     """Returns an instance of AccessControlPoliciesResource.
 
     Returns:
         A AccessControlPoliciesResource instance initialized with this client.
     """
+    from .access_control_policies_resource import AccessControlPoliciesResource
+
     return AccessControlPoliciesResource(self)
 
-  @property
-  def agent_status_event_subscriptions(self) -> AgentStatusEventSubscriptionsResource:
+  @cached_property
+  def agent_status_event_subscriptions(self) -> 'AgentStatusEventSubscriptionsResource':
     """Returns an instance of AgentStatusEventSubscriptionsResource.
 
     Returns:
         A AgentStatusEventSubscriptionsResource instance initialized with this client.
     """
+    from .agent_status_event_subscriptions_resource import AgentStatusEventSubscriptionsResource
+
     return AgentStatusEventSubscriptionsResource(self)
 
-  @property
-  def app_settings(self) -> AppSettingsResource:
+  @cached_property
+  def app_settings(self) -> 'AppSettingsResource':
     """Returns an instance of AppSettingsResource.
 
     Returns:
         A AppSettingsResource instance initialized with this client.
     """
+    from .app_settings_resource import AppSettingsResource
+
     return AppSettingsResource(self)
 
-  @property
-  def blocked_numbers(self) -> BlockedNumbersResource:
+  @cached_property
+  def blocked_numbers(self) -> 'BlockedNumbersResource':
     """Returns an instance of BlockedNumbersResource.
 
     Returns:
         A BlockedNumbersResource instance initialized with this client.
     """
+    from .blocked_numbers_resource import BlockedNumbersResource
+
     return BlockedNumbersResource(self)
 
-  @property
-  def call_center_operators(self) -> CallCenterOperatorsResource:
+  @cached_property
+  def call_center_operators(self) -> 'CallCenterOperatorsResource':
     """Returns an instance of CallCenterOperatorsResource.
 
     Returns:
         A CallCenterOperatorsResource instance initialized with this client.
     """
+    from .call_center_operators_resource import CallCenterOperatorsResource
+
     return CallCenterOperatorsResource(self)
 
-  @property
-  def call_centers(self) -> CallCentersResource:
+  @cached_property
+  def call_centers(self) -> 'CallCentersResource':
     """Returns an instance of CallCentersResource.
 
     Returns:
         A CallCentersResource instance initialized with this client.
     """
+    from .call_centers_resource import CallCentersResource
+
     return CallCentersResource(self)
 
-  @property
-  def call_event_subscriptions(self) -> CallEventSubscriptionsResource:
+  @cached_property
+  def call_event_subscriptions(self) -> 'CallEventSubscriptionsResource':
     """Returns an instance of CallEventSubscriptionsResource.
 
     Returns:
         A CallEventSubscriptionsResource instance initialized with this client.
     """
+    from .call_event_subscriptions_resource import CallEventSubscriptionsResource
+
     return CallEventSubscriptionsResource(self)
 
-  @property
-  def call_labels(self) -> CallLabelsResource:
+  @cached_property
+  def call_labels(self) -> 'CallLabelsResource':
     """Returns an instance of CallLabelsResource.
 
     Returns:
         A CallLabelsResource instance initialized with this client.
     """
+    from .call_labels_resource import CallLabelsResource
+
     return CallLabelsResource(self)
 
-  @property
-  def call_review_share_links(self) -> CallReviewShareLinksResource:
+  @cached_property
+  def call_review_share_links(self) -> 'CallReviewShareLinksResource':
     """Returns an instance of CallReviewShareLinksResource.
 
     Returns:
         A CallReviewShareLinksResource instance initialized with this client.
     """
+    from .call_review_share_links_resource import CallReviewShareLinksResource
+
     return CallReviewShareLinksResource(self)
 
-  @property
-  def call_routers(self) -> CallRoutersResource:
+  @cached_property
+  def call_routers(self) -> 'CallRoutersResource':
     """Returns an instance of CallRoutersResource.
 
     Returns:
         A CallRoutersResource instance initialized with this client.
     """
+    from .call_routers_resource import CallRoutersResource
+
     return CallRoutersResource(self)
 
-  @property
-  def callbacks(self) -> CallbacksResource:
+  @cached_property
+  def callbacks(self) -> 'CallbacksResource':
     """Returns an instance of CallbacksResource.
 
     Returns:
         A CallbacksResource instance initialized with this client.
     """
+    from .callbacks_resource import CallbacksResource
+
     return CallbacksResource(self)
 
-  @property
-  def calls(self) -> CallsResource:
+  @cached_property
+  def calls(self) -> 'CallsResource':
     """Returns an instance of CallsResource.
 
     Returns:
         A CallsResource instance initialized with this client.
     """
+    from .calls_resource import CallsResource
+
     return CallsResource(self)
 
-  @property
-  def changelog_event_subscriptions(self) -> ChangelogEventSubscriptionsResource:
+  @cached_property
+  def changelog_event_subscriptions(self) -> 'ChangelogEventSubscriptionsResource':
     """Returns an instance of ChangelogEventSubscriptionsResource.
 
     Returns:
         A ChangelogEventSubscriptionsResource instance initialized with this client.
     """
+    from .changelog_event_subscriptions_resource import ChangelogEventSubscriptionsResource
+
     return ChangelogEventSubscriptionsResource(self)
 
-  @property
-  def channels(self) -> ChannelsResource:
+  @cached_property
+  def channels(self) -> 'ChannelsResource':
     """Returns an instance of ChannelsResource.
 
     Returns:
         A ChannelsResource instance initialized with this client.
     """
+    from .channels_resource import ChannelsResource
+
     return ChannelsResource(self)
 
-  @property
-  def coaching_teams(self) -> CoachingTeamsResource:
+  @cached_property
+  def coaching_teams(self) -> 'CoachingTeamsResource':
     """Returns an instance of CoachingTeamsResource.
 
     Returns:
         A CoachingTeamsResource instance initialized with this client.
     """
+    from .coaching_teams_resource import CoachingTeamsResource
+
     return CoachingTeamsResource(self)
 
-  @property
-  def company(self) -> CompanyResource:
+  @cached_property
+  def company(self) -> 'CompanyResource':
     """Returns an instance of CompanyResource.
 
     Returns:
         A CompanyResource instance initialized with this client.
     """
+    from .company_resource import CompanyResource
+
     return CompanyResource(self)
 
-  @property
-  def contact_event_subscriptions(self) -> ContactEventSubscriptionsResource:
+  @cached_property
+  def contact_event_subscriptions(self) -> 'ContactEventSubscriptionsResource':
     """Returns an instance of ContactEventSubscriptionsResource.
 
     Returns:
         A ContactEventSubscriptionsResource instance initialized with this client.
     """
+    from .contact_event_subscriptions_resource import ContactEventSubscriptionsResource
+
     return ContactEventSubscriptionsResource(self)
 
-  @property
-  def contacts(self) -> ContactsResource:
+  @cached_property
+  def contacts(self) -> 'ContactsResource':
     """Returns an instance of ContactsResource.
 
     Returns:
         A ContactsResource instance initialized with this client.
     """
+    from .contacts_resource import ContactsResource
+
     return ContactsResource(self)
 
-  @property
-  def custom_ivrs(self) -> CustomIVRsResource:
+  @cached_property
+  def custom_ivrs(self) -> 'CustomIVRsResource':
     """Returns an instance of CustomIVRsResource.
 
     Returns:
         A CustomIVRsResource instance initialized with this client.
     """
+    from .custom_ivrs_resource import CustomIVRsResource
+
     return CustomIVRsResource(self)
 
-  @property
-  def departments(self) -> DepartmentsResource:
+  @cached_property
+  def departments(self) -> 'DepartmentsResource':
     """Returns an instance of DepartmentsResource.
 
     Returns:
         A DepartmentsResource instance initialized with this client.
     """
+    from .departments_resource import DepartmentsResource
+
     return DepartmentsResource(self)
 
-  @property
-  def fax_lines(self) -> FaxLinesResource:
+  @cached_property
+  def fax_lines(self) -> 'FaxLinesResource':
     """Returns an instance of FaxLinesResource.
 
     Returns:
         A FaxLinesResource instance initialized with this client.
     """
+    from .fax_lines_resource import FaxLinesResource
+
     return FaxLinesResource(self)
 
-  @property
-  def meeting_rooms(self) -> MeetingRoomsResource:
+  @cached_property
+  def meeting_rooms(self) -> 'MeetingRoomsResource':
     """Returns an instance of MeetingRoomsResource.
 
     Returns:
         A MeetingRoomsResource instance initialized with this client.
     """
+    from .meeting_rooms_resource import MeetingRoomsResource
+
     return MeetingRoomsResource(self)
 
-  @property
-  def meetings(self) -> MeetingsResource:
+  @cached_property
+  def meetings(self) -> 'MeetingsResource':
     """Returns an instance of MeetingsResource.
 
     Returns:
         A MeetingsResource instance initialized with this client.
     """
+    from .meetings_resource import MeetingsResource
+
     return MeetingsResource(self)
 
-  @property
-  def numbers(self) -> NumbersResource:
+  @cached_property
+  def numbers(self) -> 'NumbersResource':
     """Returns an instance of NumbersResource.
 
     Returns:
         A NumbersResource instance initialized with this client.
     """
+    from .numbers_resource import NumbersResource
+
     return NumbersResource(self)
 
-  @property
-  def oauth_apps(self) -> OAuthAppsResource:
+  @cached_property
+  def oauth_apps(self) -> 'OAuthAppsResource':
     """Returns an instance of OAuthAppsResource.
 
     Returns:
         A OAuthAppsResource instance initialized with this client.
     """
+    from .oauth_apps_resource import OAuthAppsResource
+
     return OAuthAppsResource(self)
 
-  @property
-  def oauth2(self) -> OAuth2Resource:
+  @cached_property
+  def oauth2(self) -> 'OAuth2Resource':
     """Returns an instance of OAuth2Resource.
 
     Returns:
         A OAuth2Resource instance initialized with this client.
     """
+    from .oauth2_resource import OAuth2Resource
+
     return OAuth2Resource(self)
 
-  @property
-  def offices(self) -> OfficesResource:
+  @cached_property
+  def offices(self) -> 'OfficesResource':
     """Returns an instance of OfficesResource.
 
     Returns:
         A OfficesResource instance initialized with this client.
     """
+    from .offices_resource import OfficesResource
+
     return OfficesResource(self)
 
-  @property
-  def recording_share_links(self) -> RecordingShareLinksResource:
+  @cached_property
+  def recording_share_links(self) -> 'RecordingShareLinksResource':
     """Returns an instance of RecordingShareLinksResource.
 
     Returns:
         A RecordingShareLinksResource instance initialized with this client.
     """
+    from .recording_share_links_resource import RecordingShareLinksResource
+
     return RecordingShareLinksResource(self)
 
-  @property
-  def rooms(self) -> RoomsResource:
+  @cached_property
+  def rooms(self) -> 'RoomsResource':
     """Returns an instance of RoomsResource.
 
     Returns:
         A RoomsResource instance initialized with this client.
     """
+    from .rooms_resource import RoomsResource
+
     return RoomsResource(self)
 
-  @property
-  def schedule_reports(self) -> ScheduleReportsResource:
+  @cached_property
+  def schedule_reports(self) -> 'ScheduleReportsResource':
     """Returns an instance of ScheduleReportsResource.
 
     Returns:
         A ScheduleReportsResource instance initialized with this client.
     """
+    from .schedule_reports_resource import ScheduleReportsResource
+
     return ScheduleReportsResource(self)
 
-  @property
-  def sms_event_subscriptions(self) -> SmsEventSubscriptionsResource:
+  @cached_property
+  def sms_event_subscriptions(self) -> 'SmsEventSubscriptionsResource':
     """Returns an instance of SmsEventSubscriptionsResource.
 
     Returns:
         A SmsEventSubscriptionsResource instance initialized with this client.
     """
+    from .sms_event_subscriptions_resource import SmsEventSubscriptionsResource
+
     return SmsEventSubscriptionsResource(self)
 
-  @property
-  def sms(self) -> SmsResource:
+  @cached_property
+  def sms(self) -> 'SmsResource':
     """Returns an instance of SmsResource.
 
     Returns:
         A SmsResource instance initialized with this client.
     """
+    from .sms_resource import SmsResource
+
     return SmsResource(self)
 
-  @property
-  def stats(self) -> StatsResource:
+  @cached_property
+  def stats(self) -> 'StatsResource':
     """Returns an instance of StatsResource.
 
     Returns:
         A StatsResource instance initialized with this client.
     """
+    from .stats_resource import StatsResource
+
     return StatsResource(self)
 
-  @property
-  def transcripts(self) -> TranscriptsResource:
+  @cached_property
+  def transcripts(self) -> 'TranscriptsResource':
     """Returns an instance of TranscriptsResource.
 
     Returns:
         A TranscriptsResource instance initialized with this client.
     """
+    from .transcripts_resource import TranscriptsResource
+
     return TranscriptsResource(self)
 
-  @property
-  def user_devices(self) -> UserDevicesResource:
+  @cached_property
+  def user_devices(self) -> 'UserDevicesResource':
     """Returns an instance of UserDevicesResource.
 
     Returns:
         A UserDevicesResource instance initialized with this client.
     """
+    from .user_devices_resource import UserDevicesResource
+
     return UserDevicesResource(self)
 
-  @property
-  def users(self) -> UsersResource:
+  @cached_property
+  def users(self) -> 'UsersResource':
     """Returns an instance of UsersResource.
 
     Returns:
         A UsersResource instance initialized with this client.
     """
+    from .users_resource import UsersResource
+
     return UsersResource(self)
 
-  @property
-  def webhooks(self) -> WebhooksResource:
+  @cached_property
+  def webhooks(self) -> 'WebhooksResource':
     """Returns an instance of WebhooksResource.
 
     Returns:
         A WebhooksResource instance initialized with this client.
     """
+    from .webhooks_resource import WebhooksResource
+
     return WebhooksResource(self)
 
-  @property
-  def websockets(self) -> WebsocketsResource:
+  @cached_property
+  def websockets(self) -> 'WebsocketsResource':
     """Returns an instance of WebsocketsResource.
 
     Returns:
         A WebsocketsResource instance initialized with this client.
     """
+    from .websockets_resource import WebsocketsResource
+
     return WebsocketsResource(self)
 
 
@@ -21,6 +21,8 @@ class AccessControlPoliciesResource(DialpadResource):
   - /api/v2/accesscontrolpolicies/{id}/assignments
   - /api/v2/accesscontrolpolicies/{id}/unassign"""
 
+  __slots__ = ()
+
   def assign(self, id: int, request_body: AssignmentPolicyMessage) -> PolicyAssignmentProto:
     """Access Control Policies -- Assign
 
@@ -37,7 +39,11 @@ class AccessControlPoliciesResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/accesscontrolpolicies/{id}/assign', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}/assign',
+      body=request_body,
+      operation_id='accesscontrolpolicies.assign',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreatePolicyMessage) -> PolicyProto:
@@ -54,7 +60,13 @@ class AccessControlPoliciesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/accesscontrolpolicies', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/accesscontrolpolicies',
+      body=request_body,
+      operation_id='accesscontrolpolicies.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> PolicyProto:
     """Access Control Policies -- Delete
@@ -70,7 +82,12 @@ class AccessControlPoliciesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/accesscontrolpolicies/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}',
+      operation_id='accesscontrolpolicies.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> PolicyProto:
     """Access Control Policies -- Get
@@ -84,7 +101,12 @@ class AccessControlPoliciesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/accesscontrolpolicies/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}',
+      operation_id='accesscontrolpolicies.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[PolicyProto]:
     """Access Control Policies -- List Policies
@@ -99,7 +121,11 @@ class AccessControlPoliciesResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/accesscontrolpolicies', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/accesscontrolpolicies',
+      params={'cursor': cursor},
+      operation_id='accesscontrolpolicies.list',
+      rate_limit=(1200, 60),
     )
 
   def list_assignments(
@@ -121,6 +147,8 @@ class AccessControlPoliciesResource(DialpadResource):
       method='GET',
       sub_path=f'/api/v2/accesscontrolpolicies/{id}/assignments',
       params={'cursor': cursor},
+      operation_id='accesscontrolpolicies.assignments',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(self, id: int, request_body: UpdatePolicyMessage) -> PolicyProto:
@@ -139,7 +167,11 @@ class AccessControlPoliciesResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/accesscontrolpolicies/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}',
+      body=request_body,
+      operation_id='accesscontrolpolicies.update',
+      rate_limit=(1200, 60),
     )
 
   def unassign(self, id: int, request_body: UnassignmentPolicyMessage) -> PolicyAssignmentProto:
@@ -158,5 +190,9 @@ class AccessControlPoliciesResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/accesscontrolpolicies/{id}/unassign', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/accesscontrolpolicies/{id}/unassign',
+      body=request_body,
+      operation_id='accesscontrolpolicies.unassign',
+      rate_limit=(1200, 60),
     )
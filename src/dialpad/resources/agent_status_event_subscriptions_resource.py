@@ -15,6 +15,8 @@ class AgentStatusEventSubscriptionsResource(DialpadResource):
   - /api/v2/subscriptions/agent_status
   - /api/v2/subscriptions/agent_status/{id}"""
 
+  __slots__ = ()
+
   def create(
     self, request_body: CreateAgentStatusEventSubscription
   ) -> AgentStatusEventSubscriptionProto:
@@ -36,7 +38,11 @@ class AgentStatusEventSubscriptionsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path='/api/v2/subscriptions/agent_status', body=request_body
+      method='POST',
+      sub_path='/api/v2/subscriptions/agent_status',
+      body=request_body,
+      operation_id='webhook_agent_status_event_subscription.create',
+      rate_limit=(1200, 60),
     )
 
   def delete(self, id: int) -> AgentStatusEventSubscriptionProto:
@@ -55,7 +61,12 @@ class AgentStatusEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/agent_status/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/agent_status/{id}',
+      operation_id='webhook_agent_status_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> AgentStatusEventSubscriptionProto:
     """Agent Status -- Get
@@ -73,7 +84,12 @@ class AgentStatusEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/subscriptions/agent_status/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/agent_status/{id}',
+      operation_id='webhook_agent_status_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[AgentStatusEventSubscriptionProto]:
     """Agent Status -- List
@@ -92,7 +108,11 @@ class AgentStatusEventSubscriptionsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/subscriptions/agent_status', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/subscriptions/agent_status',
+      params={'cursor': cursor},
+      operation_id='webhook_agent_status_event_subscription.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(
@@ -115,5 +135,9 @@ class AgentStatusEventSubscriptionsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/agent_status/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/agent_status/{id}',
+      body=request_body,
+      operation_id='webhook_agent_status_event_subscription.update',
+      rate_limit=(1200, 60),
     )
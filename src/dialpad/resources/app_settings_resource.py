@@ -10,6 +10,8 @@ class AppSettingsResource(DialpadResource):
   Handles API operations for:
   - /api/v2/app/settings"""
 
+  __slots__ = ()
+
   def get(
     self,
     target_id: Optional[int] = None,
@@ -45,4 +47,6 @@ class AppSettingsResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/app/settings',
       params={'target_id': target_id, 'target_type': target_type},
+      operation_id='app_settings.get',
+      rate_limit=(1200, 60),
     )
@@ -1,7 +1,11 @@
 from typing import Iterator, Optional
 
+from dialpad.rate_limit import RateLimit
+
 
 class DialpadResource(object):
+  __slots__ = ('_client',)
+
   def __init__(self, client):
     self._client = client
 
@@ -12,9 +16,17 @@ class DialpadResource(object):
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
   ) -> dict:
     return self._client.request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
+      method=method,
+      sub_path=sub_path,
+      params=params,
+      body=body,
+      headers=headers,
+      operation_id=operation_id,
+      rate_limit=rate_limit,
     )
 
   def _iter_request(
@@ -24,7 +36,15 @@ class DialpadResource(object):
     params: Optional[dict] = None,
     body: Optional[dict] = None,
     headers: Optional[dict] = None,
+    operation_id: Optional[str] = None,
+    rate_limit: Optional[RateLimit] = None,
   ) -> Iterator[dict]:
     return self._client.iter_request(
-      method=method, sub_path=sub_path, params=params, body=body, headers=headers
+      method=method,
+      sub_path=sub_path,
+      params=params,
+      body=body,
+      headers=headers,
+      operation_id=operation_id,
+      rate_limit=rate_limit,
     )
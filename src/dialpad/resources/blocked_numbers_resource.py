@@ -17,6 +17,8 @@ class BlockedNumbersResource(DialpadResource):
   - /api/v2/blockednumbers/remove
   - /api/v2/blockednumbers/{number}"""
 
+  __slots__ = ()
+
   def add(self, request_body: AddBlockedNumbersProto) -> None:
     """Blocked Number -- Add
 
@@ -29,7 +31,13 @@ class BlockedNumbersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/blockednumbers/add', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/blockednumbers/add',
+      body=request_body,
+      operation_id='blockednumbers.add',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, number: str) -> BlockedNumber:
     """Blocked Number -- Get
@@ -43,7 +51,12 @@ class BlockedNumbersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/blockednumbers/{number}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/blockednumbers/{number}',
+      operation_id='blockednumbers.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[BlockedNumber]:
     """Blocked Numbers -- List
@@ -58,7 +71,11 @@ class BlockedNumbersResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/blockednumbers', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/blockednumbers',
+      params={'cursor': cursor},
+      operation_id='blockednumbers.list',
+      rate_limit=(1200, 60),
     )
 
   def remove(self, request_body: RemoveBlockedNumbersProto) -> None:
@@ -73,4 +90,10 @@ class BlockedNumbersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/blockednumbers/remove', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/blockednumbers/remove',
+      body=request_body,
+      operation_id='blockednumbers.remove',
+      rate_limit=(1200, 60),
+    )
@@ -8,6 +8,8 @@ class CallCenterOperatorsResource(DialpadResource):
   Handles API operations for:
   - /api/v2/callcenters/operators/{id}/dutystatus"""
 
+  __slots__ = ()
+
   def get_duty_status(self, id: int) -> OperatorDutyStatusProto:
     """Operator -- Get Duty Status
 
@@ -20,7 +22,12 @@ class CallCenterOperatorsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus',
+      operation_id='callcenters.operators.get.dutystatus',
+      rate_limit=(1200, 60),
+    )
 
   def update_duty_status(
     self, id: int, request_body: UpdateOperatorDutyStatusMessage
@@ -38,5 +45,9 @@ class CallCenterOperatorsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/callcenters/operators/{id}/dutystatus',
+      body=request_body,
+      operation_id='callcenters.operators.dutystatus',
+      rate_limit=(1200, 60),
     )
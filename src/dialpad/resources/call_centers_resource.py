@@ -25,6 +25,8 @@ class CallCentersResource(DialpadResource):
   - /api/v2/callcenters/{id}/operators
   - /api/v2/callcenters/{id}/status"""
 
+  __slots__ = ()
+
   def add_operator(self, id: int, request_body: AddCallCenterOperatorMessage) -> UserOrRoomProto:
     """Operator -- Add
 
@@ -45,7 +47,11 @@ class CallCentersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/callcenters/{id}/operators', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/callcenters/{id}/operators',
+      body=request_body,
+      operation_id='callcenters.operators.post',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateCallCenterMessage) -> CallCenterProto:
@@ -62,7 +68,13 @@ class CallCentersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/callcenters', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/callcenters',
+      body=request_body,
+      operation_id='callcenters.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> CallCenterProto:
     """Call Centers -- Delete
@@ -78,7 +90,12 @@ class CallCentersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/callcenters/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/callcenters/{id}',
+      operation_id='callcenters.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> CallCenterProto:
     """Call Centers -- Get
@@ -92,7 +109,12 @@ class CallCentersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/callcenters/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{id}',
+      operation_id='callcenters.get',
+      rate_limit=(1200, 60),
+    )
 
   def get_operator_skill_level(self, call_center_id: int, user_id: int) -> OperatorSkillLevelProto:
     """Operator -- Get Skill Level
@@ -108,7 +130,10 @@ class CallCentersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='GET', sub_path=f'/api/v2/callcenters/{call_center_id}/operators/{user_id}/skill'
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{call_center_id}/operators/{user_id}/skill',
+      operation_id='callcenters.operators.get.skilllevel',
+      rate_limit=(1200, 60),
     )
 
   def get_status(self, id: int) -> CallCenterStatusProto:
@@ -125,7 +150,12 @@ class CallCentersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/callcenters/{id}/status')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{id}/status',
+      operation_id='callcenters.status',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self,
@@ -151,6 +181,8 @@ class CallCentersResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/callcenters',
       params={'cursor': cursor, 'office_id': office_id, 'name_search': name_search},
+      operation_id='callcenters.listall',
+      rate_limit=(1200, 60),
     )
 
   def list_operators(self, id: int) -> OperatorCollection:
@@ -165,7 +197,12 @@ class CallCentersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/callcenters/{id}/operators')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/callcenters/{id}/operators',
+      operation_id='callcenters.operators.get',
+      rate_limit=(1200, 60),
+    )
 
   def partial_update(self, id: int, request_body: UpdateCallCenterMessage) -> CallCenterProto:
     """Call Centers -- Update
@@ -182,7 +219,13 @@ class CallCentersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/callcenters/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/callcenters/{id}',
+      body=request_body,
+      operation_id='callcenters.update',
+      rate_limit=(1200, 60),
+    )
 
   def remove_operator(
     self, id: int, request_body: RemoveCallCenterOperatorMessage
@@ -204,7 +247,11 @@ class CallCentersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='DELETE', sub_path=f'/api/v2/callcenters/{id}/operators', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/callcenters/{id}/operators',
+      body=request_body,
+      operation_id='callcenters.operators.delete',
+      rate_limit=(1200, 60),
     )
 
   def update_operator_skill_level(
@@ -227,4 +274,6 @@ class CallCentersResource(DialpadResource):
       method='PATCH',
       sub_path=f'/api/v2/callcenters/{call_center_id}/operators/{user_id}/skill',
       body=request_body,
+      operation_id='callcenters.operators.skilllevel',
+      rate_limit=(1200, 60),
     )
@@ -15,6 +15,8 @@ class CallEventSubscriptionsResource(DialpadResource):
   - /api/v2/subscriptions/call
   - /api/v2/subscriptions/call/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateCallEventSubscription) -> CallEventSubscriptionProto:
     """Call Event -- Create
 
@@ -35,7 +37,13 @@ class CallEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/subscriptions/call', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/subscriptions/call',
+      body=request_body,
+      operation_id='webhook_call_event_subscription.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> CallEventSubscriptionProto:
     """Call Event -- Delete
@@ -53,7 +61,12 @@ class CallEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/call/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/call/{id}',
+      operation_id='webhook_call_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> CallEventSubscriptionProto:
     """Call Event -- Get
@@ -71,7 +84,12 @@ class CallEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/subscriptions/call/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/call/{id}',
+      operation_id='webhook_call_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self,
@@ -114,6 +132,8 @@ class CallEventSubscriptionsResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/subscriptions/call',
       params={'cursor': cursor, 'target_type': target_type, 'target_id': target_id},
+      operation_id='webhook_call_event_subscription.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(
@@ -136,5 +156,9 @@ class CallEventSubscriptionsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/call/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/call/{id}',
+      body=request_body,
+      operation_id='webhook_call_event_subscription.update',
+      rate_limit=(1200, 60),
     )
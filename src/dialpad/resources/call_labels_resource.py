@@ -10,6 +10,8 @@ class CallLabelsResource(DialpadResource):
   Handles API operations for:
   - /api/v2/calllabels"""
 
+  __slots__ = ()
+
   def list(self, limit: Optional[int] = None) -> CompanyCallLabels:
     """Label -- List
 
@@ -24,4 +26,10 @@ class CallLabelsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path='/api/v2/calllabels', params={'limit': limit})
+    return self._request(
+      method='GET',
+      sub_path='/api/v2/calllabels',
+      params={'limit': limit},
+      operation_id='calllabel.list',
+      rate_limit=(1200, 60),
+    )
@@ -13,6 +13,8 @@ class CallReviewShareLinksResource(DialpadResource):
   - /api/v2/callreviewsharelink
   - /api/v2/callreviewsharelink/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateCallReviewShareLink) -> CallReviewShareLink:
     """Call Review Sharelink -- Create
 
@@ -27,7 +29,13 @@ class CallReviewShareLinksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/callreviewsharelink', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/callreviewsharelink',
+      body=request_body,
+      operation_id='call_review_share_link.create',
+      rate_limit=(250, 60),
+    )
 
   def delete(self, id: str) -> CallReviewShareLink:
     """Call Review Sharelink -- Delete
@@ -43,7 +51,12 @@ class CallReviewShareLinksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/callreviewsharelink/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/callreviewsharelink/{id}',
+      operation_id='call_review_share_link.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: str) -> CallReviewShareLink:
     """Call Review Sharelink -- Get
@@ -59,7 +72,12 @@ class CallReviewShareLinksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/callreviewsharelink/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/callreviewsharelink/{id}',
+      operation_id='call_review_share_link.get',
+      rate_limit=(1200, 60),
+    )
 
   def update(self, id: str, request_body: UpdateCallReviewShareLink) -> CallReviewShareLink:
     """Call Review Sharelink -- Update
@@ -77,5 +95,9 @@ class CallReviewShareLinksResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PUT', sub_path=f'/api/v2/callreviewsharelink/{id}', body=request_body
+      method='PUT',
+      sub_path=f'/api/v2/callreviewsharelink/{id}',
+      body=request_body,
+      operation_id='call_review_share_link.update',
+      rate_limit=(250, 60),
     )
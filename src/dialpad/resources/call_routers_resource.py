@@ -17,6 +17,8 @@ class CallRoutersResource(DialpadResource):
   - /api/v2/callrouters/{id}
   - /api/v2/callrouters/{id}/assign_number"""
 
+  __slots__ = ()
+
   def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -31,7 +33,11 @@ class CallRoutersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/callrouters/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/callrouters/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_call_router_number.post',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateApiCallRouterMessage) -> ApiCallRouterProto:
@@ -46,7 +52,13 @@ class CallRoutersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/callrouters', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/callrouters',
+      body=request_body,
+      operation_id='callrouters.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: str) -> None:
     """Call Router -- Delete
@@ -60,7 +72,12 @@ class CallRoutersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/callrouters/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/callrouters/{id}',
+      operation_id='callrouters.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> ApiCallRouterProto:
     """Call Router -- Get
@@ -74,7 +91,12 @@ class CallRoutersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/callrouters/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/callrouters/{id}',
+      operation_id='callrouters.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self, cursor: Optional[str] = None, office_id: Optional[int] = None
@@ -95,6 +117,8 @@ class CallRoutersResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/callrouters',
       params={'cursor': cursor, 'office_id': office_id},
+      operation_id='callrouters.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(self, id: str, request_body: UpdateApiCallRouterMessage) -> ApiCallRouterProto:
@@ -110,4 +134,10 @@ class CallRoutersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/callrouters/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/callrouters/{id}',
+      body=request_body,
+      operation_id='callrouters.update',
+      rate_limit=(1, 300),
+    )
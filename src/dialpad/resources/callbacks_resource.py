@@ -9,6 +9,8 @@ class CallbacksResource(DialpadResource):
   - /api/v2/callback
   - /api/v2/callback/validate"""
 
+  __slots__ = ()
+
   def enqueue_callback(self, request_body: CallbackMessage) -> CallbackProto:
     """Call Back -- Enqueue
 
@@ -24,7 +26,13 @@ class CallbacksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/callback', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/callback',
+      body=request_body,
+      operation_id='call.callback',
+      rate_limit=(1200, 60),
+    )
 
   def validate_callback(self, request_body: CallbackMessage) -> ValidateCallbackProto:
     """Call Back -- Validate
@@ -40,4 +48,10 @@ class CallbacksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/callback/validate', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/callback/validate',
+      body=request_body,
+      operation_id='call.validate_callback',
+      rate_limit=(1200, 60),
+    )
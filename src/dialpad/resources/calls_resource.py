@@ -28,6 +28,8 @@ class CallsResource(DialpadResource):
   - /api/v2/call/{id}/transfer
   - /api/v2/call/{id}/unpark"""
 
+  __slots__ = ()
+
   def add_participant(self, id: int, request_body: AddParticipantMessage) -> RingCallProto:
     """Call -- Add Participant
 
@@ -42,7 +44,11 @@ class CallsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/call/{id}/participants/add', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/call/{id}/participants/add',
+      body=request_body,
+      operation_id='call.participants.add',
+      rate_limit=(1200, 60),
     )
 
   def get(self, id: int) -> CallProto:
@@ -57,7 +63,12 @@ class CallsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/call/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/call/{id}',
+      operation_id='call.get_call_info',
+      rate_limit=(10, 60),
+    )
 
   def hangup_call(self, id: int) -> None:
     """Call Actions -- Hang up
@@ -71,7 +82,12 @@ class CallsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PUT', sub_path=f'/api/v2/call/{id}/actions/hangup')
+    return self._request(
+      method='PUT',
+      sub_path=f'/api/v2/call/{id}/actions/hangup',
+      operation_id='call.actions.hangup',
+      rate_limit=(1200, 60),
+    )
 
   def initiate_ivr_call(self, request_body: OutboundIVRMessage) -> InitiatedIVRCallProto:
     """Call -- Initiate IVR Call
@@ -90,7 +106,11 @@ class CallsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path='/api/v2/call/initiate_ivr_call', body=request_body
+      method='POST',
+      sub_path='/api/v2/call/initiate_ivr_call',
+      body=request_body,
+      operation_id='call.initiate_ivr_call',
+      rate_limit=(1200, 60),
     )
 
   def initiate_ring_call(self, request_body: RingCallMessage) -> RingCallProto:
@@ -107,7 +127,13 @@ class CallsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/call', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/call',
+      body=request_body,
+      operation_id='call.call',
+      rate_limit=(5, 60),
+    )
 
   def list(
     self,
@@ -166,6 +192,8 @@ class CallsResource(DialpadResource):
         'target_id': target_id,
         'target_type': target_type,
       },
+      operation_id='call.list',
+      rate_limit=(1200, 60),
     )
 
   def set_call_label(self, id: int, request_body: AddCallLabelsMessage) -> CallProto:
@@ -183,7 +211,13 @@ class CallsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PUT', sub_path=f'/api/v2/call/{id}/labels', body=request_body)
+    return self._request(
+      method='PUT',
+      sub_path=f'/api/v2/call/{id}/labels',
+      body=request_body,
+      operation_id='call.put_call_labels',
+      rate_limit=(250, 60),
+    )
 
   def transfer(self, id: int, request_body: TransferCallMessage) -> TransferredCallProto:
     """Call -- Transfer
@@ -198,7 +232,13 @@ class CallsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path=f'/api/v2/call/{id}/transfer', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path=f'/api/v2/call/{id}/transfer',
+      body=request_body,
+      operation_id='call.transfer_call',
+      rate_limit=(1200, 60),
+    )
 
   def unpark(self, id: int, request_body: UnparkCallMessage) -> RingCallProto:
     """Call -- Unpark
@@ -213,4 +253,10 @@ class CallsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path=f'/api/v2/call/{id}/unpark', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path=f'/api/v2/call/{id}/unpark',
+      body=request_body,
+      operation_id='call.unpark',
+      rate_limit=(1200, 60),
+    )
@@ -15,6 +15,8 @@ class ChangelogEventSubscriptionsResource(DialpadResource):
   - /api/v2/subscriptions/changelog
   - /api/v2/subscriptions/changelog/{id}"""
 
+  __slots__ = ()
+
   def create(
     self, request_body: CreateChangeLogEventSubscription
   ) -> ChangeLogEventSubscriptionProto:
@@ -38,7 +40,11 @@ class ChangelogEventSubscriptionsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path='/api/v2/subscriptions/changelog', body=request_body
+      method='POST',
+      sub_path='/api/v2/subscriptions/changelog',
+      body=request_body,
+      operation_id='webhook_change_log_event_subscription.create',
+      rate_limit=(1200, 60),
     )
 
   def delete(self, id: int) -> ChangeLogEventSubscriptionProto:
@@ -59,7 +65,12 @@ class ChangelogEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/changelog/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/changelog/{id}',
+      operation_id='webhook_change_log_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> ChangeLogEventSubscriptionProto:
     """Change Log -- Get
@@ -79,7 +90,12 @@ class ChangelogEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/subscriptions/changelog/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/changelog/{id}',
+      operation_id='webhook_change_log_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[ChangeLogEventSubscriptionProto]:
     """Change Log -- List
@@ -100,7 +116,11 @@ class ChangelogEventSubscriptionsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/subscriptions/changelog', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/subscriptions/changelog',
+      params={'cursor': cursor},
+      operation_id='webhook_change_log_event_subscription.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(
@@ -125,5 +145,9 @@ class ChangelogEventSubscriptionsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/changelog/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/changelog/{id}',
+      body=request_body,
+      operation_id='webhook_change_log_event_subscription.update',
+      rate_limit=(1200, 60),
     )
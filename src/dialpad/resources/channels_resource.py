@@ -17,6 +17,8 @@ class ChannelsResource(DialpadResource):
   - /api/v2/channels/{id}
   - /api/v2/channels/{id}/members"""
 
+  __slots__ = ()
+
   def add_member(self, id: int, request_body: AddChannelMemberMessage) -> MembersProto:
     """Member -- Add
 
@@ -33,7 +35,11 @@ class ChannelsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/channels/{id}/members', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/channels/{id}/members',
+      body=request_body,
+      operation_id='channels.members.post',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateChannelMessage) -> ChannelProto:
@@ -50,7 +56,13 @@ class ChannelsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/channels', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/channels',
+      body=request_body,
+      operation_id='channels.post',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> None:
     """Channel -- Delete
@@ -66,7 +78,12 @@ class ChannelsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/channels/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/channels/{id}',
+      operation_id='channels.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> ChannelProto:
     """Channel -- Get
@@ -82,7 +99,12 @@ class ChannelsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/channels/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/channels/{id}',
+      operation_id='channels.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self, cursor: Optional[str] = None, state: Optional[str] = None
@@ -102,7 +124,11 @@ class ChannelsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/channels', params={'cursor': cursor, 'state': state}
+      method='GET',
+      sub_path='/api/v2/channels',
+      params={'cursor': cursor, 'state': state},
+      operation_id='channels.list',
+      rate_limit=(1200, 60),
     )
 
   def list_members(self, id: int, cursor: Optional[str] = None) -> Iterator[MembersProto]:
@@ -121,7 +147,11 @@ class ChannelsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path=f'/api/v2/channels/{id}/members', params={'cursor': cursor}
+      method='GET',
+      sub_path=f'/api/v2/channels/{id}/members',
+      params={'cursor': cursor},
+      operation_id='channels.members.list',
+      rate_limit=(1200, 60),
     )
 
   def remove_member(self, id: int, request_body: RemoveChannelMemberMessage) -> None:
@@ -140,5 +170,9 @@ class ChannelsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='DELETE', sub_path=f'/api/v2/channels/{id}/members', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/channels/{id}/members',
+      body=request_body,
+      operation_id='channels.members.delete',
+      rate_limit=(1200, 60),
     )
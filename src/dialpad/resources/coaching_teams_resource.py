@@ -16,6 +16,8 @@ class CoachingTeamsResource(DialpadResource):
   - /api/v2/coachingteams/{id}
   - /api/v2/coachingteams/{id}/members"""
 
+  __slots__ = ()
+
   def add_member(self, id: int, request_body: CoachingTeamMemberMessage) -> CoachingTeamMemberProto:
     """Coaching Team -- Add Member
 
@@ -32,7 +34,11 @@ class CoachingTeamsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/coachingteams/{id}/members', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/coachingteams/{id}/members',
+      body=request_body,
+      operation_id='coaching_team.members.add',
+      rate_limit=(1200, 60),
     )
 
   def get(self, id: int) -> CoachingTeamProto:
@@ -47,7 +53,12 @@ class CoachingTeamsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/coachingteams/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/coachingteams/{id}',
+      operation_id='coaching_team.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[CoachingTeamProto]:
     """Coaching Team -- List
@@ -62,7 +73,11 @@ class CoachingTeamsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/coachingteams', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/coachingteams',
+      params={'cursor': cursor},
+      operation_id='coaching_team.listall',
+      rate_limit=(1200, 60),
     )
 
   def list_members(self, id: int) -> Iterator[CoachingTeamMemberProto]:
@@ -77,4 +92,9 @@ class CoachingTeamsResource(DialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    return self._iter_request(method='GET', sub_path=f'/api/v2/coachingteams/{id}/members')
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/coachingteams/{id}/members',
+      operation_id='coaching_team.members.get',
+      rate_limit=(1200, 60),
+    )
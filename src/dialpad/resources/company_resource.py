@@ -12,6 +12,8 @@ class CompanyResource(DialpadResource):
   - /api/v2/company
   - /api/v2/company/{id}/smsoptout"""
 
+  __slots__ = ()
+
   def get(self) -> CompanyProto:
     """Company -- Get
 
@@ -25,7 +27,9 @@ class CompanyResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path='/api/v2/company')
+    return self._request(
+      method='GET', sub_path='/api/v2/company', operation_id='company.get', rate_limit=(1200, 60)
+    )
 
   def get_sms_opt_out_list(
     self,
@@ -55,4 +59,6 @@ class CompanyResource(DialpadResource):
       method='GET',
       sub_path=f'/api/v2/company/{id}/smsoptout',
       params={'a2p_campaign_id': a2p_campaign_id, 'cursor': cursor, 'opt_out_state': opt_out_state},
+      operation_id='company.sms_opt_out',
+      rate_limit=(250, 60),
     )
@@ -15,6 +15,8 @@ class ContactEventSubscriptionsResource(DialpadResource):
   - /api/v2/subscriptions/contact
   - /api/v2/subscriptions/contact/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateContactEventSubscription) -> ContactEventSubscriptionProto:
     """Contact Event -- Create
 
@@ -33,7 +35,13 @@ class ContactEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/subscriptions/contact', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/subscriptions/contact',
+      body=request_body,
+      operation_id='webhook_contact_event_subscription.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> ContactEventSubscriptionProto:
     """Contact Event -- Delete
@@ -53,7 +61,12 @@ class ContactEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/contact/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/contact/{id}',
+      operation_id='webhook_contact_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> ContactEventSubscriptionProto:
     """Contact Event -- Get
@@ -73,7 +86,12 @@ class ContactEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/subscriptions/contact/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/contact/{id}',
+      operation_id='webhook_contact_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[ContactEventSubscriptionProto]:
     """Contact Event -- List
@@ -94,7 +112,11 @@ class ContactEventSubscriptionsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/subscriptions/contact', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/subscriptions/contact',
+      params={'cursor': cursor},
+      operation_id='webhook_contact_event_subscription.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(
@@ -119,5 +141,9 @@ class ContactEventSubscriptionsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/contact/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/contact/{id}',
+      body=request_body,
+      operation_id='webhook_contact_event_subscription.update',
+      rate_limit=(1200, 60),
     )
@@ -16,6 +16,8 @@ class ContactsResource(DialpadResource):
   - /api/v2/contacts
   - /api/v2/contacts/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateContactMessage) -> ContactProto:
     """Contact -- Create
 
@@ -28,7 +30,13 @@ class ContactsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/contacts', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/contacts',
+      body=request_body,
+      operation_id='contacts.create',
+      rate_limit=(100, 60),
+    )
 
   def create_or_update(self, request_body: CreateContactMessageWithUid) -> ContactProto:
     """Contact -- Create or Update
@@ -42,7 +50,13 @@ class ContactsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PUT', sub_path='/api/v2/contacts', body=request_body)
+    return self._request(
+      method='PUT',
+      sub_path='/api/v2/contacts',
+      body=request_body,
+      operation_id='contacts.create_with_uid',
+      rate_limit=(100, 60),
+    )
 
   def delete(self, id: str) -> ContactProto:
     """Contact -- Delete
@@ -56,7 +70,12 @@ class ContactsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/contacts/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/contacts/{id}',
+      operation_id='contacts.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: str) -> ContactProto:
     """Contact -- Get
@@ -72,7 +91,12 @@ class ContactsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/contacts/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/contacts/{id}',
+      operation_id='contacts.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self,
@@ -99,6 +123,8 @@ class ContactsResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/contacts',
       params={'cursor': cursor, 'include_local': include_local, 'owner_id': owner_id},
+      operation_id='contacts.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(self, id: str, request_body: UpdateContactMessage) -> ContactProto:
@@ -114,4 +140,10 @@ class ContactsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/contacts/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/contacts/{id}',
+      body=request_body,
+      operation_id='contacts.update',
+      rate_limit=(1200, 60),
+    )
@@ -18,6 +18,8 @@ class CustomIVRsResource(DialpadResource):
   - /api/v2/customivrs/{ivr_id}
   - /api/v2/customivrs/{target_type}/{target_id}/{ivr_type}"""
 
+  __slots__ = ()
+
   def assign(
     self,
     ivr_type: Literal[
@@ -125,6 +127,8 @@ class CustomIVRsResource(DialpadResource):
       method='PATCH',
       sub_path=f'/api/v2/customivrs/{target_type}/{target_id}/{ivr_type}',
       body=request_body,
+      operation_id='ivr.update',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateCustomIvrMessage) -> CustomIvrDetailsProto:
@@ -141,7 +145,13 @@ class CustomIVRsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/customivrs', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/customivrs',
+      body=request_body,
+      operation_id='ivr.create',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self,
@@ -180,6 +190,8 @@ class CustomIVRsResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/customivrs',
       params={'cursor': cursor, 'target_type': target_type, 'target_id': target_id},
+      operation_id='custom_ivrs.get',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(
@@ -197,7 +209,13 @@ class CustomIVRsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/customivrs/{ivr_id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/customivrs/{ivr_id}',
+      body=request_body,
+      operation_id='ivr_details.update',
+      rate_limit=(1200, 60),
+    )
 
   def unassign(
     self,
@@ -304,4 +322,6 @@ class CustomIVRsResource(DialpadResource):
       method='DELETE',
       sub_path=f'/api/v2/customivrs/{target_type}/{target_id}/{ivr_type}',
       body=request_body,
+      operation_id='ivr.delete',
+      rate_limit=(1200, 60),
     )
@@ -20,6 +20,8 @@ class DepartmentsResource(DialpadResource):
   - /api/v2/departments/{id}
   - /api/v2/departments/{id}/operators"""
 
+  __slots__ = ()
+
   def add_operator(self, id: int, request_body: AddOperatorMessage) -> UserOrRoomProto:
     """Operator -- Add
 
@@ -36,7 +38,11 @@ class DepartmentsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/departments/{id}/operators', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/departments/{id}/operators',
+      body=request_body,
+      operation_id='departments.operators.post',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateDepartmentMessage) -> DepartmentProto:
@@ -55,7 +61,13 @@ class DepartmentsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/departments', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/departments',
+      body=request_body,
+      operation_id='departments.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> DepartmentProto:
     """Departments-- Delete
@@ -71,7 +83,12 @@ class DepartmentsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/departments/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/departments/{id}',
+      operation_id='departments.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> DepartmentProto:
     """Department -- Get
@@ -85,7 +102,12 @@ class DepartmentsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/departments/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/departments/{id}',
+      operation_id='departments.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self,
@@ -110,6 +132,8 @@ class DepartmentsResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/departments',
       params={'cursor': cursor, 'office_id': office_id, 'name_search': name_search},
+      operation_id='departments.listall',
+      rate_limit=(1200, 60),
     )
 
   def list_operators(self, id: int) -> OperatorCollection:
@@ -124,7 +148,12 @@ class DepartmentsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/departments/{id}/operators')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/departments/{id}/operators',
+      operation_id='departments.operators.get',
+      rate_limit=(1200, 60),
+    )
 
   def partial_update(self, id: int, request_body: UpdateDepartmentMessage) -> DepartmentProto:
     """Departments-- Update
@@ -141,7 +170,13 @@ class DepartmentsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/departments/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/departments/{id}',
+      body=request_body,
+      operation_id='departments.update',
+      rate_limit=(1200, 60),
+    )
 
   def remove_operator(self, id: int, request_body: RemoveOperatorMessage) -> UserOrRoomProto:
     """Operator -- Remove
@@ -159,5 +194,9 @@ class DepartmentsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='DELETE', sub_path=f'/api/v2/departments/{id}/operators', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/departments/{id}/operators',
+      body=request_body,
+      operation_id='departments.operators.delete',
+      rate_limit=(1200, 60),
     )
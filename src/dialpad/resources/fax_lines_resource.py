@@ -8,6 +8,8 @@ class FaxLinesResource(DialpadResource):
   Handles API operations for:
   - /api/v2/faxline"""
 
+  __slots__ = ()
+
   def assign(self, request_body: CreateFaxNumberMessage) -> FaxNumberProto:
     """Fax Line -- Assign
 
@@ -24,4 +26,10 @@ class FaxLinesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/faxline', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/faxline',
+      body=request_body,
+      operation_id='faxline.create',
+      rate_limit=(1200, 60),
+    )
@@ -10,6 +10,8 @@ class MeetingRoomsResource(DialpadResource):
   Handles API operations for:
   - /api/v2/conference/rooms"""
 
+  __slots__ = ()
+
   def list(self, cursor: Optional[str] = None) -> Iterator[RoomProto]:
     """Meeting Room -- List
 
@@ -25,5 +27,9 @@ class MeetingRoomsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/conference/rooms', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/conference/rooms',
+      params={'cursor': cursor},
+      operation_id='conference-rooms.list',
+      rate_limit=(1200, 60),
     )
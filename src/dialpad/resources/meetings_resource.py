@@ -10,6 +10,8 @@ class MeetingsResource(DialpadResource):
   Handles API operations for:
   - /api/v2/conference/meetings"""
 
+  __slots__ = ()
+
   def list(
     self, cursor: Optional[str] = None, room_id: Optional[str] = None
   ) -> Iterator[MeetingSummaryProto]:
@@ -31,4 +33,6 @@ class MeetingsResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/conference/meetings',
       params={'cursor': cursor, 'room_id': room_id},
+      operation_id='conference-meetings.list',
+      rate_limit=(1200, 60),
     )
@@ -21,6 +21,8 @@ class NumbersResource(DialpadResource):
   - /api/v2/numbers/{number}
   - /api/v2/numbers/{number}/assign"""
 
+  __slots__ = ()
+
   def assign(self, number: str, request_body: AssignNumberTargetMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -38,7 +40,11 @@ class NumbersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/numbers/{number}/assign', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/numbers/{number}/assign',
+      body=request_body,
+      operation_id='numbers.assign_number.post',
+      rate_limit=(1200, 60),
     )
 
   def auto_assign(self, request_body: AssignNumberTargetGenericMessage) -> NumberProto:
@@ -56,7 +62,13 @@ class NumbersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/numbers/assign', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/numbers/assign',
+      body=request_body,
+      operation_id='numbers.assign_target_number.post',
+      rate_limit=(1200, 60),
+    )
 
   def format_number(
     self, country_code: Optional[str] = None, number: Optional[str] = None
@@ -79,6 +91,8 @@ class NumbersResource(DialpadResource):
       method='POST',
       sub_path='/api/v2/numbers/format',
       params={'country_code': country_code, 'number': number},
+      operation_id='format.post',
+      rate_limit=(1200, 60),
     )
 
   def get(self, number: str) -> NumberProto:
@@ -97,7 +111,12 @@ class NumbersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/numbers/{number}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/numbers/{number}',
+      operation_id='numbers.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self, cursor: Optional[str] = None, status: Optional[str] = None
@@ -119,7 +138,11 @@ class NumbersResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/numbers', params={'cursor': cursor, 'status': status}
+      method='GET',
+      sub_path='/api/v2/numbers',
+      params={'cursor': cursor, 'status': status},
+      operation_id='numbers.list',
+      rate_limit=(1200, 60),
     )
 
   def swap(self, request_body: SwapNumberMessage) -> NumberProto:
@@ -140,7 +163,13 @@ class NumbersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/numbers/swap', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/numbers/swap',
+      body=request_body,
+      operation_id='numbers.swap_number.post',
+      rate_limit=(1200, 60),
+    )
 
   def unassign(self, number: str, release: Optional[bool] = None) -> NumberProto:
     """Dialpad Number -- Unassign
@@ -158,5 +187,9 @@ class NumbersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='DELETE', sub_path=f'/api/v2/numbers/{number}', params={'release': release}
+      method='DELETE',
+      sub_path=f'/api/v2/numbers/{number}',
+      params={'release': release},
+      operation_id='numbers.delete',
+      rate_limit=(1200, 60),
     )
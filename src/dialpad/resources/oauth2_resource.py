@@ -16,6 +16,8 @@ class OAuth2Resource(DialpadResource):
   - /oauth2/deauthorize
   - /oauth2/token"""
 
+  __slots__ = ()
+
   def authorize_token(
     self,
     client_id: str,
@@ -50,13 +52,16 @@ class OAuth2Resource(DialpadResource):
         'client_id': client_id,
         'state': state,
       },
+      operation_id='oauth2.authorize.get',
     )
 
   def deauthorize_token(self) -> None:
     """Token -- Deauthorize
 
     Revokes oauth2 tokens for a given oauth app."""
-    return self._request(method='POST', sub_path='/oauth2/deauthorize')
+    return self._request(
+      method='POST', sub_path='/oauth2/deauthorize', operation_id='oauth2.deauthorize.post'
+    )
 
   def redeem_token(
     self, request_body: Union[AuthorizationCodeGrantBodySchema, RefreshTokenGrantBodySchema]
@@ -70,4 +75,6 @@ class OAuth2Resource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/oauth2/token', body=request_body)
+    return self._request(
+      method='POST', sub_path='/oauth2/token', body=request_body, operation_id='oauth2.token.post'
+    )
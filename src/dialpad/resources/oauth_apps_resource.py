@@ -8,6 +8,8 @@ class OAuthAppsResource(DialpadResource):
   Handles API operations for:
   - /api/v2/oauth_apps/{id}/toggle"""
 
+  __slots__ = ()
+
   def toggle(
     self,
     id: str,
@@ -28,5 +30,9 @@ class OAuthAppsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/oauth_apps/{id}/toggle', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/oauth_apps/{id}/toggle',
+      body=request_body,
+      operation_id='oauth_apps.toggle',
+      rate_limit=(1200, 60),
     )
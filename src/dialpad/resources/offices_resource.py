@@ -39,6 +39,8 @@ class OfficesResource(DialpadResource):
   - /api/v2/offices/{office_id}/plan
   - /api/v2/offices/{office_id}/teams"""
 
+  __slots__ = ()
+
   def add_operator(self, id: int, request_body: AddOperatorMessage) -> UserOrRoomProto:
     """Operator -- Add
 
@@ -55,7 +57,11 @@ class OfficesResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/offices/{id}/operators', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/offices/{id}/operators',
+      body=request_body,
+      operation_id='offices.operators.post',
+      rate_limit=(1200, 60),
     )
 
   def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
@@ -74,7 +80,11 @@ class OfficesResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/offices/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/offices/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_office_number.post',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateOfficeMessage) -> OfficeUpdateResponse:
@@ -89,7 +99,13 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/offices', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/offices',
+      body=request_body,
+      operation_id='offices.create',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> OfficeProto:
     """Office -- Get
@@ -105,7 +121,12 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/offices/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}',
+      operation_id='offices.get',
+      rate_limit=(1200, 60),
+    )
 
   def get_billing_plan(self, office_id: int) -> PlanProto:
     """Billing Plan -- Get
@@ -121,7 +142,12 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/offices/{office_id}/plan')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/plan',
+      operation_id='plan.get',
+      rate_limit=(1200, 60),
+    )
 
   def get_e911_address(self, id: int) -> E911GetProto:
     """E911 Address -- Get
@@ -137,7 +163,12 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/offices/{id}/e911')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}/e911',
+      operation_id='offices.e911.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self, active_only: Optional[bool] = None, cursor: Optional[str] = None
@@ -160,6 +191,8 @@ class OfficesResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/offices',
       params={'cursor': cursor, 'active_only': active_only},
+      operation_id='offices.list',
+      rate_limit=(1200, 60),
     )
 
   def list_available_licenses(self, office_id: int) -> AvailableLicensesProto:
@@ -176,7 +209,12 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/offices/{office_id}/available_licenses')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/available_licenses',
+      operation_id='plan.available_licenses.get',
+      rate_limit=(1200, 60),
+    )
 
   def list_call_centers(
     self, office_id: int, cursor: Optional[str] = None
@@ -194,7 +232,11 @@ class OfficesResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path=f'/api/v2/offices/{office_id}/callcenters', params={'cursor': cursor}
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/callcenters',
+      params={'cursor': cursor},
+      operation_id='callcenters.list',
+      rate_limit=(1200, 60),
     )
 
   def list_coaching_teams(
@@ -213,7 +255,11 @@ class OfficesResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path=f'/api/v2/offices/{office_id}/teams', params={'cursor': cursor}
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/teams',
+      params={'cursor': cursor},
+      operation_id='coaching_team.list',
+      rate_limit=(1200, 60),
     )
 
   def list_departments(
@@ -232,7 +278,11 @@ class OfficesResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path=f'/api/v2/offices/{office_id}/departments', params={'cursor': cursor}
+      method='GET',
+      sub_path=f'/api/v2/offices/{office_id}/departments',
+      params={'cursor': cursor},
+      operation_id='departments.list',
+      rate_limit=(1200, 60),
     )
 
   def list_offduty_statuses(self, id: int) -> OffDutyStatusesProto:
@@ -247,7 +297,12 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/offices/{id}/offdutystatuses')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}/offdutystatuses',
+      operation_id='offices.offdutystatuses.get',
+      rate_limit=(1200, 60),
+    )
 
   def list_operators(self, id: int) -> OperatorCollection:
     """Operator -- List
@@ -261,7 +316,12 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/offices/{id}/operators')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/offices/{id}/operators',
+      operation_id='offices.operators.get',
+      rate_limit=(1200, 60),
+    )
 
   def remove_operator(self, id: int, request_body: RemoveOperatorMessage) -> UserOrRoomProto:
     """Operator -- Remove
@@ -279,7 +339,11 @@ class OfficesResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='DELETE', sub_path=f'/api/v2/offices/{id}/operators', body=request_body
+      method='DELETE',
+      sub_path=f'/api/v2/offices/{id}/operators',
+      body=request_body,
+      operation_id='offices.operators.delete',
+      rate_limit=(1200, 60),
     )
 
   def unassign_number(self, id: int, request_body: UnassignNumberMessage) -> NumberProto:
@@ -298,7 +362,11 @@ class OfficesResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/offices/{id}/unassign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/offices/{id}/unassign_number',
+      body=request_body,
+      operation_id='numbers.office_unassign_number.post',
+      rate_limit=(1200, 60),
     )
 
   def update_e911_address(self, id: int, request_body: E911UpdateMessage) -> E911GetProto:
@@ -316,4 +384,10 @@ class OfficesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PUT', sub_path=f'/api/v2/offices/{id}/e911', body=request_body)
+    return self._request(
+      method='PUT',
+      sub_path=f'/api/v2/offices/{id}/e911',
+      body=request_body,
+      operation_id='offices.e911.update',
+      rate_limit=(1200, 60),
+    )
@@ -13,6 +13,8 @@ class RecordingShareLinksResource(DialpadResource):
   - /api/v2/recordingsharelink
   - /api/v2/recordingsharelink/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateRecordingShareLink) -> RecordingShareLink:
     """Recording Sharelink -- Create
 
@@ -27,7 +29,13 @@ class RecordingShareLinksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/recordingsharelink', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/recordingsharelink',
+      body=request_body,
+      operation_id='recording_share_link.create',
+      rate_limit=(100, 60),
+    )
 
   def delete(self, id: str) -> RecordingShareLink:
     """Recording Sharelink -- Delete
@@ -43,7 +51,12 @@ class RecordingShareLinksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/recordingsharelink/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/recordingsharelink/{id}',
+      operation_id='recording_share_link.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: str) -> RecordingShareLink:
     """Recording Sharelink -- Get
@@ -59,7 +72,12 @@ class RecordingShareLinksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/recordingsharelink/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/recordingsharelink/{id}',
+      operation_id='recording_share_link.get',
+      rate_limit=(1200, 60),
+    )
 
   def update(self, id: str, request_body: UpdateRecordingShareLink) -> RecordingShareLink:
     """Recording Sharelink -- Update
@@ -77,5 +95,9 @@ class RecordingShareLinksResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PUT', sub_path=f'/api/v2/recordingsharelink/{id}', body=request_body
+      method='PUT',
+      sub_path=f'/api/v2/recordingsharelink/{id}',
+      body=request_body,
+      operation_id='recording_share_link.update',
+      rate_limit=(100, 60),
     )
@@ -24,6 +24,8 @@ class RoomsResource(DialpadResource):
   - /api/v2/rooms/{parent_id}/deskphones
   - /api/v2/rooms/{parent_id}/deskphones/{id}"""
 
+  __slots__ = ()
+
   def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -40,7 +42,11 @@ class RoomsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/rooms/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/rooms/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_room_number.post',
+      rate_limit=(1200, 60),
     )
 
   def assign_phone_pin(self, request_body: CreateInternationalPinProto) -> InternationalPinProto:
@@ -62,7 +68,11 @@ class RoomsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path='/api/v2/rooms/international_pin', body=request_body
+      method='POST',
+      sub_path='/api/v2/rooms/international_pin',
+      body=request_body,
+      operation_id='deskphones.rooms.create_international_pin',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateRoomMessage) -> RoomProto:
@@ -79,7 +89,13 @@ class RoomsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/rooms', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/rooms',
+      body=request_body,
+      operation_id='rooms.post',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> RoomProto:
     """Room -- Delete
@@ -95,7 +111,12 @@ class RoomsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/rooms/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/rooms/{id}',
+      operation_id='rooms.delete',
+      rate_limit=(1200, 60),
+    )
 
   def delete_room_phone(self, id: str, parent_id: int) -> None:
     """Room Phone -- Delete
@@ -110,7 +131,12 @@ class RoomsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.rooms.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> RoomProto:
     """Room -- Get
@@ -126,7 +152,9 @@ class RoomsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/rooms/{id}')
+    return self._request(
+      method='GET', sub_path=f'/api/v2/rooms/{id}', operation_id='rooms.get', rate_limit=(1200, 60)
+    )
 
   def get_room_phone(self, id: str, parent_id: int) -> DeskPhone:
     """Room Phone -- Get
@@ -141,7 +169,12 @@ class RoomsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/rooms/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.rooms.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self, cursor: Optional[str] = None, office_id: Optional[int] = None
@@ -161,7 +194,11 @@ class RoomsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/rooms', params={'cursor': cursor, 'office_id': office_id}
+      method='GET',
+      sub_path='/api/v2/rooms',
+      params={'cursor': cursor, 'office_id': office_id},
+      operation_id='rooms.list',
+      rate_limit=(1200, 60),
     )
 
   def list_room_phones(self, parent_id: int) -> Iterator[DeskPhone]:
@@ -176,7 +213,12 @@ class RoomsResource(DialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    return self._iter_request(method='GET', sub_path=f'/api/v2/rooms/{parent_id}/deskphones')
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/rooms/{parent_id}/deskphones',
+      operation_id='deskphones.rooms.list',
+      rate_limit=(1200, 60),
+    )
 
   def partial_update(self, id: int, request_body: UpdateRoomMessage) -> RoomProto:
     """Room -- Update
@@ -193,7 +235,13 @@ class RoomsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/rooms/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/rooms/{id}',
+      body=request_body,
+      operation_id='rooms.patch',
+      rate_limit=(1200, 60),
+    )
 
   def unassign_number(self, id: int, request_body: UnassignNumberMessage) -> NumberProto:
     """Dialpad Number -- Unassign
@@ -211,5 +259,9 @@ class RoomsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/rooms/{id}/unassign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/rooms/{id}/unassign_number',
+      body=request_body,
+      operation_id='numbers.room_unassign_number.post',
+      rate_limit=(1200, 60),
     )
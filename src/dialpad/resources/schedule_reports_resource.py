@@ -14,6 +14,8 @@ class ScheduleReportsResource(DialpadResource):
   - /api/v2/schedulereports
   - /api/v2/schedulereports/{id}"""
 
+  __slots__ = ()
+
   def create(
     self, request_body: ProcessScheduleReportsMessage
   ) -> ScheduleReportsStatusEventSubscriptionProto:
@@ -30,7 +32,13 @@ class ScheduleReportsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/schedulereports', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/schedulereports',
+      body=request_body,
+      operation_id='schedule_reports.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> ScheduleReportsStatusEventSubscriptionProto:
     """Schedule reports -- Delete
@@ -46,7 +54,12 @@ class ScheduleReportsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/schedulereports/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/schedulereports/{id}',
+      operation_id='schedule_reports.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> ScheduleReportsStatusEventSubscriptionProto:
     """Schedule reports -- Get
@@ -62,7 +75,12 @@ class ScheduleReportsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/schedulereports/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/schedulereports/{id}',
+      operation_id='schedule_reports.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self, cursor: Optional[str] = None
@@ -81,7 +99,11 @@ class ScheduleReportsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/schedulereports', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/schedulereports',
+      params={'cursor': cursor},
+      operation_id='schedule_reports.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(
@@ -102,5 +124,9 @@ class ScheduleReportsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/schedulereports/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/schedulereports/{id}',
+      body=request_body,
+      operation_id='schedule_reports.update',
+      rate_limit=(1200, 60),
     )
@@ -15,6 +15,8 @@ class SmsEventSubscriptionsResource(DialpadResource):
   - /api/v2/subscriptions/sms
   - /api/v2/subscriptions/sms/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateSmsEventSubscription) -> SmsEventSubscriptionProto:
     """SMS Event -- Create
 
@@ -37,7 +39,13 @@ class SmsEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/subscriptions/sms', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/subscriptions/sms',
+      body=request_body,
+      operation_id='webhook_sms_event_subscription.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: int) -> SmsEventSubscriptionProto:
     """SMS Event -- Delete
@@ -55,7 +63,12 @@ class SmsEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/subscriptions/sms/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/subscriptions/sms/{id}',
+      operation_id='webhook_sms_event_subscription.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> SmsEventSubscriptionProto:
     """SMS Event -- Get
@@ -73,7 +86,12 @@ class SmsEventSubscriptionsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/subscriptions/sms/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/subscriptions/sms/{id}',
+      operation_id='webhook_sms_event_subscription.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self,
@@ -116,6 +134,8 @@ class SmsEventSubscriptionsResource(DialpadResource):
       method='GET',
       sub_path='/api/v2/subscriptions/sms',
       params={'cursor': cursor, 'target_type': target_type, 'target_id': target_id},
+      operation_id='webhook_sms_event_subscription.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(
@@ -138,5 +158,9 @@ class SmsEventSubscriptionsResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/subscriptions/sms/{id}', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/subscriptions/sms/{id}',
+      body=request_body,
+      operation_id='webhook_sms_event_subscription.update',
+      rate_limit=(1200, 60),
     )
@@ -8,6 +8,8 @@ class SmsResource(DialpadResource):
   Handles API operations for:
   - /api/v2/sms"""
 
+  __slots__ = ()
+
   def send(self, request_body: SendSMSMessage) -> SMSProto:
     """SMS -- Send
 
@@ -26,4 +28,10 @@ class SmsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/sms', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/sms',
+      body=request_body,
+      operation_id='sms.send',
+      rate_limit=(100, 60),
+    )
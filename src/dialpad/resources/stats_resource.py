@@ -9,6 +9,8 @@ class StatsResource(DialpadResource):
   - /api/v2/stats
   - /api/v2/stats/{id}"""
 
+  __slots__ = ()
+
   def get_result(self, id: str) -> StatsProto:
     """Stats -- Get Result
 
@@ -23,7 +25,9 @@ class StatsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/stats/{id}')
+    return self._request(
+      method='GET', sub_path=f'/api/v2/stats/{id}', operation_id='stats.get', rate_limit=(1200, 60)
+    )
 
   def initiate_processing(self, request_body: ProcessStatsMessage) -> ProcessingProto:
     """Stats -- Initiate Processing
@@ -41,4 +45,10 @@ class StatsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/stats', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/stats',
+      body=request_body,
+      operation_id='stats.create',
+      rate_limit=(200, 3600),
+    )
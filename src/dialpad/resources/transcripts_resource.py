@@ -9,6 +9,8 @@ class TranscriptsResource(DialpadResource):
   - /api/v2/transcripts/{call_id}
   - /api/v2/transcripts/{call_id}/url"""
 
+  __slots__ = ()
+
   def get(self, call_id: int) -> TranscriptProto:
     """Call Transcript -- Get
 
@@ -23,7 +25,12 @@ class TranscriptsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/transcripts/{call_id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/transcripts/{call_id}',
+      operation_id='transcripts.get',
+      rate_limit=(1200, 60),
+    )
 
   def get_url(self, call_id: int) -> TranscriptUrlProto:
     """Call Transcript -- Get URL
@@ -39,4 +46,9 @@ class TranscriptsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/transcripts/{call_id}/url')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/transcripts/{call_id}/url',
+      operation_id='transcripts.get_url',
+      rate_limit=(1200, 60),
+    )
@@ -11,6 +11,8 @@ class UserDevicesResource(DialpadResource):
   - /api/v2/userdevices
   - /api/v2/userdevices/{id}"""
 
+  __slots__ = ()
+
   def get(self, id: str) -> UserDeviceProto:
     """User Device -- Get
 
@@ -25,7 +27,12 @@ class UserDevicesResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/userdevices/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/userdevices/{id}',
+      operation_id='userdevices.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(
     self, cursor: Optional[str] = None, user_id: Optional[str] = None
@@ -45,5 +52,9 @@ class UserDevicesResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/userdevices', params={'cursor': cursor, 'user_id': user_id}
+      method='GET',
+      sub_path='/api/v2/userdevices',
+      params={'cursor': cursor, 'user_id': user_id},
+      operation_id='userdevices.list',
+      rate_limit=(1200, 60),
     )
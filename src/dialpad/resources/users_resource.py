@@ -49,6 +49,8 @@ class UsersResource(DialpadResource):
   - /api/v2/users/{parent_id}/deskphones
   - /api/v2/users/{parent_id}/deskphones/{id}"""
 
+  __slots__ = ()
+
   def assign_number(self, id: int, request_body: AssignNumberMessage) -> NumberProto:
     """Dialpad Number -- Assign
 
@@ -65,7 +67,11 @@ class UsersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/assign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/assign_number',
+      body=request_body,
+      operation_id='numbers.assign_user_number.post',
+      rate_limit=(1200, 60),
     )
 
   def create(self, request_body: CreateUserMessage) -> UserProto:
@@ -82,7 +88,13 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/users', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/users',
+      body=request_body,
+      operation_id='users.create',
+      rate_limit=(1200, 60),
+    )
 
   def delete(self, id: str) -> UserProto:
     """User -- Delete
@@ -98,7 +110,12 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/users/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/users/{id}',
+      operation_id='users.delete',
+      rate_limit=(1200, 60),
+    )
 
   def delete_deskphone(self, id: str, parent_id: int) -> None:
     """Desk Phone -- Delete
@@ -113,7 +130,12 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.users.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: str) -> UserProto:
     """User -- Get
@@ -129,7 +151,9 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/users/{id}')
+    return self._request(
+      method='GET', sub_path=f'/api/v2/users/{id}', operation_id='users.get', rate_limit=(1200, 60)
+    )
 
   def get_caller_id(self, id: str) -> CallerIdProto:
     """Caller ID -- Get
@@ -145,7 +169,12 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/users/{id}/caller_id')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/users/{id}/caller_id',
+      operation_id='caller_id.users.get',
+      rate_limit=(1200, 60),
+    )
 
   def get_deskphone(self, id: str, parent_id: int) -> DeskPhone:
     """Desk Phone -- Get
@@ -160,7 +189,12 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/users/{parent_id}/deskphones/{id}',
+      operation_id='deskphones.users.get',
+      rate_limit=(1200, 60),
+    )
 
   def get_e911_address(self, id: int) -> E911GetProto:
     """E911 Address -- Get
@@ -176,7 +210,12 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/users/{id}/e911')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/users/{id}/e911',
+      operation_id='users.e911.get',
+      rate_limit=(1200, 60),
+    )
 
   def initiate_call(self, id: str, request_body: InitiateCallMessage) -> InitiatedCallProto:
     """Call -- Initiate
@@ -192,7 +231,11 @@ class UsersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/initiate_call', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/initiate_call',
+      body=request_body,
+      operation_id='users.initiate_call',
+      rate_limit=(5, 60),
     )
 
   def list(
@@ -239,6 +282,8 @@ class UsersResource(DialpadResource):
         'email': email,
         'number': number,
       },
+      operation_id='users.list',
+      rate_limit=(1200, 60),
     )
 
   def list_deskphones(self, parent_id: int) -> Iterator[DeskPhone]:
@@ -253,7 +298,12 @@ class UsersResource(DialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    return self._iter_request(method='GET', sub_path=f'/api/v2/users/{parent_id}/deskphones')
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/users/{parent_id}/deskphones',
+      operation_id='deskphones.users.list',
+      rate_limit=(1200, 60),
+    )
 
   def list_personas(self, id: str) -> Iterator[PersonaProto]:
     """Persona -- List
@@ -271,7 +321,12 @@ class UsersResource(DialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    return self._iter_request(method='GET', sub_path=f'/api/v2/users/{id}/personas')
+    return self._iter_request(
+      method='GET',
+      sub_path=f'/api/v2/users/{id}/personas',
+      operation_id='users.personas.get',
+      rate_limit=(1200, 60),
+    )
 
   def move_office(self, id: str, request_body: MoveOfficeMessage) -> UserProto:
     """User -- Switch Office
@@ -289,7 +344,11 @@ class UsersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/move_office', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/move_office',
+      body=request_body,
+      operation_id='users.move_office.patch',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(self, id: str, request_body: UpdateUserMessage) -> UserProto:
@@ -307,7 +366,13 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/users/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}',
+      body=request_body,
+      operation_id='users.update',
+      rate_limit=(1200, 60),
+    )
 
   def set_caller_id(self, id: str, request_body: SetCallerIdMessage) -> CallerIdProto:
     """Caller ID -- POST
@@ -324,7 +389,13 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path=f'/api/v2/users/{id}/caller_id', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/caller_id',
+      body=request_body,
+      operation_id='caller_id.users.post',
+      rate_limit=(1200, 60),
+    )
 
   def set_e911_address(self, id: int, request_body: E911UpdateMessage) -> E911GetProto:
     """E911 Address -- Update
@@ -341,7 +412,13 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PUT', sub_path=f'/api/v2/users/{id}/e911', body=request_body)
+    return self._request(
+      method='PUT',
+      sub_path=f'/api/v2/users/{id}/e911',
+      body=request_body,
+      operation_id='users.e911.update',
+      rate_limit=(1200, 60),
+    )
 
   def toggle_active_call_recording(
     self, id: int, request_body: UpdateActiveCallMessage
@@ -361,7 +438,11 @@ class UsersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/activecall', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/activecall',
+      body=request_body,
+      operation_id='users.update_active_call',
+      rate_limit=(1200, 60),
     )
 
   def toggle_active_call_vi(self, id: int, request_body: ToggleViMessage) -> ToggleViProto:
@@ -377,7 +458,13 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/users/{id}/togglevi', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/togglevi',
+      body=request_body,
+      operation_id='users.toggle_call_vi',
+      rate_limit=(1200, 60),
+    )
 
   def toggle_dnd(self, id: str, request_body: ToggleDNDMessage) -> ToggleDNDProto:
     """Do Not Disturb -- Toggle
@@ -395,7 +482,11 @@ class UsersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='PATCH', sub_path=f'/api/v2/users/{id}/togglednd', body=request_body
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/togglednd',
+      body=request_body,
+      operation_id='users.toggle_dnd',
+      rate_limit=(1200, 60),
     )
 
   def trigger_screenpop(
@@ -415,7 +506,13 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path=f'/api/v2/users/{id}/screenpop', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/screenpop',
+      body=request_body,
+      operation_id='screen_pop.initiate',
+      rate_limit=(5, 60),
+    )
 
   def unassign_number(self, id: int, request_body: UnassignNumberMessage) -> NumberProto:
     """Dialpad Number -- Unassign
@@ -433,7 +530,11 @@ class UsersResource(DialpadResource):
     Returns:
         A successful response"""
     return self._request(
-      method='POST', sub_path=f'/api/v2/users/{id}/unassign_number', body=request_body
+      method='POST',
+      sub_path=f'/api/v2/users/{id}/unassign_number',
+      body=request_body,
+      operation_id='numbers.user_unassign_number.post',
+      rate_limit=(1200, 60),
     )
 
   def update_user_status(self, id: int, request_body: SetStatusMessage) -> SetStatusProto:
@@ -449,4 +550,10 @@ class UsersResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/users/{id}/status', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/users/{id}/status',
+      body=request_body,
+      operation_id='users.update_status',
+      rate_limit=(1200, 60),
+    )
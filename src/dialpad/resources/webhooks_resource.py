@@ -11,6 +11,8 @@ class WebhooksResource(DialpadResource):
   - /api/v2/webhooks
   - /api/v2/webhooks/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateWebhook) -> WebhookProto:
     """Webhook -- Create
 
@@ -27,7 +29,13 @@ class WebhooksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/webhooks', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/webhooks',
+      body=request_body,
+      operation_id='webhooks.create',
+      rate_limit=(100, 60),
+    )
 
   def delete(self, id: int) -> WebhookProto:
     """Webhook -- Delete
@@ -43,7 +51,12 @@ class WebhooksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/webhooks/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/webhooks/{id}',
+      operation_id='webhooks.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> WebhookProto:
     """Webhook -- Get
@@ -59,7 +72,12 @@ class WebhooksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/webhooks/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/webhooks/{id}',
+      operation_id='webhooks.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[WebhookProto]:
     """Webhook -- List
@@ -75,7 +93,13 @@ class WebhooksResource(DialpadResource):
 
     Returns:
         An iterator of items from A successful response"""
-    return self._iter_request(method='GET', sub_path='/api/v2/webhooks', params={'cursor': cursor})
+    return self._iter_request(
+      method='GET',
+      sub_path='/api/v2/webhooks',
+      params={'cursor': cursor},
+      operation_id='webhooks.list',
+      rate_limit=(1200, 60),
+    )
 
   def partial_update(self, id: str, request_body: UpdateWebhook) -> WebhookProto:
     """Webhook -- Update
@@ -92,4 +116,10 @@ class WebhooksResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/webhooks/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/webhooks/{id}',
+      body=request_body,
+      operation_id='webhook.update',
+      rate_limit=(1200, 60),
+    )
@@ -15,6 +15,8 @@ class WebsocketsResource(DialpadResource):
   - /api/v2/websockets
   - /api/v2/websockets/{id}"""
 
+  __slots__ = ()
+
   def create(self, request_body: CreateWebsocket) -> WebsocketProto:
     """Websocket -- Create
 
@@ -31,7 +33,13 @@ class WebsocketsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='POST', sub_path='/api/v2/websockets', body=request_body)
+    return self._request(
+      method='POST',
+      sub_path='/api/v2/websockets',
+      body=request_body,
+      operation_id='websockets.create',
+      rate_limit=(250, 60),
+    )
 
   def delete(self, id: int) -> WebsocketProto:
     """Websocket -- Delete
@@ -47,7 +55,12 @@ class WebsocketsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='DELETE', sub_path=f'/api/v2/websockets/{id}')
+    return self._request(
+      method='DELETE',
+      sub_path=f'/api/v2/websockets/{id}',
+      operation_id='websockets.delete',
+      rate_limit=(1200, 60),
+    )
 
   def get(self, id: int) -> WebsocketProto:
     """Websocket -- Get
@@ -63,7 +76,12 @@ class WebsocketsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='GET', sub_path=f'/api/v2/websockets/{id}')
+    return self._request(
+      method='GET',
+      sub_path=f'/api/v2/websockets/{id}',
+      operation_id='websockets.get',
+      rate_limit=(1200, 60),
+    )
 
   def list(self, cursor: Optional[str] = None) -> Iterator[WebsocketProto]:
     """Websocket -- List
@@ -80,7 +98,11 @@ class WebsocketsResource(DialpadResource):
     Returns:
         An iterator of items from A successful response"""
     return self._iter_request(
-      method='GET', sub_path='/api/v2/websockets', params={'cursor': cursor}
+      method='GET',
+      sub_path='/api/v2/websockets',
+      params={'cursor': cursor},
+      operation_id='websockets.list',
+      rate_limit=(1200, 60),
     )
 
   def partial_update(self, id: int, request_body: UpdateWebsocket) -> WebsocketProto:
@@ -98,4 +120,10 @@ class WebsocketsResource(DialpadResource):
 
     Returns:
         A successful response"""
-    return self._request(method='PATCH', sub_path=f'/api/v2/websockets/{id}', body=request_body)
+    return self._request(
+      method='PATCH',
+      sub_path=f'/api/v2/websockets/{id}',
+      body=request_body,
+      operation_id='websockets.update',
+      rate_limit=(1200, 60),
+    )
@@ -0,0 +1,114 @@
+"""Retry policies for transient API failures, shared by the sync and async clients."""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'PUT', 'DELETE'})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+  """Parses a Retry-After header (either delta-seconds or an HTTP-date) into seconds from now."""
+  if not value:
+    return None
+
+  value = value.strip()
+  if value.isdigit():
+    return float(value)
+
+  try:
+    retry_at = parsedate_to_datetime(value)
+  except (TypeError, ValueError):
+    return None
+
+  return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+  """Caps retries to a fraction of the overall request volume.
+
+  Every request deposits `ratio` tokens (up to `max_tokens`), and every retry withdraws one, so a
+  sustained outage degrades to roughly `ratio` extra requests per request instead of multiplying
+  upstream load by the number of attempts. `min_tokens` allows a few retries before any deposits.
+  """
+
+  def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+    self.ratio = ratio
+    self.max_tokens = max_tokens
+    self._tokens = min_tokens
+    self._lock = threading.Lock()
+
+  def deposit(self) -> None:
+    with self._lock:
+      self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+  def withdraw(self) -> bool:
+    with self._lock:
+      if self._tokens < 1:
+        return False
+
+      self._tokens -= 1
+      return True
+
+
+class RetryPolicy:
+  """Decides whether (and when) a failed request should be retried.
+
+  Only idempotent methods are retried by default. Pass e.g. `methods=IDEMPOTENT_METHODS | {'POST'}`
+  to opt other methods in. Delays grow exponentially from `backoff_factor` up to `max_backoff`, with
+  full jitter, unless the API supplies a Retry-After header.
+  """
+
+  def __init__(
+    self,
+    max_attempts: int = 4,
+    backoff_factor: float = 0.5,
+    max_backoff: float = 60.0,
+    jitter: bool = True,
+    status_codes: Collection[int] = RETRYABLE_STATUS_CODES,
+    methods: Collection[str] = IDEMPOTENT_METHODS,
+    budget: Optional[RetryBudget] = None,
+  ):
+    self.max_attempts = max_attempts
+    self.backoff_factor = backoff_factor
+    self.max_backoff = max_backoff
+    self.jitter = jitter
+    self.status_codes = frozenset(status_codes)
+    self.methods = frozenset(m.upper() for m in methods)
+    self.budget = budget
+
+  def record_request(self) -> None:
+    """Should be called once for each request (but not for each retry of it)."""
+    if self.budget:
+      self.budget.deposit()
+
+  def should_retry(self, method: str, attempt: int, status_code: Optional[int] = None) -> bool:
+    """Determines whether to retry after `attempt` attempts have been made.
+
+    A `status_code` of None indicates that the request failed at the transport level.
+    """
+    if attempt >= self.max_attempts:
+      return False
+
+    if str(method).upper() not in self.methods:
+      return False
+
+    if status_code is not None and status_code not in self.status_codes:
+      return False
+
+    return not self.budget or self.budget.withdraw()
+
+  def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+    """Returns the number of seconds to wait before the next attempt."""
+    retry_after_seconds = parse_retry_after(retry_after)
+    if retry_after_seconds is not None:
+      return min(retry_after_seconds, self.max_backoff)
+
+    delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+    if self.jitter:
+      return random.uniform(0, delay)
+
+    return delay
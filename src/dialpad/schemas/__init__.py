@@ -1 +1,59 @@
 # This is an auto-generated schema package. Please do not edit it directly.
+
+from importlib import import_module
+
+_SUBMODULES = [
+  'access_control_policies',
+  'agent_status_event_subscription',
+  'app',
+  'blocked_number',
+  'breadcrumbs',
+  'call',
+  'call_event_subscription',
+  'call_label',
+  'call_review_share_link',
+  'call_router',
+  'caller_id',
+  'change_log_event_subscription',
+  'channel',
+  'coaching_team',
+  'company',
+  'contact',
+  'contact_event_subscription',
+  'custom_ivr',
+  'deskphone',
+  'e164_format',
+  'faxline',
+  'group',
+  'member_channel',
+  'number',
+  'oauth',
+  'office',
+  'plan',
+  'recording_share_link',
+  'room',
+  'schedule_reports',
+  'screen_pop',
+  'signature',
+  'sms',
+  'sms_event_subscription',
+  'sms_opt_out',
+  'stats',
+  'transcript',
+  'uberconference',
+  'user',
+  'userdevice',
+  'webhook',
+  'websocket',
+]
+
+
+def __getattr__(name: str):
+  if name not in _SUBMODULES:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  return import_module(f'.{name}', __name__)
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_SUBMODULES))
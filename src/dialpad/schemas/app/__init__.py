@@ -1 +1,18 @@
 # This is an auto-generated schema package. Please do not edit it directly.
+
+from importlib import import_module
+
+_SUBMODULES = [
+  'setting',
+]
+
+
+def __getattr__(name: str):
+  if name not in _SUBMODULES:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  return import_module(f'.{name}', __name__)
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_SUBMODULES))
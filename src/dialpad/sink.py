@@ -0,0 +1,268 @@
+"""Sinks which write the items of paginated responses to NDJSON or CSV files.
+
+Items are serialized and written by a background thread, so that the thread (or event loop) which
+is iterating over the pages can carry on fetching the next page in the meantime:
+
+    from dialpad import DialpadClient
+    from dialpad.sink import NDJSONSink
+
+    dp = DialpadClient(token='API_TOKEN_HERE')
+    with NDJSONSink('calls.ndjson.gz', compression='gzip') as sink:
+      stats = sink.consume(dp.calls.list(started_after=1700000000000))
+    print(f'{stats.rows} calls at {stats.rows_per_second:.0f} rows/s')
+"""
+
+import asyncio
+import csv
+import gzip
+import io
+import json
+import queue
+import threading
+import time
+from typing import IO, Any, AsyncIterable, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+from .json_codec import JSONCodec, get_codec
+from .models.base import Model
+
+try:
+  import zstandard
+except ImportError:  # pragma: no cover
+  zstandard = None
+
+# Marks the end of the items in the writer's queue.
+_DONE = object()
+
+
+class SinkStats(NamedTuple):
+  """The progress of a sink."""
+
+  rows: int
+  bytes_written: int
+  elapsed: float
+
+  @property
+  def rows_per_second(self) -> float:
+    return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _open(path: str, compression: Optional[str]) -> IO[bytes]:
+  if compression is None:
+    return open(path, 'wb')
+
+  if compression == 'gzip':
+    return gzip.open(path, 'wb')
+
+  if compression == 'zstd':
+    if zstandard is None:
+      raise ImportError(
+        'zstd compression requires the zstandard package (pip install python-dialpad[zstd]).'
+      )
+    return zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+
+  raise ValueError(f'Unknown compression "{compression}" (expected "gzip" or "zstd")')
+
+
+class Sink:
+  """Base class for the sinks, which serialize and write items on a background thread.
+
+  Items are handed to the writer thread in chunks of `chunk_size`, through a queue that holds at
+  most `queue_size` chunks; once it's full, `write` blocks until the writer catches up.
+
+  Args:
+      path: The path of the file to write.
+      compression: 'gzip' or 'zstd' (which requires the zstandard package), or None.
+      chunk_size: The number of items to hand to the writer thread at a time.
+      queue_size: The number of chunks which may be waiting to be written.
+  """
+
+  def __init__(
+    self,
+    path: str,
+    compression: Optional[str] = None,
+    chunk_size: int = 1000,
+    queue_size: int = 8,
+  ):
+    self.path = path
+    self._file = _open(path, compression)
+    self._chunk_size = chunk_size
+    self._chunk: List[Any] = []
+    self._queue = queue.Queue(maxsize=queue_size)
+    self._error: Optional[BaseException] = None
+    self._closed = False
+    self._rows = 0
+    self._bytes = 0
+    self._started = time.monotonic()
+    self._finished: Optional[float] = None
+    self._thread = threading.Thread(target=self._run, name='dialpad-sink', daemon=True)
+    self._thread.start()
+
+  @property
+  def stats(self) -> SinkStats:
+    """The number of rows (and bytes, before compression) that have been written so far."""
+    finished = self._finished or time.monotonic()
+    return SinkStats(self._rows, self._bytes, finished - self._started)
+
+  def _serialize(self, items: List[Any]) -> bytes:
+    raise NotImplementedError
+
+  def _run(self) -> None:
+    while True:
+      chunk = self._queue.get()
+      if chunk is _DONE:
+        return
+
+      if self._error is not None:
+        # Keep draining the queue so that the producer doesn't block.
+        continue
+
+      try:
+        data = self._serialize([i.to_dict() if isinstance(i, Model) else i for i in chunk])
+        self._file.write(data)
+      except BaseException as e:
+        self._error = e
+        continue
+
+      self._bytes += len(data)
+      self._rows += len(chunk)
+
+  def _check(self) -> None:
+    if self._closed:
+      raise ValueError('The sink has been closed')
+    if self._error is not None:
+      raise self._error
+
+  def _take_chunk(self) -> Optional[List[Any]]:
+    if len(self._chunk) < self._chunk_size:
+      return None
+
+    chunk, self._chunk = self._chunk, []
+    return chunk
+
+  def write(self, item: Any) -> None:
+    """Adds an item (a dict or a model) to the sink."""
+    self._check()
+    self._chunk.append(item)
+    chunk = self._take_chunk()
+    if chunk is not None:
+      self._queue.put(chunk)
+
+  async def awrite(self, item: Any) -> None:
+    """Adds an item to the sink, without blocking the event loop while the queue is full."""
+    self._check()
+    self._chunk.append(item)
+    chunk = self._take_chunk()
+    if chunk is not None:
+      try:
+        self._queue.put_nowait(chunk)
+      except queue.Full:
+        await asyncio.get_running_loop().run_in_executor(None, self._queue.put, chunk)
+
+  def _close_quietly(self) -> None:
+    # Used when the items raised, since their error is the one worth re-raising.
+    try:
+      self.close()
+    except BaseException:
+      pass
+
+  def consume(self, items: Iterable[Any]) -> SinkStats:
+    """Writes every item of an iterable (such as the iterator returned by a list method).
+
+    The sink is closed even if `items` raises, and the error is then re-raised.
+    """
+    try:
+      for item in items:
+        self.write(item)
+    except BaseException:
+      self._close_quietly()
+      raise
+    return self.close()
+
+  async def aconsume(self, items: AsyncIterable[Any]) -> SinkStats:
+    """Writes every item of an async iterable (such as an AsyncDialpadClient list method's)."""
+    loop = asyncio.get_running_loop()
+    try:
+      async for item in items:
+        await self.awrite(item)
+    except BaseException:
+      await loop.run_in_executor(None, self._close_quietly)
+      raise
+    return await loop.run_in_executor(None, self.close)
+
+  def close(self) -> SinkStats:
+    """Writes the remaining items, waits for the writer thread and closes the file.
+
+    Returns:
+        The final SinkStats. Any error that the writer thread ran into is raised instead.
+    """
+    if not self._closed:
+      self._closed = True
+      if self._chunk:
+        self._queue.put(self._chunk)
+        self._chunk = []
+      self._queue.put(_DONE)
+      self._thread.join()
+      self._file.close()
+      self._finished = time.monotonic()
+
+    if self._error is not None:
+      raise self._error
+
+    return self.stats
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    self.close()
+
+
+class NDJSONSink(Sink):
+  """Writes each item as a line of JSON, using the fastest JSON codec that's installed.
+
+  Args:
+      json_codec: The JSON codec to serialize items with (see dialpad.json_codec.get_codec).
+  """
+
+  def __init__(self, path: str, json_codec: Optional[Union[str, JSONCodec]] = None, **kwargs):
+    self._json = get_codec(json_codec)
+    super().__init__(path, **kwargs)
+
+  def _serialize(self, items: List[Any]) -> bytes:
+    dumps = self._json.dumps
+    return b''.join([dumps(item) + b'\n' for item in items])
+
+
+class CSVSink(Sink):
+  """Writes each item as a row of a CSV file, with a header row.
+
+  Nested objects and lists are written as JSON, and fields which aren't columns are dropped.
+
+  Args:
+      fieldnames: The columns to write (defaults to the fields of the first item).
+  """
+
+  def __init__(self, path: str, fieldnames: Optional[Sequence[str]] = None, **kwargs):
+    self._fieldnames = list(fieldnames) if fieldnames is not None else None
+    self._header_written = False
+    super().__init__(path, **kwargs)
+
+  def _serialize(self, items: List[Any]) -> bytes:
+    if self._fieldnames is None:
+      self._fieldnames = list(items[0])
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=self._fieldnames, extrasaction='ignore')
+    if not self._header_written:
+      writer.writeheader()
+      self._header_written = True
+
+    for item in items:
+      writer.writerow(
+        {
+          key: json.dumps(value) if isinstance(value, (dict, list)) else value
+          for key, value in item.items()
+        }
+      )
+
+    return buffer.getvalue().encode('utf-8')
@@ -0,0 +1,341 @@
+"""Broadcasting SMS messages at the highest rate that the per-sender limits of sms.send allow.
+
+Each sender (the `from_number`, sender group or user of a message) may only send so many messages
+per minute (100, or 800 on a higher tier). Messages are scheduled per sender, so that a sender that
+has used up its budget doesn't hold up the messages of the others, and any recipients that have
+opted out of SMS are dropped before anything is sent:
+
+    from dialpad import DialpadClient
+    from dialpad.sms_broadcast import SMSBroadcast
+
+    dp = DialpadClient(token='API_TOKEN_HERE')
+    broadcast = SMSBroadcast(dp, company_id='1234')
+    for result in broadcast.send(messages):
+      if result.error:
+        print(f'Message {result.index} failed: {result.error}')
+    print(broadcast.stats)
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+  AsyncIterable,
+  AsyncIterator,
+  Collection,
+  Dict,
+  FrozenSet,
+  Hashable,
+  Iterable,
+  Iterator,
+  List,
+  NamedTuple,
+  Optional,
+  Tuple,
+  Union,
+)
+
+from .bulk import field
+from .operation_rate_limits import OPERATION_RATE_LIMITS
+from .rate_limit import RateLimit, TokenBucket
+from .schemas.sms import SendSMSMessage, SMSProto
+
+# The documented (tier 0) rate limit of sms.send
+SMS_RATE_LIMIT: RateLimit = OPERATION_RATE_LIMITS['sms.send']
+
+
+class OptOutList:
+  """The set of numbers that have opted out of SMS from the company, for quick lookups."""
+
+  def __init__(self, numbers: Iterable[str]):
+    self.numbers: FrozenSet[str] = frozenset(numbers)
+    self.fetched_at = time.monotonic()
+
+  def __contains__(self, number: str) -> bool:
+    return number in self.numbers
+
+  def __len__(self) -> int:
+    return len(self.numbers)
+
+  @classmethod
+  def fetch(cls, client, company_id: str, a2p_campaign_id: Optional[int] = None) -> 'OptOutList':
+    """Fetches the company's (or one of its A2P campaigns') opt-out list."""
+    entries = client.company.get_sms_opt_out_list(
+      company_id, 'opted_out', a2p_campaign_id=a2p_campaign_id
+    )
+    return cls(field(entry, 'external_endpoint') for entry in entries)
+
+  @classmethod
+  async def fetch_async(
+    cls, client, company_id: str, a2p_campaign_id: Optional[int] = None
+  ) -> 'OptOutList':
+    """The AsyncDialpadClient equivalent of `fetch`."""
+    entries = client.company.get_sms_opt_out_list(
+      company_id, 'opted_out', a2p_campaign_id=a2p_campaign_id
+    )
+    return cls([field(entry, 'external_endpoint') async for entry in entries])
+
+
+class SMSResult(NamedTuple):
+  """The outcome of a message.
+
+  `opted_out` lists the recipients that were dropped. If none were left, the message was skipped
+  rather than sent.
+  """
+
+  index: int
+  message: SendSMSMessage
+  response: Optional[SMSProto] = None
+  error: Optional[BaseException] = None
+  opted_out: Tuple[str, ...] = ()
+
+  @property
+  def skipped(self) -> bool:
+    return self.response is None and self.error is None
+
+
+class BroadcastStats(NamedTuple):
+  """The progress of a broadcast."""
+
+  sent: int
+  failed: int
+  skipped: int
+  opted_out: int
+  elapsed: float
+
+  @property
+  def messages_per_second(self) -> float:
+    return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _sender(message: SendSMSMessage) -> Hashable:
+  # The API gives from_number precedence over the sender group, and the group over the user.
+  if message.get('from_number'):
+    return message['from_number']
+  if message.get('sender_group_id') is not None:
+    return (message.get('sender_group_type'), message['sender_group_id'])
+  return message.get('user_id')
+
+
+class SMSBroadcast:
+  """Sends streams of SMS messages concurrently, within the rate limit of each sender.
+
+  A client with a rate limiter also throttles sms.send as a whole to its documented limit, so that
+  limit should be overridden (such as with `RateLimiter({'sms.send': (10_000, 60)})`) to let several
+  senders send at once.
+
+  Args:
+      client: The DialpadClient (or AsyncDialpadClient) to send the messages with.
+      sender_rate_limit: The (requests, period) that each sender is limited to, such as (800, 60) on
+        the higher tier.
+      company_id: The company whose SMS opt-out list recipients are checked against.
+      a2p_campaign_id: The A2P campaign whose opt-out list to use instead of the company's.
+      opt_outs: The numbers that have opted out, instead of fetching the opt-out list.
+      opt_out_max_age: The number of seconds for which a fetched opt-out list is reused.
+      max_workers: The number of messages that are sent concurrently.
+      max_pending: The number of messages that are read ahead of those being sent, so that senders
+        which aren't throttled can go ahead of those which are.
+  """
+
+  def __init__(
+    self,
+    client,
+    sender_rate_limit: RateLimit = SMS_RATE_LIMIT,
+    company_id: Optional[str] = None,
+    a2p_campaign_id: Optional[int] = None,
+    opt_outs: Optional[Collection[str]] = None,
+    opt_out_max_age: float = 15 * 60,
+    max_workers: int = 8,
+    max_pending: int = 1000,
+  ):
+    self._client = client
+    self._sender_rate_limit = sender_rate_limit
+    self._company_id = company_id
+    self._a2p_campaign_id = a2p_campaign_id
+    self._opt_outs = OptOutList(opt_outs) if opt_outs is not None else None
+    self._opt_out_max_age = opt_out_max_age
+    self._max_workers = max_workers
+    self._max_pending = max_pending
+    self._buckets: Dict[Hashable, TokenBucket] = {}
+    self._reset_stats()
+
+  def _reset_stats(self) -> None:
+    self._sent = self._failed = self._skipped = self._opted_out = 0
+    self._started = time.monotonic()
+
+  @property
+  def stats(self) -> BroadcastStats:
+    """The progress of the current (or last) broadcast, which may be read while it's underway."""
+    return BroadcastStats(
+      self._sent, self._failed, self._skipped, self._opted_out, time.monotonic() - self._started
+    )
+
+  def _opt_outs_stale(self) -> bool:
+    if self._company_id is None:
+      return False
+    return (
+      self._opt_outs is None or time.monotonic() - self._opt_outs.fetched_at > self._opt_out_max_age
+    )
+
+  def _filter(self, index: int, message: SendSMSMessage) -> SMSResult:
+    """Drops the recipients that opted out, returning the result that the message is sent with."""
+    numbers = message.get('to_numbers')
+    if not numbers or not self._opt_outs:
+      return SMSResult(index, message)
+
+    opted_out = tuple(number for number in numbers if number in self._opt_outs)
+    if opted_out:
+      message = {**message, 'to_numbers': [n for n in numbers if n not in self._opt_outs]}
+    return SMSResult(index, message, opted_out=opted_out)
+
+  def _delay(self, message: SendSMSMessage) -> float:
+    """Reserves a send for the message's sender, and returns how long it has to wait for it."""
+    sender = _sender(message)
+    if sender not in self._buckets:
+      self._buckets[sender] = TokenBucket(*self._sender_rate_limit)
+    return self._buckets[sender].reserve()
+
+  def _record(self, result: SMSResult) -> SMSResult:
+    self._opted_out += len(result.opted_out)
+    if result.error is not None:
+      self._failed += 1
+    elif result.skipped:
+      self._skipped += 1
+    else:
+      self._sent += 1
+    return result
+
+  def _schedule(
+    self, scheduled: List[tuple], counter: Iterator[int], index: int, message: SendSMSMessage
+  ) -> Optional[SMSResult]:
+    """Queues the message to be sent once its sender may send it, unless it should be skipped."""
+    result = self._filter(index, message)
+    if result.opted_out and not result.message['to_numbers']:
+      return self._record(result)
+
+    ready_at = time.monotonic() + self._delay(result.message)
+    heapq.heappush(scheduled, (ready_at, next(counter), result))
+    return None
+
+  def send(self, messages: Iterable[SendSMSMessage]) -> Iterator[SMSResult]:
+    """Sends the messages, yielding an SMSResult for each as it's sent (or skipped, or fails).
+
+    Messages are read lazily, so they can be streamed from a file or a database.
+    """
+    self._reset_stats()
+    if self._opt_outs_stale():
+      self._opt_outs = OptOutList.fetch(self._client, self._company_id, self._a2p_campaign_id)
+
+    def send_one(result: SMSResult) -> SMSResult:
+      try:
+        return result._replace(response=self._client.sms.send(result.message))
+      except Exception as e:
+        return result._replace(error=e)
+
+    messages = enumerate(messages)
+    scheduled: List[tuple] = []
+    counter = itertools.count()
+    pending = set()
+    pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='dialpad-sms')
+    try:
+      while True:
+        while messages is not None and len(scheduled) < self._max_pending:
+          message = next(messages, None)
+          if message is None:
+            messages = None
+            break
+          skipped = self._schedule(scheduled, counter, *message)
+          if skipped is not None:
+            yield skipped
+
+        now = time.monotonic()
+        while scheduled and scheduled[0][0] <= now and len(pending) < self._max_workers:
+          pending.add(pool.submit(send_one, heapq.heappop(scheduled)[2]))
+
+        if not pending and not scheduled:
+          return
+
+        timeout = None
+        if scheduled and len(pending) < self._max_workers:
+          timeout = max(0.0, scheduled[0][0] - now)
+
+        if not pending:
+          time.sleep(timeout)
+          continue
+
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+          yield self._record(future.result())
+    finally:
+      pool.shutdown(wait=False, cancel_futures=True)
+
+  async def send_async(
+    self, messages: Union[Iterable[SendSMSMessage], AsyncIterable[SendSMSMessage]]
+  ) -> AsyncIterator[SMSResult]:
+    """The AsyncDialpadClient equivalent of `send`.
+
+    The messages may also be read from an async iterable.
+    """
+    self._reset_stats()
+    if self._opt_outs_stale():
+      self._opt_outs = await OptOutList.fetch_async(
+        self._client, self._company_id, self._a2p_campaign_id
+      )
+
+    async def send_one(result: SMSResult) -> SMSResult:
+      try:
+        return result._replace(response=await self._client.sms.send(result.message))
+      except Exception as e:
+        return result._replace(error=e)
+
+    async def read():
+      if hasattr(messages, '__aiter__'):
+        async for message in messages:
+          yield message
+      else:
+        for message in messages:
+          yield message
+
+    reader = read()
+    index = 0
+    scheduled: List[tuple] = []
+    counter = itertools.count()
+    pending = set()
+    try:
+      while True:
+        while reader is not None and len(scheduled) < self._max_pending:
+          try:
+            message = await reader.__anext__()
+          except StopAsyncIteration:
+            reader = None
+            break
+          skipped = self._schedule(scheduled, counter, index, message)
+          index += 1
+          if skipped is not None:
+            yield skipped
+
+        now = time.monotonic()
+        while scheduled and scheduled[0][0] <= now and len(pending) < self._max_workers:
+          pending.add(asyncio.ensure_future(send_one(heapq.heappop(scheduled)[2])))
+
+        if not pending and not scheduled:
+          return
+
+        timeout = None
+        if scheduled and len(pending) < self._max_workers:
+          timeout = max(0.0, scheduled[0][0] - now)
+
+        if not pending:
+          await asyncio.sleep(timeout)
+          continue
+
+        done, pending = await asyncio.wait(
+          pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+          yield self._record(task.result())
+    finally:
+      for task in pending:
+        task.cancel()
@@ -0,0 +1,207 @@
+"""Running stats jobs end-to-end: initiating them, polling until they finish, and reading the rows.
+
+`client.stats.initiate_processing` only starts a job, so the result has to be polled for with
+`client.stats.get_result` until it's complete, and then downloaded from its `download_url`. The
+functions here do all of that, polling with a backoff and parsing the CSV file as it downloads.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Iterable, Iterator, NamedTuple, Optional
+
+from .bulk import fallback_limiter, field
+from .download import aiter_csv_records, iter_csv_records
+from .operation_rate_limits import OPERATION_RATE_LIMITS
+from .rate_limit import TokenBucket
+from .schemas.stats import ProcessStatsMessage, StatsProto
+
+
+class StatsJob(NamedTuple):
+  """A stats request, along with its result (or the error that it failed with)."""
+
+  request: ProcessStatsMessage
+  request_id: Optional[str] = None
+  result: Optional[StatsProto] = None
+  error: Optional[BaseException] = None
+
+
+class _Polling:
+  """The intervals between polls for a job's result, which grow by `backoff` up to `max_interval`."""
+
+  def __init__(self, interval: float, max_interval: float, backoff: float, timeout: float):
+    self.interval = interval
+    self.max_interval = max_interval
+    self.backoff = backoff
+    self.deadline = time.monotonic() + timeout
+
+  def next_delay(self, request_id: str) -> float:
+    remaining = self.deadline - time.monotonic()
+    if remaining <= 0:
+      raise TimeoutError(f'Stats request {request_id} is still processing')
+
+    delay = min(self.interval, remaining)
+    self.interval = min(self.interval * self.backoff, self.max_interval)
+    return delay
+
+
+def _check_result(request_id: str, result: StatsProto) -> bool:
+  """Returns whether the job has finished, raising an error if it failed."""
+  status = field(result, 'status')
+  if status == 'failed':
+    raise RuntimeError(f'Stats request {request_id} failed')
+  return status == 'complete'
+
+
+def _set_default_limiters(client, options: dict) -> None:
+  """Shares a limiter for initiating (stats.create) and polling (stats.get) between many jobs."""
+  options.setdefault(
+    'initiate_limiter', fallback_limiter(client, OPERATION_RATE_LIMITS['stats.create'])
+  )
+  options.setdefault('poll_limiter', fallback_limiter(client, OPERATION_RATE_LIMITS['stats.get']))
+
+
+def wait_for_stats(
+  client,
+  request: ProcessStatsMessage,
+  poll_interval: float = 1.0,
+  max_poll_interval: float = 30.0,
+  backoff: float = 1.5,
+  timeout: float = 60 * 60,
+  initiate_limiter: Optional[TokenBucket] = None,
+  poll_limiter: Optional[TokenBucket] = None,
+) -> StatsJob:
+  """Initiates a stats job, and polls for its result until it has finished.
+
+  Args:
+      client: The DialpadClient to run the job with.
+      request: The stats request (as passed to `client.stats.initiate_processing`).
+      poll_interval: The number of seconds to wait before polling for the result the first time.
+      max_poll_interval: The longest wait between polls, which grow by a factor of `backoff`.
+      backoff: The factor by which the wait between polls grows.
+      timeout: The number of seconds after which a TimeoutError is raised.
+      initiate_limiter: A TokenBucket to throttle initiating the job with.
+      poll_limiter: A TokenBucket to throttle polling for the result with.
+
+  Returns:
+      The StatsJob, whose result has the `download_url` of the stats file.
+
+  Raises:
+      RuntimeError: If the job failed.
+      TimeoutError: If the job didn't finish in time.
+  """
+  if initiate_limiter is not None:
+    initiate_limiter.acquire()
+
+  request_id = field(client.stats.initiate_processing(request), 'request_id')
+  polling = _Polling(poll_interval, max_poll_interval, backoff, timeout)
+  while True:
+    time.sleep(polling.next_delay(request_id))
+    if poll_limiter is not None:
+      poll_limiter.acquire()
+    result = client.stats.get_result(request_id)
+    if _check_result(request_id, result):
+      return StatsJob(request, request_id, result)
+
+
+def iter_stats_rows(client, download_url: str) -> Iterator[dict]:
+  """Downloads a stats file over the client's session, yielding each row as it's parsed."""
+  return iter_csv_records(client.stream_download(download_url))
+
+
+def run_stats(client, request: ProcessStatsMessage, **options) -> Iterator[dict]:
+  """Runs a stats job, and yields the rows of the resulting file as they're downloaded.
+
+  Accepts the same options as `wait_for_stats`.
+  """
+  job = wait_for_stats(client, request, **options)
+  yield from iter_stats_rows(client, field(job.result, 'download_url'))
+
+
+def run_stats_many(
+  client, requests: Iterable[ProcessStatsMessage], max_workers: int = 8, **options
+) -> Iterator[StatsJob]:
+  """Runs many stats jobs (such as one per office or target) concurrently on a pool of threads.
+
+  The jobs are initiated and polled within the documented rate limits of stats.create and
+  stats.get (unless the client has its own rate limiter), and yielded as they finish. A job that failed (or timed out) is yielded with its `error` set rather than raised, so
+  that it can be retried; the rows of the others can be read with `iter_stats_rows`.
+
+  Accepts the same options as `wait_for_stats`.
+  """
+  _set_default_limiters(client, options)
+
+  def run(request: ProcessStatsMessage) -> StatsJob:
+    try:
+      return wait_for_stats(client, request, **options)
+    except Exception as e:
+      return StatsJob(request, error=e)
+
+  pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dialpad-stats')
+  try:
+    futures = [pool.submit(run, request) for request in requests]
+    for future in as_completed(futures):
+      yield future.result()
+  finally:
+    # Don't wait for the jobs that are still being polled if the caller stopped early.
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def wait_for_stats_async(
+  client,
+  request: ProcessStatsMessage,
+  poll_interval: float = 1.0,
+  max_poll_interval: float = 30.0,
+  backoff: float = 1.5,
+  timeout: float = 60 * 60,
+  initiate_limiter: Optional[TokenBucket] = None,
+  poll_limiter: Optional[TokenBucket] = None,
+) -> StatsJob:
+  """The AsyncDialpadClient equivalent of `wait_for_stats`."""
+  if initiate_limiter is not None:
+    await initiate_limiter.acquire_async()
+
+  request_id = field(await client.stats.initiate_processing(request), 'request_id')
+  polling = _Polling(poll_interval, max_poll_interval, backoff, timeout)
+  while True:
+    await asyncio.sleep(polling.next_delay(request_id))
+    if poll_limiter is not None:
+      await poll_limiter.acquire_async()
+    result = await client.stats.get_result(request_id)
+    if _check_result(request_id, result):
+      return StatsJob(request, request_id, result)
+
+
+def iter_stats_rows_async(client, download_url: str) -> AsyncIterator[dict]:
+  """The AsyncDialpadClient equivalent of `iter_stats_rows`."""
+  return aiter_csv_records(client.stream_download(download_url))
+
+
+async def run_stats_async(client, request: ProcessStatsMessage, **options) -> AsyncIterator[dict]:
+  """The AsyncDialpadClient equivalent of `run_stats`."""
+  job = await wait_for_stats_async(client, request, **options)
+  async for row in iter_stats_rows_async(client, field(job.result, 'download_url')):
+    yield row
+
+
+async def run_stats_many_async(
+  client, requests: Iterable[ProcessStatsMessage], concurrency: int = 8, **options
+) -> AsyncIterator[StatsJob]:
+  """The AsyncDialpadClient equivalent of `run_stats_many`, with up to `concurrency` jobs at once."""
+  _set_default_limiters(client, options)
+  semaphore = asyncio.Semaphore(concurrency)
+
+  async def run(request: ProcessStatsMessage) -> StatsJob:
+    async with semaphore:
+      try:
+        return await wait_for_stats_async(client, request, **options)
+      except Exception as e:
+        return StatsJob(request, error=e)
+
+  tasks = [asyncio.ensure_future(run(request)) for request in requests]
+  try:
+    for next_done in asyncio.as_completed(tasks):
+      yield await next_done
+  finally:
+    for task in tasks:
+      task.cancel()
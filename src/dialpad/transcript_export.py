@@ -0,0 +1,114 @@
+"""Bulk fetching of call transcripts, such as those of every call of the day.
+
+Transcripts are fetched concurrently (within the rate limit of transcripts.get) and yielded as they
+arrive, while the IDs of the calls whose transcripts couldn't be fetched are collected for a retry:
+
+    from dialpad import DialpadClient
+    from dialpad.transcript_export import fetch_transcripts
+
+    dp = DialpadClient(token='API_TOKEN_HERE')
+    results = fetch_transcripts(dp, dp.calls.list(started_after=1700000000000))
+    for call_id, transcript in results:
+      print(call_id, len(transcript['lines']))
+    print(f'Failed: {sorted(results.failed)}')
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Union
+
+from .bulk import AsyncBulkResults, BulkResults, fallback_limiter
+from .models.base import Model
+from .operation_rate_limits import OPERATION_RATE_LIMITS
+
+# A call ID, or a call (as a dict or a model) from calls.list
+CallOrId = Union[int, str, dict, Model]
+
+
+class InvalidCall:
+  """Stands in for a call whose ID couldn't be read, as its key in `failed`."""
+
+  __slots__ = ('call', 'error')
+
+  def __init__(self, call: Any, error: Exception):
+    self.call = call
+    self.error = error
+
+  def __repr__(self) -> str:
+    return f'InvalidCall({self.call!r})'
+
+
+def _call_id(call: CallOrId) -> Union[int, InvalidCall]:
+  if isinstance(call, InvalidCall):
+    # Retrying the failures of an earlier fetch.
+    return call
+  try:
+    if isinstance(call, dict):
+      call = call['call_id']
+    elif isinstance(call, Model):
+      call = call.call_id
+    # 64-bit IDs may be sent as strings, which would otherwise defeat deduplication.
+    return int(call)
+  except Exception as e:
+    return InvalidCall(call, e)
+
+
+def _fetcher(get):
+  def fetch(call_id: Union[int, InvalidCall]):
+    if isinstance(call_id, InvalidCall):
+      raise call_id.error
+    return get(call_id)
+
+  return fetch
+
+
+def _async_fetcher(get):
+  async def fetch(call_id: Union[int, InvalidCall]):
+    if isinstance(call_id, InvalidCall):
+      raise call_id.error
+    return await get(call_id)
+
+  return fetch
+
+
+def fetch_transcripts(client, calls: Iterable[CallOrId], max_workers: int = 8) -> BulkResults:
+  """Fetches the transcripts of many calls concurrently, within the rate limit of transcripts.get.
+
+  Args:
+      client: The DialpadClient to fetch the transcripts with.
+      calls: Call IDs, or the calls themselves (such as the iterator returned by `calls.list`).
+        Duplicates are only fetched once.
+      max_workers: The number of transcripts that are fetched concurrently.
+
+  Returns:
+      A BulkResults, which yields `(call_id, transcript)` pairs as they're fetched and maps the IDs
+      of the calls whose transcript couldn't be fetched to the error in `failed`. Calls whose ID
+      couldn't be read are recorded there too, under an InvalidCall that holds the call.
+  """
+  return BulkResults(
+    _fetcher(client.transcripts.get),
+    map(_call_id, calls),
+    max_workers=max_workers,
+    limiter=fallback_limiter(client, OPERATION_RATE_LIMITS['transcripts.get']),
+  )
+
+
+async def _call_ids(
+  calls: Union[Iterable[CallOrId], AsyncIterable[CallOrId]],
+) -> AsyncIterator[Union[int, InvalidCall]]:
+  if hasattr(calls, '__aiter__'):
+    async for call in calls:
+      yield _call_id(call)
+  else:
+    for call in calls:
+      yield _call_id(call)
+
+
+def fetch_transcripts_async(
+  client, calls: Union[Iterable[CallOrId], AsyncIterable[CallOrId]], concurrency: int = 8
+) -> AsyncBulkResults:
+  """The AsyncDialpadClient equivalent of `fetch_transcripts`, with up to `concurrency` at once."""
+  return AsyncBulkResults(
+    _async_fetcher(client.transcripts.get),
+    _call_ids(calls),
+    concurrency=concurrency,
+    limiter=fallback_limiter(client, OPERATION_RATE_LIMITS['transcripts.get']),
+  )
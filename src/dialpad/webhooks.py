@@ -0,0 +1,184 @@
+"""A framework-agnostic receiver for webhook events, which can be mounted as a WSGI or ASGI app.
+
+    from dialpad.events import CALL
+    from dialpad.webhooks import WebhookReceiver
+
+    receiver = WebhookReceiver(secret='WEBHOOK_SECRET')
+
+    @receiver.on(CALL)
+    def on_call(event):
+      print(event.payload['call_id'], event.payload['state'])
+
+    # As a WSGI app (with gunicorn, or mounted within Flask or Django)...
+    app = receiver
+    # ...or as an ASGI app (with uvicorn, or mounted within Starlette or FastAPI).
+    app = receiver.asgi
+
+Each request is verified and decoded before it's acknowledged, while the handlers run afterwards on
+a bounded pool of worker threads, so that Dialpad isn't kept waiting on them.
+"""
+
+from typing import Callable, List, Optional, Tuple, Union
+
+from .bulk import field
+from .events import (
+  Event,
+  EventDecoder,
+  EventDispatcher,
+  Handler,
+  classify_event,
+  signature_options,
+)
+from .json_codec import JSONCodec
+from .schemas.webhook import WebhookProto
+
+_REASONS = {
+  200: 'OK',
+  400: 'Bad Request',
+  401: 'Unauthorized',
+  405: 'Method Not Allowed',
+  413: 'Payload Too Large',
+  503: 'Service Unavailable',
+}
+
+
+class WebhookReceiver:
+  """Verifies, decodes and dispatches the events that are posted to a webhook.
+
+  Responds with a 401 to requests whose signature is invalid, a 400 to malformed ones, and a 503
+  while the queue of events waiting for a worker is full.
+
+  Args:
+      secret: The webhook's secret, or None if its payloads aren't signed.
+      algo: The JWT algorithm that payloads are signed with.
+      max_workers: The number of events that are handled concurrently.
+      queue_size: The number of events that may wait for a worker.
+      max_body_size: The largest request body that's accepted, in bytes.
+      json_codec: The JSON codec to decode payloads with (see dialpad.json_codec.get_codec).
+      classify: The function that works out the type of an event from its payload.
+  """
+
+  def __init__(
+    self,
+    secret: Optional[str] = None,
+    algo: str = 'HS256',
+    max_workers: int = 4,
+    queue_size: int = 100,
+    max_body_size: int = 1024 * 1024,
+    json_codec: Optional[Union[str, JSONCodec]] = None,
+    classify: Callable[[dict], str] = classify_event,
+  ):
+    self.decoder = EventDecoder(secret, algo, json_codec=json_codec, classify=classify)
+    self.dispatcher = EventDispatcher(max_workers=max_workers, queue_size=queue_size)
+    self.max_body_size = max_body_size
+
+  @classmethod
+  def from_webhook(cls, webhook: WebhookProto, **kwargs) -> 'WebhookReceiver':
+    """Creates a receiver for a webhook (as returned by `webhooks.get` or `webhooks.create`)."""
+    return cls(**signature_options(field(webhook, 'signature')), **kwargs)
+
+  def on(self, event_type: str = '*') -> Callable[[Handler], Handler]:
+    """Registers a handler for events of a type (such as `events.CALL`), or for all with '*'."""
+    return self.dispatcher.on(event_type)
+
+  def handle(self, method: str, body: bytes) -> Tuple[int, Optional[Event]]:
+    """Handles a request, returning the status to respond with along with the decoded event."""
+    if method != 'POST':
+      return 405, None
+    if len(body) > self.max_body_size:
+      return 413, None
+
+    try:
+      event = self.decoder.decode(body)
+    except PermissionError:
+      return 401, None
+    except ValueError:
+      return 400, None
+
+    if not self.dispatcher.dispatch(event):
+      return 503, event
+    return 200, event
+
+  def _read_wsgi_body(self, environ: dict) -> Optional[bytes]:
+    """Reads the body of a WSGI request, or returns None if it's larger than `max_body_size`."""
+    stream = environ['wsgi.input']
+    length = environ.get('CONTENT_LENGTH')
+    if length:
+      try:
+        length = int(length)
+      except ValueError:
+        length = 0
+      return stream.read(length) if length <= self.max_body_size else None
+
+    # Without a Content-Length (as with a chunked request), the body is read until EOF, but no
+    # further than is needed to tell that it's too large.
+    chunks = []
+    size = 0
+    while size <= self.max_body_size:
+      chunk = stream.read(self.max_body_size + 1 - size)
+      if not chunk:
+        break
+      chunks.append(chunk)
+      size += len(chunk)
+    return b''.join(chunks) if size <= self.max_body_size else None
+
+  def __call__(self, environ: dict, start_response: Callable) -> List[bytes]:
+    """The WSGI app."""
+    body = self._read_wsgi_body(environ)
+    if body is None:
+      status = 413
+    else:
+      status, _ = self.handle(environ['REQUEST_METHOD'], body)
+
+    body = _REASONS[status].encode('utf-8')
+    start_response(
+      f'{status} {_REASONS[status]}',
+      [('Content-Type', 'text/plain'), ('Content-Length', str(len(body)))],
+    )
+    return [body]
+
+  async def asgi(self, scope: dict, receive: Callable, send: Callable) -> None:
+    """The ASGI app."""
+    if scope['type'] == 'lifespan':
+      await self._lifespan(receive, send)
+      return
+
+    chunks = []
+    size = 0
+    more_body = True
+    while more_body:
+      message = await receive()
+      chunk = message.get('body', b'')
+      size += len(chunk)
+      if size <= self.max_body_size:
+        chunks.append(chunk)
+      more_body = message.get('more_body', False)
+
+    if size > self.max_body_size:
+      status = 413
+    else:
+      status, _ = self.handle(scope['method'], b''.join(chunks))
+
+    body = _REASONS[status].encode('utf-8')
+    await send(
+      {
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'text/plain'), (b'content-length', str(len(body)).encode())],
+      }
+    )
+    await send({'type': 'http.response.body', 'body': body})
+
+  async def _lifespan(self, receive: Callable, send: Callable) -> None:
+    while True:
+      message = await receive()
+      if message['type'] == 'lifespan.startup':
+        await send({'type': 'lifespan.startup.complete'})
+      elif message['type'] == 'lifespan.shutdown':
+        self.close()
+        await send({'type': 'lifespan.shutdown.complete'})
+        return
+
+  def close(self, wait: bool = True) -> None:
+    """Stops the worker pool, waiting for the queued events to be handled if `wait` is True."""
+    self.dispatcher.close(wait=wait)
@@ -0,0 +1,294 @@
+"""An asyncio consumer for the events that Dialpad sends to a registered websocket.
+
+Requires the websockets package (`pip install python-dialpad[websockets]`), unless a `connect`
+function is given.
+
+    from dialpad import AsyncDialpadClient
+    from dialpad.events import CALL
+    from dialpad.websocket_consumer import WebsocketConsumer
+
+    dp = AsyncDialpadClient(token='API_TOKEN_HERE')
+    websocket = await dp.websockets.create({'secret': 'WEBSOCKET_SECRET'})
+    consumer = WebsocketConsumer.from_websocket(websocket)
+    async for event in consumer:
+      if event.type == CALL:
+        print(event.payload['call_id'], event.payload['state'])
+
+Events are verified and decoded as each message arrives, and passed on through a bounded queue. When
+it's full, the consumer stops reading from the socket until there's room again, so a slow consumer
+holds the sender back rather than buffering without bound. Dropped connections are re-established
+with a jittered exponential backoff.
+
+There's no way to resume a websocket from the last event that was received, so events that are sent
+while the consumer is disconnected are missed. Messages that are sent again after a reconnect are
+skipped by comparing them with a window of hashes of the most recent ones, which only catches exact
+repeats of messages that were received recently.
+"""
+
+import asyncio
+import collections
+import hashlib
+import inspect
+import logging
+import random
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union
+
+from .bulk import field
+from .events import (
+  Event,
+  EventDecoder,
+  EventHandlers,
+  Handler,
+  classify_event,
+  signature_options,
+)
+from .json_codec import JSONCodec
+from .schemas.websocket import WebsocketProto
+
+try:
+  import websockets
+except ImportError:  # pragma: no cover
+  websockets = None
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the events in the queue.
+_CLOSED = object()
+
+# Returns a connection (with async `recv()` and `close()` methods) to the given URL.
+Connect = Callable[[str], Awaitable[Any]]
+
+
+async def _websockets_connect(url: str) -> Any:  # pragma: no cover
+  return await websockets.connect(url)
+
+
+class WebsocketConsumer:
+  """Consumes the events that are sent to a websocket, reconnecting whenever the connection drops.
+
+  Events can be read with `async for`, or handed to the handlers registered with `on` by `run`.
+
+  Args:
+      url: The `websocket_url` to connect to, or a function (which may be async) that returns it,
+        which is called again before each reconnect so that the URL can be refreshed.
+      secret: The websocket's secret, or None if its payloads aren't signed.
+      algo: The JWT algorithm that payloads are signed with.
+      queue_size: The number of decoded events that may wait to be consumed.
+      min_backoff: The number of seconds to wait before the first reconnect.
+      max_backoff: The longest wait between reconnects, which double after each failed attempt.
+      max_retries: The number of reconnects in a row to attempt before giving up, or None to keep
+        trying forever.
+      min_uptime: The number of seconds that a connection must stay up, unless it delivers a
+        message first, to be counted as a success. Connections that are accepted and then dropped
+        sooner count towards `max_retries` (and the backoff), like those that are refused.
+      dedupe_window: The number of recent messages whose hashes are remembered, so that exact
+        repeats of them (such as those that are sent again after a reconnect) are skipped.
+      json_codec: The JSON codec to decode payloads with (see dialpad.json_codec.get_codec).
+      classify: The function that works out the type of an event from its payload.
+      connect: The function to connect with, instead of the websockets package.
+  """
+
+  def __init__(
+    self,
+    url: Union[str, Callable[[], Union[str, Awaitable[str]]]],
+    secret: Optional[str] = None,
+    algo: str = 'HS256',
+    queue_size: int = 100,
+    min_backoff: float = 0.5,
+    max_backoff: float = 30.0,
+    max_retries: Optional[int] = None,
+    min_uptime: float = 10.0,
+    dedupe_window: int = 1000,
+    json_codec: Optional[Union[str, JSONCodec]] = None,
+    classify: Callable[[dict], str] = classify_event,
+    connect: Optional[Connect] = None,
+  ):
+    if connect is None:
+      if websockets is None:
+        raise ImportError(
+          'The websocket consumer requires the websockets package '
+          '(pip install python-dialpad[websockets]).'
+        )
+      connect = _websockets_connect
+
+    self._url = url
+    self._connect = connect
+    self._decoder = EventDecoder(secret, algo, json_codec=json_codec, classify=classify)
+    self._handlers = EventHandlers()
+    self._queue_size = queue_size
+    self._queue: Optional[asyncio.Queue] = None
+    self._reader: Optional[asyncio.Task] = None
+    self._min_backoff = min_backoff
+    self._max_backoff = max_backoff
+    self._max_retries = max_retries
+    self._min_uptime = min_uptime
+    self._dedupe_window = dedupe_window
+    self._recent = collections.OrderedDict()
+    self.connections = 0
+    self.received = 0
+    self.rejected = 0
+    self.duplicates = 0
+
+  @classmethod
+  def from_websocket(cls, websocket: WebsocketProto, **kwargs) -> 'WebsocketConsumer':
+    """Creates a consumer for a websocket (as returned by `websockets.get` or `websockets.create`)."""
+    url = field(websocket, 'websocket_url')
+    return cls(url, **signature_options(field(websocket, 'signature')), **kwargs)
+
+  def on(self, event_type: str = '*') -> Callable[[Handler], Handler]:
+    """Registers a handler for events of a type (such as `events.CALL`), or for all with '*'."""
+    return self._handlers.on(event_type)
+
+  def _backoff(self, attempt: int) -> float:
+    delay = min(self._max_backoff, self._min_backoff * 2 ** (attempt - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+  async def _get_url(self) -> str:
+    if isinstance(self._url, str):
+      return self._url
+    url = self._url()
+    return await url if inspect.isawaitable(url) else url
+
+  def _is_duplicate(self, message: Union[str, bytes]) -> bool:
+    if not self._dedupe_window:
+      return False
+
+    if isinstance(message, str):
+      message = message.encode('utf-8')
+    digest = hashlib.blake2b(message, digest_size=16).digest()
+    if digest in self._recent:
+      return True
+
+    self._recent[digest] = None
+    if len(self._recent) > self._dedupe_window:
+      self._recent.popitem(last=False)
+    return False
+
+  async def _consume(self, connection: Any) -> None:
+    """Decodes the messages of a connection into the queue, until the connection is closed."""
+    while True:
+      message = await connection.recv()
+      self.received += 1
+      try:
+        event = self._decoder.decode(message)
+      except (PermissionError, ValueError) as e:
+        self.rejected += 1
+        logger.warning('Skipping a websocket message that could not be decoded: %s', e)
+        continue
+
+      if self._is_duplicate(message):
+        self.duplicates += 1
+        continue
+
+      # Waits for room in the queue, which stops the socket from being read in the meantime.
+      await self._queue.put(event)
+
+  async def _reconnect(self) -> None:
+    """Keeps a connection open, until `max_retries` reconnects in a row have failed."""
+    attempt = 0
+    while True:
+      if attempt:
+        if self._max_retries is not None and attempt > self._max_retries:
+          raise ConnectionError(f'Gave up reconnecting to the websocket after {attempt - 1} tries')
+        await asyncio.sleep(self._backoff(attempt))
+
+      try:
+        connection = await self._connect(await self._get_url())
+      except Exception as e:
+        attempt += 1
+        logger.warning('Could not connect to the websocket: %r', e)
+        continue
+
+      self.connections += 1
+      connected_at = asyncio.get_running_loop().time()
+      received = self.received
+      try:
+        await self._consume(connection)
+      except Exception as e:
+        logger.info('The websocket connection was lost: %r', e)
+      finally:
+        await connection.close()
+
+      # Only a connection that worked for a while starts the retries over, so that one which keeps
+      # being accepted and then dropped still backs off and gives up.
+      uptime = asyncio.get_running_loop().time() - connected_at
+      if self.received > received or uptime >= self._min_uptime:
+        attempt = 1
+      else:
+        attempt += 1
+
+  async def _read(self) -> None:
+    try:
+      await self._reconnect()
+    except Exception as e:
+      await self._queue.put(e)
+      await self._queue.put(_CLOSED)
+
+  def _start(self) -> None:
+    if self._reader is None:
+      self._queue = asyncio.Queue(maxsize=self._queue_size)
+      self._reader = asyncio.ensure_future(self._read())
+
+  async def __aiter__(self) -> AsyncIterator[Event]:
+    """Yields the events as they arrive, until the consumer is closed.
+
+    Raises:
+        ConnectionError: If `max_retries` reconnects in a row failed.
+    """
+    self._start()
+    while True:
+      item = await self._queue.get()
+      if item is _CLOSED:
+        # Let any other readers see that the consumer has closed too.
+        self._queue.put_nowait(_CLOSED)
+        return
+      if isinstance(item, Exception):
+        raise item
+      yield item
+
+  async def _handle(self, event: Event, slots: asyncio.Semaphore) -> None:
+    try:
+      for handler in self._handlers.handlers(event):
+        try:
+          if asyncio.iscoroutinefunction(handler):
+            await handler(event)
+          else:
+            await asyncio.get_running_loop().run_in_executor(None, handler, event)
+        except Exception:
+          logger.exception('Handler %r failed on a %s event', handler, event.type)
+    finally:
+      slots.release()
+
+  async def run(self, concurrency: int = 4) -> None:
+    """Hands each event to the registered handlers, with up to `concurrency` events at once.
+
+    Sync handlers are run on the event loop's default executor. Returns once the consumer is closed
+    (and the events that were being handled have been), or raises like `async for`.
+    """
+    slots = asyncio.Semaphore(concurrency)
+    tasks = set()
+    try:
+      async for event in self:
+        # No more events are taken from the queue while every slot is busy.
+        await slots.acquire()
+        task = asyncio.ensure_future(self._handle(event, slots))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    finally:
+      if tasks:
+        await asyncio.gather(*tasks)
+
+  async def close(self) -> None:
+    """Closes the connection and stops reconnecting, discarding any events that are still queued."""
+    if self._reader is None or self._reader.done():
+      return
+
+    self._reader.cancel()
+    try:
+      await self._reader
+    except asyncio.CancelledError:
+      pass
+
+    while not self._queue.empty():
+      self._queue.get_nowait()
+    self._queue.put_nowait(_CLOSED)
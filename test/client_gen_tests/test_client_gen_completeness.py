@@ -14,11 +14,12 @@ from openapi_core import OpenAPI
 from cli.client_gen.annotation import spec_piece_to_annotation
 from cli.client_gen.module_mapping import load_module_mapping
 from cli.client_gen.resource_classes import resource_class_to_class_def
-from cli.client_gen.resource_methods import http_method_to_func_def
+from cli.client_gen.resource_methods import http_method_to_func_def, parse_rate_limit
 from cli.client_gen.resource_modules import resource_class_to_module_def
-from cli.client_gen.resource_packages import _group_operations_by_class
-from cli.client_gen.schema_classes import schema_to_typed_dict_def
+from cli.client_gen.resource_packages import _group_operations_by_class, operation_rate_limits
+from cli.client_gen.schema_classes import schema_to_model_def, schema_to_typed_dict_def
 from cli.client_gen.schema_modules import schemas_to_module_def
+from dialpad.operation_rate_limits import OPERATION_RATE_LIMITS
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,60 @@ class TestGenerationUtilities:
           logger.error(f'Exception: {e}')
           raise
 
+  def test_parse_rate_limit(self, open_api_spec):
+    """Test that parse_rate_limit understands the rate limits documented in the spec."""
+    assert parse_rate_limit('Rate limit: 1 per 5 minute.') == (1, 300)
+    assert parse_rate_limit('Rate limit: 200 per hour.') == (200, 3600)
+    assert parse_rate_limit(
+      'Tier 0 Rate limit: 100 per minute.\n\nTier 1 Rate limit: 800 per minute.'
+    ) == (100, 60)
+    assert parse_rate_limit(
+      'Rate limit: 10 per minute per IVR.\n\nRate limit: 1200 per minute.'
+    ) == (1200, 60)
+    assert parse_rate_limit('No limits here.') is None
+
+    # Every documented "Rate limit" line in the spec should be understood.
+    for path_key, path_item_spec in (open_api_spec.spec / 'paths').items():
+      for http_method_key, operation_spec in path_item_spec.items():
+        description = operation_spec.contents().get('description', '')
+        if 'Rate limit' in description:
+          assert parse_rate_limit(description), (
+            f'Could not parse rate limit for {http_method_key.upper()} {path_key}'
+          )
+
+  def test_operation_rate_limits(self, open_api_spec):
+    """Test that the generated rate limits match the spec and the generated resource methods."""
+    assert OPERATION_RATE_LIMITS == operation_rate_limits(open_api_spec.spec)
+
+    operation_ids = {
+      operation_spec['operationId']
+      for _path_key, path_item_spec in (open_api_spec.spec / 'paths').items()
+      for _method_key, operation_spec in path_item_spec.items()
+      if 'operationId' in operation_spec
+    }
+    resources_dir = os.path.join(REPO_ROOT, 'src', 'dialpad', 'resources')
+    for file_name in os.listdir(resources_dir):
+      if not file_name.endswith('_resource.py'):
+        continue
+
+      with open(os.path.join(resources_dir, file_name)) as f:
+        module = ast.parse(f.read())
+
+      for node in ast.walk(module):
+        if not isinstance(node, ast.Call):
+          continue
+
+        keywords = {k.arg: k.value for k in node.keywords}
+        operation_id = (
+          ast.literal_eval(keywords['operation_id']) if 'operation_id' in keywords else None
+        )
+        # Some resources predate the copy of the spec in this repo.
+        if operation_id in operation_ids:
+          rate_limit = keywords.get('rate_limit')
+          assert OPERATION_RATE_LIMITS.get(operation_id) == (
+            ast.literal_eval(rate_limit) if rate_limit else None
+          ), f'Mismatched rate limit for {operation_id} in {file_name}'
+
   def test_schema_to_typed_dict_def(self, open_api_spec):
     """Test the schema_to_typed_dict_def function for all schemas in the spec."""
     # Get the components/schemas section which contains all schema definitions
@@ -173,6 +228,17 @@ class TestGenerationUtilities:
         logger.error(f'Exception: {e}')
         raise
 
+  def test_schema_to_model_def(self, open_api_spec):
+    """Test that schema_to_model_def emits a slotted Model class for every schema in the spec."""
+    for schema_name, schema in (open_api_spec.spec / 'components' / 'schemas').items():
+      model_def = schema_to_model_def(schema)
+      assert isinstance(model_def, ast.ClassDef), f'No model class generated for {schema_name}'
+      assert [base.id for base in model_def.bases] == ['Model']
+
+      # Every property should have a slot.
+      slots = next(node.value for node in model_def.body if isinstance(node, ast.Assign))
+      assert [elt.value for elt in slots.elts] == list(schema.contents().get('properties', {}))
+
   def test_schemas_to_module_def(self, open_api_spec):
     """Test the schemas_to_module_def function with appropriate schema groupings."""
     # Get the components/schemas section which contains all schema definitions
@@ -0,0 +1,113 @@
+"""Tests for the Arrow, Parquet and Feather exports of paginated responses."""
+
+import json
+
+import pytest
+
+from dialpad.arrow_export import arrow_schema, export_feather, export_parquet, iter_record_batches
+from dialpad.client import DialpadClient
+from dialpad.schemas.call import CallProto
+from dialpad.schemas.number import SwapNumberMessage
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+CALLS_URL = 'https://dialpad.com/api/v2/call'
+
+PAGES = {
+  None: {
+    'items': [
+      {
+        'call_id': 1,
+        'direction': 'inbound',
+        'duration': 1500.0,
+        'contact': {'id': '10', 'name': 'Jane'},
+        'labels': ['support'],
+        'state': 'hangup',
+      },
+      # 64-bit integers may be sent as strings.
+      {'call_id': '2', 'contact': {'id': '11'}},
+    ],
+    'cursor': 'abc',
+  },
+  'abc': {
+    'items': [{'call_id': 3, 'routing_breadcrumbs': [{'request': {'a': 1}, 'target_id': '7'}]}]
+  },
+}
+
+
+@pytest.fixture
+def calls_api(requests_mock):
+  return requests_mock.get(
+    CALLS_URL,
+    content=lambda request, context: json.dumps(PAGES[request.qs.get('cursor', [None])[0]]).encode(
+      'utf-8'
+    ),
+  )
+
+
+class TestArrowSchema:
+  def test_call_schema(self):
+    schema = arrow_schema(CallProto)
+    assert schema.field('call_id').type == pa.int64()
+    assert schema.field('duration').type == pa.float64()
+    assert schema.field('was_recorded').type == pa.bool_()
+    assert schema.field('labels').type == pa.list_(pa.string())
+    assert schema.field('state').type == pa.string()
+    assert pa.types.is_struct(schema.field('contact').type)
+    assert schema.field('contact').type.field('name').type == pa.string()
+
+    breadcrumb = schema.field('routing_breadcrumbs').type.value_type
+    assert breadcrumb.field('request').type == pa.string()
+
+  def test_union_and_enum_schema(self):
+    schema = arrow_schema(SwapNumberMessage)
+    assert schema.field('swap_details').type == pa.string()
+    target_type = schema.field('target').type.field('target_type').type
+    assert target_type == pa.dictionary(pa.int32(), pa.string())
+
+    with pytest.raises(TypeError):
+      arrow_schema(dict)
+
+
+class TestExport:
+  def test_record_batches(self, calls_api):
+    dp = DialpadClient('123')
+    batches = list(iter_record_batches(dp.calls.list(), CallProto))
+    assert len(batches) == 1
+    table = pa.Table.from_batches(batches)
+    assert table.column('call_id').to_pylist() == [1, 2, 3]
+    assert table.column('contact').to_pylist()[1]['id'] == '11'
+    assert table.column('state').to_pylist() == ['hangup', None, None]
+    assert table.column('routing_breadcrumbs').to_pylist()[2][0]['request'] == '{"a": 1}'
+    assert table.column('routing_breadcrumbs').to_pylist()[2][0]['target_id'] == 7
+
+    # Batches are cut once they reach the batch size.
+    batches = list(iter_record_batches(dp.calls.list(), CallProto, batch_size=1))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+
+  def test_models(self, calls_api):
+    dp = DialpadClient('123', models=True)
+    batches = list(
+      iter_record_batches(dp.iter_pages('GET', '/api/v2/call', operation_id='call.list'), CallProto)
+    )
+    assert pa.Table.from_batches(batches).column('call_id').to_pylist() == [1, 2, 3]
+
+  def test_parquet(self, calls_api, tmp_path):
+    dp = DialpadClient('123')
+    path = str(tmp_path / 'calls.parquet')
+    assert export_parquet(dp.calls.list(), path, CallProto, row_group_size=2) == 3
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.read().column('direction').to_pylist() == ['inbound', None, None]
+
+  def test_feather(self, calls_api, tmp_path):
+    dp = DialpadClient('123')
+    path = str(tmp_path / 'calls.feather')
+    assert export_feather(dp.calls.list(), path, CallProto, compression='zstd') == 3
+
+    with pa.memory_map(path) as source:
+      table = pa.ipc.open_file(source).read_all()
+    assert table.schema == arrow_schema(CallProto)
+    assert table.column('call_id').to_pylist() == [1, 2, 3]
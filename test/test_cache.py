@@ -0,0 +1,146 @@
+"""Tests for the response cache, and its use by the sync and async clients."""
+
+import httpx
+import pytest
+
+from dialpad import cache as cache_module
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.cache import MISS, ResponseCache
+from dialpad.client import DialpadClient
+
+USER_URL = 'https://dialpad.com/api/v2/users/1'
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 0.0
+
+  def monotonic(self) -> float:
+    return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+  fake = FakeClock()
+  monkeypatch.setattr(cache_module.time, 'monotonic', fake.monotonic)
+  return fake
+
+
+class TestResponseCache:
+  def test_key(self):
+    key = ResponseCache.key('get', 'api/v2/users/1/', {'b': 1, 'a': None}, 123)
+    assert key == ResponseCache.key('GET', '/api/v2/users/1', {'a': None, 'b': 1}, '123')
+    assert key != ResponseCache.key('GET', '/api/v2/users/1', {'a': None, 'b': 1})
+
+  def test_ttls(self, clock):
+    cache = ResponseCache(ttl=0, ttls={'users': 60, 'users.get_e911_address': 5})
+    assert cache.ttl_for('users.get') == 60
+    assert cache.ttl_for('users.get_e911_address') == 5
+    assert cache.ttl_for('offices.get') == 0
+    assert cache.ttl_for(None) == 0
+
+    cache.set('user', {'id': 1}, 'users.get')
+    cache.set('office', {'id': 2}, 'offices.get')
+    assert cache.get('user') == {'id': 1}
+    assert cache.get('office') is MISS
+
+    clock.now = 60
+    assert cache.get('user') is MISS
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 0)
+
+  def test_lru_eviction(self):
+    cache = ResponseCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is MISS
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+    with pytest.raises(ValueError):
+      ResponseCache(maxsize=0)
+
+  def test_copies(self):
+    cache = ResponseCache()
+    user = {'id': 1, 'emails': ['a@example.com']}
+    cache.set('user', user)
+    user['emails'].append('b@example.com')
+    cache.get('user')['emails'].clear()
+    assert cache.get('user') == {'id': 1, 'emails': ['a@example.com']}
+
+  def test_invalidate(self):
+    cache = ResponseCache()
+    for path in (
+      '/api/v2/users/1',
+      '/api/v2/users/1/devices',
+      '/api/v2/users/12',
+      '/api/v2/offices/1',
+    ):
+      cache.set(cache.key('GET', path), path)
+
+    generation = cache.generation
+    cache.invalidate('/api/v2/users/1/')
+    assert len(cache) == 2
+    assert cache.get(cache.key('GET', '/api/v2/users/12')) == '/api/v2/users/12'
+
+    # A response that was requested before the invalidation isn't cached.
+    cache.set(cache.key('GET', '/api/v2/users/1'), 'stale', generation=generation)
+    assert cache.get(cache.key('GET', '/api/v2/users/1')) is MISS
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+class TestClientCache:
+  def test_sync(self, requests_mock):
+    requests_mock.get(USER_URL, json={'id': 1, 'state': 'active'})
+    requests_mock.patch(USER_URL, json={'id': 1, 'state': 'suspended'})
+    cache = ResponseCache(ttl=0, ttls={'users': 60})
+    dp = DialpadClient('123', cache=cache)
+
+    assert dp.users.get('1') == {'id': 1, 'state': 'active'}
+    assert dp.users.get('1') == {'id': 1, 'state': 'active'}
+    assert requests_mock.call_count == 1
+
+    # Requests on behalf of another company are cached separately.
+    dp.company_id = '456'
+    dp.users.get('1')
+    assert requests_mock.call_count == 2
+
+    dp.users.partial_update('1', {'state': 'suspended'})
+    requests_mock.get(USER_URL, json={'id': 1, 'state': 'suspended'})
+    assert dp.users.get('1') == {'id': 1, 'state': 'suspended'}
+    assert requests_mock.call_count == 4
+
+    # Uncached resources always hit the API.
+    requests_mock.get('https://dialpad.com/api/v2/offices/1', json={'id': 1})
+    dp.offices.get('1')
+    dp.offices.get('1')
+    assert requests_mock.call_count == 6
+
+  @pytest.mark.asyncio
+  async def test_async(self, httpx_mock):
+    httpx_mock.add_response(method='GET', url=USER_URL, json={'id': 1}, is_reusable=True)
+    httpx_mock.add_response(method='DELETE', url=USER_URL, json={'id': 1})
+    dp = AsyncDialpadClient('123', cache=ResponseCache())
+
+    assert await dp.users.get('1') == {'id': 1}
+    assert await dp.users.get('1') == {'id': 1}
+    assert len(httpx_mock.get_requests()) == 1
+
+    await dp.users.delete('1')
+    await dp.users.get('1')
+    assert len(httpx_mock.get_requests()) == 3
+
+  @pytest.mark.asyncio
+  async def test_failed_write_still_invalidates(self, httpx_mock):
+    httpx_mock.add_response(method='GET', url=USER_URL, json={'id': 1}, is_reusable=True)
+    httpx_mock.add_response(method='DELETE', url=USER_URL, status_code=500)
+    cache = ResponseCache()
+    dp = AsyncDialpadClient('123', cache=cache)
+
+    await dp.users.get('1')
+    with pytest.raises(httpx.HTTPStatusError):
+      await dp.users.delete('1')
+    assert len(cache) == 0
@@ -0,0 +1,113 @@
+"""Tests for the time-sharded parallel call export."""
+
+import time
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.call_export import _shards, export_calls, export_calls_async
+from dialpad.client import DialpadClient
+
+CALLS_URL = 'https://dialpad.com/api/v2/call'
+PAGE_SIZE = 2
+
+# A sparse first half of the range, and a dense second half.
+CALL_TIMES = list(range(0, 50_000, 10_000)) + list(range(50_000, 100_000, 1_000))
+
+
+def fake_call_list(url: str) -> dict:
+  """Mimics GET /api/v2/call over CALL_TIMES, returning reverse-chronological pages."""
+  query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+  after, before = int(query['started_after']), int(query['started_before'])
+  offset = int(query.get('cursor', 0))
+
+  matches = sorted((t for t in CALL_TIMES if after < t < before), reverse=True)
+  page = {
+    'items': [{'call_id': t, 'date_started': t} for t in matches[offset : offset + PAGE_SIZE]]
+  }
+  if offset + PAGE_SIZE < len(matches):
+    page['cursor'] = str(offset + PAGE_SIZE)
+  return page
+
+
+def test_shards():
+  assert list(_shards(-1, 10, 4)) == [(6, 10), (2, 6), (0, 2)]
+
+
+def test_export_calls(requests_mock):
+  requests_mock.get(CALLS_URL, json=lambda request, context: fake_call_list(request.url))
+  dp = DialpadClient('123')
+
+  calls = export_calls(
+    dp,
+    -1,
+    100_000,
+    window_ms=25_000,
+    min_window_ms=1_000,
+    split_pages=3,
+    max_workers=3,
+    part_pages=2,
+  )
+  assert [c['call_id'] for c in calls] == sorted(CALL_TIMES, reverse=True)
+
+  # The dense shards should have been split into narrower windows.
+  windows = {
+    int(r.qs['started_before'][0]) - int(r.qs['started_after'][0])
+    for r in requests_mock.request_history
+  }
+  assert min(windows) < 25_000
+
+
+def test_export_calls_filters(requests_mock):
+  requests_mock.get(CALLS_URL, json={'items': []})
+  dp = DialpadClient('123')
+
+  assert list(export_calls(dp, 0, 100, target_id=1, target_type='office')) == []
+  assert requests_mock.last_request.qs['target_type'] == ['office']
+
+
+def test_export_calls_early_exit(requests_mock):
+  requests_mock.get(CALLS_URL, json=lambda request, context: fake_call_list(request.url))
+  dp = DialpadClient('123')
+
+  calls = export_calls(dp, -1, 100_000, window_ms=1_000, max_workers=2)
+  assert next(calls)['call_id'] == 99_000
+  calls.close()
+
+  # The shards that were queued up are cancelled, and the running ones stop after their page.
+  time.sleep(0.05)
+  requested = requests_mock.call_count
+  assert requested <= 5
+  time.sleep(0.05)
+  assert requests_mock.call_count == requested
+
+
+def test_export_calls_models(requests_mock):
+  requests_mock.get(CALLS_URL, json=lambda request, context: fake_call_list(request.url))
+  dp = DialpadClient('123', models=True)
+
+  calls = list(export_calls(dp, 49_000, 60_000, split_pages=1, min_window_ms=1_000, part_pages=1))
+  assert [c.call_id for c in calls] == sorted(range(50_000, 60_000, 1_000), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_export_calls_async(httpx_mock):
+  httpx_mock.add_callback(
+    lambda request: httpx.Response(200, json=fake_call_list(str(request.url))),
+    is_reusable=True,
+  )
+  dp = AsyncDialpadClient('123')
+
+  calls = export_calls_async(
+    dp,
+    -1,
+    100_000,
+    window_ms=25_000,
+    min_window_ms=1_000,
+    split_pages=3,
+    concurrency=3,
+    part_pages=2,
+  )
+  assert [c['call_id'] async for c in calls] == sorted(CALL_TIMES, reverse=True)
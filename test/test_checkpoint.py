@@ -0,0 +1,232 @@
+"""Tests for resumable paginated iterators and the checkpoint stores."""
+
+import json
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.checkpoint import (
+  Checkpoint,
+  FileCheckpointStore,
+  SQLiteCheckpointStore,
+  checkpoint_key,
+)
+from dialpad.client import DialpadClient
+
+CONTACTS_URL = 'https://dialpad.com/api/v2/contacts'
+
+# Three pages of two contacts each.
+PAGES = {
+  None: {'items': [{'id': '1'}, {'id': '2'}], 'cursor': 'c2'},
+  'c2': {'items': [{'id': '3'}, {'id': '4'}], 'cursor': 'c3'},
+  'c3': {'items': [{'id': '5'}, {'id': '6'}]},
+}
+
+
+def fake_page(request_url: str) -> bytes:
+  cursor = dict(httpx.URL(request_url).params).get('cursor') or None
+  return json.dumps(PAGES[cursor]).encode('utf-8')
+
+
+@pytest.fixture
+def contacts_api(requests_mock):
+  return requests_mock.get(CONTACTS_URL, content=lambda request, context: fake_page(request.url))
+
+
+@pytest.fixture(params=['file', 'sqlite'])
+def store(request, tmp_path):
+  if request.param == 'file':
+    return FileCheckpointStore(str(tmp_path / 'checkpoints.json'))
+  return SQLiteCheckpointStore(str(tmp_path / 'checkpoints.db'))
+
+
+class TestCheckpointStores:
+  def test_round_trip(self, store):
+    assert store.load('a') is None
+
+    store.save('a', Checkpoint('c2', 1, 0))
+    store.save('b', Checkpoint('c3', 2, 1))
+    store.save('a', Checkpoint('c3', 2, 0))
+    assert store.load('a') == Checkpoint('c3', 2, 0)
+    assert store.load('b') == Checkpoint('c3', 2, 1)
+
+    store.clear('a')
+    store.clear('a')
+    assert store.load('a') is None
+    assert store.load('b') == Checkpoint('c3', 2, 1)
+
+  def test_sqlite_table_name(self, tmp_path):
+    with pytest.raises(ValueError):
+      SQLiteCheckpointStore(str(tmp_path / 'checkpoints.db'), table='x; DROP TABLE y')
+
+  def test_checkpoint_key(self):
+    key = checkpoint_key('get', 'api/v2/contacts/', {'cursor': 'c2', 'owner_id': 1}, 123)
+    assert key == checkpoint_key('GET', '/api/v2/contacts', {'owner_id': 1, 'cursor': None}, '123')
+    assert key != checkpoint_key('GET', '/api/v2/contacts', {'owner_id': 2}, '123')
+
+  def test_checkpoint_dict(self):
+    checkpoint = Checkpoint('c2', 1, 1)
+    assert Checkpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict()))) == checkpoint
+    assert not Checkpoint().done
+    assert Checkpoint(None, 3).done
+
+
+class TestResume:
+  @pytest.mark.parametrize('stream', [False, True])
+  def test_position(self, contacts_api, stream):
+    dp = DialpadClient('123', stream_pages=stream)
+    contacts = dp.contacts.list()
+    assert contacts.checkpoint == Checkpoint()
+
+    assert next(contacts)['id'] == '1'
+    assert next(contacts)['id'] == '2'
+    assert (contacts.cursor, contacts.pages, contacts.offset) == (None, 0, 2)
+    assert next(contacts)['id'] == '3'
+    assert contacts.checkpoint == Checkpoint('c2', 1, 1)
+
+    assert [c['id'] for c in contacts] == ['4', '5', '6']
+    assert contacts.checkpoint == Checkpoint(None, 3, 0)
+
+  @pytest.mark.parametrize('prefetch', [0, 2])
+  def test_resume_from_checkpoint(self, contacts_api, prefetch):
+    dp = DialpadClient('123', prefetch_pages=prefetch)
+    contacts = dp.contacts.list()
+    assert [next(contacts)['id'] for _ in range(3)] == ['1', '2', '3']
+    checkpoint = contacts.checkpoint
+    contacts.close()
+
+    resumed = dp.contacts.list().resume(checkpoint)
+    assert [c['id'] for c in resumed] == ['4', '5', '6']
+    assert contacts_api.last_request.qs['cursor'] == ['c3']
+
+    # A finished iteration has nothing left to resume.
+    assert list(dp.contacts.list().resume(resumed.checkpoint)) == []
+
+    items = dp.iter_request('GET', '/api/v2/contacts', checkpoint=Checkpoint('c3', 2, 0))
+    assert [c['id'] for c in items] == ['5', '6']
+
+  def test_resume_after_start(self, contacts_api):
+    dp = DialpadClient('123')
+    contacts = dp.contacts.list()
+    next(contacts)
+    with pytest.raises(RuntimeError):
+      contacts.resume(Checkpoint('c2', 1))
+
+  def test_store(self, requests_mock, store):
+    requests_mock.get(
+      CONTACTS_URL,
+      [
+        {'content': fake_page(f'{CONTACTS_URL}')},
+        {'content': fake_page(f'{CONTACTS_URL}?cursor=c2')},
+        {'status_code': 500},
+        {'content': fake_page(f'{CONTACTS_URL}?cursor=c3')},
+      ],
+    )
+    dp = DialpadClient('123', checkpoint_store=store)
+    key = checkpoint_key('GET', '/api/v2/contacts', {}, None)
+
+    seen = []
+    with pytest.raises(Exception):
+      for contact in dp.contacts.list():
+        seen.append(contact['id'])
+    assert seen == ['1', '2', '3', '4']
+    assert store.load(key) == Checkpoint('c3', 2, 0)
+
+    # The next iteration picks up where the last one failed, and clears the checkpoint at the end.
+    assert [c['id'] for c in dp.contacts.list()] == ['5', '6']
+    assert requests_mock.last_request.qs['cursor'] == ['c3']
+    assert store.load(key) is None
+
+  def test_models(self, contacts_api):
+    dp = DialpadClient('123', models=True)
+    contacts = dp.contacts.list().resume(Checkpoint('c2', 1, 1))
+    assert [c.id for c in contacts] == ['4', '5', '6']
+
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize('stream', [False, True])
+  async def test_async(self, httpx_mock, tmp_path, stream):
+    httpx_mock.add_callback(
+      lambda request: httpx.Response(200, content=fake_page(str(request.url))), is_reusable=True
+    )
+    store = FileCheckpointStore(str(tmp_path / 'checkpoints.json'))
+    dp = AsyncDialpadClient('123', stream_pages=stream, checkpoint_store=store)
+
+    contacts = dp.contacts.list()
+    assert [await contacts.__anext__() for _ in range(3)] == [{'id': '1'}, {'id': '2'}, {'id': '3'}]
+    assert contacts.checkpoint == Checkpoint('c2', 1, 1)
+    await contacts.aclose()
+    assert store.load(checkpoint_key('GET', '/api/v2/contacts')) == Checkpoint('c2', 1, 0)
+
+    assert [c['id'] async for c in dp.contacts.list()] == ['3', '4', '5', '6']
+    resumed = dp.contacts.list().resume(Checkpoint('c3', 2, 1))
+    assert [c['id'] async for c in resumed] == ['6']
+
+
+class TestIterPages:
+  @pytest.mark.parametrize('stream', [False, True])
+  def test_pages(self, contacts_api, stream):
+    dp = DialpadClient('123', stream_pages=stream)
+    pages = list(dp.contacts.list().iter_pages())
+    assert pages == [PAGES[None], PAGES['c2'], dict(PAGES['c3'], cursor=None)]
+
+    pages = list(dp.iter_pages('GET', '/api/v2/contacts', max_pages=2))
+    assert [p['cursor'] for p in pages] == ['c2', 'c3']
+    assert contacts_api.call_count == 5
+
+  def test_limit(self, contacts_api):
+    dp = DialpadClient('123')
+    contacts = dp.contacts.list()
+    pages = list(contacts.iter_pages(limit=3))
+    assert [[c['id'] for c in p['items']] for p in pages] == [['1', '2'], ['3']]
+    assert contacts.checkpoint == Checkpoint('c2', 1, 1)
+    assert contacts_api.call_count == 2
+
+    # Resuming from part-way through a page only returns the rest of it.
+    pages = dp.iter_pages('GET', '/api/v2/contacts', checkpoint=contacts.checkpoint, limit=2)
+    assert [[c['id'] for c in p['items']] for p in pages] == [['4'], ['5']]
+
+    pages = dp.iter_pages('GET', '/api/v2/contacts', limit=4)
+    assert [len(p['items']) for p in pages] == [2, 2]
+    assert list(dp.iter_pages('GET', '/api/v2/contacts', limit=0)) == []
+
+    contacts = dp.iter_request('GET', '/api/v2/contacts', limit=3)
+    assert [c['id'] for c in contacts] == ['1', '2', '3']
+    assert list(dp.iter_request('GET', '/api/v2/contacts', limit=0)) == []
+
+  def test_limit_param(self, requests_mock):
+    requests_mock.get(CONTACTS_URL, json={'items': [{'id': '1'}]})
+    dp = DialpadClient('123')
+    items = dp.iter_request('GET', '/api/v2/contacts', params={'limit': None}, limit=10)
+    assert list(items) == [{'id': '1'}]
+    assert requests_mock.last_request.qs['limit'] == ['10']
+
+  def test_started(self, contacts_api):
+    dp = DialpadClient('123')
+    contacts = dp.contacts.list()
+    next(contacts)
+    with pytest.raises(RuntimeError):
+      contacts.iter_pages()
+
+  def test_models(self, contacts_api):
+    dp = DialpadClient('123', models=True)
+    pages = list(dp.contacts.list().iter_pages(max_pages=1))
+    assert [c.id for c in pages[0].items] == ['1', '2']
+    assert pages[0].cursor == 'c2'
+
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize('stream', [False, True])
+  async def test_async(self, httpx_mock, stream):
+    httpx_mock.add_callback(
+      lambda request: httpx.Response(200, content=fake_page(str(request.url))), is_reusable=True
+    )
+    dp = AsyncDialpadClient('123', stream_pages=stream)
+
+    pages = [p async for p in dp.contacts.list().iter_pages(limit=5)]
+    assert [[c['id'] for c in p['items']] for p in pages] == [['1', '2'], ['3', '4'], ['5']]
+
+    pages = [p async for p in dp.iter_pages('GET', '/api/v2/contacts', max_pages=1)]
+    assert pages == [PAGES[None]]
+
+    contacts = dp.iter_request('GET', '/api/v2/contacts', limit=1)
+    assert [c async for c in contacts] == [{'id': '1'}]
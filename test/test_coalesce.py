@@ -0,0 +1,130 @@
+"""Tests for the single-flight coalescing of concurrent identical GET requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.coalesce import AsyncSingleFlight, SingleFlight
+
+USER_URL = 'https://dialpad.com/api/v2/users/1'
+
+
+class TestSingleFlight:
+  def test_concurrent_calls_share_a_result(self):
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+      calls.append(1)
+      release.wait(5)
+      return 'result'
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+      futures = [pool.submit(flight.do, 'key', fetch) for _ in range(8)]
+      while flight.coalesced < 7:
+        time.sleep(0.001)
+      release.set()
+
+    assert [f.result() for f in futures] == ['result'] * 8
+    assert len(calls) == 1
+
+    # Once the call completes, the next one is made afresh.
+    assert flight.do('key', lambda: 'next') == 'next'
+
+  def test_exceptions_are_shared(self):
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+      release.wait(5)
+      raise ValueError('nope')
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+      futures = [pool.submit(flight.do, 'key', fail) for _ in range(2)]
+      while not flight.coalesced:
+        time.sleep(0.001)
+      release.set()
+
+    for future in futures:
+      with pytest.raises(ValueError):
+        future.result()
+
+  @pytest.mark.asyncio
+  async def test_async_concurrent_calls_share_a_result(self):
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+      calls.append(1)
+      await asyncio.sleep(0.01)
+      return 'result'
+
+    assert await asyncio.gather(*[flight.do('key', fetch) for _ in range(10)]) == ['result'] * 10
+    assert len(calls) == 1
+    assert flight.coalesced == 9
+
+  @pytest.mark.asyncio
+  async def test_async_cancelling_the_first_caller(self):
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+      await asyncio.sleep(0.01)
+      return 'result'
+
+    first = asyncio.ensure_future(flight.do('key', fetch))
+    second = asyncio.ensure_future(flight.do('key', fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 'result'
+    with pytest.raises(asyncio.CancelledError):
+      await first
+
+
+class TestClientCoalescing:
+  def test_sync(self, requests_mock):
+    release = threading.Event()
+
+    def respond(request, context):
+      release.wait(5)
+      return {'id': 1}
+
+    requests_mock.get(USER_URL, json=respond)
+    dp = DialpadClient('123', coalesce_requests=True)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+      futures = [pool.submit(dp.users.get, '1') for _ in range(8)]
+      while dp._single_flight.coalesced < 7:
+        time.sleep(0.001)
+      release.set()
+
+    users = [f.result() for f in futures]
+    assert users == [{'id': 1}] * 8
+    assert requests_mock.call_count == 1
+
+    # Each caller gets its own copy of the response.
+    assert users[0] is not users[1]
+
+  @pytest.mark.asyncio
+  async def test_async(self, httpx_mock):
+    async def respond(request):
+      await asyncio.sleep(0.01)
+      return httpx.Response(200, json={'id': 1})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    dp = AsyncDialpadClient('123', coalesce_requests=True)
+
+    users = await asyncio.gather(*[dp.users.get('1') for _ in range(200)])
+    assert users == [{'id': 1}] * 200
+    assert len(httpx_mock.get_requests()) == 1
+
+    # Writes are never coalesced.
+    await asyncio.gather(dp.users.delete('1'), dp.users.delete('1'))
+    assert len(httpx_mock.get_requests()) == 3
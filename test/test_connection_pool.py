@@ -0,0 +1,111 @@
+"""Tests for the connection pool, timeout and lifecycle configuration of the clients."""
+
+import sys
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient, build_session
+
+USER_URL = 'https://dialpad.com/api/v2/users/1'
+
+
+class TestConnectionPool:
+  def test_pool_sizing(self):
+    dp = DialpadClient('123', pool_connections=4, pool_maxsize=32)
+    adapter = dp._session.get_adapter('https://dialpad.com')
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+
+  def test_pool_stats(self):
+    dp = DialpadClient('123', pool_maxsize=32)
+    assert dp.pool_stats() == {}
+
+    # Opening a pool doesn't make any requests, but should show up in the stats.
+    dp._session.get_adapter('https://dialpad.com').poolmanager.connection_from_url(
+      'https://dialpad.com'
+    )
+    assert dp.pool_stats() == {
+      'https://dialpad.com:443': {'connections': 0, 'requests': 0, 'idle': 0, 'maxsize': 32}
+    }
+
+  def test_timeouts_and_keep_alive(self, requests_mock):
+    requests_mock.get(USER_URL, json={'id': 1})
+
+    dp = DialpadClient('123', timeout=(3.05, 30))
+    dp.users.get('1')
+    assert requests_mock.last_request.timeout == (3.05, 30)
+    assert requests_mock.last_request.headers['Connection'] == 'keep-alive'
+
+    dp = DialpadClient('123', keep_alive=False)
+    dp.users.get('1')
+    assert requests_mock.last_request.headers['Connection'] == 'close'
+
+  def test_shared_session(self, requests_mock, monkeypatch):
+    requests_mock.get(USER_URL, json={'id': 1})
+    session = build_session(pool_maxsize=64)
+    closed = []
+    monkeypatch.setattr(session, 'close', lambda: closed.append(True))
+
+    with DialpadClient('123', session=session) as dp1, DialpadClient('456', session=session) as dp2:
+      assert dp1._session is dp2._session
+      dp1.users.get('1')
+      dp2.users.get('1')
+
+    # Closing the clients shouldn't close a session that they don't own.
+    assert closed == []
+
+  def test_close(self, monkeypatch):
+    closed = []
+    with DialpadClient('123') as dp:
+      monkeypatch.setattr(dp._session, 'close', lambda: closed.append(True))
+
+    assert closed == [True]
+
+
+class TestAsyncConnectionPool:
+  def test_limits_and_timeouts(self):
+    limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    dp = AsyncDialpadClient('123', limits=limits, timeout=(3.05, 30))
+    pool = dp._session._transport._pool
+    assert pool._max_connections == 50
+    assert pool._max_keepalive_connections == 20
+    assert dp._session.timeout == httpx.Timeout(30, connect=3.05)
+
+    # The default timeout is unchanged.
+    assert AsyncDialpadClient('123')._session.timeout == httpx.Timeout(600.0)
+
+  def test_http2_requires_h2(self, monkeypatch):
+    # Blocks the import of h2, whether or not it's installed.
+    monkeypatch.setitem(sys.modules, 'h2', None)
+    with pytest.raises(ImportError, match=r'python-dialpad\[http2\]'):
+      AsyncDialpadClient('123', http2=True)
+
+  def test_http2(self):
+    pytest.importorskip('h2')
+    assert AsyncDialpadClient('123', http2=True)._session._transport._pool._http2
+
+  @pytest.mark.asyncio
+  async def test_operation_timeouts(self, httpx_mock):
+    httpx_mock.add_response(json={'items': []}, is_reusable=True)
+
+    async with AsyncDialpadClient('123', timeout=10, operation_timeouts={'users.get': 2.5}) as dp:
+      await dp.users.get('1')
+      assert [u async for u in dp.users.list()] == []
+
+    get_request, list_request = httpx_mock.get_requests()
+    assert get_request.extensions['timeout']['read'] == 2.5
+    assert list_request.extensions['timeout']['read'] == 10
+
+  @pytest.mark.asyncio
+  async def test_aclose(self):
+    async with AsyncDialpadClient('123') as dp:
+      pass
+    assert dp._session.is_closed
+
+    session = httpx.AsyncClient()
+    async with AsyncDialpadClient('123', session=session) as dp:
+      assert dp._session is session
+    assert not session.is_closed
+    await session.aclose()
@@ -0,0 +1,179 @@
+"""Tests for syncing contacts with local diffing."""
+
+import json
+import re
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.contact_sync import (
+  ContactIndex,
+  contact_hash,
+  default_key,
+  diff_contacts,
+  sync_contacts,
+  sync_contacts_async,
+)
+
+CONTACTS_URL = 'https://dialpad.com/api/v2/contacts'
+CONTACT_URL = re.compile(r'https://dialpad\.com/api/v2/contacts/(\w+)$')
+
+EXISTING = [
+  {'id': 'c1', 'first_name': 'Jane', 'last_name': 'Doe', 'emails': ['Jane@example.com']},
+  {'id': 'c2', 'first_name': 'John', 'last_name': 'Doe', 'emails': ['john@example.com']},
+  {'id': 'c3', 'first_name': 'Gone', 'last_name': 'Away', 'phones': ['+15550000003']},
+  # Contacts without an email or a phone can't be matched, so they're left alone.
+  {'id': 'c4', 'first_name': 'No', 'last_name': 'Key'},
+]
+
+RECORDS = [
+  # Unchanged, apart from the case of the email.
+  {'uid': '1', 'first_name': 'Jane', 'last_name': 'Doe', 'emails': ['jane@EXAMPLE.com']},
+  {'uid': '2', 'first_name': 'John', 'last_name': 'Smith', 'emails': ['john@example.com']},
+  {'uid': '5', 'first_name': 'New', 'last_name': 'Person', 'phones': ['+15550000005']},
+  {'uid': '6', 'first_name': 'Fails', 'last_name': 'Create', 'phones': ['+15550000006']},
+  # A duplicate of the record for John.
+  {'uid': '2', 'first_name': 'John', 'last_name': 'Other', 'emails': ['john@example.com']},
+]
+
+
+def respond(method: str, url: str, body):
+  if url.startswith(CONTACTS_URL) and method == 'GET':
+    if 'cursor=next' in url:
+      return 200, {'items': EXISTING[2:]}
+    return 200, {'items': EXISTING[:2], 'cursor': 'next'}
+  if method == 'PUT':
+    if body['first_name'] == 'Fails':
+      return 400, {'error': 'Invalid'}
+    return 200, {'id': f'new{body["uid"]}', **body}
+  contact_id = CONTACT_URL.match(url).group(1)
+  return 200, {'id': contact_id, 'method': method, **(body or {})}
+
+
+def check_results(results):
+  results = {(result.action, result.key): result for result in results}
+  # Since a create failed, the missing contact isn't deleted.
+  assert sorted(results) == [
+    ('create', '+15550000005'),
+    ('create', '+15550000006'),
+    ('update', 'john@example.com'),
+  ]
+  assert results['create', '+15550000005'].contact_id == 'new5'
+  assert results['create', '+15550000006'].error is not None
+
+  update = results['update', 'john@example.com'].response
+  if not isinstance(update, dict):
+    update = update.to_dict()
+  # Only the changed field is sent.
+  assert (update['id'], update['last_name']) == ('c2', 'Smith')
+  assert update.get('first_name') is None
+
+
+def test_diff():
+  index = ContactIndex(EXISTING)
+  assert len(index) == 3
+  assert default_key(RECORDS[0]) == default_key(EXISTING[0]) == 'jane@example.com'
+  assert contact_hash({'first_name': 'a', 'urls': []}) == contact_hash({'first_name': 'a'})
+
+  actions = list(diff_contacts(index, RECORDS))
+  assert [(a.action, a.key) for a in actions] == [
+    ('update', 'john@example.com'),
+    ('create', '+15550000005'),
+    ('create', '+15550000006'),
+  ]
+  assert (actions[0].contact_id, actions[0].body) == ('c2', {'last_name': 'Smith'})
+
+
+def test_diff_omitted_fields():
+  existing = {
+    'id': 'c1',
+    'first_name': 'Jane',
+    'last_name': 'Doe',
+    'job_title': 'CEO',
+    'emails': ['jane@example.com'],
+    'phones': ['+15550000001'],
+  }
+  index = ContactIndex([existing])
+
+  # Fields that a record leaves out are left alone, rather than cleared.
+  assert list(diff_contacts(index, [{'first_name': 'Jane', 'emails': ['jane@example.com']}])) == []
+
+  # Those that it explicitly empties are cleared, and only the changed fields are sent.
+  record = {
+    'first_name': 'Janet',
+    'last_name': 'Doe',
+    'job_title': None,
+    'phones': [],
+    'emails': ['JANE@example.com'],
+  }
+  (action,) = diff_contacts(index, [record])
+  assert (action.action, action.contact_id) == ('update', 'c1')
+  assert action.body == {'first_name': 'Janet', 'job_title': '', 'phones': []}
+
+
+def test_sync_contacts(requests_mock):
+  def callback(request, context):
+    body = request.json() if request.body else None
+    context.status_code, response = respond(request.method, request.url, body)
+    return response
+
+  for method in ('GET', 'PUT'):
+    requests_mock.register_uri(method, CONTACTS_URL, json=callback)
+  for method in ('PATCH', 'DELETE'):
+    requests_mock.register_uri(method, CONTACT_URL, json=callback)
+
+  dp = DialpadClient('123', models=True)
+  check_results(sync_contacts(dp, iter(RECORDS), delete_missing=True, max_workers=2))
+  assert requests_mock.request_history[0].qs == {}
+
+  # Nothing is sent when nothing has changed.
+  requests_mock.reset()
+  index = ContactIndex(EXISTING)
+  assert list(sync_contacts(dp, RECORDS[:1], index=index)) == []
+  assert requests_mock.call_count == 0
+
+
+def test_sync_contacts_changed_email(requests_mock):
+  contacts = [
+    {'id': 'c1', 'first_name': 'Jane', 'emails': ['a@example.com']},
+    {'id': 'c2', 'first_name': 'Gone', 'emails': ['gone@example.com']},
+  ]
+  requests_mock.get(CONTACTS_URL, json={'items': contacts})
+  # The record is created by its uid, which Dialpad applies to the existing contact.
+  requests_mock.put(CONTACTS_URL, json={'id': 'c1', 'emails': ['b@example.com']})
+  requests_mock.delete(CONTACT_URL, json={})
+
+  records = [{'uid': '42', 'first_name': 'Jane', 'emails': ['b@example.com']}]
+  actions = list(diff_contacts(ContactIndex(contacts), records, delete_missing=True))
+  assert [(a.action, a.contact_id) for a in actions] == [
+    ('create', None),
+    ('delete', 'c1'),
+    ('delete', 'c2'),
+  ]
+
+  results = sync_contacts(DialpadClient('123'), records, delete_missing=True)
+  assert [(r.action, r.contact_id) for r in results] == [('create', 'c1'), ('delete', 'c2')]
+  assert requests_mock.request_history[-1].url.endswith('/contacts/c2')
+
+
+@pytest.mark.asyncio
+async def test_sync_contacts_async(httpx_mock):
+  def callback(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content) if request.content else None
+    status, response = respond(request.method, str(request.url), body)
+    return httpx.Response(status, json=response)
+
+  httpx_mock.add_callback(callback, is_reusable=True)
+  dp = AsyncDialpadClient('123')
+
+  async def records():
+    for record in RECORDS:
+      yield record
+
+  check_results([r async for r in sync_contacts_async(dp, records(), delete_missing=True)])
+
+  index = await ContactIndex.fetch_async(dp)
+  results = [r async for r in sync_contacts_async(dp, RECORDS[2:3], index=index)]
+  assert [(r.action, r.contact_id) for r in results] == [('create', 'new5')]
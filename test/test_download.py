@@ -0,0 +1,131 @@
+"""Tests for streaming downloads and the incremental CSV parser."""
+
+import gzip
+
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.download import CSVRecordParser, GzipDecoder, aiter_csv_records, iter_csv_records
+
+DOWNLOAD_URL = 'https://storage.example.com/stats.csv'
+
+CSV_BODY = (
+  '\ufeffdate,user,notes\r\n2024-01-01,Jane,"said ""hi""\r\nthen left"\r\n\r\n2024-01-02,Zoë,'
+)
+ROWS = [
+  {'date': '2024-01-01', 'user': 'Jane', 'notes': 'said "hi"\nthen left'},
+  {'date': '2024-01-02', 'user': 'Zoë', 'notes': ''},
+]
+
+
+def chunked(data: bytes, size: int) -> list:
+  return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+async def achunked(data: bytes, size: int):
+  for chunk in chunked(data, size):
+    yield chunk
+
+
+class TestGzipDecoder:
+  @pytest.mark.parametrize('size', [1, 7, 1 << 16])
+  def test_gzip(self, size):
+    data = CSV_BODY.encode('utf-8')
+    # Files that were appended to are made of several gzip members.
+    compressed = gzip.compress(data[:20]) + gzip.compress(data[20:])
+
+    decoder = GzipDecoder()
+    assert b''.join(decoder.feed(chunk) for chunk in chunked(compressed, size)) == data
+    assert decoder.close() == b''
+
+  def test_plain(self):
+    decoder = GzipDecoder()
+    assert decoder.feed(b'a') == b''
+    assert decoder.feed(b'bc') == b'abc'
+    assert decoder.close() == b''
+
+    decoder = GzipDecoder()
+    decoder.feed(b'x')
+    assert decoder.close() == b'x'
+
+  def test_truncated(self):
+    decoder = GzipDecoder()
+    decoder.feed(gzip.compress(b'abc' * 100)[:-4])
+    with pytest.raises(ValueError):
+      decoder.close()
+
+
+class TestCSVRecords:
+  @pytest.mark.parametrize('size', [1, 5, 1 << 16])
+  def test_chunk_boundaries(self, size):
+    assert list(iter_csv_records(chunked(CSV_BODY.encode('utf-8'), size))) == ROWS
+
+  def test_incremental(self):
+    parser = CSVRecordParser()
+    assert parser.feed(b'a,b\n1,"x\n') == []
+    assert parser.feed(b'y"\n2,') == [{'a': '1', 'b': 'x\ny'}]
+    assert parser.close() == [{'a': '2', 'b': ''}]
+
+  def test_unterminated_quote(self):
+    with pytest.raises(ValueError):
+      list(iter_csv_records([b'a,b\n1,"x\n']))
+
+  @pytest.mark.asyncio
+  async def test_async(self):
+    records = aiter_csv_records(achunked(CSV_BODY.encode('utf-8'), 3))
+    assert [row async for row in records] == ROWS
+
+
+class TestStreamDownload:
+  def test_gzipped_file(self, requests_mock):
+    route = requests_mock.get(DOWNLOAD_URL, content=gzip.compress(CSV_BODY.encode('utf-8')))
+    dp = DialpadClient('123')
+
+    chunks = list(dp.stream_download(DOWNLOAD_URL, chunk_size=8))
+    assert b''.join(chunks) == CSV_BODY.encode('utf-8')
+    assert list(iter_csv_records(dp.stream_download(DOWNLOAD_URL))) == ROWS
+    # Download URLs are pre-signed, so the API token mustn't be sent along with them.
+    assert 'Authorization' not in route.last_request.headers
+
+  def test_errors(self, requests_mock):
+    requests_mock.get(DOWNLOAD_URL, status_code=403)
+    dp = DialpadClient('123')
+    with pytest.raises(Exception):
+      list(dp.stream_download(DOWNLOAD_URL))
+
+  @pytest.mark.asyncio
+  async def test_async(self, httpx_mock):
+    httpx_mock.add_response(url=DOWNLOAD_URL, content=gzip.compress(CSV_BODY.encode('utf-8')))
+    dp = AsyncDialpadClient('123')
+
+    rows = [row async for row in aiter_csv_records(dp.stream_download(DOWNLOAD_URL, 4))]
+    assert rows == ROWS
+    assert 'Authorization' not in httpx_mock.get_request().headers
+
+
+class TestRowBatches:
+  def test_row_batches(self):
+    pa = pytest.importorskip('pyarrow')
+    from dialpad.arrow_export import iter_row_batches
+
+    rows = [{'user': str(i), 'calls': str(i * 2) if i % 3 else ''} for i in range(5)]
+    batches = list(iter_row_batches(rows, batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert batches[0].schema == pa.schema([('user', pa.string()), ('calls', pa.string())])
+
+    schema = pa.schema([('calls', pa.int64())])
+    table = pa.Table.from_batches(iter_row_batches(rows, schema=schema))
+    assert table.column('calls').to_pylist() == [None, 2, 4, None, 8]
+
+  @pytest.mark.asyncio
+  async def test_async_row_batches(self):
+    pytest.importorskip('pyarrow')
+    from dialpad.arrow_export import aiter_row_batches
+
+    async def rows():
+      for row in ROWS:
+        yield row
+
+    batches = [batch async for batch in aiter_row_batches(rows(), batch_size=1)]
+    assert [batch.to_pylist() for batch in batches] == [[ROWS[0]], [{**ROWS[1], 'notes': None}]]
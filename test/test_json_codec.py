@@ -0,0 +1,100 @@
+"""Tests for the pluggable JSON codecs, and a benchmark of them over large call list pages."""
+
+import timeit
+
+import pytest
+
+from dialpad import json_codec
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.json_codec import CODECS, JSONCodec, OrjsonCodec, get_codec
+from dialpad.schemas.call import CallProto
+
+from .utils import _generate_fake_data
+
+USERS_URL = 'https://dialpad.com/api/v2/users'
+
+
+def installed_codecs() -> list:
+  codecs = []
+  for name in CODECS:
+    try:
+      codecs.append(get_codec(name))
+    except ImportError:
+      pass
+  return codecs
+
+
+class TestJSONCodecs:
+  @pytest.mark.parametrize('codec', installed_codecs(), ids=lambda codec: codec.name)
+  def test_round_trip(self, codec):
+    obj = {'id': 1, 'name': 'Jösé', 'tags': ['a', None], 'score': 1.5, 'active': True}
+    encoded = codec.dumps(obj)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == obj
+    assert JSONCodec().loads(encoded) == obj
+
+  def test_get_codec(self, monkeypatch):
+    codec = JSONCodec()
+    assert get_codec(codec) is codec
+    assert get_codec('json').name == 'json'
+
+    with pytest.raises(ValueError):
+      get_codec('yaml')
+
+    # The fastest installed codec is preferred, and the standard library is the fallback.
+    monkeypatch.setattr(json_codec, 'orjson', None)
+    monkeypatch.setattr(json_codec, 'msgspec', None)
+    assert get_codec().name == 'json'
+    with pytest.raises(ImportError):
+      OrjsonCodec()
+    with pytest.raises(ImportError):
+      get_codec('msgspec')
+
+  def test_msgspec(self):
+    pytest.importorskip('msgspec')
+    codec = get_codec('msgspec')
+    assert codec.dumps({'id': 1, 'name': 'Jösé'}) == '{"id":1,"name":"Jösé"}'.encode('utf-8')
+    assert codec.loads(b'{"id": 1, "tags": [null]}') == {'id': 1, 'tags': [None]}
+    assert codec.loads('[1.5]') == [1.5]
+
+  @pytest.mark.parametrize('codec', installed_codecs(), ids=lambda codec: codec.name)
+  def test_client_round_trip(self, codec, requests_mock):
+    requests_mock.post(USERS_URL, json={'id': 1, 'first_name': 'Jösé'})
+    dp = DialpadClient('123', json_codec=codec)
+
+    assert dp.users.create({'email': 'jose@example.com', 'first_name': 'Jösé'}) == {
+      'id': 1,
+      'first_name': 'Jösé',
+    }
+    assert requests_mock.last_request.headers['Content-Type'] == 'application/json'
+    assert requests_mock.last_request.json() == {'email': 'jose@example.com', 'first_name': 'Jösé'}
+
+  @pytest.mark.asyncio
+  @pytest.mark.parametrize('codec', installed_codecs(), ids=lambda codec: codec.name)
+  async def test_async_client_round_trip(self, codec, httpx_mock):
+    httpx_mock.add_response(method='POST', url=USERS_URL, json={'id': 1})
+    dp = AsyncDialpadClient('123', json_codec=codec.name)
+
+    assert await dp.users.create({'email': 'jose@example.com'}) == {'id': 1}
+    request = httpx_mock.get_request()
+    assert request.headers['Content-Type'] == 'application/json'
+    assert JSONCodec().loads(request.content) == {'email': 'jose@example.com'}
+
+
+@pytest.mark.benchmark
+def test_decode_benchmark():
+  """Checks that the optional codecs decode a large page of calls faster than the stdlib one.
+
+  This is opt-in (with `-m benchmark`), since timings are too noisy to assert on in the default run.
+  """
+  page = JSONCodec().dumps(
+    {'cursor': 'abc', 'items': [_generate_fake_data(CallProto) for _ in range(1000)]}
+  )
+
+  timings = {}
+  for codec in installed_codecs():
+    timings[codec.name] = min(timeit.repeat(lambda: codec.loads(page), number=5, repeat=5)) / 5
+
+  stdlib_seconds = timings.pop('json')
+  assert all(seconds < stdlib_seconds for seconds in timings.values()), timings
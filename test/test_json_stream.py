@@ -0,0 +1,133 @@
+"""Tests for the incremental parsing of streamed list pages."""
+
+import json
+import random
+
+import httpx
+import pytest
+import requests
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.json_stream import ItemsParser
+
+CALLS_URL = 'https://dialpad.com/api/v2/call'
+
+TRICKY_PAGE = {
+  'total': 3,
+  'meta': {'items': [1, 2], 'note': 'a "quoted" } value ]'},
+  'items': [
+    {'id': 1, 'text': 'braces { } [ ] and commas, colons: inside a string'},
+    {'id': 2, 'text': 'escaped \\" quote and a trailing backslash \\', 'nested': [[1], {'a': []}]},
+    'a plain string item',
+    3.5,
+    None,
+    {'id': 3, 'text': 'unicode ✓ and é'},
+  ],
+  'cursor': 'next-page',
+}
+
+
+def parse(body: bytes, chunk_sizes) -> tuple:
+  parser = ItemsParser()
+  items = []
+  pos = 0
+  while pos < len(body):
+    size = next(chunk_sizes)
+    items.extend(parser.feed(body[pos : pos + size]))
+    pos += size
+  return items, parser.close()
+
+
+class TestItemsParser:
+  @pytest.mark.parametrize('indent', [None, 2])
+  def test_chunk_boundaries(self, indent):
+    body = json.dumps(TRICKY_PAGE, indent=indent).encode('utf-8')
+    expected_fields = {k: v for k, v in TRICKY_PAGE.items() if k != 'items'}
+
+    # Every split point should work, from one byte at a time up to the whole body at once.
+    for size in (1, 2, 3, 7, 64, len(body)):
+      assert parse(body, iter(lambda: size, None)) == (TRICKY_PAGE['items'], expected_fields)
+
+    rng = random.Random(0)
+    for _ in range(20):
+      chunk_sizes = iter(lambda: rng.randint(1, 40), None)
+      assert parse(body, chunk_sizes) == (TRICKY_PAGE['items'], expected_fields)
+
+  def test_pages_without_items(self):
+    assert parse(b'{}', iter(lambda: 1, None)) == ([], {})
+    assert parse(b'{"items": []}', iter(lambda: 1, None)) == ([], {})
+    assert parse(b'{"items": null, "cursor": "x"}', iter(lambda: 3, None)) == (
+      [],
+      {'items': None, 'cursor': 'x'},
+    )
+
+  def test_buffer_only_holds_the_current_item(self):
+    item = {'id': 1, 'labels': ['x' * 100] * 10}
+    body = json.dumps({'items': [item] * 1000}).encode('utf-8')
+    parser = ItemsParser()
+    largest_buffer = 0
+    count = 0
+    for pos in range(0, len(body), 4096):
+      count += len(parser.feed(body[pos : pos + 4096]))
+      largest_buffer = max(largest_buffer, len(parser._buf))
+
+    assert count == 1000
+    assert largest_buffer < 4096 + len(json.dumps(item))
+
+  def test_invalid_bodies(self):
+    with pytest.raises(ValueError):
+      ItemsParser().feed(b'[1, 2]')
+
+    parser = ItemsParser()
+    parser.feed(b'{"items": [{"id": 1}, {"id"')
+    with pytest.raises(ValueError):
+      parser.close()
+
+
+def fake_pages(request_url: str) -> bytes:
+  cursor = dict(httpx.URL(request_url).params).get('cursor')
+  if cursor:
+    page = {'items': [{'call_id': 3}]}
+  else:
+    page = {'items': [{'call_id': 1}, {'call_id': 2}], 'cursor': 'abc'}
+  return json.dumps(page).encode('utf-8')
+
+
+class TestClientStreaming:
+  def test_sync(self, requests_mock):
+    requests_mock.get(CALLS_URL, content=lambda request, context: fake_pages(request.url))
+
+    dp = DialpadClient('123', stream_pages=True)
+    assert [c['call_id'] for c in dp.calls.list()] == [1, 2, 3]
+    assert requests_mock.last_request.qs['cursor'] == ['abc']
+
+    # Streaming can also be enabled per call.
+    items = DialpadClient('123').iter_request('GET', '/api/v2/call', stream=True)
+    assert [c['call_id'] for c in items] == [1, 2, 3]
+
+  def test_sync_errors(self, requests_mock):
+    requests_mock.get(CALLS_URL, status_code=404, json={'error': 'nope'})
+
+    dp = DialpadClient('123', stream_pages=True)
+    with pytest.raises(requests.HTTPError) as exc_info:
+      list(dp.calls.list())
+    assert exc_info.value.response.json() == {'error': 'nope'}
+
+  @pytest.mark.asyncio
+  async def test_async(self, httpx_mock):
+    httpx_mock.add_callback(
+      lambda request: httpx.Response(200, content=fake_pages(str(request.url))), is_reusable=True
+    )
+
+    dp = AsyncDialpadClient('123', stream_pages=True, models=True)
+    assert [c.call_id async for c in dp.calls.list()] == [1, 2, 3]
+
+  @pytest.mark.asyncio
+  async def test_async_errors(self, httpx_mock):
+    httpx_mock.add_response(status_code=404, json={'error': 'nope'})
+
+    dp = AsyncDialpadClient('123', stream_pages=True)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+      [c async for c in dp.calls.list()]
+    assert exc_info.value.response.json() == {'error': 'nope'}
@@ -0,0 +1,80 @@
+"""Tests to guard against regressions in the import-time cost of the dialpad package.
+
+Resource classes, schema modules and the clients themselves are all imported lazily, so that a
+program which only uses `client.users` doesn't pay for importing the other ~40 resource modules.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import dialpad
+import dialpad.resources
+import dialpad.schemas
+
+SRC_DIR = os.path.dirname(os.path.dirname(dialpad.__file__))
+
+
+def run_python(code: str) -> str:
+  """Runs the given code in a fresh interpreter, and returns its stdout."""
+  env = dict(os.environ, PYTHONPATH=SRC_DIR)
+  return subprocess.run(
+    [sys.executable, '-c', code], check=True, capture_output=True, text=True, env=env
+  ).stdout
+
+
+def loaded_modules(code: str) -> set:
+  """Returns the set of modules that are loaded after running the given code."""
+  return set(
+    json.loads(run_python(f'{code}\nimport json, sys\nprint(json.dumps(list(sys.modules)))'))
+  )
+
+
+def best_import_time(code: str, runs: int = 3) -> float:
+  """Returns the fastest of several cold-start timings of the given import statement(s)."""
+  timer = f'import time\nstart = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)'
+  return min(float(run_python(timer)) for _ in range(runs))
+
+
+class TestLazyImports:
+  def test_client_import_is_lazy(self):
+    modules = loaded_modules('from dialpad import DialpadClient')
+    assert 'dialpad.client' in modules
+    assert 'dialpad.async_client' not in modules
+    assert 'httpx' not in modules
+    assert not [m for m in modules if m.startswith('dialpad.resources.')]
+    assert not [m for m in modules if m.startswith('dialpad.schemas.')]
+
+  def test_resources_are_imported_on_use(self):
+    modules = loaded_modules('from dialpad import DialpadClient\nDialpadClient("123").users')
+    resource_modules = {m for m in modules if m.startswith('dialpad.resources.')}
+    assert resource_modules == {'dialpad.resources.base', 'dialpad.resources.users_resource'}
+
+  def test_module_attributes(self):
+    assert dialpad.resources.UsersResource.__name__ == 'UsersResource'
+    assert 'UsersResource' in dir(dialpad.resources)
+    assert dialpad.schemas.user.UserProto.__name__ == 'UserProto'
+    assert 'user' in dir(dialpad.schemas)
+    assert dialpad.AsyncDialpadClient.__name__ == 'AsyncDialpadClient'
+    assert 'DialpadClient' in dir(dialpad)
+
+    for module in (dialpad, dialpad.resources, dialpad.schemas):
+      with pytest.raises(AttributeError):
+        module.NotAThing
+
+  @pytest.mark.benchmark
+  def test_import_time_benchmark(self):
+    """Reports the cost of `import dialpad` against eagerly importing every resource module.
+
+    Laziness itself is checked through `sys.modules` above, since timings are too noisy to assert on.
+    """
+    eager_imports = '\n'.join(
+      f'import dialpad.resources.{m.lstrip(".")}'
+      for m in dialpad.resources._RESOURCE_MODULES.values()
+    )
+    lazy_seconds = best_import_time('from dialpad import DialpadClient')
+    eager_seconds = best_import_time(f'from dialpad import DialpadClient\n{eager_imports}')
+    print(f'\nimport dialpad: {lazy_seconds * 1000:.1f}ms (eager: {eager_seconds * 1000:.1f}ms)')
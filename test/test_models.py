@@ -0,0 +1,134 @@
+"""Tests for the slotted models generated from the API schemas, and the clients' model mode."""
+
+import importlib
+import inspect
+import pkgutil
+import tracemalloc
+
+import pytest
+
+import dialpad.schemas
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.models.base import response_model
+from dialpad.models.call import CallCollection, CallContactProto, CallProto
+from dialpad.models.user import UserProto
+from dialpad.schemas.call import CallProto as CallProtoDict
+
+from .utils import _generate_fake_data
+
+CALLS_URL = 'https://dialpad.com/api/v2/call'
+USER_URL = 'https://dialpad.com/api/v2/users/1'
+
+CALL = {
+  'call_id': 1,
+  'contact': {'id': '2', 'name': 'Ada'},
+  'labels': ['sales'],
+  'recording_details': [{'id': '3', 'duration': 10}],
+  'not_in_the_schema': True,
+}
+
+
+class TestModels:
+  def test_from_dict(self):
+    call = CallProto.from_dict(CALL)
+    assert call.call_id == 1
+    assert call.contact == CallContactProto(id='2', name='Ada')
+    assert call.labels == ['sales']
+    assert call.recording_details[0].duration == 10
+    assert call.date_started is None
+    assert not hasattr(call, '__dict__')
+    assert not hasattr(call, 'not_in_the_schema')
+
+  def test_to_dict(self):
+    expected = {k: v for k, v in CALL.items() if k != 'not_in_the_schema'}
+    assert CallProto.from_dict(CALL).to_dict() == expected
+
+  def test_init_and_repr(self):
+    contact = CallContactProto(id='2', name='Ada')
+    assert repr(contact) == "CallContactProto(id='2', name='Ada')"
+    assert contact != CallContactProto(id='2')
+    assert contact != {'id': '2', 'name': 'Ada'}
+
+    with pytest.raises(TypeError):
+      CallContactProto(nickname='Ada')
+
+  def test_response_model(self):
+    assert response_model('users.get') is UserProto
+    assert response_model('call.list') is CallCollection
+    assert response_model('oauth_apps.toggle').__name__ == 'ToggleOAuthAppProto'
+    assert response_model('not.an_operation') is None
+    assert response_model(None) is None
+
+  def test_memory(self):
+    """Compares the memory used by a page of calls as TypedDicts against as models."""
+    calls = [_generate_fake_data(CallProtoDict) for _ in range(1000)]
+
+    def measure(build):
+      tracemalloc.start()
+      try:
+        records = build()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+      finally:
+        tracemalloc.stop()
+
+    dict_bytes = measure(lambda: [dict(call) for call in calls])
+    model_bytes = measure(lambda: [CallProto(**call) for call in calls])
+    print(
+      f'\n1000 CallProtos: {dict_bytes // 1024}KiB as dicts, {model_bytes // 1024}KiB as models'
+    )
+
+    assert model_bytes < dict_bytes
+
+
+def schema_modules():
+  """Yields the name of every module in the dialpad.schemas package."""
+  for module_info in pkgutil.walk_packages(dialpad.schemas.__path__, 'dialpad.schemas.'):
+    if not module_info.ispkg:
+      yield module_info.name
+
+
+@pytest.mark.parametrize('module_name', list(schema_modules()))
+def test_every_schema_has_a_model(module_name):
+  """Round-trips faked data for each TypedDict schema through the equivalent model."""
+  schema_module = importlib.import_module(module_name)
+  model_module = importlib.import_module(module_name.replace('.schemas.', '.models.', 1))
+
+  for name, schema in inspect.getmembers(schema_module, inspect.isclass):
+    if schema.__module__ != module_name:
+      continue
+
+    model = getattr(model_module, name)
+    assert model.__slots__ == tuple(schema.__annotations__)
+
+    data = _generate_fake_data(schema)
+    instance = model.from_dict(data)
+    assert set(instance.to_dict()) == {k for k, v in data.items() if v is not None}
+    assert model.from_dict(instance.to_dict()) == instance
+
+
+class TestClientModelMode:
+  def test_sync(self, requests_mock):
+    requests_mock.get(USER_URL, json={'id': 1, 'first_name': 'Ada'})
+    requests_mock.get(CALLS_URL, json={'items': [CALL]})
+
+    dp = DialpadClient('123', models=True)
+    user = dp.users.get('1')
+    assert isinstance(user, UserProto)
+    assert user.first_name == 'Ada'
+
+    [call] = dp.calls.list()
+    assert isinstance(call, CallProto)
+    assert call.contact.name == 'Ada'
+
+    # The default remains plain dicts.
+    assert DialpadClient('123').users.get('1') == {'id': 1, 'first_name': 'Ada'}
+
+  @pytest.mark.asyncio
+  async def test_async(self, httpx_mock):
+    httpx_mock.add_response(url=USER_URL, json={'id': 1})
+    httpx_mock.add_response(json={'items': [CALL]})
+
+    dp = AsyncDialpadClient('123', models=True)
+    assert (await dp.users.get('1')).id == 1
+    assert [call.call_id async for call in dp.calls.list()] == [1]
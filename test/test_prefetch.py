@@ -0,0 +1,160 @@
+"""Tests for prefetching pages of paginated responses."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.prefetch import prefetch_aiter, prefetch_iter
+
+USERS_URL = 'https://dialpad.com/api/v2/users'
+USER_PAGES = [
+  {'json': {'items': [{'id': 1}, {'id': 2}], 'cursor': 'page2'}},
+  {'json': {'items': [{'id': 3}], 'cursor': 'page3'}},
+  {'json': {'items': [{'id': 4}]}},
+]
+
+
+class Interrupted(BaseException):
+  pass
+
+
+class TestPrefetchIter:
+  def test_order_and_errors(self):
+    def source():
+      yield from range(5)
+      raise RuntimeError('boom')
+
+    results = []
+    with pytest.raises(RuntimeError):
+      for i in prefetch_iter(source(), 2):
+        results.append(i)
+
+    assert results == [0, 1, 2, 3, 4]
+
+  def test_base_exceptions(self):
+    def source():
+      yield 1
+      raise Interrupted()
+
+    items = prefetch_iter(source(), 2)
+    assert next(items) == 1
+    # The consumer sees the end of the stream rather than waiting forever.
+    with pytest.raises(Interrupted):
+      next(items)
+
+  def test_buffering_is_bounded(self):
+    produced = []
+
+    def source():
+      for i in range(100):
+        produced.append(i)
+        yield i
+
+    items = prefetch_iter(source(), 2)
+    assert next(items) == 0
+    time.sleep(0.3)
+
+    # One item consumed, two buffered, and one held by the producer waiting for space.
+    assert len(produced) <= 4
+    items.close()
+
+  def test_producer_stops_when_consumer_does(self):
+    finished = threading.Event()
+
+    def source():
+      try:
+        while True:
+          yield 1
+      finally:
+        finished.set()
+
+    items = prefetch_iter(source(), 1)
+    next(items)
+    items.close()
+    assert finished.wait(2)
+
+  @pytest.mark.asyncio
+  async def test_async_order_and_errors(self):
+    async def source():
+      for i in range(5):
+        yield i
+        await asyncio.sleep(0)
+      raise RuntimeError('boom')
+
+    results = []
+    with pytest.raises(RuntimeError):
+      async for i in prefetch_aiter(source(), 2):
+        results.append(i)
+
+    assert results == [0, 1, 2, 3, 4]
+
+  @pytest.mark.asyncio
+  async def test_async_base_exceptions(self):
+    async def source():
+      yield 1
+      raise Interrupted()
+
+    items = prefetch_aiter(source(), 2)
+    assert await items.__anext__() == 1
+    with pytest.raises(Interrupted):
+      await items.__anext__()
+
+  @pytest.mark.asyncio
+  async def test_async_source_is_closed_on_early_exit(self):
+    closed = asyncio.Event()
+
+    async def source():
+      try:
+        while True:
+          yield 1
+          await asyncio.sleep(0)
+      finally:
+        closed.set()
+
+    items = prefetch_aiter(source(), 1)
+    assert await items.__anext__() == 1
+    await items.aclose()
+    assert closed.is_set()
+
+
+class TestClientPrefetch:
+  def test_prefetched_pagination(self, requests_mock):
+    requests_mock.get(USERS_URL, USER_PAGES)
+    dp = DialpadClient('123', prefetch_pages=2)
+
+    assert [u['id'] for u in dp.users.list()] == [1, 2, 3, 4]
+    assert requests_mock.call_count == 3
+
+  def test_prefetch_errors_are_raised(self, requests_mock):
+    requests_mock.get(USERS_URL, [USER_PAGES[0], {'status_code': 400}])
+    dp = DialpadClient('123')
+
+    users = dp.iter_request(sub_path='/api/v2/users', prefetch=1)
+    assert next(users) == {'id': 1}
+    assert next(users) == {'id': 2}
+    with pytest.raises(requests.HTTPError):
+      next(users)
+
+  @pytest.mark.asyncio
+  async def test_async_prefetched_pagination(self, httpx_mock):
+    for page in USER_PAGES:
+      httpx_mock.add_response(json=page['json'])
+    dp = AsyncDialpadClient('123', prefetch_pages=2)
+
+    assert [u['id'] async for u in dp.users.list()] == [1, 2, 3, 4]
+
+  @pytest.mark.asyncio
+  async def test_async_early_exit(self, httpx_mock):
+    httpx_mock.add_response(json=USER_PAGES[0]['json'], is_optional=True)
+    httpx_mock.add_response(json=USER_PAGES[1]['json'], is_optional=True)
+    httpx_mock.add_response(json=USER_PAGES[2]['json'], is_optional=True)
+    dp = AsyncDialpadClient('123')
+
+    users = dp.iter_request(sub_path='/api/v2/users', prefetch=1)
+    assert await users.__anext__() == {'id': 1}
+    await users.aclose()
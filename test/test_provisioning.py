@@ -0,0 +1,119 @@
+"""Tests for bulk user provisioning."""
+
+import inspect
+import json
+import re
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.provisioning import _STEPS, UserProvisioning, provision_users, provision_users_async
+from dialpad.resources.users_resource import UsersResource
+
+USERS_URL = 'https://dialpad.com/api/v2/users'
+USER_URL = re.compile(r'https://dialpad\.com/api/v2/users/(\d+)/(\w+)$')
+
+ROWS = [
+  UserProvisioning(
+    user={'email': 'jane@example.com', 'office_id': 1},
+    move_office={'office_id': 2},
+    assign_number={'area_code': '415'},
+    caller_id={'caller_id': '+14155550100'},
+    e911_address={'address': '1 Main St', 'city': 'SF', 'country': 'us', 'state': 'ca', 'zip': '1'},
+  ),
+  # A user without any follow-up actions.
+  {'email': 'john@example.com', 'office_id': 1},
+  # The number can't be assigned, so the caller ID isn't set.
+  UserProvisioning(
+    user={'email': 'fail@example.com', 'office_id': 1},
+    assign_number={'area_code': '000'},
+    caller_id={'caller_id': '+14155550101'},
+  ),
+  UserProvisioning(user={'email': 'taken@example.com', 'office_id': 1}),
+]
+
+
+def respond(method: str, url: str, body: dict):
+  """Returns the (status, JSON) response of the fake users API."""
+  if url == USERS_URL:
+    if body['email'] == 'taken@example.com':
+      return 400, {'error': 'Email taken'}
+    if body['email'] == 'noid@example.com':
+      return 200, {'id': 'not a number'}
+    # 64-bit IDs are sent as strings.
+    return 200, {'id': str(100 + len(body['email'])), 'emails': [body['email']]}
+
+  user_id, action = USER_URL.match(url).groups()
+  if action == 'assign_number' and body['area_code'] == '000':
+    return 400, {'error': 'No numbers available'}
+  return 200, {'id': user_id, 'action': action, 'method': method}
+
+
+def check_results(results):
+  assert sorted(result.index for result in results) == [0, 1, 2, 3]
+  jane, john, fail, taken = sorted(results, key=lambda result: result.index)
+
+  assert jane.ok and jane.user_id == 116
+  assert list(jane.responses) == [
+    'create',
+    'move_office',
+    'assign_number',
+    'caller_id',
+    'e911_address',
+  ]
+  assert jane.responses['e911_address']['method'] == 'PUT'
+
+  assert john.ok and list(john.responses) == ['create']
+  assert john.request == UserProvisioning(user=ROWS[1])
+
+  assert not fail.ok
+  assert (fail.user_id, fail.failed_step) == (116, 'assign_number')
+  assert list(fail.responses) == ['create']
+  assert fail.error is not None
+
+  assert (taken.user_id, taken.failed_step, taken.responses) == (None, 'create', {})
+
+
+def test_steps_match_users_resource():
+  for _step, method, operation_id in _STEPS:
+    assert f"operation_id='{operation_id}'" in inspect.getsource(getattr(UsersResource, method))
+
+
+def test_provision_users(requests_mock):
+  def callback(request, context):
+    context.status_code, body = respond(request.method, request.url, request.json())
+    return body
+
+  requests_mock.post(USERS_URL, json=callback)
+  for method in ('POST', 'PATCH', 'PUT'):
+    requests_mock.register_uri(method, USER_URL, json=callback)
+
+  dp = DialpadClient('123')
+  check_results(list(provision_users(dp, iter(ROWS), max_workers=2)))
+
+  # A response without a valid user ID fails the row, rather than the whole run.
+  rows = [{'email': 'noid@example.com'}, *ROWS[1:2]]
+  noid, john = sorted(provision_users(dp, rows), key=lambda result: result.index)
+  assert (noid.user_id, noid.failed_step, list(noid.responses)) == (None, 'create', ['create'])
+  assert isinstance(noid.error, ValueError)
+  assert john.ok
+
+
+@pytest.mark.asyncio
+async def test_provision_users_async(httpx_mock):
+  def callback(request: httpx.Request) -> httpx.Response:
+    status, body = respond(request.method, str(request.url), json.loads(request.content))
+    return httpx.Response(status, json=body)
+
+  httpx_mock.add_callback(callback, is_reusable=True)
+  dp = AsyncDialpadClient('123')
+
+  async def rows():
+    for row in ROWS:
+      yield row
+
+  check_results([result async for result in provision_users_async(dp, rows(), concurrency=2)])
+  results = [result async for result in provision_users_async(dp, ROWS[1:2])]
+  assert [(result.index, result.ok) for result in results] == [(0, True)]
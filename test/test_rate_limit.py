@@ -0,0 +1,88 @@
+"""Tests for the client-side rate limiting of API operations."""
+
+import httpx
+import pytest
+
+from dialpad import rate_limit
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.rate_limit import RateLimiter, TokenBucket
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+  """Freezes the rate limiter's clock, and records any sleeps instead of performing them."""
+
+  class FakeClock:
+    now = 1000.0
+    sleeps = []
+
+    def sleep(self, seconds):
+      self.sleeps.append(seconds)
+
+    async def async_sleep(self, seconds):
+      self.sleeps.append(seconds)
+
+  clock = FakeClock()
+  monkeypatch.setattr(rate_limit.time, 'monotonic', lambda: clock.now)
+  monkeypatch.setattr(rate_limit.time, 'sleep', clock.sleep)
+  monkeypatch.setattr(rate_limit.asyncio, 'sleep', clock.async_sleep)
+  return clock
+
+
+class TestTokenBucket:
+  def test_burst_then_throttle(self, fake_clock):
+    bucket = TokenBucket(5, 60)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+    # The bucket refills at one token every 12 seconds, and deficits accumulate.
+    assert bucket.reserve() == pytest.approx(12.0)
+    assert bucket.reserve() == pytest.approx(24.0)
+
+    fake_clock.now += 36.0
+    assert bucket.reserve() == pytest.approx(0.0)
+
+  def test_refill_is_capped(self, fake_clock):
+    bucket = TokenBucket(2, 1)
+    fake_clock.now += 3600.0
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+
+  def test_invalid_limit(self):
+    with pytest.raises(ValueError):
+      TokenBucket(0, 60)
+
+
+class TestRateLimiter:
+  def test_buckets_are_per_operation(self):
+    limiter = RateLimiter()
+    assert limiter.bucket('users.get', (10, 60)) is limiter.bucket('users.get', (10, 60))
+    assert limiter.bucket('users.get', (10, 60)) is not limiter.bucket('users.list', (10, 60))
+
+  def test_unlimited_operations(self):
+    limiter = RateLimiter()
+    assert limiter.bucket(None, (10, 60)) is None
+    assert limiter.bucket('oauth2.token.post', None) is None
+
+  def test_overrides(self):
+    limiter = RateLimiter(overrides={'sms.send': (800, 60)})
+    assert limiter.bucket('sms.send', (100, 60)).capacity == 800
+
+  def test_client_enforcement(self, fake_clock, requests_mock):
+    requests_mock.post('https://dialpad.com/api/v2/users/me/initiate_call', json={})
+    dp = DialpadClient('123', rate_limiter=RateLimiter())
+
+    for _ in range(6):
+      dp.users.initiate_call('me', {'phone_number': '+15555555555'})
+
+    assert fake_clock.sleeps == [pytest.approx(12.0)]
+
+  @pytest.mark.asyncio
+  async def test_async_client_enforcement(self, fake_clock, httpx_mock):
+    httpx_mock.add_callback(lambda request: httpx.Response(200, json={}), is_reusable=True)
+    dp = AsyncDialpadClient('123', rate_limiter=RateLimiter())
+
+    for _ in range(6):
+      await dp.users.initiate_call('me', {'phone_number': '+15555555555'})
+
+    assert fake_clock.sleeps == [pytest.approx(12.0)]
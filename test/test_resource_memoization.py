@@ -0,0 +1,77 @@
+"""Tests for the memoization of resource instances by the clients."""
+
+import gc
+import timeit
+import weakref
+
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.resources import UsersResource
+
+
+class TestResourceMemoization:
+  def test_resources_are_memoized_per_client(self):
+    dp = DialpadClient('123')
+    assert dp.users is dp.users
+    assert dp.users is not DialpadClient('123').users
+
+    async_dp = AsyncDialpadClient('123')
+    assert async_dp.users is async_dp.users
+
+  def test_resources_are_slotted(self):
+    assert not hasattr(DialpadClient('123').users, '__dict__')
+    assert not hasattr(AsyncDialpadClient('123').users, '__dict__')
+
+  def test_resources_keep_their_client(self, requests_mock):
+    requests_mock.get('https://dialpad.com/api/v2/users/me', json={'id': 1})
+    users = DialpadClient('123').users
+    gc.collect()
+    assert users.get('me') == {'id': 1}
+
+  @pytest.mark.parametrize('client_class', [DialpadClient, AsyncDialpadClient])
+  def test_client_is_collected(self, client_class):
+    dp = client_class('123')
+    dp.users
+    client_ref, session_ref = weakref.ref(dp), weakref.ref(dp._session)
+    del dp
+    gc.collect()
+    assert client_ref() is None
+    assert session_ref() is None
+
+  def test_close_breaks_the_cycle(self):
+    gc.disable()
+    try:
+      with DialpadClient('123') as dp:
+        users = dp.users
+      client_ref = weakref.ref(dp)
+      del dp
+
+      # The resource still works, but the client is freed as soon as the resource is.
+      assert users._client is client_ref()
+      del users
+      assert client_ref() is None
+    finally:
+      gc.enable()
+
+  @pytest.mark.asyncio
+  async def test_aclose_breaks_the_cycle(self):
+    gc.disable()
+    try:
+      async with AsyncDialpadClient('123') as dp:
+        dp.users
+      client_ref = weakref.ref(dp)
+      del dp
+      assert client_ref() is None
+    finally:
+      gc.enable()
+
+  @pytest.mark.benchmark
+  def test_microbenchmark(self):
+    """Checks that accessing a memoized resource is cheaper than constructing one each time."""
+    dp = DialpadClient('123')
+    runs = 100_000
+    memoized = min(timeit.repeat(lambda: dp.users, number=runs, repeat=3)) / runs
+    constructed = min(timeit.repeat(lambda: UsersResource(dp), number=runs, repeat=3)) / runs
+    assert memoized < constructed
@@ -0,0 +1,107 @@
+"""Tests for the retry policy, and its use by the sync and async clients."""
+
+from email.utils import formatdate
+
+import httpx
+import pytest
+import requests
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.retry import IDEMPOTENT_METHODS, RetryBudget, RetryPolicy, parse_retry_after
+
+USERS_URL = 'https://dialpad.com/api/v2/users'
+
+
+def no_wait_policy(**kwargs) -> RetryPolicy:
+  return RetryPolicy(backoff_factor=0, jitter=False, **kwargs)
+
+
+class TestRetryPolicy:
+  def test_parse_retry_after(self):
+    assert parse_retry_after('7') == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(formatdate(0, usegmt=True)) == 0.0
+
+  def test_should_retry(self):
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry('get', 1, 503)
+    assert policy.should_retry('GET', 2, None)
+    assert not policy.should_retry('GET', 3, 503)
+    assert not policy.should_retry('GET', 1, 404)
+    assert not policy.should_retry('POST', 1, 503)
+    assert RetryPolicy(methods=IDEMPOTENT_METHODS | {'POST'}).should_retry('POST', 1, 503)
+
+  def test_backoff(self):
+    policy = RetryPolicy(backoff_factor=1, max_backoff=10, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 8, 10]
+    assert policy.backoff(1, retry_after='3') == 3.0
+    assert policy.backoff(1, retry_after='3600') == 10
+
+    jittered = RetryPolicy(backoff_factor=1, max_backoff=10)
+    assert all(0 <= jittered.backoff(4) <= 8 for _ in range(20))
+
+  def test_budget(self):
+    policy = RetryPolicy(budget=RetryBudget(ratio=0.5, min_tokens=1))
+    assert policy.should_retry('GET', 1, 503)
+    assert not policy.should_retry('GET', 1, 503)
+
+    policy.record_request()
+    policy.record_request()
+    assert policy.should_retry('GET', 1, 503)
+
+
+class TestClientRetries:
+  def test_pagination_resumes_from_cursor(self, requests_mock):
+    requests_mock.get(
+      USERS_URL,
+      [
+        {'json': {'items': [{'id': 1}], 'cursor': 'page2'}},
+        {'status_code': 503},
+        {'status_code': 429, 'headers': {'Retry-After': '0'}},
+        {'json': {'items': [{'id': 2}]}},
+      ],
+    )
+    dp = DialpadClient('123', retry_policy=no_wait_policy())
+
+    assert [u['id'] for u in dp.users.list()] == [1, 2]
+    assert [r.qs.get('cursor') for r in requests_mock.request_history] == [
+      None,
+      ['page2'],
+      ['page2'],
+      ['page2'],
+    ]
+
+  def test_transport_errors(self, requests_mock):
+    requests_mock.get(f'{USERS_URL}/1', [{'exc': requests.ConnectionError}, {'json': {'id': 1}}])
+    dp = DialpadClient('123', retry_policy=no_wait_policy())
+    assert dp.users.get('1') == {'id': 1}
+
+    requests_mock.get(f'{USERS_URL}/2', exc=requests.ConnectionError)
+    with pytest.raises(requests.ConnectionError):
+      dp.users.get('2')
+
+  def test_non_idempotent_methods_are_not_retried(self, requests_mock):
+    requests_mock.post(USERS_URL, [{'status_code': 503}, {'json': {'id': 1}}])
+    dp = DialpadClient('123', retry_policy=no_wait_policy())
+
+    with pytest.raises(requests.HTTPError):
+      dp.users.create({'email': 'test@example.com', 'office_id': 1})
+
+  @pytest.mark.asyncio
+  async def test_async_retries(self, httpx_mock):
+    httpx_mock.add_response(url=f'{USERS_URL}/1', status_code=502)
+    httpx_mock.add_exception(httpx.ConnectError('boom'), url=f'{USERS_URL}/1')
+    httpx_mock.add_response(url=f'{USERS_URL}/1', json={'id': 1})
+    dp = AsyncDialpadClient('123', retry_policy=no_wait_policy())
+
+    assert await dp.users.get('1') == {'id': 1}
+
+  @pytest.mark.asyncio
+  async def test_async_retries_exhausted(self, httpx_mock):
+    httpx_mock.add_exception(httpx.ConnectError('boom'), url=f'{USERS_URL}/1')
+    dp = AsyncDialpadClient('123', retry_policy=no_wait_policy(max_attempts=1))
+
+    with pytest.raises(httpx.ConnectError):
+      await dp.users.get('1')
@@ -0,0 +1,135 @@
+"""Tests for the NDJSON and CSV sinks."""
+
+import csv
+import gzip
+import json
+
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.json_codec import get_codec
+from dialpad.sink import CSVSink, NDJSONSink
+
+CALLS_URL = 'https://dialpad.com/api/v2/call'
+
+CALLS = [
+  {'call_id': 1, 'direction': 'inbound', 'contact': {'name': 'Jane'}, 'labels': ['a', 'b']},
+  {'call_id': 2, 'direction': 'outbound'},
+  {'call_id': 3, 'direction': 'inbound'},
+]
+
+
+def read_lines(path: str, compression=None) -> list:
+  if compression == 'gzip':
+    with gzip.open(path, 'rt') as f:
+      return [json.loads(line) for line in f]
+
+  if compression == 'zstd':
+    zstandard = pytest.importorskip('zstandard')
+    with open(path, 'rb') as f:
+      data = zstandard.ZstdDecompressor().stream_reader(f).read()
+    return [json.loads(line) for line in data.decode('utf-8').splitlines()]
+
+  with open(path) as f:
+    return [json.loads(line) for line in f]
+
+
+class TestNDJSONSink:
+  @pytest.mark.parametrize('compression', [None, 'gzip', 'zstd'])
+  def test_compression(self, tmp_path, compression):
+    if compression == 'zstd':
+      pytest.importorskip('zstandard')
+
+    path = str(tmp_path / 'calls.ndjson')
+    with NDJSONSink(path, compression=compression, chunk_size=2) as sink:
+      stats = sink.consume(CALLS)
+
+    assert stats.rows == 3
+    assert stats.bytes_written == sum(len(get_codec().dumps(c)) + 1 for c in CALLS)
+    assert stats.rows_per_second > 0
+    assert read_lines(path, compression) == CALLS
+
+  def test_resource_iterator(self, requests_mock, tmp_path):
+    requests_mock.get(CALLS_URL, json={'items': CALLS})
+    dp = DialpadClient('123', models=True)
+    path = str(tmp_path / 'calls.ndjson')
+
+    stats = NDJSONSink(path, json_codec='json').consume(dp.calls.list())
+    assert stats.rows == 3
+    assert read_lines(path) == CALLS
+
+  @pytest.mark.asyncio
+  async def test_async(self, httpx_mock, tmp_path):
+    httpx_mock.add_response(json={'items': CALLS})
+    dp = AsyncDialpadClient('123')
+    path = str(tmp_path / 'calls.ndjson')
+
+    # A single-chunk queue means that the event loop has to wait for the writer.
+    sink = NDJSONSink(path, chunk_size=1, queue_size=1)
+    stats = await sink.aconsume(dp.calls.list())
+    assert stats.rows == 3
+    assert read_lines(path) == CALLS
+
+  @pytest.mark.asyncio
+  async def test_source_errors(self, tmp_path):
+    def items():
+      yield CALLS[0]
+      raise RuntimeError('Page failed')
+
+    async def aitems():
+      for item in items():
+        yield item
+
+    # The sink is closed (with what was written so far) before the error is re-raised.
+    path = str(tmp_path / 'calls.ndjson')
+    sink = NDJSONSink(path, chunk_size=1)
+    with pytest.raises(RuntimeError):
+      sink.consume(items())
+    assert not sink._thread.is_alive() and sink._file.closed
+    assert read_lines(path) == CALLS[:1]
+
+    sink = NDJSONSink(path, chunk_size=1)
+    with pytest.raises(RuntimeError):
+      await sink.aconsume(aitems())
+    assert not sink._thread.is_alive() and sink._file.closed
+
+  def test_errors(self, tmp_path):
+    path = str(tmp_path / 'calls.ndjson')
+    sink = NDJSONSink(path, json_codec='json', chunk_size=1)
+    sink.write({'call_id': 1})
+    sink.write({'call_id': {2}})
+    with pytest.raises(TypeError):
+      for i in range(100):
+        sink.write({'call_id': i})
+        sink._thread.join(0.01)
+
+    with pytest.raises(TypeError):
+      sink.close()
+    with pytest.raises(ValueError):
+      sink.write({'call_id': 3})
+
+    with pytest.raises(ValueError):
+      NDJSONSink(path, compression='bz2')
+
+
+class TestCSVSink:
+  def test_csv(self, tmp_path):
+    path = str(tmp_path / 'calls.csv')
+    stats = CSVSink(path, chunk_size=2).consume(CALLS)
+    assert stats.rows == 3
+
+    with open(path, newline='') as f:
+      rows = list(csv.DictReader(f))
+    assert [row['call_id'] for row in rows] == ['1', '2', '3']
+    assert json.loads(rows[0]['contact']) == {'name': 'Jane'}
+    assert json.loads(rows[0]['labels']) == ['a', 'b']
+    assert rows[1]['contact'] == ''
+
+  def test_fieldnames(self, tmp_path):
+    path = str(tmp_path / 'calls.csv.gz')
+    CSVSink(path, fieldnames=['call_id', 'direction'], compression='gzip').consume(CALLS)
+
+    with gzip.open(path, 'rt', newline='') as f:
+      rows = list(csv.reader(f))
+    assert rows == [['call_id', 'direction'], ['1', 'inbound'], ['2', 'outbound'], ['3', 'inbound']]
@@ -0,0 +1,119 @@
+"""Tests for the SMS broadcast dispatcher."""
+
+import json
+import time
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.sms_broadcast import OptOutList, SMSBroadcast, _sender
+
+SMS_URL = 'https://dialpad.com/api/v2/sms'
+OPT_OUT_URL = 'https://dialpad.com/api/v2/company/1/smsoptout'
+
+OPT_OUTS = {
+  'items': [
+    {'external_endpoint': '+15550000002', 'opt_out_state': 'opted_out'},
+    {'external_endpoint': '+15550000003', 'opt_out_state': 'opted_out'},
+  ]
+}
+
+MESSAGES = [
+  {'user_id': 1, 'text': 'a', 'to_numbers': ['+15550000001', '+15550000002']},
+  # Every recipient has opted out, so it isn't sent.
+  {'user_id': 1, 'text': 'b', 'to_numbers': ['+15550000003']},
+  {'user_id': 1, 'text': 'fail', 'to_numbers': ['+15550000004']},
+  {'from_number': '+15551111111', 'text': 'c', 'to_numbers': ['+15550000005']},
+  {'user_id': 2, 'channel_hashtag': 'general', 'text': 'd'},
+]
+
+
+def sms_response(body: dict):
+  if body['text'] == 'fail':
+    return 400, {'error': 'Invalid number'}
+  return 200, {'id': body['text'], 'to_numbers': body.get('to_numbers')}
+
+
+def check_results(results, broadcast):
+  results = sorted(results, key=lambda result: result.index)
+  assert [result.index for result in results] == [0, 1, 2, 3, 4]
+  sent, skipped, failed = results[0], results[1], results[2]
+
+  assert sent.message['to_numbers'] == ['+15550000001']
+  assert sent.response['to_numbers'] == ['+15550000001']
+  assert sent.opted_out == ('+15550000002',)
+  assert skipped.skipped and skipped.opted_out == ('+15550000003',)
+  assert failed.error is not None and not failed.skipped
+  assert results[4].response['id'] == 'd'
+
+  stats = broadcast.stats
+  assert (stats.sent, stats.failed, stats.skipped, stats.opted_out) == (3, 1, 1, 2)
+  assert stats.messages_per_second > 0
+
+
+def test_sender():
+  assert _sender({'from_number': '+1555', 'user_id': 1}) == '+1555'
+  assert _sender({'sender_group_id': 5, 'sender_group_type': 'office', 'user_id': 1}) == (
+    'office',
+    5,
+  )
+  assert _sender({'user_id': 1}) == 1
+
+
+def test_opt_out_list(requests_mock):
+  requests_mock.get(OPT_OUT_URL, json=OPT_OUTS)
+  opt_outs = OptOutList.fetch(DialpadClient('123'), '1')
+  assert '+15550000002' in opt_outs and '+15550000001' not in opt_outs
+  assert len(opt_outs) == 2
+  assert requests_mock.last_request.qs['opt_out_state'] == ['opted_out']
+
+
+def test_send(requests_mock):
+  def callback(request, context):
+    context.status_code, body = sms_response(request.json())
+    return body
+
+  opt_out_route = requests_mock.get(OPT_OUT_URL, json=OPT_OUTS)
+  requests_mock.post(SMS_URL, json=callback)
+  broadcast = SMSBroadcast(DialpadClient('123'), company_id='1', max_workers=2)
+
+  check_results(list(broadcast.send(iter(MESSAGES))), broadcast)
+  # The opt-out list is cached between broadcasts.
+  assert [result.response['id'] for result in broadcast.send(MESSAGES[3:4])] == ['c']
+  assert opt_out_route.call_count == 1
+
+
+def test_per_sender_scheduling(requests_mock):
+  requests_mock.post(SMS_URL, json=lambda request, context: {'id': request.json()['text']})
+  broadcast = SMSBroadcast(DialpadClient('123'), sender_rate_limit=(1, 0.2), opt_outs=[])
+
+  messages = [{'user_id': 1, 'text': f'slow{i}'} for i in range(3)] + [{'user_id': 2, 'text': 'x'}]
+  started = time.monotonic()
+  order = [result.response['id'] for result in broadcast.send(messages)]
+  # The second user's message isn't held up behind the first user's, which are spaced out.
+  assert order.index('x') < order.index('slow1')
+  assert time.monotonic() - started >= 0.35
+
+
+@pytest.mark.asyncio
+async def test_send_async(httpx_mock):
+  def callback(request: httpx.Request) -> httpx.Response:
+    if request.method == 'GET':
+      return httpx.Response(200, json=OPT_OUTS)
+    status, body = sms_response(json.loads(request.content))
+    return httpx.Response(status, json=body)
+
+  httpx_mock.add_callback(callback, is_reusable=True)
+  broadcast = SMSBroadcast(
+    AsyncDialpadClient('123'), sender_rate_limit=(2, 0.1), company_id='1', max_workers=2
+  )
+
+  async def messages():
+    for message in MESSAGES:
+      yield message
+
+  check_results([result async for result in broadcast.send_async(messages())], broadcast)
+  results = [result async for result in broadcast.send_async(MESSAGES[:1])]
+  assert results[0].opted_out == ('+15550000002',)
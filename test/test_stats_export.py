@@ -0,0 +1,161 @@
+"""Tests for running stats jobs end-to-end."""
+
+import json
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.client import DialpadClient
+from dialpad.rate_limit import RateLimiter, TokenBucket
+from dialpad.stats_export import (
+  _Polling,
+  iter_stats_rows,
+  run_stats,
+  run_stats_async,
+  run_stats_many,
+  run_stats_many_async,
+  wait_for_stats,
+)
+
+STATS_URL = 'https://dialpad.com/api/v2/stats'
+DOWNLOAD_URL = 'https://storage.example.com/stats.csv'
+
+CSV_BODY = (
+  'date,user,calls,notes\r\n2024-01-01,Jane,3,"said ""hi""\r\nthen left"\r\n2024-01-02,John,5,\r\n'
+)
+ROWS = [
+  {'date': '2024-01-01', 'user': 'Jane', 'calls': '3', 'notes': 'said "hi"\nthen left'},
+  {'date': '2024-01-02', 'user': 'John', 'calls': '5', 'notes': ''},
+]
+
+OPTIONS = {'poll_interval': 0, 'max_poll_interval': 0}
+
+
+class CountingBucket(TokenBucket):
+  def __init__(self):
+    super().__init__(100, 1)
+    self.acquired = 0
+
+  def reserve(self) -> float:
+    self.acquired += 1
+    return super().reserve()
+
+
+@pytest.fixture
+def stats_api(requests_mock):
+  requests_mock.post(STATS_URL, json={'request_id': 'r1'})
+  requests_mock.get(
+    f'{STATS_URL}/r1',
+    [
+      {'json': {'status': 'processing'}},
+      {'json': {'status': 'processing'}},
+      {'json': {'status': 'complete', 'download_url': DOWNLOAD_URL, 'file_type': 'csv'}},
+    ],
+  )
+  requests_mock.get(DOWNLOAD_URL, content=CSV_BODY.encode('utf-8'))
+  return requests_mock
+
+
+class TestHelpers:
+  def test_polling(self):
+    polling = _Polling(1.0, 3.0, 2.0, timeout=60)
+    assert [polling.next_delay('r1') for _ in range(4)] == [1.0, 2.0, 3.0, 3.0]
+
+    with pytest.raises(TimeoutError):
+      _Polling(1.0, 3.0, 2.0, timeout=0).next_delay('r1')
+
+
+class TestRunStats:
+  def test_run_stats(self, stats_api):
+    dp = DialpadClient('123')
+    rows = list(run_stats(dp, {'export_type': 'stats', 'stat_type': 'calls'}, **OPTIONS))
+    assert rows == ROWS
+    assert stats_api.request_history[0].json() == {'export_type': 'stats', 'stat_type': 'calls'}
+    assert stats_api.call_count == 5
+
+  def test_limiters(self, stats_api):
+    dp = DialpadClient('123')
+    initiate_limiter, poll_limiter = CountingBucket(), CountingBucket()
+    wait_for_stats(
+      dp,
+      {'export_type': 'stats', 'stat_type': 'calls'},
+      initiate_limiter=initiate_limiter,
+      poll_limiter=poll_limiter,
+      **OPTIONS,
+    )
+    assert (initiate_limiter.acquired, poll_limiter.acquired) == (1, 3)
+
+  def test_models(self, stats_api):
+    dp = DialpadClient('123', models=True)
+    job = wait_for_stats(dp, {'export_type': 'stats', 'stat_type': 'calls'}, **OPTIONS)
+    assert (job.request_id, job.result.download_url) == ('r1', DOWNLOAD_URL)
+    assert list(iter_stats_rows(dp, job.result.download_url)) == ROWS
+
+  def test_failures(self, requests_mock):
+    requests_mock.post(STATS_URL, json={'request_id': 'r1'})
+    requests_mock.get(f'{STATS_URL}/r1', json={'status': 'failed'})
+    requests_mock.get(DOWNLOAD_URL, status_code=403)
+    dp = DialpadClient('123')
+
+    with pytest.raises(RuntimeError):
+      wait_for_stats(dp, {'export_type': 'stats', 'stat_type': 'calls'}, **OPTIONS)
+    with pytest.raises(Exception):
+      list(iter_stats_rows(dp, DOWNLOAD_URL))
+
+  def test_run_stats_many(self, requests_mock):
+    def initiate(request, context):
+      return {'request_id': str(request.json()['office_id'])}
+
+    def result(request, context):
+      if request.path.endswith('/2'):
+        return {'status': 'failed'}
+      return {'status': 'complete', 'download_url': DOWNLOAD_URL}
+
+    requests_mock.post(STATS_URL, json=initiate)
+    requests_mock.get(f'{STATS_URL}/1', json=result)
+    requests_mock.get(f'{STATS_URL}/2', json=result)
+    requests_mock.get(f'{STATS_URL}/3', json=result)
+    requests_mock.get(DOWNLOAD_URL, content=CSV_BODY.encode('utf-8'))
+
+    dp = DialpadClient('123', rate_limiter=RateLimiter())
+    requests = [{'export_type': 'stats', 'stat_type': 'calls', 'office_id': i} for i in (1, 2, 3)]
+    jobs = {job.request['office_id']: job for job in run_stats_many(dp, requests, **OPTIONS)}
+    assert sorted(jobs) == [1, 2, 3]
+    assert isinstance(jobs[2].error, RuntimeError)
+    assert jobs[3].error is None
+    assert list(iter_stats_rows(dp, jobs[3].result['download_url'])) == ROWS
+
+
+class TestRunStatsAsync:
+  @pytest.mark.asyncio
+  async def test_run_stats(self, httpx_mock):
+    httpx_mock.add_response(method='POST', url=STATS_URL, json={'request_id': 'r1'})
+    httpx_mock.add_response(method='GET', url=f'{STATS_URL}/r1', json={'status': 'processing'})
+    httpx_mock.add_response(
+      method='GET', url=f'{STATS_URL}/r1', json={'status': 'complete', 'download_url': DOWNLOAD_URL}
+    )
+    httpx_mock.add_response(method='GET', url=DOWNLOAD_URL, content=CSV_BODY.encode('utf-8'))
+
+    dp = AsyncDialpadClient('123')
+    request = {'export_type': 'stats', 'stat_type': 'calls'}
+    assert [row async for row in run_stats_async(dp, request, **OPTIONS)] == ROWS
+
+  @pytest.mark.asyncio
+  async def test_run_stats_many(self, httpx_mock):
+    def callback(request: httpx.Request) -> httpx.Response:
+      if request.method == 'POST':
+        return httpx.Response(
+          200, json={'request_id': str(json.loads(request.content)['office_id'])}
+        )
+      if request.url.path.endswith('/2'):
+        return httpx.Response(200, json={'status': 'failed'})
+      return httpx.Response(200, json={'status': 'complete', 'download_url': DOWNLOAD_URL})
+
+    httpx_mock.add_callback(callback, is_reusable=True)
+    dp = AsyncDialpadClient('123')
+    requests = [{'stat_type': 'calls', 'office_id': i} for i in (1, 2, 3)]
+    jobs = [job async for job in run_stats_many_async(dp, requests, concurrency=2, **OPTIONS)]
+    assert sorted(job.request['office_id'] for job in jobs) == [1, 2, 3]
+    assert [job.request_id for job in jobs if not job.error] in (['1', '3'], ['3', '1'])
+    assert [job.request['office_id'] for job in jobs if job.error] == [2]
@@ -0,0 +1,108 @@
+"""Tests for bulk fetching of call transcripts."""
+
+import re
+
+import httpx
+import pytest
+
+from dialpad.async_client import AsyncDialpadClient
+from dialpad.bulk import BulkResults, fallback_limiter
+from dialpad.client import DialpadClient
+from dialpad.rate_limit import RateLimiter
+from dialpad.transcript_export import InvalidCall, fetch_transcripts, fetch_transcripts_async
+
+CALLS_URL = 'https://dialpad.com/api/v2/call'
+TRANSCRIPT_URL = re.compile(r'https://dialpad\.com/api/v2/transcripts/(\d+)$')
+
+# Calls 4 and 8 have no transcript.
+MISSING = {4, 8}
+
+
+def transcript(call_id: int) -> dict:
+  return {'call_id': call_id, 'lines': [{'content': f'Call {call_id}', 'type': 'transcript'}]}
+
+
+@pytest.fixture
+def transcripts_api(requests_mock):
+  def respond(request, context):
+    call_id = int(TRANSCRIPT_URL.match(request.url).group(1))
+    if call_id in MISSING:
+      context.status_code = 404
+      return {'error': 'Not found'}
+    return transcript(call_id)
+
+  return requests_mock.get(TRANSCRIPT_URL, json=respond)
+
+
+class TestFetchTranscripts:
+  def test_fetch_transcripts(self, transcripts_api):
+    dp = DialpadClient('123')
+    # Malformed calls are recorded as failed, rather than ending the export.
+    call_ids = [1, 2, '3', 3, 4, 'abc', 2, 5, 6, {'id': 7}, 7, 8, 9, 10]
+
+    results = fetch_transcripts(dp, call_ids, max_workers=3)
+    fetched = dict(results)
+    assert sorted(fetched) == [1, 2, 3, 5, 6, 7, 9, 10]
+    assert fetched[3] == transcript(3)
+    failed = {str(getattr(key, 'call', key)): error for key, error in results.failed.items()}
+    assert sorted(failed) == ['4', '8', 'abc', "{'id': 7}"]
+    assert isinstance(failed['abc'], ValueError)
+    assert repr(InvalidCall('abc', failed['abc'])) == "InvalidCall('abc')"
+
+    # Duplicate IDs are only fetched once.
+    assert transcripts_api.call_count == 10
+
+    retry = fetch_transcripts(dp, results.failed)
+    assert list(retry) == [] and len(retry.failed) == 4
+
+  def test_calls_list(self, requests_mock, transcripts_api):
+    requests_mock.get(
+      CALLS_URL, json={'items': [{'call_id': 1}, {'call_id': '2'}, {'call_id': 4}, {'call_id': 1}]}
+    )
+    dp = DialpadClient('123', models=True, rate_limiter=RateLimiter())
+
+    results = fetch_transcripts(dp, dp.calls.list())
+    assert sorted(call_id for call_id, _ in results) == [1, 2]
+    assert list(results.failed) == [4]
+
+  def test_early_exit(self, transcripts_api):
+    dp = DialpadClient('123')
+    results = fetch_transcripts(dp, range(1, 1000), max_workers=2)
+    for _ in zip(range(3), results):
+      pass
+
+    # Only a few calls beyond those consumed should have been fetched.
+    assert transcripts_api.call_count < 20
+
+  @pytest.mark.asyncio
+  async def test_async(self, httpx_mock):
+    def respond(request: httpx.Request) -> httpx.Response:
+      if request.url.path == '/api/v2/call':
+        return httpx.Response(200, json={'items': [{'call_id': i} for i in (1, 2, 2, 4, 5)]})
+
+      call_id = int(request.url.path.rsplit('/', 1)[1])
+      if call_id in MISSING:
+        return httpx.Response(404, json={'error': 'Not found'})
+      return httpx.Response(200, json=transcript(call_id))
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    dp = AsyncDialpadClient('123')
+
+    results = fetch_transcripts_async(dp, dp.calls.list(), concurrency=2)
+    fetched = {call_id: t async for call_id, t in results}
+    assert sorted(fetched) == [1, 2, 5]
+    assert list(results.failed) == [4]
+
+    results = fetch_transcripts_async(dp, [5, None, 1], concurrency=1)
+    assert [call_id async for call_id, _ in results] == [5, 1]
+    assert [key.call for key in results.failed] == [None]
+
+
+def test_fallback_limiter():
+  assert fallback_limiter(DialpadClient('123', rate_limiter=RateLimiter()), (10, 1)) is None
+
+  limiter = fallback_limiter(DialpadClient('123'), (10, 1))
+  results = BulkResults(lambda key: key * 2, [1, 2, 2, 3], limiter=limiter)
+  assert sorted(results) == [(1, 2), (2, 4), (3, 6)]
+  # Each call took a token.
+  assert limiter._tokens < limiter.capacity - 2
@@ -0,0 +1,237 @@
+"""Tests for the webhook receiver and event decoding."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import io
+import json
+import threading
+
+import pytest
+
+from dialpad.events import (
+  AGENT_STATUS,
+  CALL,
+  CONTACT,
+  SMS,
+  UNKNOWN,
+  EventDecoder,
+  EventDispatcher,
+  classify_event,
+  signature_options,
+)
+from dialpad.models.signature import SignatureProto
+from dialpad.models.webhook import WebhookProto
+from dialpad.webhooks import WebhookReceiver
+
+SECRET = 'webhook-secret'
+CALL_EVENT = {'call_id': 123, 'state': 'hangup', 'direction': 'inbound'}
+
+
+def b64(data: bytes) -> bytes:
+  return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def sign(payload: dict, secret: str = SECRET, alg: str = 'HS256') -> bytes:
+  digest = {'HS256': hashlib.sha256, 'HS512': hashlib.sha512}[alg]
+  signing_input = b64(json.dumps({'alg': alg, 'typ': 'JWT'}).encode()) + b'.'
+  signing_input += b64(json.dumps(payload).encode())
+  signature = hmac.new(secret.encode(), signing_input, digest).digest()
+  return signing_input + b'.' + b64(signature)
+
+
+class ChunkedInput(io.BytesIO):
+  """Returns a chunk of a request body at a time, like a server that decodes chunked requests."""
+
+  def read(self, size: int = -1) -> bytes:
+    return super().read(min(size, 10) if size >= 0 else 10)
+
+
+def wsgi_request(app, method: str, body: bytes, chunked: bool = False) -> str:
+  responses = []
+  environ = {'REQUEST_METHOD': method}
+  if chunked:
+    environ['wsgi.input'] = ChunkedInput(body)
+  else:
+    environ.update({'CONTENT_LENGTH': str(len(body)), 'wsgi.input': io.BytesIO(body)})
+  app(environ, lambda status, headers: responses.append(status))
+  return responses[0]
+
+
+async def asgi_request(app, method: str, body: bytes) -> int:
+  messages = [
+    {'type': 'http.request', 'body': body[:10], 'more_body': True},
+    {'type': 'http.request', 'body': body[10:], 'more_body': False},
+  ]
+  sent = []
+
+  async def receive():
+    return messages.pop(0)
+
+  async def send(message):
+    sent.append(message)
+
+  await app({'type': 'http', 'method': method}, receive, send)
+  return sent[0]['status']
+
+
+class TestEventDecoder:
+  def test_classify(self):
+    assert classify_event(CALL_EVENT) == CALL
+    assert classify_event({'id': 1, 'text': 'hi', 'direction': 'inbound'}) == SMS
+    assert classify_event({'message_status': 'sent'}) == SMS
+    assert classify_event({'user_id': 1, 'availability_status': 'available'}) == AGENT_STATUS
+    assert classify_event({'contact_event_type': 'created', 'contact': {'id': '1'}}) == CONTACT
+    assert classify_event({'foo': 'bar'}) == UNKNOWN
+
+  @pytest.mark.parametrize('alg', ['HS256', 'HS512'])
+  def test_jwt(self, alg):
+    decoder = EventDecoder(SECRET, alg.lower())
+    # The precomputed key is reused for every payload.
+    for _ in range(2):
+      event = decoder.decode(sign(CALL_EVENT, alg=alg))
+      assert (event.type, event.payload) == (CALL, CALL_EVENT)
+
+    with pytest.raises(PermissionError):
+      decoder.decode(sign(CALL_EVENT, secret='wrong', alg=alg))
+    with pytest.raises(PermissionError):
+      decoder.decode(sign(CALL_EVENT, alg='HS512' if alg == 'HS256' else 'HS256'))
+    with pytest.raises(ValueError):
+      decoder.decode(json.dumps(CALL_EVENT))
+    with pytest.raises(ValueError):
+      decoder.decode(b'!!.!!.!!')
+
+  def test_unsigned(self):
+    decoder = EventDecoder()
+    assert decoder.decode(json.dumps(CALL_EVENT)).payload == CALL_EVENT
+    with pytest.raises(ValueError):
+      decoder.decode(b'[1, 2]')
+    with pytest.raises(ValueError):
+      decoder.decode(b'{')
+
+  def test_signature_options(self):
+    assert signature_options({'algo': 'HS512', 'secret': 's', 'type': 'jwt'}) == {
+      'secret': 's',
+      'algo': 'HS512',
+    }
+    assert signature_options(None) == {'secret': None, 'algo': 'HS256'}
+    assert signature_options(SignatureProto(secret='s', type='jwt')) == {
+      'secret': 's',
+      'algo': 'HS256',
+    }
+    with pytest.raises(ValueError):
+      signature_options({'type': 'basic'})
+    with pytest.raises(ValueError):
+      EventDecoder(SECRET, 'RS256')
+
+
+class TestEventDispatcher:
+  def test_backpressure(self):
+    dispatcher = EventDispatcher(max_workers=1, queue_size=1)
+    release = threading.Event()
+    handled = []
+
+    @dispatcher.on(CALL)
+    def slow(event):
+      release.wait(5)
+      handled.append(event.payload['call_id'])
+
+    decoder = EventDecoder()
+    events = [decoder.decode(json.dumps({**CALL_EVENT, 'call_id': i})) for i in range(3)]
+    assert [dispatcher.dispatch(event) for event in events] == [True, True, False]
+
+    release.set()
+    dispatcher.close()
+    assert handled == [0, 1]
+    with pytest.raises(RuntimeError):
+      dispatcher.dispatch(events[0])
+
+  def test_handlers(self, caplog):
+    dispatcher = EventDispatcher()
+    handled = []
+
+    @dispatcher.on()
+    async def everything(event):
+      await asyncio.sleep(0)
+      handled.append(('*', event.type))
+
+    @dispatcher.on(SMS)
+    def failing(event):
+      raise RuntimeError('Handler failed')
+
+    decoder = EventDecoder()
+    dispatcher.dispatch(decoder.decode(json.dumps(CALL_EVENT)))
+    dispatcher.dispatch(decoder.decode(json.dumps({'text': 'hi', 'direction': 'inbound'})))
+    dispatcher.close()
+
+    assert sorted(handled) == [('*', CALL), ('*', SMS)]
+    assert 'failing' in caplog.text
+
+
+class TestWebhookReceiver:
+  def test_wsgi(self):
+    receiver = WebhookReceiver.from_webhook(
+      {'hook_url': 'https://example.com', 'signature': {'secret': SECRET, 'type': 'jwt'}},
+      max_body_size=1000,
+    )
+    calls = []
+    receiver.on(CALL)(lambda event: calls.append(event.payload))
+
+    assert wsgi_request(receiver, 'POST', sign(CALL_EVENT)) == '200 OK'
+    assert wsgi_request(receiver, 'POST', sign(CALL_EVENT, secret='wrong')) == '401 Unauthorized'
+    assert wsgi_request(receiver, 'POST', b'not a jwt') == '400 Bad Request'
+    assert wsgi_request(receiver, 'GET', b'') == '405 Method Not Allowed'
+    assert wsgi_request(receiver, 'POST', b'x' * 1001) == '413 Payload Too Large'
+    assert receiver.handle('POST', b'x' * 1001) == (413, None)
+
+    # Requests without a Content-Length are read until the end of their body.
+    assert wsgi_request(receiver, 'POST', sign(CALL_EVENT), chunked=True) == '200 OK'
+    assert wsgi_request(receiver, 'POST', b'x' * 1000, chunked=True) == '400 Bad Request'
+    assert wsgi_request(receiver, 'POST', b'x' * 5000, chunked=True) == '413 Payload Too Large'
+
+    receiver.close()
+    assert calls == [CALL_EVENT, CALL_EVENT]
+
+  def test_from_model(self):
+    webhook = WebhookProto.from_dict(
+      {'hook_url': 'https://example.com', 'signature': {'secret': SECRET, 'type': 'jwt'}}
+    )
+    receiver = WebhookReceiver.from_webhook(webhook)
+    assert receiver.handle('POST', sign(CALL_EVENT))[0] == 200
+    assert receiver.handle('POST', sign(CALL_EVENT, secret='wrong'))[0] == 401
+    receiver.close()
+
+  def test_backpressure(self):
+    receiver = WebhookReceiver(max_workers=1, queue_size=0)
+    release = threading.Event()
+    receiver.on()(lambda event: release.wait(5))
+
+    assert receiver.handle('POST', json.dumps(CALL_EVENT).encode())[0] == 200
+    status, event = receiver.handle('POST', json.dumps(CALL_EVENT).encode())
+    assert (status, event.type) == (503, CALL)
+    release.set()
+    receiver.close()
+
+  @pytest.mark.asyncio
+  async def test_asgi(self):
+    receiver = WebhookReceiver(secret=SECRET, max_body_size=1000)
+    calls = []
+    receiver.on(CALL)(lambda event: calls.append(event.payload))
+
+    assert await asgi_request(receiver.asgi, 'POST', sign(CALL_EVENT)) == 200
+    assert await asgi_request(receiver.asgi, 'POST', sign(CALL_EVENT, secret='x')) == 401
+    assert await asgi_request(receiver.asgi, 'POST', b'x' * 1001) == 413
+
+    lifespan = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+      return lifespan.pop(0)
+
+    async def send(message):
+      sent.append(message['type'])
+
+    await receiver.asgi({'type': 'lifespan'}, receive, send)
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+    assert calls == [CALL_EVENT]
@@ -0,0 +1,238 @@
+"""Tests for the websocket event consumer."""
+
+import asyncio
+import json
+
+import pytest
+
+from dialpad import websocket_consumer
+from dialpad.events import CALL, SMS, EventDecoder
+from dialpad.json_codec import JSONCodec
+from dialpad.models.websocket import WebsocketProto
+from dialpad.websocket_consumer import WebsocketConsumer
+
+from .test_webhooks import CALL_EVENT, SECRET, sign
+
+WEBSOCKET = {
+  'id': 1,
+  'websocket_url': 'wss://example.com/events',
+  'signature': {'algo': 'HS256', 'secret': SECRET, 'type': 'jwt'},
+}
+
+
+def call(call_id: int) -> bytes:
+  return sign({**CALL_EVENT, 'call_id': call_id})
+
+
+class StandInServer:
+  """Serves each connection one session of messages, then drops it.
+
+  Sessions of None refuse the connection, and the server stops accepting connections once it runs
+  out of sessions.
+  """
+
+  def __init__(self, *sessions):
+    self.sessions = list(sessions)
+    self.urls = []
+    self.sent = 0
+    self.closed = 0
+
+  async def connect(self, url: str) -> 'StandInServer':
+    self.urls.append(url)
+    if not self.sessions or self.sessions[0] is None:
+      self.sessions[:1] = []
+      raise ConnectionRefusedError('Refused')
+    self.messages = list(self.sessions.pop(0))
+    return self
+
+  async def recv(self) -> bytes:
+    await asyncio.sleep(0)
+    if not self.messages:
+      raise ConnectionResetError('Dropped')
+    self.sent += 1
+    return self.messages.pop(0)
+
+  async def close(self) -> None:
+    self.closed += 1
+
+
+def consumer(server: StandInServer, url=WEBSOCKET['websocket_url'], **kwargs) -> WebsocketConsumer:
+  kwargs = {'secret': SECRET, 'min_backoff': 0.001, 'max_retries': 2, **kwargs}
+  return WebsocketConsumer(url, connect=server.connect, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_reconnect(caplog):
+  server = StandInServer(
+    [call(1), call(2)],
+    None,
+    # The second call is sent again after the reconnect, along with a forged one.
+    [call(2), sign(CALL_EVENT, secret='wrong'), b'not a jwt', call(3)],
+  )
+  urls = iter(['wss://example.com/1', 'wss://example.com/2', 'wss://example.com/3'])
+
+  async def refresh_url():
+    return next(urls, 'wss://example.com/4')
+
+  events = consumer(server, url=refresh_url)
+  received = []
+  with pytest.raises(ConnectionError, match='after 2 tries'):
+    async for event in events:
+      received.append(event.payload['call_id'])
+
+  assert received == [1, 2, 3]
+  assert server.urls == [f'wss://example.com/{i}' for i in (1, 2, 3, 4, 4)]
+  assert (events.connections, server.closed) == (2, 2)
+  assert (events.received, events.rejected, events.duplicates) == (6, 2, 1)
+  assert 'could not be decoded' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_accepted_then_dropped():
+  # Connections that are dropped straight away count as failed attempts.
+  server = StandInServer(*[[] for _ in range(10)])
+  events = consumer(server)
+  with pytest.raises(ConnectionError, match='after 2 tries'):
+    async for _event in events:
+      pass
+  assert events.connections == server.closed == 3
+
+  # Unless they stay up for long enough.
+  server = StandInServer([], [], [call(1)])
+  events = consumer(server, min_uptime=0)
+  with pytest.raises(ConnectionError):
+    async for _event in events:
+      pass
+  assert (events.connections, events.received) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_backpressure():
+  server = StandInServer([call(i) for i in range(100)])
+  events = WebsocketConsumer.from_websocket(WEBSOCKET, connect=server.connect, queue_size=2)
+
+  received = []
+  async for event in events:
+    received.append(event)
+    await asyncio.sleep(0.01)
+    # The server is only read from as quickly as events are consumed.
+    assert server.sent <= len(received) + 3
+    if len(received) == 5:
+      break
+
+  await events.close()
+  assert server.closed == 1
+  # The consumer stays closed, with the events that were queued discarded.
+  assert [event async for event in events] == []
+  await events.close()
+
+
+@pytest.mark.asyncio
+async def test_run():
+  messages = [{**CALL_EVENT, 'call_id': 1}, {'text': 'hi', 'direction': 'inbound'}, CALL_EVENT]
+  server = StandInServer([json.dumps(message) for message in messages])
+  events = consumer(server, secret=None, max_retries=None, dedupe_window=0)
+  handled = []
+  done = asyncio.Event()
+
+  @events.on(CALL)
+  async def on_call(event):
+    await asyncio.sleep(0)
+    handled.append(event.payload['call_id'])
+    if event.payload['call_id'] == 123:
+      done.set()
+
+  @events.on(SMS)
+  def on_sms(event):
+    handled.append(event.payload['text'])
+
+  @events.on()
+  def failing(event):
+    raise RuntimeError('Handler failed')
+
+  task = asyncio.ensure_future(events.run(concurrency=1))
+  await asyncio.wait_for(done.wait(), 5)
+  await events.close()
+  await task
+  assert handled == [1, 'hi', 123]
+
+
+@pytest.mark.asyncio
+async def test_run_raises():
+  events = consumer(StandInServer(), max_retries=0)
+  with pytest.raises(ConnectionError):
+    await events.run()
+
+
+class StrictCodec(JSONCodec):
+  """Raises its own error type on malformed JSON, like msgspec does."""
+
+  class DecodeError(Exception):
+    pass
+
+  def loads(self, data):
+    try:
+      return super().loads(data)
+    except ValueError as e:
+      raise self.DecodeError(str(e)) from None
+
+
+@pytest.mark.asyncio
+async def test_codec_errors():
+  server = StandInServer([b'{', json.dumps(CALL_EVENT)])
+  events = consumer(server, secret=None, json_codec=StrictCodec())
+  received = []
+  with pytest.raises(ConnectionError):
+    async for event in events:
+      received.append(event.payload)
+
+  # The malformed message is skipped without dropping the connection.
+  assert received == [CALL_EVENT]
+  assert (events.connections, events.rejected) == (1, 1)
+
+
+def test_msgspec_errors():
+  pytest.importorskip('msgspec')
+  with pytest.raises(ValueError):
+    EventDecoder(json_codec='msgspec').decode(b'{')
+
+
+@pytest.mark.asyncio
+async def test_from_model():
+  server = StandInServer([call(1)])
+  events = WebsocketConsumer.from_websocket(
+    WebsocketProto.from_dict(WEBSOCKET), connect=server.connect, max_retries=0
+  )
+  with pytest.raises(ConnectionError):
+    async for event in events:
+      assert event.payload['call_id'] == 1
+
+  assert server.urls == [WEBSOCKET['websocket_url']]
+  assert events.received == 1 and events.rejected == 0
+
+
+def test_requires_websockets(monkeypatch):
+  monkeypatch.setattr(websocket_consumer, 'websockets', None)
+  with pytest.raises(ImportError):
+    WebsocketConsumer.from_websocket(WEBSOCKET)
+
+
+@pytest.mark.asyncio
+async def test_websockets_server():
+  websockets = pytest.importorskip('websockets')
+
+  async def serve(connection, *args):
+    await connection.send(call(1).decode())
+    await connection.send(call(2))
+
+  async with websockets.serve(serve, 'localhost', 0) as server:
+    port = server.sockets[0].getsockname()[1]
+    events = WebsocketConsumer(f'ws://localhost:{port}', secret=SECRET)
+    received = []
+    async for event in events:
+      received.append(event.payload['call_id'])
+      if len(received) == 2:
+        break
+    await events.close()
+
+  assert received == [1, 2]